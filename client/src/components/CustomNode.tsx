@@ -41,6 +41,8 @@ const CustomNode = memo((props: NodeProps<CustomNodeType>) => {
         shallow
     );
 
+    const nodePreview = useWebsocketState((state) => state.nodePreview[props.id]);
+
     const onClearCache = async () => {
         const nodeId = props.id;
 
@@ -149,6 +151,14 @@ const CustomNode = memo((props: NodeProps<CustomNodeType>) => {
                     updateStore={updateStore}
                     groups={props.data.groups}
                 />
+                {nodePreview && (
+                    <Box
+                        component="img"
+                        src={nodePreview}
+                        alt="Live preview"
+                        sx={{ width: '100%', height: 'auto', display: 'block', mt: 1 }}
+                    />
+                )}
             </Box>
             <Box
                 component="footer"
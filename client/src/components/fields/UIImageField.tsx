@@ -20,7 +20,6 @@ const LightBox = memo(({ urls, index, label, onClose }: { urls: {url: string, wi
 
     const isDraggingRef = useRef(false);
     const dragStartRef = useRef({ x: 0, y: 0 });
-    const timeRef = useRef(0);
 
     // Add mouse drag handlers for panning
     const handleMouseDown = (e: React.MouseEvent) => {
@@ -55,10 +54,6 @@ const LightBox = memo(({ urls, index, label, onClose }: { urls: {url: string, wi
         setPan({ x: 0, y: 0 });
     }, [zoom, currentIndex]);
 
-    useEffect(() => {
-        timeRef.current = Date.now();
-    }, [urls]);
-
     useEffect(() => {
         setZoom(1);
         setPan({ x: 0, y: 0 });
@@ -88,7 +83,8 @@ const LightBox = memo(({ urls, index, label, onClose }: { urls: {url: string, wi
 
     const currentUrl = () => {
         if (currentIndex === -1) return '';
-        return `http://${config.serverAddress}${urls[currentIndex].url.split('?')[0].replace(/\/$/, '')}?t=${timeRef.current}`;
+        // urls are bound to the content hash of the image, no need to bust the browser cache
+        return `http://${config.serverAddress}${urls[currentIndex].url}`;
     };
 
     // Navigation handlers
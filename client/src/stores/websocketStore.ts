@@ -28,6 +28,9 @@ export type WebsocketState = {
 
     nodeProgress: Record<string, NodeProgress>;
     updateNodeProgress: (nodeId: string, progress: number) => void;
+
+    nodePreview: Record<string, string>;
+    updateNodePreview: (nodeId: string, blob: Blob | null) => void;
 }
 
 export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get) => ({
@@ -50,6 +53,23 @@ export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get)
         }));
     },
 
+    nodePreview: {},
+    updateNodePreview: (nodeId: string, blob: Blob | null) => {
+        const current = get().nodePreview[nodeId];
+        if (current) {
+            URL.revokeObjectURL(current);
+        }
+        set((state) => {
+            const nodePreview = { ...state.nodePreview };
+            if (blob) {
+                nodePreview[nodeId] = URL.createObjectURL(blob);
+            } else {
+                delete nodePreview[nodeId];
+            }
+            return { nodePreview };
+        });
+    },
+
     threeData: {},
     updateThreeData: (nodeId: string, key: string, value: string) => {
         set((state) => ({
@@ -90,6 +110,7 @@ export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get)
         }
 
         socket = new WebSocket(`${address}?sid=${sid}`);
+        socket.binaryType = 'arraybuffer';
         set({ socket });
 
         const onOpen = () => {
@@ -110,7 +131,27 @@ export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get)
             set({ reconnectTimer: timer });
         };
 
+        const onBinaryMessage = (data: ArrayBuffer) => {
+            // frame layout: 4 bytes header length, JSON header, image data
+            const headerLength = new DataView(data).getUint32(0);
+            const header = JSON.parse(new TextDecoder().decode(data.slice(4, 4 + headerLength)));
+
+            if (header.type === 'preview' && header.nodeId) {
+                // ignore previews arriving after the node is done
+                if (get().nodeProgress[header.nodeId]?.type !== 'determinate') {
+                    return;
+                }
+                const blob = new Blob([data.slice(4 + headerLength)], { type: `image/${header.format || 'webp'}` });
+                get().updateNodePreview(header.nodeId, blob);
+            }
+        };
+
         const onMessage = (event: MessageEvent) => {
+            if (event.data instanceof ArrayBuffer) {
+                onBinaryMessage(event.data);
+                return;
+            }
+
             //const { setNodeExecuted } = useNodeState((state: NodeState) => ({ setNodeExecuted: state.setNodeExecuted }), shallow);
             const message = JSON.parse(event.data);
 
@@ -131,6 +172,16 @@ export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get)
                 }
                 get().updateNodeProgress(message.nodeId, message.progress);
             }
+            else if (message.type === 'progressBatch') {
+                if (!Array.isArray(message.updates)) {
+                    return;
+                }
+                message.updates.forEach(({ nodeId, progress }: { nodeId: string, progress: number }) => {
+                    if (nodeId && progress) {
+                        get().updateNodeProgress(nodeId, progress);
+                    }
+                });
+            }
             else if (message.type === 'image') {
                 if (!message.nodeId || !message.key || !message.data) {
                     console.error('Invalid image message. Ignoring.');
@@ -173,6 +224,7 @@ export const useWebsocketState = createWithEqualityFn<WebsocketState>((set, get)
                 }
                 useNodeState.getState().setNodeExecuted(message.nodeId, true, message.time || 0, message.memory || 0);
                 get().updateNodeProgress(message.nodeId, -2);
+                get().updateNodePreview(message.nodeId, null);
 
                 // if ('updateValues' in message) {
                 //     Object.entries(message.updateValues).forEach(([k, v]) => {
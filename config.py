@@ -16,8 +16,58 @@ class Config:
 
         self.app = {
             'global_seed': self.config.getint('app', 'global_seed', fallback=42),
+            'incremental_execution': self.config.getboolean('app', 'incremental_execution', fallback=True),
+            'parallel_execution': self.config.getboolean('app', 'parallel_execution', fallback=False),
+            'view_cache_size': self.config.getint('app', 'view_cache_size', fallback=256),
+            'progress_interval': self.config.getint('app', 'progress_interval', fallback=100),
+            'client_queue_size': self.config.getint('app', 'client_queue_size', fallback=256),
+            'client_send_timeout': self.config.getfloat('app', 'client_send_timeout', fallback=10),
+            'concurrent_graphs': max(1, self.config.getint('app', 'concurrent_graphs', fallback=1)),
+            # node modules imported in the background at startup: comma separated names, * for all
+            'warm_up': self.config.get('app', 'warm_up', fallback='').strip(),
         }
 
+        self.executors = {
+            # 0 means one worker per available device and concurrent graph
+            'gpu_workers': self.config.getint('executors', 'gpu_workers', fallback=0),
+            'cpu_workers': self.config.getint('executors', 'cpu_workers', fallback=min(4, os.cpu_count() or 1)),
+            'io_workers': self.config.getint('executors', 'io_workers', fallback=4),
+            # nodes that don't run on a device (api calls, tools...), same size as the asyncio default executor
+            'default_workers': self.config.getint('executors', 'default_workers', fallback=min(32, (os.cpu_count() or 1) + 4)),
+        }
+
+        self.batching = {
+            # group the compatible sampler calls of concurrent graphs, see mellon/batcher.py
+            'enabled': self.config.getboolean('batching', 'enabled', fallback=False),
+            'window': self.config.getint('batching', 'window', fallback=50),
+            'max_batch': self.config.getint('batching', 'max_batch', fallback=8),
+        }
+
+        self.workers = {
+            # execute the nodes in one process per device, see mellon/workers.py
+            'enabled': self.config.getboolean('workers', 'enabled', fallback=False),
+            # seconds a node can run in a worker before the worker is considered hung and restarted
+            'timeout': self.config.getint('workers', 'timeout', fallback=3600),
+        }
+
+        self.memory = {
+            # fraction of the memory of each device (and of the RAM) the models can use
+            'threshold': self.config.getfloat('memory', 'threshold', fallback=0.9),
+            # lru, lfu or cost (reload cost of the model against its recency)
+            'eviction': self.config.get('memory', 'eviction', fallback='lru'),
+            # number of upcoming nodes whose models are moved to their device ahead of time, 0 to disable
+            'prefetch': self.config.getint('memory', 'prefetch', fallback=2),
+        }
+
+        self.cache = {
+            # persistent cache of the outputs of the nodes marked as `cacheable` in the MODULE_MAP
+            'enabled': self.config.getboolean('cache', 'enabled', fallback=False),
+            'max_size': self.config.getfloat('cache', 'max_size', fallback=20),
+        }
+
+        # models loaded at boot: name = Module.Action param=value ... device=cuda:0
+        self.warm_pool = dict(self.config.items('warm_pool', raw=True)) if self.config.has_section('warm_pool') else {}
+
         self.log = {
             'level': getattr(logging, self.config.get('logging', 'level', fallback='INFO').upper()),
         }
@@ -31,6 +81,8 @@ class Config:
         self.paths = {
             'data': self.config.get('paths', 'data', fallback='data'),
             'temp': self.config.get('paths', 'temp', fallback='data/temp'),
+            'cache': self.config.get('paths', 'cache', fallback='data/cache'),
+            'spool': self.config.get('paths', 'spool', fallback='data/spool'),
         }
 
         for path, value in self.paths.items():
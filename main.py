@@ -31,13 +31,15 @@ from modules import MODULE_MAP
 from mellon.server import web_server #WebServer
 #web_server = WebServer(MODULE_MAP, **config.server)
 
-# welcome message
-logger.info(f"""\x1b[33;20m
+# the worker processes import this module too, only the main process runs the server
+if __name__ == '__main__':
+    # welcome message
+    logger.info(f"""\x1b[33;20m
 ╔══════════════════════╗
 ║  Welcome to Mellon!  ║
 ╚══════════════════════╝\x1b[0m
 Speak Friend and Enter: http://{config.server['host']}:{config.server['port']}""")
 
-# Engage!
-web_server.run()
+    # Engage!
+    web_server.run()
 
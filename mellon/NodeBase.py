@@ -4,9 +4,10 @@ from modules import MODULE_MAP
 import torch
 import time
 from utils.memory_manager import memory_flush, memory_manager
-from mellon.server import web_server
+from mellon.progress import node_events
 import nanoid
 import numpy as np
+from utils.hash_utils import fingerprint, image_fingerprint, tensor_fingerprint, stamp_output
 
 def get_module_params(module_name, class_name):
     params = MODULE_MAP[module_name][class_name]['params'] if module_name in MODULE_MAP and class_name in MODULE_MAP[module_name] else {}
@@ -34,8 +35,18 @@ def are_different(a, b):
 
     # check custom hash, this value is king
     if hasattr(a, "_MELLON_HASH") and hasattr(b, "_MELLON_HASH"):
-       return hasattr(a, "_MELLON_HASH") != hasattr(b, "_MELLON_HASH")
-    
+       return a._MELLON_HASH != b._MELLON_HASH
+
+    # compare tensors, hashed on their own device and memoized until modified in place
+    if isinstance(a, torch.Tensor):
+        return tensor_fingerprint(a) != tensor_fingerprint(b)
+
+    # PIL images, the digests are memoized for the output they belong to
+    if hasattr(a, 'getdata') and hasattr(a, 'width') and hasattr(a, 'height'):
+        if a.size != b.size or a.mode != b.mode:
+            return True
+        return image_fingerprint(a) != image_fingerprint(b)
+
     # common attributes
     if hasattr(a, 'shape'):
         if a.shape != b.shape:
@@ -44,7 +55,6 @@ def are_different(a, b):
         if not hasattr(b, 'dtype') or a.dtype != b.dtype:
             return True
 
-    # quick image comparison
     if hasattr(a, 'size'):
         if a.size != b.size:
             return True
@@ -52,13 +62,6 @@ def are_different(a, b):
         if a.mode != b.mode:
             return True
 
-    # deep PIL images comparison
-    if hasattr(a, 'getdata') and hasattr(a, 'width') and hasattr(a, 'height'):
-        # compare small images with tobytes(), possibly unnecessary optimization
-        if a.width*a.height < 32768:
-            return a.tobytes() != b.tobytes()
-        return not np.array_equal(np.asarray(a), np.asarray(b))
-
     # trimesh comparison
     if hasattr(a, 'vertices') and hasattr(a.vertices, 'shape'):
         if are_different(a.vertices, b.vertices):
@@ -77,10 +80,6 @@ def are_different(a, b):
     if isinstance(a, np.ndarray):
         return not np.array_equal(a, b)
 
-    # compare tensors
-    if isinstance(a, torch.Tensor):
-        return not torch.equal(a, b)
-
     # iterate list, tuple, dict
     if isinstance(a, (list, tuple)):
         if len(a) != len(b):
@@ -121,7 +120,12 @@ class NodeBase():
         self._client_id = None
         self._pipe_interrupt = False
         self._mm_model_ids = []
+        self._mm_shared = set()         # signatures of the shared models held by the node
+        self._mm_stale_shared = set()   # held since the previous execution, not yet acquired again
+        self._mm_loading = None         # signature being loaded by mm_acquire
         self._execution_time = 0
+        self._output_fingerprint = None
+        self._cache_key = None    # key of the current output in the persistent output cache
 
     def __call__(self, **kwargs):
         self._pipe_interrupt = False
@@ -138,20 +142,27 @@ class NodeBase():
 
         self.params.update(values)
 
-        # delete previously loaded models
-        # TODO: delete a model only if something changed about it
+        # delete previously loaded models, the shared ones are kept if they are acquired again (see mm_acquire)
         if self._mm_model_ids:
             memory_manager.delete_model(self._mm_model_ids, unload=self.FORCE_UNLOAD)
             self._mm_model_ids = []
 
+        self._mm_stale_shared |= self._mm_shared
+        self._mm_shared = set()
+
         try:
             params = { key: self.params[key] for key in self.params if not key.startswith('__') }
             output = getattr(self, self.CALLBACK)(**params)
         except Exception as e:
             self.params = {}
             self.output = get_module_output(self.module_name, self.class_name)
+            self._output_fingerprint = None
             memory_flush(gc_collect=True)
             raise e
+        finally:
+            # let nodes running on other devices use the models we loaded
+            memory_manager.release_models()
+            self.mm_release_stale()
 
         if isinstance(output, dict):
             # Overwrite output values only for existing keys
@@ -162,6 +173,13 @@ class NodeBase():
             first_key = next(iter(self.output))
             self.output[first_key] = output
 
+        # a new output, the memoized digests of its images and inference tensors are invalidated
+        stamp_output(self.output)
+
+        # computed on demand, see _get_output_fingerprint
+        self._output_fingerprint = None
+        self._cache_key = None
+
         self._execution_time = time.time() - execution_time
 
         # for good measure, flush the memory
@@ -175,6 +193,9 @@ class NodeBase():
         if self._mm_model_ids:
             memory_manager.delete_model(self._mm_model_ids, unload=self.FORCE_UNLOAD)
 
+        for key in self._mm_shared | self._mm_stale_shared:
+            memory_manager.release_shared(key, self.node_id, unload=self.FORCE_UNLOAD)
+
         memory_flush(gc_collect=True)
 
     def _validate_params(self, values):
@@ -245,28 +266,48 @@ class NodeBase():
             for key in values
         )
     
+    def _get_output_fingerprint(self):
+        # content hash of the current output, used to detect changes without keeping a copy of it
+        if self._output_fingerprint is None:
+            self._output_fingerprint = fingerprint(self.output)
+        return self._output_fingerprint
+
     def _is_output_empty(self):
         return all(value is None for value in self.output.values())
+
+    def _is_cached(self, values):
+        # the previous output can be reused only if the node has already been executed
+        # and neither its own params nor any of its inputs changed since then
+        if not self.params or self._is_output_empty():
+            return False
+
+        try:
+            values = self._validate_params(values)
+        except Exception:
+            # let the actual execution raise the validation error
+            return False
+
+        return not self._has_changed(values)
     
     def pipe_callback(self, pipe, step_index, timestep, kwargs):
-        import asyncio
         if self.node_id:
             try:
+                # the web server coalesces the updates and sends only the latest value
                 progress = int((step_index + 1) / pipe._num_timesteps * 100)
-                asyncio.run_coroutine_threadsafe(
-                    web_server.client_queue.put({
-                        "client_id": self._client_id,
-                        "data": {
-                            "type": "progress",
-                            "nodeId": self.node_id,
-                            "progress": progress
-                        }
-                    }), 
-                    web_server.event_loop
-                )
+                node_events.progress(self._client_id, self.node_id, progress)
             except Exception as e:
                 logger.warning(f"Error queuing progress update: {str(e)}")
 
+            # stream an approximate preview of the latents every `preview_steps`
+            preview_steps = self.params.get('preview_steps') or 0
+            if preview_steps > 0 and 'latents' in kwargs and ((step_index + 1) % preview_steps == 0):
+                try:
+                    from utils.torch_utils import latentToRGB
+                    preview = latentToRGB(kwargs['latents'][:1])[0]
+                    node_events.preview(self._client_id, self.node_id, step_index + 1, preview)
+                except Exception as e:
+                    logger.warning(f"Error generating the latent preview: {str(e)}")
+
             # interrupt callback
             if self._pipe_interrupt:
                 pipe._interrupt = True
@@ -283,12 +324,50 @@ class NodeBase():
             self.mm_update(model_id, model=model, priority=priority)
             return model_id
 
-        model_id = f'{self.node_id}.{model_id}' if model_id else f'{self.node_id}.{nanoid.generate(size=8)}'
         device = device if device else str(model.device)
 
+        # models created inside mm_acquire belong to the shared load, not to the node
+        if self._mm_loading:
+            model_id = f'shared.{nanoid.generate(size=8)}.{model_id}' if model_id else f'shared.{nanoid.generate(size=8)}'
+            return memory_manager.add_model(model, model_id, device=device, priority=priority, shared=self._mm_loading)
+
+        model_id = f'{self.node_id}.{model_id}' if model_id else f'{self.node_id}.{nanoid.generate(size=8)}'
+
         self._mm_model_ids.append(model_id)
         return memory_manager.add_model(model, model_id, device=device, priority=priority)
 
+    def mm_acquire(self, signature, factory):
+        """
+        Load a model (or a group of models) shared by all the nodes that use the same load `signature`,
+        eg: `('sdxl_unet', model_id, dtype, variant)`. `factory` is called only if no other node holds it
+        and the models registered with `mm_add` inside it are freed when the last node releases them.
+        The models are kept across re-executions as long as the node asks for the same signature.
+        """
+        if not self.node_id:
+            return factory()
+
+        key = memory_manager.shared_key(signature)
+        if key not in self._mm_stale_shared and key not in self._mm_shared:
+            # the signature changed, free the old models before loading the new ones
+            self.mm_release_stale()
+
+        def load():
+            self._mm_loading = key
+            try:
+                return factory()
+            finally:
+                self._mm_loading = None
+
+        value = memory_manager.acquire_shared(key, self.node_id, load)
+        self._mm_stale_shared.discard(key)
+        self._mm_shared.add(key)
+        return value
+
+    def mm_release_stale(self):
+        for key in self._mm_stale_shared:
+            memory_manager.release_shared(key, self.node_id, unload=self.FORCE_UNLOAD)
+        self._mm_stale_shared = set()
+
     def mm_get(self, model_id):
         model_id = model_id if isinstance(model_id, str) else model_id._mm_id if hasattr(model_id, '_mm_id') else None
         return memory_manager.get_model(model_id) if model_id else None
@@ -320,7 +399,7 @@ class NodeBase():
                 with torch.inference_mode() if not no_grad else torch.no_grad():
                     return func()
             except torch.OutOfMemoryError as e:
-                if memory_manager.unload_next(device, exclude=exclude):
+                if memory_manager.unload_next(device, exclude=exclude_list):
                     continue
                 else:
                     raise e
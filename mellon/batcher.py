@@ -0,0 +1,147 @@
+import threading
+from config import config
+import logging
+logger = logging.getLogger('mellon')
+
+class BatchRequest:
+    def __init__(self, inputs, size, owner=None):
+        """
+        A sampler call waiting to be batched. `size` is the number of images it produces,
+        `owner` the node that receives the progress updates.
+        """
+        self.inputs = inputs
+        self.size = size
+        self.owner = owner
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+class Batch:
+    def __init__(self, key):
+        self.key = key
+        self.requests = []
+        self.full = threading.Event()
+
+    @property
+    def size(self):
+        return sum(r.size for r in self.requests)
+
+class DynamicBatcher:
+    def __init__(self, enabled, window, max_batch):
+        """
+        Group the compatible sampler calls of concurrent graphs into a single denoise call.
+
+        The first request of a batch waits up to `window` seconds for other requests with the same key
+        (same model, resolution, scheduler, steps...), then runs the whole batch and hands each request
+        its share of the result. Only one batch runs at a time on each device.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.max_batch = max_batch
+        self.lock = threading.Lock()
+        self.pending = {}           # key -> Batch collecting requests
+        self.device_locks = {}
+
+        self.batches = 0
+        self.requests = 0
+        self.largest = 0
+
+    def run(self, key, device, request, run_batch):
+        """
+        Called from the worker thread of the node. `run_batch(requests)` returns one result per request,
+        it's executed by the thread of the first request of the batch.
+        """
+        if not self.enabled or request.size >= self.max_batch:
+            with self.get_device_lock(device):
+                return run_batch([request])[0]
+
+        with self.lock:
+            batch = self.pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self.pending[key] = Batch(key)
+            batch.requests.append(request)
+            if batch.size >= self.max_batch:
+                # later requests start a new batch
+                del self.pending[key]
+                batch.full.set()
+
+        if not leader:
+            request.done.wait()
+            if request.error:
+                raise request.error
+            return request.result
+
+        batch.full.wait(self.window)
+        with self.lock:
+            if self.pending.get(key) is batch:
+                del self.pending[key]
+            self.batches += 1
+            self.requests += len(batch.requests)
+            self.largest = max(self.largest, batch.size)
+
+        if len(batch.requests) > 1:
+            logger.debug(f"Batching {len(batch.requests)} sampler requests ({batch.size} images)")
+
+        try:
+            with self.get_device_lock(device):
+                results = run_batch(batch.requests)
+            for r, result in zip(batch.requests, results):
+                r.result = result
+        except Exception as e:
+            for r in batch.requests:
+                r.error = e
+        finally:
+            for r in batch.requests:
+                r.done.set()
+
+        if request.error:
+            raise request.error
+        return request.result
+
+    def get_device_lock(self, device):
+        with self.lock:
+            if device not in self.device_locks:
+                self.device_locks[device] = threading.Lock()
+            return self.device_locks[device]
+
+    def pipe_callback(self, requests, slices):
+        """
+        Forward the denoise loop callbacks to the owner of each request, with its own slice of the latents.
+        The batch is interrupted only when all the owners asked for it.
+        """
+        def callback(pipe, step_index, timestep, kwargs):
+            latents = kwargs.get('latents')
+            for request, (start, end) in zip(requests, slices):
+                if request.owner is not None:
+                    request.owner.pipe_callback(pipe, step_index, timestep, { 'latents': latents[start:end] } if latents is not None else {})
+            pipe._interrupt = all(getattr(r.owner, '_pipe_interrupt', False) for r in requests)
+            return kwargs
+
+        return callback
+
+    def stats(self):
+        with self.lock:
+            return {
+                'enabled': self.enabled,
+                'window': self.window,
+                'max_batch': self.max_batch,
+                'batches': self.batches,
+                'requests': self.requests,
+                'largest': self.largest,
+                'pending': sum(len(b.requests) for b in self.pending.values()),
+            }
+
+def batch_slices(requests):
+    slices = []
+    start = 0
+    for r in requests:
+        slices.append((start, start + r.size))
+        start += r.size
+    return slices
+
+sampler_batcher = DynamicBatcher(
+    config.batching['enabled'],
+    config.batching['window'] / 1000,
+    config.batching['max_batch'],
+)
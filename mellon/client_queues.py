@@ -0,0 +1,143 @@
+import asyncio
+from collections import deque
+import logging
+logger = logging.getLogger('mellon')
+
+# messages that can be dropped when a client can't keep up, only the latest value matters
+DROPPABLE_TYPES = ('progress', 'progressBatch')
+
+def is_droppable(data):
+    return isinstance(data, bytes) or (isinstance(data, dict) and data.get('type') in DROPPABLE_TYPES)
+
+class ClientChannel:
+    def __init__(self, sid, ws, max_size, timeout=10):
+        """
+        Outbound queue of a single websocket client with its own sender task.
+
+        The queue is bounded: when it is full the oldest droppable message (progress, previews) is
+        discarded; messages that can't be dropped (results) wait up to `timeout` seconds for the client
+        to catch up. A client still stalled after that is disconnected, it resyncs when it reconnects.
+        """
+        self.sid = sid
+        self.ws = ws
+        self.max_size = max_size
+        self.timeout = timeout
+        self.queue = deque()
+        self.ready = asyncio.Event()        # there are messages to send
+        self.space = asyncio.Event()        # the queue is not full
+        self.space.set()
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        self.stalled = False
+        self.task = asyncio.create_task(self.run())
+
+    async def put(self, data):
+        droppable = is_droppable(data)
+
+        while len(self.queue) >= self.max_size and not self.closed:
+            oldest = next((m for m in self.queue if is_droppable(m)), None)
+            if oldest is not None:
+                self.queue.remove(oldest)
+                self.dropped += 1
+            elif droppable:
+                self.dropped += 1
+                return
+            else:
+                self.space.clear()
+                try:
+                    await asyncio.wait_for(self.space.wait(), self.timeout)
+                except asyncio.TimeoutError:
+                    self.disconnect_stalled()
+                    self.dropped += 1
+                    return
+
+        if self.closed:
+            return
+
+        self.queue.append(data)
+        self.ready.set()
+
+    async def run(self):
+        while True:
+            while not self.queue:
+                self.ready.clear()
+                await self.ready.wait()
+
+            data = self.queue.popleft()
+            self.space.set()
+
+            try:
+                if isinstance(data, bytes):
+                    await self.ws.send_bytes(data)
+                else:
+                    await self.ws.send_json(data)
+                self.sent += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Error sending message to client {self.sid}: {str(e)}")
+                if self.ws.closed:
+                    break
+
+    def disconnect_stalled(self):
+        # never block the producers on a single slow client
+        logger.warning(f"Client {self.sid} stopped reading its messages, disconnecting it")
+        self.stalled = True
+        self.closed = True
+        self.space.set()
+        asyncio.create_task(self.ws.close())
+
+    async def close(self):
+        self.closed = True
+        self.space.set()
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+    def stats(self):
+        return {
+            'queued': len(self.queue),
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'stalled': self.stalled,
+        }
+
+class ClientQueues:
+    def __init__(self, max_size=256, timeout=10):
+        """
+        Route outbound messages to the per-client channels. Messages are in the form
+        `{ "client_id": sid, "data": message }`.
+        """
+        self.max_size = max_size
+        self.timeout = timeout
+        self.channels = {}
+
+    async def open(self, sid, ws):
+        await self.close(sid)
+        self.channels[sid] = ClientChannel(sid, ws, self.max_size, self.timeout)
+        return self.channels[sid]
+
+    async def close(self, sid, ws=None):
+        channel = self.channels.get(sid)
+        # a reconnecting client may have already replaced the channel
+        if channel is None or (ws is not None and channel.ws is not ws):
+            return
+
+        del self.channels[sid]
+        await channel.close()
+
+    async def put(self, message):
+        channel = self.channels.get(message["client_id"])
+        if channel is None:
+            logger.debug(f"Dropping message for disconnected client {message['client_id']}")
+            return
+
+        await channel.put(message["data"])
+
+    async def close_all(self):
+        for sid in list(self.channels.keys()):
+            await self.close(sid)
+
+    def stats(self):
+        return { sid: channel.stats() for sid, channel in self.channels.items() }
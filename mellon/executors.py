@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import config
+from utils.torch_utils import device_list
+import logging
+logger = logging.getLogger('mellon')
+
+class ExecutionPool:
+    def __init__(self, name, max_workers):
+        self.name = name
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"mellon-{name}")
+        self.lock = threading.Lock()
+
+        self.queued = 0         # tasks waiting for a free worker
+        self.peak_queued = 0    # highest queue depth observed
+        self.running = 0        # tasks currently executing
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0    # cumulative seconds spent executing tasks
+
+    def run(self, func, *args):
+        """
+        Run `func` in the pool and return an awaitable for its result.
+        """
+        return asyncio.get_running_loop().run_in_executor(self.executor, self.track(func, *args))
+
+    def submit(self, func, *args):
+        """
+        Same as `run` but can be called from any thread, returns a concurrent Future.
+        """
+        return self.executor.submit(self.track(func, *args))
+
+    def track(self, func, *args):
+        with self.lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        def task():
+            with self.lock:
+                self.queued -= 1
+                self.running += 1
+
+            start = time.perf_counter()
+            failed = False
+            try:
+                return func(*args)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self.lock:
+                    self.running -= 1
+                    self.completed += 1
+                    self.failed += failed
+                    self.busy_time += time.perf_counter() - start
+
+        return task
+
+    def stats(self):
+        with self.lock:
+            return {
+                'workers': self.max_workers,
+                'queued': self.queued,
+                'peak_queued': self.peak_queued,
+                'running': self.running,
+                'completed': self.completed,
+                'failed': self.failed,
+                'busy_time': round(self.busy_time, 3),
+            }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# gpu: node execution, by default one worker per device (and concurrent graph) so that each device lane can run in parallel
+# default: nodes that don't run on a device (api calls, tools...)
+# cpu: CPU-bound image and mesh nodes
+# io:  blocking file operations of the HTTP API
+# prefetch: model transfers ahead of the nodes, one at a time, they are bound by the bus bandwidth anyway
+execution_pools = {
+    'gpu': ExecutionPool('gpu', config.executors['gpu_workers'] or len(device_list) * config.app['concurrent_graphs']),
+    'default': ExecutionPool('default', config.executors['default_workers']),
+    'cpu': ExecutionPool('cpu', config.executors['cpu_workers']),
+    'io': ExecutionPool('io', config.executors['io_workers']),
+    'prefetch': ExecutionPool('prefetch', 1),
+}
+
+def get_pool(name):
+    if name not in execution_pools:
+        logger.warning(f"Unknown execution pool: {name}, using the gpu pool")
+        name = 'gpu'
+
+    return execution_pools[name]
@@ -1 +1,161 @@
- 
\ No newline at end of file
+import base64
+import bisect
+import json
+import os
+import threading
+from collections import OrderedDict
+import logging
+logger = logging.getLogger('mellon')
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.tif', '.tiff')
+
+def sort_key(name, is_dir):
+    # directories first, then case insensitive name, the exact name breaks the ties
+    return (not is_dir, name.lower(), name)
+
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def decode_cursor(cursor):
+    try:
+        is_file, lower, name = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (bool(is_file), str(lower), str(name))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+class DirectoryListing:
+    def __init__(self, path, version, entries):
+        """
+        Sorted snapshot of a directory, valid as long as the directory `version` doesn't change.
+        """
+        self.path = path
+        self.version = version
+        self.entries = entries
+        self.keys = [sort_key(e['name'], e['isDirectory']) for e in entries]
+        self.metadata = {}          # name -> { size, mtime, width, height }
+        self.metadata_task = None
+
+    @property
+    def metadata_ready(self):
+        return self.metadata_task is not None and self.metadata_task.done()
+
+    def page(self, cursor=None, limit=None, extensions=None, query=None):
+        start = bisect.bisect_right(self.keys, decode_cursor(cursor)) if cursor else 0
+        query = query.lower() if query else None
+
+        page = []
+        next_cursor = None
+        for i in range(start, len(self.entries)):
+            entry = self.entries[i]
+            if query and query not in entry['name'].lower():
+                continue
+            # directories are kept so that the browser can still navigate
+            if extensions and not entry['isDirectory'] and not entry['name'].lower().endswith(extensions):
+                continue
+            if limit and len(page) >= limit:
+                # the cursor is the sort key of the last entry, so it survives rescans of the directory
+                next_cursor = encode_cursor(sort_key(page[-1]['name'], page[-1]['isDirectory']))
+                break
+            page.append(entry)
+
+        return page, next_cursor
+
+class DirectoryIndex:
+    def __init__(self, max_directories=64):
+        """
+        Cache of the sorted directory listings used by the file browser.
+
+        A listing is rebuilt only when the directory mtime changes (files added, removed or renamed)
+        or when it is explicitly invalidated. Stat metadata is gathered in the background the first
+        time it is requested.
+        """
+        self.max_directories = max_directories
+        self.listings = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, path):
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def get(self, path):
+        """
+        Return the listing of `path`, rescanning the directory if it changed. Blocking, run it in the io pool.
+        """
+        key = os.path.abspath(path)
+        version = self.version(path)
+
+        with self.lock:
+            listing = self.listings.get(key)
+            if listing and listing.version == version:
+                self.hits += 1
+                self.listings.move_to_end(key)
+                return listing
+            self.misses += 1
+
+        listing = DirectoryListing(path, version, self.scan(path))
+
+        with self.lock:
+            self.listings[key] = listing
+            self.listings.move_to_end(key)
+            while len(self.listings) > self.max_directories:
+                self.listings.popitem(last=False)
+
+        return listing
+
+    def scan(self, path):
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                # skip the blob store and the staged uploads
+                if entry.name.startswith('.'):
+                    continue
+                entries.append({
+                    'name': entry.name,
+                    'isDirectory': entry.is_dir(),
+                    'path': os.path.join(path, entry.name).replace('\\', '/')
+                })
+        entries.sort(key=lambda x: sort_key(x['name'], x['isDirectory']))
+        return entries
+
+    def invalidate(self, path=None):
+        with self.lock:
+            if path is None:
+                self.listings.clear()
+            else:
+                self.listings.pop(os.path.abspath(path), None)
+
+    def collect_metadata(self, listing):
+        """
+        Stat every entry of the listing, image dimensions are read from the file header only.
+        """
+        for entry in listing.entries:
+            if entry['name'] in listing.metadata:
+                continue
+
+            file_path = os.path.join(listing.path, entry['name'])
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+
+            metadata = { 'size': stat.st_size, 'mtime': stat.st_mtime }
+            if not entry['isDirectory'] and entry['name'].lower().endswith(IMAGE_EXTENSIONS):
+                try:
+                    from PIL import Image
+                    with Image.open(file_path) as image:
+                        metadata['width'], metadata['height'] = image.size
+                except Exception:
+                    pass
+
+            listing.metadata[entry['name']] = metadata
+
+    def stats(self):
+        with self.lock:
+            return {
+                'directories': len(self.listings),
+                'entries': sum(len(l.entries) for l in self.listings.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+import shutil
+import time
+from copy import deepcopy
+import nanoid
+from mellon.scheduler import GraphPlan
+from mellon.output_cache import write_output
+import logging
+logger = logging.getLogger('mellon')
+
+# queued -> running -> completed | failed | cancelled
+FINAL_STATES = ('completed', 'failed', 'cancelled')
+
+class Job:
+    def __init__(self, graph, overrides=None, sinks=None, sid=None):
+        """
+        A graph submitted through the job API. The graph is executed once for each set of overrides
+        (`{ node_id: { param: value } }`), the outputs of the `sinks` nodes are spooled to disk.
+        """
+        self.id = nanoid.generate(alphabet='0123456789abcdefghijklmnopqrstuvwxyz', size=16)
+        self.graph = graph
+        self.overrides = overrides or [{}]
+        self.sinks = sinks
+        # graph messages (progress, executed...) are sent to this websocket client, if connected
+        self.sid = sid or self.id
+
+        self.status = 'queued'
+        self.error = None
+        self.runs = [{ 'index': i, 'status': 'queued', 'outputs': {} } for i in range(len(self.overrides))]
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.changed = asyncio.Event()
+
+    def run_graph(self, index):
+        graph = deepcopy(self.graph)
+        for node, params in self.overrides[index].items():
+            for param, value in params.items():
+                graph['nodes'][node]['params'].setdefault(param, {})['value'] = value
+        graph['sid'] = self.sid
+        # the sinks are executed even if their dependents are served by the output cache
+        graph['sinks'] = self.sinks
+        return graph
+
+    def update(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self.notify()
+
+    def notify(self):
+        # wake up the long-polling clients
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    @property
+    def done(self):
+        return self.status in FINAL_STATES
+
+    def to_dict(self):
+        return {
+            'jobId': self.id,
+            'status': self.status,
+            'error': self.error,
+            'runs': self.runs,
+            'sinks': self.sinks,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+        }
+
+def check_node_id(node):
+    if not isinstance(node, str) or not node or '..' in node or '/' in node or '\\' in node or '\0' in node:
+        raise ValueError(f"Invalid node id: {node}")
+
+class JobManager:
+    def __init__(self, spool_path, max_finished=1000):
+        """
+        Registry of the submitted jobs, the results are written to `spool_path/<job_id>`.
+        """
+        self.spool_path = spool_path
+        self.max_finished = max_finished
+        self.jobs = {}
+
+    def create(self, data):
+        graph = data.get('graph')
+        if not isinstance(graph, dict) or not isinstance(graph.get('nodes'), dict):
+            raise ValueError("A graph with its nodes is required")
+
+        overrides = data.get('overrides') or [{}]
+        if isinstance(overrides, dict):
+            overrides = [overrides]
+
+        # validate everything now, a batch should not fail in the middle of the night
+        plan = GraphPlan(graph['nodes'], graph.get('paths'))
+        for override in overrides:
+            for node, params in override.items():
+                if node not in graph['nodes']:
+                    raise ValueError(f"Override for unknown node: {node}")
+                if not isinstance(params, dict):
+                    raise ValueError(f"Overrides of node {node} must be an object")
+
+        sinks = data.get('sinks') or plan.sinks()
+        for node in sinks:
+            if node not in plan.dependencies:
+                raise ValueError(f"Sink node {node} is not part of the graph")
+            # the sink id is used as directory name in the spool
+            check_node_id(node)
+
+        job = Job(graph, overrides, sinks, data.get('sid'))
+        self.jobs[job.id] = job
+        self.prune()
+        return job
+
+    def get(self, job_id):
+        if job_id not in self.jobs:
+            raise KeyError(job_id)
+        return self.jobs[job_id]
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if not job.done:
+            # a running job stops after the current run
+            job.update(status='cancelled', finished=time.time())
+        return job
+
+    def prune(self):
+        finished = [job for job in self.jobs.values() if job.done]
+        for job in sorted(finished, key=lambda j: j.finished)[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job.id]
+
+    def stats(self):
+        stats = {}
+        for job in self.jobs.values():
+            stats[job.status] = stats.get(job.status, 0) + 1
+        return stats
+
+    def job_path(self, job_id):
+        return os.path.join(self.spool_path, job_id)
+
+    def spool_path_of(self, job_id, run, node):
+        check_node_id(node)
+        job_path = os.path.realpath(self.job_path(job_id))
+        path = os.path.realpath(os.path.join(job_path, f"{run:04d}", node))
+        if os.path.commonpath([job_path, path]) != job_path or path == job_path:
+            raise ValueError(f"Invalid node id: {node}")
+        return path
+
+    def write_status(self, job):
+        path = self.job_path(job.id)
+        os.makedirs(path, exist_ok=True)
+        temp_path = os.path.join(path, '.job.json')
+        with open(temp_path, 'w') as f:
+            json.dump(job.to_dict(), f, indent=2)
+        os.replace(temp_path, os.path.join(path, 'job.json'))
+
+    def spool_output(self, job, run, node, output):
+        """
+        Write the output of a sink node, values that can't be serialized (eg: models) are skipped.
+        """
+        path = self.spool_path_of(job.id, run, node)
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        write_output(path, output, partial=True)
+        return os.path.relpath(path, os.path.realpath(self.spool_path)).replace('\\', '/')
@@ -0,0 +1,350 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from utils.hash_utils import fingerprint, combine_fingerprints
+import logging
+logger = logging.getLogger('mellon')
+
+MANIFEST = 'manifest.json'
+TENSORS = 'tensors.safetensors'
+
+# entries are written in a temporary directory renamed when complete, possibly by another process
+TEMP_PREFIX = '.tmp-'
+# seconds after which a temporary directory is considered left over by a crash
+TEMP_GRACE = 3600
+
+# PIL modes that survive a PNG round trip unchanged
+PNG_MODES = ('1', 'L', 'LA', 'P', 'RGB', 'RGBA', 'I', 'I;16')
+
+class NotSerializable(Exception):
+    pass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the web server, the node events and the module registry don't change what a node computes
+NOT_VERSIONED = ('mellon.server', 'mellon.progress', 'modules')
+
+code_versions = {}
+
+def local_modules(module, found=None):
+    """
+    The module and, recursively, the modules of this repository it imports from (NodeBase, utils...).
+    """
+    found = {} if found is None else found
+    try:
+        path = os.path.abspath(inspect.getfile(module))
+    except TypeError:
+        return found
+    if module.__name__ in found or module.__name__ in NOT_VERSIONED or not path.startswith(ROOT + os.sep):
+        return found
+
+    found[module.__name__] = path
+    for value in list(vars(module).values()):
+        name = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, '__module__', None)
+        if isinstance(name, str) and name in sys.modules:
+            local_modules(sys.modules[name], found)
+    return found
+
+def code_version(module_name, cls, entry):
+    """
+    Version of a node implementation: its schema and the source of the module that defines it and of
+    the modules of this repository it uses. Any edit to those files invalidates the cached outputs.
+    Third party libraries (torch, diffusers...) are not part of it, bump the `version` of the
+    MODULE_MAP entry when an upgrade changes the outputs.
+    """
+    if cls in code_versions:
+        return code_versions[cls]
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{module_name}.{cls.__name__}:{entry.get('version', '')}:".encode())
+    try:
+        for name, path in sorted(local_modules(sys.modules[cls.__module__]).items()):
+            with open(path, 'rb') as f:
+                h.update(name.encode())
+                h.update(f.read())
+    except (OSError, KeyError):
+        h.update(cls.__qualname__.encode())
+
+    defaults = { p: repr(v.get('default')) for p, v in entry.get('params', {}).items() }
+    h.update(json.dumps(defaults, sort_keys=True).encode())
+    code_versions[cls] = h.hexdigest()
+    return code_versions[cls]
+
+class CachePlan:
+    def __init__(self):
+        """
+        Result of the cache lookup of a graph, built before the execution.
+        """
+        self.keys = {}          # node -> cache key, None if the node can't be cached
+        self.outputs = {}       # node -> output loaded from the cache
+        self.skipped = set()    # upstream nodes needed only by cache hits
+
+class OutputCache:
+    def __init__(self, path, max_size):
+        """
+        Persistent, content addressed store of node outputs.
+
+        Each entry is a directory named after the cache key with a JSON manifest, the tensors in a
+        single safetensors file and the images as PNG. The total size is bounded, the least recently
+        used entries are evicted first.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.entries = {}       # key -> (size, last access)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+
+        os.makedirs(self.path, exist_ok=True)
+        self.load_index()
+
+    def load_index(self):
+        for key in os.listdir(self.path):
+            entry = os.path.join(self.path, key)
+            if key.startswith(TEMP_PREFIX):
+                try:
+                    if time.time() - os.stat(entry).st_mtime > TEMP_GRACE:
+                        shutil.rmtree(entry, ignore_errors=True)
+                except OSError:
+                    pass
+                continue
+
+            manifest = os.path.join(entry, MANIFEST)
+            if not os.path.exists(manifest):
+                # incomplete write, the manifest is always the last file written
+                shutil.rmtree(entry, ignore_errors=True)
+                continue
+
+            size = sum(f.stat().st_size for f in os.scandir(entry) if f.is_file())
+            self.entries[key] = (size, os.stat(manifest).st_mtime)
+            self.size += size
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key)
+
+    def contains(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def get(self, key):
+        """
+        Load the output stored under `key`, None if missing or unreadable.
+        """
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+
+        entry = self.entry_path(key)
+        try:
+            output = read_output(entry)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable output cache entry {key}: {str(e)}")
+            self.remove(key)
+            with self.lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        os.utime(os.path.join(entry, MANIFEST), (now, now))
+        with self.lock:
+            self.hits += 1
+            if key in self.entries:
+                self.entries[key] = (self.entries[key][0], now)
+
+        return output
+
+    def put(self, key, output):
+        """
+        Store a node output. Outputs that contain anything other than tensors, images and plain values
+        (eg: models) are not stored. Returns True if the output was stored.
+        """
+        if self.contains(key):
+            return True
+
+        os.makedirs(self.path, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=self.path, prefix=TEMP_PREFIX)
+        try:
+            size = write_output(temp_dir, output)
+            if size > self.max_size:
+                raise NotSerializable(f"output is larger than the cache ({size} bytes)")
+
+            if os.path.exists(self.entry_path(key)):
+                # stored in the meantime by another graph
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return True
+            os.replace(temp_dir, self.entry_path(key))
+        except NotSerializable as e:
+            logger.debug(f"Output {key} not cached: {str(e)}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return False
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        with self.lock:
+            self.entries[key] = (size, time.time())
+            self.size += size
+            self.stored += 1
+
+        self.evict()
+        return True
+
+    def evict(self):
+        while True:
+            with self.lock:
+                if self.size <= self.max_size or not self.entries:
+                    return
+                key = min(self.entries, key=lambda k: self.entries[k][1])
+                self.evicted += 1
+            self.remove(key)
+
+    def remove(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)[0]
+        shutil.rmtree(self.entry_path(key), ignore_errors=True)
+
+    def clear(self):
+        for key in list(self.entries.keys()):
+            self.remove(key)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'size': self.size,
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stored': self.stored,
+                'evicted': self.evicted,
+            }
+
+def write_output(path, output, partial=False):
+    """
+    Write a node output in the `path` directory: tensors in a single safetensors file, images as PNG
+    and everything else in the JSON manifest, written last. Returns the total size in bytes.
+
+    Raises NotSerializable if the output contains other objects (eg: models), with `partial` those
+    outputs are left out and listed in the manifest instead.
+    """
+    tensors = {}
+    encoded = {}
+    skipped = []
+    if partial and isinstance(output, dict):
+        for key, value in output.items():
+            try:
+                encoded[key] = encode_value(value, path, tensors)
+            except NotSerializable:
+                skipped.append(key)
+        encoded = { '$dict': encoded }
+    else:
+        encoded = encode_value(output, path, tensors)
+
+    if tensors:
+        from safetensors.torch import save_file
+        save_file(tensors, os.path.join(path, TENSORS))
+
+    with open(os.path.join(path, MANIFEST), 'w') as f:
+        json.dump({
+            'output': encoded,
+            'tensors': len(tensors),
+            'skipped': skipped,
+            'created': time.time(),
+        }, f)
+
+    return sum(f.stat().st_size for f in os.scandir(path) if f.is_file())
+
+def read_output(path):
+    with open(os.path.join(path, MANIFEST), 'r') as f:
+        manifest = json.load(f)
+
+    tensors = {}
+    if manifest['tensors']:
+        from safetensors.torch import load_file
+        tensors = load_file(os.path.join(path, TENSORS))
+
+    return decode_value(manifest['output'], path, tensors)
+
+def encode_value(value, path, tensors):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return { '$list' if isinstance(value, list) else '$tuple': [encode_value(v, path, tensors) for v in value] }
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise NotSerializable("dict with non string keys")
+        return { '$dict': { k: encode_value(v, path, tensors) for k, v in value.items() } }
+
+    import torch
+
+    if isinstance(value, torch.Tensor):
+        name = f"t{len(tensors)}"
+        tensors[name] = value.detach().to('cpu', copy=True).contiguous()
+        # plain attributes set on the tensor (eg: `_denoising_end` of the SDXL latents), not the memoized digests
+        attributes = { k: v for k, v in vars(value).items() if not k.startswith('_mellon_') and (v is None or isinstance(v, (bool, int, float, str))) }
+        return { '$tensor': name, 'device': str(value.device), 'attributes': attributes }
+    if hasattr(value, 'getdata') and hasattr(value, 'mode') and hasattr(value, 'save'):
+        if value.mode not in PNG_MODES:
+            raise NotSerializable(f"image mode {value.mode}")
+        name = f"i{len(os.listdir(path))}.png"
+        value.save(os.path.join(path, name), format='PNG', compress_level=1)
+        return { '$image': name }
+
+    raise NotSerializable(type(value).__qualname__)
+
+def decode_value(value, path, tensors):
+    if not isinstance(value, dict):
+        return value
+    if '$list' in value:
+        return [decode_value(v, path, tensors) for v in value['$list']]
+    if '$tuple' in value:
+        return tuple(decode_value(v, path, tensors) for v in value['$tuple'])
+    if '$dict' in value:
+        return { k: decode_value(v, path, tensors) for k, v in value['$dict'].items() }
+    if '$tensor' in value:
+        from utils.torch_utils import device_list
+        tensor = tensors[value['$tensor']]
+        tensor = tensor.to(value['device']) if value['device'] in device_list else tensor
+        for k, v in value.get('attributes', {}).items():
+            setattr(tensor, k, v)
+        return tensor
+    if '$image' in value:
+        from PIL import Image
+        with Image.open(os.path.join(path, value['$image'])) as image:
+            image.load()
+            return image
+
+    raise ValueError(f"Unknown cache value: {value}")
+
+def node_cache_key(module_name, action_name, cls, entry, params, upstream_keys):
+    """
+    Cache key of a node: its implementation, its own param values and, for the connected inputs,
+    the cache keys of the upstream nodes. Returns None if the node can't be cached.
+    """
+    parts = [module_name, action_name, code_version(module_name, cls, entry)]
+    for name in sorted(params):
+        param = params[name]
+        source_id = param.get('sourceId')
+        if source_id:
+            if upstream_keys.get(source_id) is None:
+                return None
+            parts.append(f"{name}<-{upstream_keys[source_id]}.{param.get('sourceKey')}")
+        else:
+            # randomized fields get a new value on every run
+            if name.startswith('__random__') and param.get('value') is True:
+                return None
+            parts.append(f"{name}={fingerprint(param.get('value'))}")
+
+    return combine_fingerprints('node', parts)
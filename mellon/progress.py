@@ -0,0 +1,51 @@
+import threading
+
+class ProgressCoalescer:
+    def __init__(self):
+        """
+        Collect progress updates coming from the node execution threads. Only the latest value
+        of each (client, node) pair is kept until the next flush.
+        """
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def update(self, client_id, node_id, progress):
+        with self.lock:
+            self.pending[(client_id, node_id)] = progress
+
+    def discard(self, client_id, node_id):
+        with self.lock:
+            self.pending.pop((client_id, node_id), None)
+
+    def flush(self):
+        """
+        Return the pending updates grouped by client: `{ client_id: { node_id: progress } }`
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+
+        updates = {}
+        for (client_id, node_id), progress in pending.items():
+            updates.setdefault(client_id, {})[node_id] = progress
+
+        return updates
+
+class NodeEvents:
+    def __init__(self):
+        """
+        Where the nodes report their progress and live previews. The web server installs its own
+        handlers at startup, the worker processes install handlers that forward to the coordinator.
+        Until then the events are dropped.
+        """
+        self.on_progress = None
+        self.on_preview = None
+
+    def progress(self, client_id, node_id, progress):
+        if self.on_progress:
+            self.on_progress(client_id, node_id, progress)
+
+    def preview(self, client_id, node_id, step, image):
+        if self.on_preview:
+            self.on_preview(client_id, node_id, step, image)
+
+node_events = NodeEvents()
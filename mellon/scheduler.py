@@ -0,0 +1,81 @@
+import heapq
+import logging
+logger = logging.getLogger('mellon')
+
+def get_dependencies(node):
+    # the upstream nodes are referenced by the `sourceId` of the connected params
+    return { p['sourceId'] for p in node['params'].values() if isinstance(p, dict) and p.get('sourceId') }
+
+class GraphPlan:
+    def __init__(self, nodes, paths=None):
+        """
+        Build the execution plan of a submitted graph.
+
+        `nodes` is the `{ node_id: { module, action, params } }` lookup sent by the client, `paths` the
+        optional list of node paths to execute. Each node is scheduled exactly once, in dependency order,
+        even if it is shared by multiple paths.
+        """
+        if paths is None:
+            paths = [list(nodes.keys())]
+
+        # keep track of how many times a node is requested and of the order the client sent them
+        self.requested = {}
+        rank = {}
+        for path in paths:
+            for node in path:
+                self.requested[node] = self.requested.get(node, 0) + 1
+                if node not in rank:
+                    rank[node] = len(rank)
+
+        # include the upstream dependencies even if the client didn't list them
+        self.dependencies = {}
+        stack = list(rank.keys())
+        while stack:
+            node = stack.pop()
+            if node in self.dependencies:
+                continue
+            if node not in nodes:
+                raise ValueError(f"Node {node} not found in the graph")
+
+            self.dependencies[node] = get_dependencies(nodes[node])
+            for dep in self.dependencies[node]:
+                if dep not in rank:
+                    rank[dep] = len(rank)
+                stack.append(dep)
+
+        self.dependents = { node: set() for node in self.dependencies }
+        for node, deps in self.dependencies.items():
+            for dep in deps:
+                self.dependents[dep].add(node)
+
+        # Kahn's algorithm, ties are broken by the order the nodes were submitted
+        indegree = { node: len(deps) for node, deps in self.dependencies.items() }
+        ready = [(rank[node], node) for node, count in indegree.items() if count == 0]
+        heapq.heapify(ready)
+
+        self.order = []
+        while ready:
+            _, node = heapq.heappop(ready)
+            self.order.append(node)
+            for dependent in self.dependents[node]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, (rank[dependent], dependent))
+
+        if len(self.order) != len(self.dependencies):
+            cycle = [node for node, count in indegree.items() if count > 0]
+            raise ValueError(f"The graph contains a cycle between nodes: {', '.join(cycle)}")
+
+    @property
+    def deduplicated(self):
+        # nodes that were requested by more than one path but are executed only once
+        return { node: count - 1 for node, count in self.requested.items() if count > 1 }
+
+    def sinks(self):
+        return [node for node in self.order if not self.dependents[node]]
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
@@ -5,32 +5,58 @@ import nanoid
 import io
 import base64
 import re
-from importlib import import_module
 import asyncio
 import traceback
-from utils.memory_manager import memory_flush
-from copy import deepcopy
+from contextlib import asynccontextmanager, nullcontext
+from utils.memory_manager import memory_flush, memory_manager, model_ids
+from utils.torch_utils import device_list
 import random
 import signal
 import time
 import os
 import gc
+import gzip
 from pathlib import Path
-import tempfile
-
-def are_different(old_output, new_output):
-    """Compare two outputs to determine if they are different."""
-    if old_output is None or new_output is None:
-        return old_output is not new_output
-    if isinstance(old_output, dict) and isinstance(new_output, dict):
-        if old_output.keys() != new_output.keys():
+from mellon.scheduler import GraphPlan
+from mellon.executors import execution_pools, get_pool
+from mellon.view_cache import ViewCache, encode_image
+from mellon.progress import ProgressCoalescer, node_events
+from mellon.client_queues import ClientQueues
+from mellon.uploads import UploadStore, DEFAULT_CHUNK_SIZE
+from mellon.file_browser import DirectoryIndex
+from mellon.output_cache import OutputCache, CachePlan, node_cache_key
+from mellon.jobs import JobManager
+from mellon.sweep import SweepPlan, base_node
+from mellon.batcher import sampler_batcher
+from mellon.workers import WorkerPool
+from mellon.warm_pool import WarmPool
+from modules import load_implementation, warm_up, import_report
+from utils.hash_utils import bytes_fingerprint, stamp_output
+from config import config
+import logging
+logger = logging.getLogger('mellon')
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# generated files (eg: rendered videos) are named after a uuid4
+GENERATED_FILE_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+def etag_matches(etag, if_none_match):
+    """
+    If-None-Match uses the weak comparison: the W/ prefix is ignored and "*" matches any etag.
+    """
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
             return True
-        return any(are_different(old_output[k], new_output[k]) for k in old_output)
-    if isinstance(old_output, (list, tuple)) and isinstance(new_output, (list, tuple)):
-        if len(old_output) != len(new_output):
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
             return True
-        return any(are_different(o, n) for o, n in zip(old_output, new_output))
-    return old_output != new_output
+    return False
 
 class WebServer:
     def __init__(
@@ -44,28 +70,58 @@ class WebServer:
         self.module_map = module_map
         self.node_store = {}
         self.queue = asyncio.Queue()
-        self.queue_task = None
+        self.queue_tasks = []
+        self.client_locks = {}
         self.host = host
         self.port = port
         self.ws_clients = {}
         self.app = web.Application()
         self.event_loop = None
 
-        self.client_queue = asyncio.Queue()
-        self.client_task = None
+        # each websocket client has its own bounded outbound queue
+        self.client_queue = ClientQueues(config.app['client_queue_size'], config.app['client_send_timeout'])
+
+        self.progress = ProgressCoalescer()
+        self.progress_task = None
+        node_events.on_progress = self.progress.update
+        node_events.on_preview = self.send_preview
+
+        self.device_lanes = {}
+        self.view_cache = ViewCache(config.app['view_cache_size'] * 1024**2)
+        self.node_catalogue = None
+        self.build_node_catalogue()
+        self.upload_store = UploadStore(os.path.join(os.getcwd(), 'data', 'files'))
+        self.file_index = DirectoryIndex()
+        self.jobs = JobManager(config.paths['spool'])
+        # worker mode, the nodes are executed in one process per device
+        self.workers = WorkerPool(config.workers['timeout']) if config.workers['enabled'] else None
+        self.warm_pool = WarmPool(config.warm_pool)
+        self.output_cache = OutputCache(config.paths['cache'], int(config.cache['max_size'] * 1024**3)) if config.cache['enabled'] else None
 
         self.app.add_routes([
             web.get('/', self.index),
             web.get('/nodes', self.nodes),
+            web.get('/stats', self.stats),
+            web.get('/warmPool', self.warm_pool_status),
             web.get('/view/{format}/{node}/{key}/{index}', self.view),
             web.get('/view/{format}/{node}/{key}', self.view),
             web.get('/custom_component/{module}/{component}', self.custom_component),
             web.get('/custom_assets/{module}/{file_path}', self.custom_assets),
             web.get('/files', self.list_files),
             web.post('/data/files', self.upload_file),
+            web.post('/data/uploads', self.upload_create),
+            web.get('/data/uploads/{upload_id}', self.upload_status),
+            web.put('/data/uploads/{upload_id}/{index}', self.upload_part),
+            web.post('/data/uploads/{upload_id}/complete', self.upload_complete),
+            web.delete('/data/uploads/{upload_id}', self.upload_abort),
             web.get('/data/files/{filename}', self.get_file),
             web.delete('/data/files/{filename}', self.delete_file),
             web.post('/graph', self.graph),
+            web.post('/jobs', self.job_create),
+            web.get('/jobs', self.job_list),
+            web.get('/jobs/{job_id}', self.job_status),
+            web.delete('/jobs/{job_id}', self.job_cancel),
+            web.get('/jobs/{job_id}/spool/{path:.*}', self.job_spool_file),
             web.post('/nodeExecute', self.node_execute),
             web.delete('/clearNodeCache', self.clear_node_cache),
             web.static('/assets', 'web/assets'),
@@ -107,6 +163,13 @@ class WebServer:
                 except Exception:
                     pass  # Ignore any websocket closing errors
             self.ws_clients.clear()
+            await self.client_queue.close_all()
+
+            for pool in execution_pools.values():
+                pool.shutdown()
+
+            if self.workers:
+                self.workers.shutdown()
 
         async def start_app():
             self.shutdown_event = asyncio.Event()
@@ -130,11 +193,22 @@ class WebServer:
             site = web.TCPSite(runner, self.host, self.port)
 
             # Start background tasks
-            self.queue_task = asyncio.create_task(self.process_queue())
-            self.client_task = asyncio.create_task(self.process_client_messages())
+            # graphs of different clients can run concurrently, see `concurrent_graphs`
+            self.queue_tasks = [asyncio.create_task(self.process_queue()) for _ in range(config.app['concurrent_graphs'])]
+            self.progress_task = asyncio.create_task(self.process_progress())
 
             await site.start()
 
+            # import the implementations of the node modules in the background, the server is already answering
+            if config.app['warm_up']:
+                warm_up(None if config.app['warm_up'] == '*' else [m.strip() for m in config.app['warm_up'].split(',')])
+
+            # preload the models of the warm pool, the clients are notified after each entry
+            self.warm_pool.start(
+                self.create_warm_node,
+                lambda: asyncio.run_coroutine_threadsafe(self.broadcast({ "type": "warmPool", **self.warm_pool.stats() }), self.event_loop),
+            )
+
             try:
                 await self.shutdown_event.wait()
             finally:
@@ -148,27 +222,34 @@ class WebServer:
         except asyncio.CancelledError:
             pass
 
-    async def process_client_messages(self):
+    async def process_progress(self):
+        # progress updates are coalesced and sent at most once per interval for each client
+        interval = config.app['progress_interval'] / 1000
         while True:
-            message = await self.client_queue.get()
-            # print("LOOKIE HERE")
-            # print(f"message: {message}")
-            try:
-                await self.ws_clients[message["client_id"]].send_json(message["data"])
-            except Exception as e:
-                # logger.error(f"Error sending client message: {str(e)}")
-                pass # Silently ignore errors for now
-            finally:
-                self.client_queue.task_done()
+            await asyncio.sleep(interval)
+            for client_id, updates in self.progress.flush().items():
+                if len(updates) == 1:
+                    node_id, progress = next(iter(updates.items()))
+                    data = { "type": "progress", "nodeId": node_id, "progress": progress }
+                else:
+                    data = {
+                        "type": "progressBatch",
+                        "updates": [{ "nodeId": node_id, "progress": progress } for node_id, progress in updates.items()],
+                    }
+                await self.client_queue.put({ "client_id": client_id, "data": data })
 
     async def process_queue(self):
         while True:
             item = await self.queue.get()
             try:
-                if "kwargs" in item:
-                    await self.node_execute_single(item)
-                else:
-                    await self.graph_execution(item)
+                sid = item["job"].sid if "job" in item else item.get("sid")
+                async with self.client_lock(sid):
+                    if "job" in item:
+                        await self.job_execution(item["job"])
+                    elif "kwargs" in item:
+                        await self.node_execute_single(item)
+                    else:
+                        await self.graph_execution(item)
             except Exception as e:
                 # logger.error(f"Error processing queue task: {str(e)}")
                 # logger.error(f"Error occurred in {traceback.format_exc()}")
@@ -179,6 +260,22 @@ class WebServer:
             finally:
                 self.queue.task_done()
 
+    @asynccontextmanager
+    async def client_lock(self, sid):
+        # the graphs of a client share its nodes, they are always executed in order
+        lock, users = self.client_locks.get(sid, (None, 0))
+        lock = lock or asyncio.Lock()
+        self.client_locks[sid] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self.client_locks[sid]
+            if users > 1:
+                self.client_locks[sid] = (lock, users - 1)
+            else:
+                del self.client_locks[sid]
+
     async def index(self, request):
         response = web.FileResponse('web/index.html')
         response.headers["Cache-Control"] = "no-cache"
@@ -214,18 +311,18 @@ class WebServer:
         file_path = request.match_info.get('file_path')
         return web.FileResponse(f'custom/{module}/web/assets/{file_path}')
 
-    async def nodes(self, request):
-        from copy import deepcopy
+    def build_node_catalogue(self):
+        """
+        Serialize the node schemas once, MODULE_MAP doesn't change after startup.
+        Call it again after reloading the modules.
+        """
         nodes = {}
         for module_name, actions in self.module_map.items():
             for action_name, action in actions.items():
                 params = {}
                 groups = {}
                 if 'params' in action:
-                    params = deepcopy(action['params'])
-                    for p in params:
-                        if 'postProcess' in params[p]:
-                            del params[p]['postProcess']
+                    params = { p: { k: v for k, v in param.items() if k != 'postProcess' } for p, param in action['params'].items() }
 
                 nodes[f"{module_name}-{action_name}"] = {
                     "label": action.get('label', f"{module_name}: {action_name}"),
@@ -243,7 +340,36 @@ class WebServer:
                 if 'type' in action:
                     nodes[f"{module_name}-{action_name}"]["type"] = action['type']
 
-        return web.json_response(nodes)
+        body = json.dumps(nodes).encode('utf-8')
+        digest = bytes_fingerprint(body)
+
+        # one body (and one strong ETag) per content encoding
+        catalogue = { 'identity': (body, f'"{digest}"') }
+        catalogue['gzip'] = (gzip.compress(body, compresslevel=9), f'"{digest}-gzip"')
+        if brotli is not None:
+            catalogue['br'] = (brotli.compress(body), f'"{digest}-br"')
+
+        self.node_catalogue = catalogue
+        logger.debug(f"Node catalogue: {len(nodes)} nodes, {len(body)} bytes")
+
+    async def nodes(self, request):
+        accept_encoding = request.headers.get('Accept-Encoding', '')
+        accepted = { e.split(';')[0].strip().lower() for e in accept_encoding.split(',') }
+        encoding = next((e for e in ('br', 'gzip') if e in accepted and e in self.node_catalogue), 'identity')
+        body, etag = self.node_catalogue[encoding]
+
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        if etag_matches(etag, request.headers.get('If-None-Match', '')):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(body=body, content_type='application/json', headers=headers)
     
     async def view(self, request):
         # Added "json" to allowed_formats so we can handle raw JSON
@@ -285,24 +411,28 @@ class WebServer:
 
         # If it's an image-like object:
         if format in ["webp","png","jpeg"]:
-            from PIL.Image import Resampling
-            if scale != 1:
-                width = int(value.width * scale)
-                height = int(value.height * scale)
-                value = value.resize((max(width, 1), max(height, 1)), resample=Resampling.BICUBIC)
+            # the fingerprint of the output is computed once per execution, encoding is CPU bound, keep both off the event loop
+            fingerprint = node._output_fingerprint or await execution_pools['cpu'].run(node._get_output_fingerprint)
+            etag = f'"{fingerprint}-{key}-{index}-{format}-{quality}-{scale:g}"'
+            headers = {
+                "Content-Disposition": f"inline; filename={filename}",
+                "ETag": etag,
+                # the content can be cached forever only if the url is bound to the content hash
+                "Cache-Control": "max-age=31536000, immutable" if request.rel_url.query.get("h") == fingerprint else "no-cache",
+            }
 
-            byte_arr = io.BytesIO()
-            value.save(byte_arr, format=format.upper(), quality=quality)
-            byte_arr = byte_arr.getvalue()
-            return web.Response(
-                body=byte_arr,
-                content_type="image/webp",
-                headers={
-                    "Content-Disposition": f"inline; filename={filename}",
-                    "Content-Length": str(len(byte_arr)),
-                    "Cache-Control": "max-age=31536000, immutable",
-                }
-            )
+            if etag_matches(etag, request.headers.get("If-None-Match", "")):
+                return web.Response(status=304, headers=headers)
+
+            cache_key = (fingerprint, key, index, format, quality, scale)
+            cached = self.view_cache.get(cache_key)
+            if cached is None:
+                body = await execution_pools['cpu'].run(encode_image, value, format, quality, scale)
+                cached = (body, f"image/{format}")
+                self.view_cache.put(cache_key, *cached)
+
+            body, content_type = cached
+            return web.Response(body=body, content_type=content_type, headers=headers)
         elif format == "glb":
             byte_arr = io.BytesIO()
             byte_arr.write(value)
@@ -324,6 +454,30 @@ class WebServer:
             # print(f"sent_to_client: {value}")
             return web.json_response(value)
 
+    async def stats(self, request):
+        return web.json_response({
+            "executors": { name: pool.stats() for name, pool in execution_pools.items() },
+            "view_cache": self.view_cache.stats(),
+            "clients": self.client_queue.stats(),
+            "file_index": self.file_index.stats(),
+            "output_cache": self.output_cache.stats() if self.output_cache else None,
+            "shared_models": memory_manager.shared_stats(),
+            "memory": memory_manager.memory_stats(),
+            "jobs": self.jobs.stats(),
+            "batching": sampler_batcher.stats(),
+            "workers": self.workers.stats() if self.workers else None,
+            "modules": import_report(),
+            "warm_pool": self.warm_pool.stats(),
+        })
+
+    async def warm_pool_status(self, request):
+        return web.json_response(self.warm_pool.stats())
+
+    def create_warm_node(self, node_id, module_name, action_name):
+        if self.workers:
+            return self.workers.node(node_id, module_name, action_name)
+        return self.get_node_class(module_name, action_name)(node_id)
+
     async def clear_node_cache(self, request):
         data = await request.json()
         nodeId = []
@@ -333,7 +487,9 @@ class WebServer:
         else:
             nodeId = list(self.node_store.keys())
 
-        for n in nodeId:
+        # the sweep variants of the nodes go with them
+        variants = [n for n in self.node_store if base_node(n) != n and base_node(n) in nodeId]
+        for n in nodeId + variants:
             if n in self.node_store:
                 self.node_store[n] = None
                 del self.node_store[n]
@@ -353,6 +509,111 @@ class WebServer:
             "sid": graph["sid"]
         })
 
+    async def job_create(self, request):
+        """
+        Submit a graph for headless execution.
+        Body: { graph: { nodes, paths? }, overrides?: [{ node_id: { param: value } }], sinks?: [node_id], sid? }
+        """
+        try:
+            data = await request.json()
+            job = self.jobs.create(data)
+        except (ValueError, TypeError, AttributeError) as e:
+            raise web.HTTPBadRequest(text=str(e))
+
+        await execution_pools['io'].run(self.jobs.write_status, job)
+        await self.queue.put({ "job": job })
+        return web.json_response(job.to_dict())
+
+    async def job_list(self, request):
+        return web.json_response({
+            "jobs": [{ "jobId": job.id, "status": job.status, "created": job.created } for job in self.jobs.jobs.values()]
+        })
+
+    async def job_status(self, request):
+        try:
+            job = self.jobs.get(request.match_info['job_id'])
+        except KeyError:
+            raise web.HTTPNotFound(text="Job not found")
+
+        # long polling, return as soon as something changes
+        try:
+            wait = min(float(request.query.get('wait', 0)), 60)
+        except ValueError:
+            raise web.HTTPBadRequest(text="Invalid wait")
+        if wait > 0 and not job.done:
+            try:
+                await asyncio.wait_for(job.changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+        return web.json_response(job.to_dict())
+
+    async def job_cancel(self, request):
+        try:
+            job = self.jobs.cancel(request.match_info['job_id'])
+        except KeyError:
+            raise web.HTTPNotFound(text="Job not found")
+
+        await self.send_job_status(job)
+        return web.json_response(job.to_dict())
+
+    async def job_spool_file(self, request):
+        base_path = os.path.realpath(self.jobs.job_path(request.match_info['job_id']))
+        file_path = os.path.realpath(os.path.join(base_path, request.match_info['path']))
+        if not file_path.startswith(base_path + os.sep):
+            raise web.HTTPForbidden(text="Access to this file is not allowed")
+        if not os.path.isfile(file_path):
+            raise web.HTTPNotFound(text="File not found")
+
+        return web.FileResponse(file_path)
+
+    async def send_job_status(self, job):
+        job.notify()
+        await execution_pools['io'].run(self.jobs.write_status, job)
+        await self.client_queue.put({
+            "client_id": job.sid,
+            "data": { "type": "jobStatus", **job.to_dict() }
+        })
+
+    async def job_execution(self, job):
+        if job.done:
+            # cancelled while queued
+            return
+
+        job.status = 'running'
+        job.started = time.time()
+        await self.send_job_status(job)
+
+        for run in job.runs:
+            if job.status == 'cancelled':
+                break
+
+            run['status'] = 'running'
+            await self.send_job_status(job)
+
+            async def spool(node):
+                # the sink outputs are written as soon as they are ready
+                if base_node(node) in job.sinks and node in self.node_store:
+                    run['outputs'][node] = await execution_pools['io'].run(
+                        self.jobs.spool_output, job, run['index'], node, self.node_store[node].output
+                    )
+                    await self.send_job_status(job)
+
+            try:
+                await self.graph_execution(job.run_graph(run['index']), spool)
+                run['status'] = 'completed'
+            except Exception as e:
+                logger.error(f"Job {job.id} run {run['index']} failed: {str(e)}")
+                run['status'] = 'failed'
+                run['error'] = str(e)
+
+        if job.status != 'cancelled':
+            failed = sum(run['status'] == 'failed' for run in job.runs)
+            job.status = 'failed' if failed else 'completed'
+            job.error = f"{failed} of {len(job.runs)} runs failed" if failed else None
+        job.finished = time.time()
+        await self.send_job_status(job)
+
     async def node_execute(self, request):
         data = await request.json()
         await self.queue.put(data)
@@ -368,16 +629,7 @@ class WebServer:
         kwargs = data["kwargs"]
         node = data["node"]
 
-        if module not in self.module_map:
-            raise ValueError("Invalid module")
-        if action not in self.module_map[module]:
-            raise ValueError("Invalid action")
-
-        if module.endswith(".custom"):
-            module_import = import_module(f"custom.{module.replace('.custom', '')}.{module.replace('.custom', '')}")
-        else:
-            module_import = import_module(f"modules.{module}.{module}")
-        action_func = getattr(module_import, action)
+        action_func = self.get_node_class(module, action)
 
         if not callable(action_func):
             raise ValueError("Action is not callable")
@@ -388,7 +640,8 @@ class WebServer:
         result = {}
 
         try:
-            result = await self.event_loop.run_in_executor(None, lambda: node_obj(**kwargs))
+            device = self.get_node_device({ "module": module, "action": action, "params": { "device": { "value": kwargs.get("device") } } })
+            result = await self.get_node_pool(module, action, device).run(lambda: node_obj(**kwargs))
         except Exception as e:
             # logger.error(f"Error executing node {module}.{action}: {str(e)}")
             raise e
@@ -404,254 +657,549 @@ class WebServer:
             }
         })
 
-    async def graph_execution(self, graph):
+    async def graph_execution(self, graph, node_callback=None):
+        """
+        Execute a graph, `node_callback(node)` is awaited after each node is done.
+        """
         sid = graph["sid"]
+
+        # parameter sweep, the nodes affected by the swept params are duplicated for each variant
+        if graph.get("sweep"):
+            sweep = SweepPlan(graph["nodes"], graph["sweep"], self.module_map)
+            graph = sweep.expand(graph)
+            await self.client_queue.put({
+                "client_id": sid,
+                "data": { "type": "sweepPlan", **sweep.to_dict() }
+            })
+
         nodes = graph["nodes"]
-        paths = graph["paths"]
-        
+        paths = graph.get("paths")
+
+        self.release_variants(nodes)
+
+        # each node is executed once, in dependency order, even if shared by multiple paths
+        plan = GraphPlan(nodes, paths)
+        if plan.deduplicated:
+            logger.debug(f"Graph {sid}: {sum(plan.deduplicated.values())} duplicate node executions skipped ({', '.join(plan.deduplicated)})")
+
+        await self.client_queue.put({
+            "client_id": sid,
+            "data": {
+                "type": "graphPlan",
+                "order": plan.order,
+                "deduplicated": plan.deduplicated,
+            }
+        })
+
         # print(f"\n=== Starting graph execution with SID: {sid} ===")
         # print(f"Number of nodes: {len(nodes)}")
-        # print(f"Number of paths: {len(paths)}")
+
+        # skip nodes whose params and inputs did not change since the last run
+        incremental = graph.get("incremental", config.app['incremental_execution'])
+
+        # reuse the outputs stored in the persistent cache, and skip the upstream nodes needed only by them
+        cache_plan = await self.plan_output_cache(nodes, plan, incremental, graph.get("sinks")) if self.output_cache else None
 
         randomized_fields = {}
-        for path_index, path in enumerate(paths):
-            # print(f"\n--- Processing path {path_index + 1}/{len(paths)} ---")
-            for node in path:
-                module_name = nodes[node]["module"]
-                action_name = nodes[node]["action"]
-                # print(f"\nExecuting node: {node}")
-                # print(f"Module: {module_name}, Action: {action_name}")
-                # logger.debug(f"Executing node {module_name}.{action_name}")
-
-                old_output = deepcopy(self.node_store[node].output) if node in self.node_store else None
-                # print(f"Previous output exists: {old_output is not None}")
-
-                params = nodes[node]["params"]
-                # print(f"Parameters: {params}")
-                ui_fields = {}
-                args = {}
+        if graph.get("parallel", config.app['parallel_execution']):
+            await self.parallel_graph_execution(sid, nodes, plan, incremental, randomized_fields, cache_plan, node_callback)
+        else:
+            for node in plan:
+                self.prefetch(nodes, plan, node)
+                await self.graph_node_execution(sid, nodes, node, incremental, randomized_fields, cache_plan)
+                if node_callback:
+                    await node_callback(node)
+
+        # print("\n=== Graph execution completed ===")
+
+    def release_variants(self, nodes):
+        # the variant nodes of a previous sweep of these nodes that the graph doesn't run anymore hold
+        # their outputs (and models) until they are removed. The graphs of a client run in order, the
+        # variants can't be in use by another graph
+        bases = { base_node(node) for node in nodes }
+        stale = [node for node in self.node_store if base_node(node) != node and base_node(node) in bases and node not in nodes]
+        if not stale:
+            return
+
+        for node in stale:
+            del self.node_store[node]
+        logger.debug(f"Released {len(stale)} sweep variant nodes")
+        memory_flush(gc_collect=True)
+
+    async def plan_output_cache(self, nodes, plan, incremental, sinks=None):
+        cache_plan = CachePlan()
+        for node in plan:
+            module_name = nodes[node]["module"]
+            action_name = nodes[node]["action"]
+            entry = self.module_map.get(module_name, {}).get(action_name, {})
+            cache_plan.keys[node] = None
+            # `cache_key` nodes (eg: loaders, their outputs are models) only take part in the keys of the downstream nodes
+            if entry.get('cacheable') or entry.get('cache_key'):
+                action = self.get_node_class(module_name, action_name)
+                cache_plan.keys[node] = node_cache_key(module_name, action_name, action, entry, nodes[node]["params"], cache_plan.keys)
+
+        # the output is either already in memory or stored on disk
+        hits = set()
+        for node, key in cache_plan.keys.items():
+            if key is None:
+                continue
+            if incremental and node in self.node_store and self.node_store[node]._cache_key == key:
+                cache_plan.outputs[node] = self.node_store[node].output
+                hits.add(node)
+            elif self.node_cache_entry(nodes[node]).get('cacheable') and await execution_pools['io'].run(self.output_cache.contains, key):
+                hits.add(node)
+
+        # the passthrough outputs of a hit are taken from its inputs, those upstream nodes must run
+        passthrough_sources = {
+            node: { nodes[node]["params"].get(param, {}).get("sourceId") for param in self.node_cache_entry(nodes[node]).get('cache_passthrough', {}).values() }
+            for node in plan
+        }
+
+        while True:
+            # a node runs if it's a sink or if any of the nodes that need its output runs
+            required = set()
+            for node in reversed(plan.order):
+                if not plan.dependents[node] or (sinks and node in sinks) or any(
+                    d in required and (d not in hits or node in passthrough_sources[d]) for d in plan.dependents[node]
+                ):
+                    required.add(node)
+
+            # load the outputs that are actually needed, an entry may have been evicted in the meantime
+            missing = False
+            for node in required & hits:
+                if node in cache_plan.outputs:
+                    continue
+                output = await execution_pools['io'].run(self.output_cache.get, cache_plan.keys[node])
+                if output is None:
+                    hits.discard(node)
+                    missing = True
+                else:
+                    cache_plan.outputs[node] = output
+
+            if not missing:
+                break
+
+        cache_plan.skipped = set(plan.order) - required
+        for node in list(cache_plan.outputs):
+            if node not in required:
+                del cache_plan.outputs[node]
+
+        if cache_plan.outputs or cache_plan.skipped:
+            logger.debug(f"Output cache: {len(cache_plan.outputs)} hits, {len(cache_plan.skipped)} nodes skipped")
+
+        return cache_plan
+
+    def node_cache_entry(self, node):
+        return self.module_map.get(node["module"], {}).get(node["action"], {})
+
+    async def parallel_graph_execution(self, sid, nodes, plan, incremental, randomized_fields, cache_plan=None, node_callback=None):
+        """
+        Run independent nodes concurrently. Each device has its own lane that executes one node at a time,
+        a node is started as soon as all its dependencies are done and its lane is free.
+        """
+        waiting = { node: len(plan.dependencies[node]) for node in plan }
+
+        async def run(node):
+            async with self.get_device_lane(nodes[node]):
+                self.prefetch(nodes, plan, node)
+                await self.graph_node_execution(sid, nodes, node, incremental, randomized_fields, cache_plan)
+            if node_callback:
+                await node_callback(node)
+            return node
+
+        pending = { asyncio.create_task(run(node)) for node in plan if waiting[node] == 0 }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = task.result()
+                    for dependent in plan.dependents[node]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            pending.add(asyncio.create_task(run(dependent)))
+        except Exception:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+    def prefetch(self, nodes, plan, node):
+        """
+        While `node` runs, move to their device the models needed by the next nodes of the plan.
+        """
+        lookahead = config.memory['prefetch']
+        # in worker mode the models live in the worker processes
+        if not lookahead or self.workers:
+            return
+
+        index = plan.order.index(node)
+        for next_node in plan.order[index + 1:index + 1 + lookahead]:
+            device = self.get_node_device(nodes[next_node])
+            if device == 'cpu':
+                continue
+            for model_id in self.node_model_ids(nodes, next_node):
+                execution_pools['prefetch'].submit(memory_manager.prefetch_model, model_id, device)
+
+    def node_model_ids(self, nodes, node):
+        # the models are found in the outputs connected to the node. Nodes that receive a whole pipeline declare
+        # the parts they load with the `prefetch` key of the MODULE_MAP (eg: `[ 'pipeline.unet' ]`)
+        params = nodes[node]["params"]
+
+        def source_value(param):
+            source_id = params.get(param, {}).get("sourceId")
+            if source_id not in self.node_store:
+                return None
+            return (self.node_store[source_id].output or {}).get(params[param].get("sourceKey"))
+
+        declared = self.module_map.get(nodes[node]["module"], {}).get(nodes[node]["action"], {}).get('prefetch')
+        if declared is None:
+            return [id for param in params for id in model_ids(source_value(param))]
+
+        ids = []
+        for path in declared:
+            param, *attributes = path.split('.')
+            value = source_value(param)
+            for attribute in attributes:
+                value = value.get(attribute) if isinstance(value, dict) else getattr(value, attribute, None)
+            ids.extend(model_ids(value))
+        return ids
+
+    def get_node_pool(self, module_name, action_name, device='cpu'):
+        # nodes declare their pool with the `executor` key of the MODULE_MAP, by default the nodes running on a device
+        # use the gpu pool and the others the default pool, so that an api call doesn't wait behind a sampler
+        executor = self.module_map[module_name][action_name].get('executor')
+        if executor is None:
+            executor = 'gpu' if device != 'cpu' else 'default'
+        return get_pool(executor)
+
+    def get_node_device(self, node):
+        # the device is taken from the node's `device` param, nodes without one run on the cpu lane
+        device = node["params"].get("device", {}).get("value")
+        if not device:
+            schema = self.module_map.get(node["module"], {}).get(node["action"], {}).get("params", {})
+            device = schema.get("device", {}).get("default")
+
+        return device if device in device_list else 'cpu'
+
+    def get_device_lane(self, node):
+        # the batched samplers are serialized by the batcher, waiting in the lane would prevent the batching
+        if sampler_batcher.enabled and self.module_map.get(node["module"], {}).get(node["action"], {}).get('dynamic_batching'):
+            return nullcontext()
+
+        device = self.get_node_device(node)
+        if device not in self.device_lanes:
+            self.device_lanes[device] = asyncio.Lock()
+
+        return self.device_lanes[device]
+
+    def get_node_class(self, module_name, action_name):
+        if module_name not in self.module_map:
+            raise ValueError("Invalid module")
+        if action_name not in self.module_map[module_name]:
+            raise ValueError("Invalid action")
+
+        # the implementation is imported on first use, see modules/__init__.py
+        return getattr(load_implementation(module_name), action_name)
+
+    async def graph_node_execution(self, sid, nodes, node, incremental, randomized_fields, cache_plan=None):
+        module_name = nodes[node]["module"]
+        action_name = nodes[node]["action"]
+        # print(f"\nExecuting node: {node}")
+        # print(f"Module: {module_name}, Action: {action_name}")
+        # logger.debug(f"Executing node {module_name}.{action_name}")
+
+        if cache_plan is not None and node in cache_plan.skipped:
+            await self.client_queue.put({
+                "client_id": sid,
+                "data": {
+                    "type": "executed",
+                    "nodeId": node,
+                    "time": "0.00",
+                    "cached": True,
+                    "skipped": True,
+                }
+            })
+            return
+
+        cache_key = cache_plan.keys.get(node) if cache_plan is not None else None
+        from_cache = cache_plan is not None and node in cache_plan.outputs
+
+        def upstream(source_id, source_key):
+            # the upstream nodes of a cache hit may have been skipped, their outputs are not needed
+            return None if from_cache else self.node_store[source_id].output[source_key]
+
+        params = nodes[node]["params"]
+        # print(f"Parameters: {params}")
+        ui_fields = {}
+        args = {}
+        # --> Added Print <--
+        print(f"[Server Debug Node {node}] Processing parameters. Full params dict being used: {params}")
+        for p in params:
+            # --> Added Print <--
+            print(f"[Server Debug Node {node}] Checking Param '{p}': Definition = {params[p]}")
+            source_id = params[p].get("sourceId")
+            source_key = params[p].get("sourceKey")
+            # print(f"\nProcessing parameter: {p}")
+            # print(f"Source ID: {source_id}, Source Key: {source_key}")
+
+            # Adjusted logic to handle "ui_video" or "ui"
+            # print(f"Params: {params[p]}")
+            if ("display" in params[p] and 
+                (params[p]["display"] in ("ui", "ui_video") or 
+                 params[p]["display"].startswith("ui_"))):
                 # --> Added Print <--
-                print(f"[Server Debug Node {node}] Processing parameters. Full params dict being used: {params}")
-                for p in params:
+                print(f"[Server Debug Node {node}] Parameter '{p}' identified as potential UI field.")
+                # print(f"UI field detected: {p} with type {params[p]['type']}")
+                if params[p]["type"] in ("image", "3d", "text", "video", "json"):
                     # --> Added Print <--
-                    print(f"[Server Debug Node {node}] Checking Param '{p}': Definition = {params[p]}")
-                    source_id = params[p].get("sourceId")
-                    source_key = params[p].get("sourceKey")
-                    # print(f"\nProcessing parameter: {p}")
-                    # print(f"Source ID: {source_id}, Source Key: {source_key}")
-
-                    # Adjusted logic to handle "ui_video" or "ui"
-                    # print(f"Params: {params[p]}")
-                    if ("display" in params[p] and 
-                        (params[p]["display"] in ("ui", "ui_video") or 
-                         params[p]["display"].startswith("ui_"))):
-                        # --> Added Print <--
-                        print(f"[Server Debug Node {node}] Parameter '{p}' identified as potential UI field.")
-                        # print(f"UI field detected: {p} with type {params[p]['type']}")
-                        if params[p]["type"] in ("image", "3d", "text", "video", "json"):
-                            # --> Added Print <--
-                            print(f"[Server Debug Node {node}] Parameter '{p}' type '{params[p]['type']}' is valid for UI update. Adding to ui_fields.")
-                            ui_fields[p] = { "source": source_key, "type": params[p]["type"] }
-                            # Also pass the value through to args if it has one
-                            if "value" in params[p]:
-                                args[p] = params[p]["value"]
-                            elif source_id:
-                                args[p] = self.node_store[source_id].output[source_key]
-                    else:
-                        if source_id and re.match(r".*\[\d+\]$", p):
-                            # print(f"List field detected: {p}")
-                            spawn_key = re.sub(r"\[\d+\]$", "", p)
-                            if not args.get(spawn_key):
-                                args[spawn_key] = []
-                            elif not isinstance(args[spawn_key], list):
-                                args[spawn_key] = [args[spawn_key]]
-                            args[spawn_key].append(self.node_store[source_id].output[source_key])
-                        else:
-                            args[p] = (
-                                self.node_store[source_id].output[source_key]
-                                if source_id
-                                else params[p].get("value")
-                            )
-                            # print(f"Regular field: {p} = {args[p]}")
-                
-                # print the name of the node
-                # print(f"\nNode name: {node}")
-                # print(f"\nFinal arguments for node execution: {args}")
-                # print(f"UI fields to update: {ui_fields}")
-
-                # Randomization
-                for key in args:
-                    if key.startswith('__random__') and args[key] is True:
-                        # print(f"\nRandomizing field: {key}")
-                        if node not in randomized_fields:
-                            randomized_fields[node] = []
-                        if key in randomized_fields[node]:
-                            # print(f"Field {key} already randomized, skipping")
-                            continue
-                        randomized_fields[node].append(key)
-                        random_field = key.split('__random__')[1]
-                        args[random_field] = random.randint(0, (1<<53)-1)
-                        params[random_field]["value"] = args[random_field]
-                        # print(f"New random value for {random_field}: {args[random_field]}")
-                        await self.client_queue.put({
-                            "client_id": sid,
-                            "data": {
-                                "type": "updateValues",
-                                "nodeId": node,
-                                "key": random_field,
-                                "value": args[random_field]
-                            }
-                        })
-
-                if module_name not in self.module_map:
-                    raise ValueError("Invalid module")
-                if action_name not in self.module_map[module_name]:
-                    raise ValueError("Invalid action")
-
-                if module_name.endswith(".custom"):
-                    # print(f"\nImporting custom module: {module_name}")
-                    mod = import_module(f"custom.{module_name.replace('.custom', '')}.{module_name.replace('.custom', '')}")
+                    print(f"[Server Debug Node {node}] Parameter '{p}' type '{params[p]['type']}' is valid for UI update. Adding to ui_fields.")
+                    ui_fields[p] = { "source": source_key, "type": params[p]["type"] }
+                    # Also pass the value through to args if it has one
+                    if "value" in params[p]:
+                        args[p] = params[p]["value"]
+                    elif source_id:
+                        args[p] = upstream(source_id, source_key)
+            else:
+                if source_id and re.match(r".*\[\d+\]$", p):
+                    # print(f"List field detected: {p}")
+                    spawn_key = re.sub(r"\[\d+\]$", "", p)
+                    if not args.get(spawn_key):
+                        args[spawn_key] = []
+                    elif not isinstance(args[spawn_key], list):
+                        args[spawn_key] = [args[spawn_key]]
+                    args[spawn_key].append(upstream(source_id, source_key))
                 else:
-                    # print(f"\nImporting standard module: {module_name}")
-                    mod = import_module(f"modules.{module_name}.{module_name}")
-                action = getattr(mod, action_name)
-
-                if node not in self.node_store:
-                    # print(f"Initializing new node in store: {node}")
-                    self.node_store[node] = action(node)
-
-                self.node_store[node]._client_id = sid
-                if not callable(self.node_store[node]):
-                    raise TypeError(
-                        f"The class `{module_name}.{action_name}` is not callable. "
-                        f"Ensure that the class has a __call__ method or extend it from `NodeBase`."
+                    args[p] = (
+                        upstream(source_id, source_key)
+                        if source_id
+                        else params[p].get("value")
                     )
-
-                # print("\nStarting node execution...")
+                    # print(f"Regular field: {p} = {args[p]}")
+
+        # print the name of the node
+        # print(f"\nNode name: {node}")
+        # print(f"\nFinal arguments for node execution: {args}")
+        # print(f"UI fields to update: {ui_fields}")
+
+        # Randomization
+        for key in args:
+            if key.startswith('__random__') and args[key] is True:
+                # print(f"\nRandomizing field: {key}")
+                if node not in randomized_fields:
+                    randomized_fields[node] = []
+                if key in randomized_fields[node]:
+                    # print(f"Field {key} already randomized, skipping")
+                    continue
+                randomized_fields[node].append(key)
+                random_field = key.split('__random__')[1]
+                args[random_field] = random.randint(0, (1<<53)-1)
+                params[random_field]["value"] = args[random_field]
+                # print(f"New random value for {random_field}: {args[random_field]}")
                 await self.client_queue.put({
                     "client_id": sid,
                     "data": {
-                        "type": "progress",
+                        "type": "updateValues",
                         "nodeId": node,
-                        "progress": -1
+                        "key": random_field,
+                        "value": args[random_field]
                     }
                 })
 
-                try:
-                    def execute_node():
-                        try:
-                            return self.node_store[node](**args)
-                        except StopIteration:
-                            return None
-
-                    result = await self.event_loop.run_in_executor(None, execute_node)
-                    # print(f"Node execution completed with result type: {type(result)}")
-                except Exception as e:
-                    # print(f"Error executing node: {str(e)}")
-                    # logger.error(f"Error executing node {module_name}.{action_name}: {str(e)}")
-                    raise e
-
-                exec_type = self.module_map[module_name][action_name].get("execution_type", "workflow")
-                # print(f"\nExecution type: {exec_type}")
-                new_output = self.node_store[node].output
-
-                if exec_type == "continuous":
-                    if not are_different(old_output, new_output):
-                        # print("Output unchanged, skipping updates")
-                        # logger.debug(f"Skipping updates for node {node} - output unchanged")
-                        execution_time = getattr(self.node_store[node], '_execution_time', 0)
-                        await self.client_queue.put({
-                            "client_id": sid,
-                            "data": {
-                                "type": "executed",
-                                "nodeId": node,
-                                "time": f"{execution_time:.2f}",
-                            }
-                        })
-                        continue
+        if node not in self.node_store:
+            # print(f"Initializing new node in store: {node}")
+            if self.workers:
+                self.node_store[node] = self.workers.node(node, module_name, action_name)
+            else:
+                self.node_store[node] = self.get_node_class(module_name, action_name)(node)
+
+        self.node_store[node]._client_id = sid
+        if self.workers:
+            self.node_store[node]._device = self.get_node_device(nodes[node])
+        if not callable(self.node_store[node]):
+            raise TypeError(
+                f"The class `{module_name}.{action_name}` is not callable. "
+                f"Ensure that the class has a __call__ method or extend it from `NodeBase`."
+            )
 
-                execution_time = getattr(self.node_store[node], '_execution_time', 0)
-                # print(f"Execution time: {execution_time:.2f}s")
+        # outputs loaded from disk are new to the UI, outputs already in memory are not
+        from_disk = from_cache and self.node_store[node].output is not cache_plan.outputs[node]
+        if from_disk:
+            output = dict(cache_plan.outputs[node])
+            # outputs that are just an input passed along (eg: the pipeline of a sampler) are not stored
+            for key, param in self.node_cache_entry(nodes[node]).get('cache_passthrough', {}).items():
+                source_id = params.get(param, {}).get("sourceId")
+                output[key] = self.node_store[source_id].output.get(params[param].get("sourceKey")) if source_id else params.get(param, {}).get("value")
+            stamp_output(output)
+            cache_plan.outputs[node] = output
+            self.node_store[node].output = output
+            self.node_store[node].params = {}
+            self.node_store[node]._output_fingerprint = None
+            self.node_store[node]._execution_time = 0
+            self.node_store[node]._cache_key = cache_key
+
+        cached = from_cache or (incremental and self.node_store[node]._is_cached(args))
+
+        exec_type = self.module_map[module_name][action_name].get("execution_type", "workflow")
+        # continuous nodes skip the UI updates when the output didn't change, compare the output fingerprints
+        # instead of keeping a copy of the previous output around
+        old_fingerprint = None
+        if exec_type == "continuous" and not cached:
+            old_fingerprint = await execution_pools['cpu'].run(self.node_store[node]._get_output_fingerprint)
+
+        if from_disk:
+            logger.debug(f"Node {module_name}.{action_name} ({node}) loaded from the output cache")
+        elif cached:
+            logger.debug(f"Node {module_name}.{action_name} ({node}) unchanged, reusing cached output")
+        else:
+            # print("\nStarting node execution...")
+            await self.client_queue.put({
+                "client_id": sid,
+                "data": {
+                    "type": "progress",
+                    "nodeId": node,
+                    "progress": -1
+                }
+            })
+
+            try:
+                def execute_node():
+                    try:
+                        return self.node_store[node](**args)
+                    except StopIteration:
+                        return None
+
+                result = await self.get_node_pool(module_name, action_name, self.get_node_device(nodes[node])).run(execute_node)
+                # print(f"Node execution completed with result type: {type(result)}")
+            except Exception as e:
+                # print(f"Error executing node: {str(e)}")
+                # logger.error(f"Error executing node {module_name}.{action_name}: {str(e)}")
+                raise e
 
+        # drop the progress updates not yet sent, the node is done
+        self.progress.discard(sid, node)
+
+        if cache_key and not from_cache:
+            self.node_store[node]._cache_key = cache_key
+            entry = self.node_cache_entry(nodes[node])
+            output = self.node_store[node].output
+            try:
+                if entry.get('cacheable'):
+                    passthrough = entry.get('cache_passthrough', {})
+                    output = { k: v for k, v in output.items() if k not in passthrough } if isinstance(output, dict) else output
+                    await execution_pools['io'].run(self.output_cache.put, cache_key, output)
+            except Exception as e:
+                logger.warning(f"Error storing the output of node {node} in the cache: {str(e)}")
+
+        # print(f"\nExecution type: {exec_type}")
+
+        if exec_type == "continuous":
+            if (cached and not from_disk) or old_fingerprint == await execution_pools['cpu'].run(self.node_store[node]._get_output_fingerprint):
+                # print("Output unchanged, skipping updates")
+                # logger.debug(f"Skipping updates for node {node} - output unchanged")
+                execution_time = getattr(self.node_store[node], '_execution_time', 0)
                 await self.client_queue.put({
                     "client_id": sid,
                     "data": {
                         "type": "executed",
                         "nodeId": node,
                         "time": f"{execution_time:.2f}",
+                        "cached": cached,
                     }
                 })
-                # logger.debug(f"Node {module_name}.{action_name} executed in {execution_time:.3f}s")
+                return
 
-                # --> Added Print <--
-                print(f"[Server Debug] Node {node}: Just before UI field loop. ui_fields = {ui_fields}")
+        execution_time = getattr(self.node_store[node], '_execution_time', 0)
+        # print(f"Execution time: {execution_time:.2f}s")
 
-                # Decide format based on node's type
-                for key in ui_fields:
-                    # print(f"\nProcessing UI field: {key}")
-                    source = ui_fields[key]["source"]
-                    # --> Added Print <--
-                    print(f"[Server Debug] Node {node}: Processing UI field '{key}' linked to source '{source}'")
-                    source_value = self.node_store[node].output[source]
-                    # print(f"Source value: {source_value}")
-                    param_type = ui_fields[key]["type"].lower()
-                    
-                    # --> Added Print <--
-                    print(f"[Server Debug] Node {node}:   - Source value retrieved: {type(source_value)}") # Avoid printing potentially large value
-                    print(f"[Server Debug] Node {node}:   - Determined param_type: '{param_type}'")
-
-                    length = len(source_value) if isinstance(source_value, list) else 1
-                    if param_type == "image":
-                        format = 'webp'
-                    elif param_type == "3d":
-                        format = 'glb'
-                    elif param_type == "video":
-                        format = 'mp4'
-                    elif param_type == "json":
-                        format = 'json' # Assign format correctly
-                        # If the display type is specifically ui_promptlist,
-                        # send the raw list value directly.
-                        # Otherwise, use the standard URL/value structure.
-                        if params[key]["display"] == "ui_promptlist":
-                            data = source_value # Assign the raw list
-                            print(f"[Server Debug] Node {node}:   - Special handling for ui_promptlist: assigned raw value.")
-                        else:
-                            # Provide a URL to /view/json/... plus the raw value (default JSON behavior)
-                            data = {
-                                "url": f"/view/{format}/{node}/{source}/{0}?t={time.time()}",
-                                "value": source_value
-                            }
-                            print(f"[Server Debug] Node {node}:   - Default JSON handling: assigned URL+value structure.")
-                    else:
-                        format = 'text'
-                        # For text, assign data structure here directly
-                        data = {
-                            "url": f"/view/{format}/{node}/{source}/{0}?t={time.time()}",
-                            "value": source_value
-                        }
-                        print(f"[Server Debug] Node {node}:   - Text handling: assigned URL+value structure.")
-
-                    # Construct and queue the message using the correctly assigned 'data'
-                    update_message = {
-                        "client_id": sid,
-                        "data": {
-                            "type": param_type, 
-                            "key": key,      
-                            "nodeId": node,
-                            "data": data      
-                        }
+        await self.client_queue.put({
+            "client_id": sid,
+            "data": {
+                "type": "executed",
+                "nodeId": node,
+                "time": f"{execution_time:.2f}",
+                "cached": cached,
+            }
+        })
+        # logger.debug(f"Node {module_name}.{action_name} executed in {execution_time:.3f}s")
+
+        # --> Added Print <--
+        print(f"[Server Debug] Node {node}: Just before UI field loop. ui_fields = {ui_fields}")
+
+        # Decide format based on node's type
+        for key in ui_fields:
+            # print(f"\nProcessing UI field: {key}")
+            source = ui_fields[key]["source"]
+            # --> Added Print <--
+            print(f"[Server Debug] Node {node}: Processing UI field '{key}' linked to source '{source}'")
+            source_value = self.node_store[node].output[source]
+            # print(f"Source value: {source_value}")
+            param_type = ui_fields[key]["type"].lower()
+
+            # --> Added Print <--
+            print(f"[Server Debug] Node {node}:   - Source value retrieved: {type(source_value)}") # Avoid printing potentially large value
+            print(f"[Server Debug] Node {node}:   - Determined param_type: '{param_type}'")
+
+            length = len(source_value) if isinstance(source_value, list) else 1
+            data = None
+            if param_type == "image":
+                format = 'webp'
+                # the urls are bound to the fingerprint of the output so the browser can cache them forever
+                images = source_value if isinstance(source_value, list) else [source_value]
+                fingerprint = await execution_pools['cpu'].run(self.node_store[node]._get_output_fingerprint)
+                data = [{
+                    "url": f"/view/{format}/{node}/{source}/{i}?h={fingerprint}",
+                    "width": images[i].width,
+                    "height": images[i].height,
+                } for i in range(length) if images[i] is not None]
+            elif param_type == "3d":
+                format = 'glb'
+                if source_value is not None:
+                    data = { "url": f"/view/{format}/{node}/{source}/{0}?h={bytes_fingerprint(source_value)}" }
+            elif param_type == "video":
+                format = 'mp4'
+            elif param_type == "json":
+                format = 'json' # Assign format correctly
+                # If the display type is specifically ui_promptlist,
+                # send the raw list value directly.
+                # Otherwise, use the standard URL/value structure.
+                if params[key]["display"] == "ui_promptlist":
+                    data = source_value # Assign the raw list
+                    print(f"[Server Debug] Node {node}:   - Special handling for ui_promptlist: assigned raw value.")
+                else:
+                    # Provide a URL to /view/json/... plus the raw value (default JSON behavior)
+                    data = {
+                        "url": f"/view/{format}/{node}/{source}/{0}?t={time.time()}",
+                        "value": source_value
                     }
-                    # Check if data is None before logging/queuing, just in case
-                    if data is not None:
-                        print(f"[Server Debug] Node {node}: Queuing update message for UI field '{key}': {update_message['data']}")
-                        await self.client_queue.put(update_message)
-                    else:
-                        print(f"[Server Debug] Node {node}: WARNING - Data is None for UI field '{key}', skipping queue.")
-
-                await asyncio.sleep(0)
-                # print(f"\n=== Completed node {node} ===")
+                    print(f"[Server Debug] Node {node}:   - Default JSON handling: assigned URL+value structure.")
+            else:
+                format = 'text'
+                # For text, assign data structure here directly
+                data = {
+                    "url": f"/view/{format}/{node}/{source}/{0}?t={time.time()}",
+                    "value": source_value
+                }
+                print(f"[Server Debug] Node {node}:   - Text handling: assigned URL+value structure.")
+
+            # Construct and queue the message using the correctly assigned 'data'
+            update_message = {
+                "client_id": sid,
+                "data": {
+                    "type": param_type, 
+                    "key": key,      
+                    "nodeId": node,
+                    "data": data      
+                }
+            }
+            # Check if data is None before logging/queuing, just in case
+            if data is not None:
+                print(f"[Server Debug] Node {node}: Queuing update message for UI field '{key}': {update_message['data']}")
+                await self.client_queue.put(update_message)
+            else:
+                print(f"[Server Debug] Node {node}: WARNING - Data is None for UI field '{key}', skipping queue.")
 
-        # print("\n=== Graph execution completed ===")
+        await asyncio.sleep(0)
+        # print(f"\n=== Completed node {node} ===")
 
     async def list_files(self, request):
         path = request.query.get('path', '')
@@ -668,25 +1216,42 @@ class WebServer:
         except (ValueError, RuntimeError):
             raise web.HTTPBadRequest(text="Invalid path")
 
+        # clients that don't page get the whole directory, paging starts with a `limit` or a `cursor`
+        limit = None
+        if 'limit' in request.query or 'cursor' in request.query:
+            try:
+                limit = min(int(request.query.get('limit', 500)), 5000)
+            except ValueError:
+                raise web.HTTPBadRequest(text="Invalid limit")
+        extensions = tuple(f".{e.strip().lstrip('.').lower()}" for e in request.query.get('ext', '').split(',') if e.strip())
+        with_metadata = request.query.get('metadata', 'false').lower() == 'true'
+
         try:
-            entries = []
-            with os.scandir(path) as it:
-                for entry in it:
-                    entries.append({
-                        'name': entry.name,
-                        'isDirectory': entry.is_dir(),
-                        'path': os.path.join(path, entry.name).replace('\\', '/')
-                    })
-            entries.sort(key=lambda x: (not x['isDirectory'], x['name'].lower()))
-            return web.json_response({
-                'files': entries,
-                'currentPath': path.replace('\\', '/')
-            })
+            listing = await execution_pools['io'].run(self.file_index.get, path)
+            entries, next_cursor = listing.page(request.query.get('cursor'), limit, extensions, request.query.get('q'))
+        except ValueError as e:
+            raise web.HTTPBadRequest(text=str(e))
         except Exception as e:
             raise web.HTTPInternalServerError(text=str(e))
 
+        response = {
+            'files': entries,
+            'currentPath': path.replace('\\', '/'),
+            'total': len(listing.entries),
+            'nextCursor': next_cursor,
+        }
+
+        if with_metadata:
+            # gathered in the background, the client polls until `metadataPending` is false
+            if listing.metadata_task is None:
+                listing.metadata_task = execution_pools['io'].run(self.file_index.collect_metadata, listing)
+            response['files'] = [{ **e, **listing.metadata.get(e['name'], {}) } for e in entries]
+            response['metadataPending'] = not listing.metadata_ready
+
+        return web.json_response(response)
+
     async def upload_file(self, request):
-        temp_file = None
+        writer = None
         try:
             reader = await request.multipart()
             file_field = await reader.next()
@@ -696,28 +1261,15 @@ class WebServer:
             filename = file_field.filename
             if not filename:
                 raise web.HTTPBadRequest(text="No filename provided")
-            
-            save_path = os.path.join(os.getcwd(), 'data', 'files')
-            os.makedirs(save_path, exist_ok=True)
-            
-            fd, temp_path = tempfile.mkstemp(dir=save_path)
-            temp_file = os.fdopen(fd, 'wb')
-            
-            size = 0
-            try:
-                while True:
-                    chunk = await file_field.read_chunk(size=8*1024*1024)
-                    if not chunk:
-                        break
-                    size += len(chunk)
-                    temp_file.write(chunk)
-                    if size % (64*1024*1024) == 0:
-                        temp_file.flush()
-                        os.fsync(temp_file.fileno())
-                temp_file.flush()
-                os.fsync(temp_file.fileno())
-            finally:
-                temp_file.close()
+
+            # the content is hashed while streaming, duplicates are linked to the existing blob
+            writer = await execution_pools['io'].run(self.upload_store.open_file)
+            while True:
+                chunk = await file_field.read_chunk(size=DEFAULT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                await execution_pools['io'].run(writer.write, chunk)
+            await execution_pools['io'].run(writer.close)
             
             custom_filename = None
             next_field = await reader.next()
@@ -731,68 +1283,123 @@ class WebServer:
                 custom_name, custom_ext = os.path.splitext(custom_filename)
                 if not custom_ext:
                     base_filename = custom_name + original_ext
-            
-            counter = 1
-            final_filename = base_filename
-            while os.path.exists(os.path.join(save_path, final_filename)):
-                name, ext = os.path.splitext(base_filename)
-                final_filename = f"{name}_{counter}{ext}"
-                counter += 1
-            
-            final_path = os.path.join(save_path, final_filename)
-            os.rename(temp_path, final_path)
-            
+
+            final_filename, _ = await execution_pools['io'].run(self.upload_store.add_file, writer.path, writer.hexdigest(), base_filename)
+            writer = None
+            self.file_index.invalidate(self.upload_store.root)
+
             return web.Response(text=final_filename)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            if temp_file:
-                temp_file.close()
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except Exception:
-                        pass
             raise web.HTTPInternalServerError(text=str(e))
+        finally:
+            if writer:
+                await execution_pools['io'].run(writer.discard)
+
+    async def upload_create(self, request):
+        """
+        Start a chunked upload. Body: { filename, size, chunkSize?, hash? }
+        If the hash is known and the content is already stored, the upload completes immediately.
+        """
+        data = await request.json()
+        try:
+            result = await execution_pools['io'].run(
+                self.upload_store.create,
+                data.get('filename'),
+                data.get('size', 0),
+                data.get('chunkSize'),
+                data.get('hash'),
+            )
+        except (ValueError, TypeError) as e:
+            raise web.HTTPBadRequest(text=str(e))
+
+        if result['complete']:
+            self.file_index.invalidate(self.upload_store.root)
+        return web.json_response(result)
+
+    async def upload_status(self, request):
+        # used by the client to resume an interrupted upload
+        try:
+            result = await execution_pools['io'].run(self.upload_store.status, request.match_info['upload_id'])
+        except (KeyError, ValueError):
+            raise web.HTTPNotFound(text="Upload not found")
+
+        return web.json_response(result)
+
+    async def upload_part(self, request):
+        upload_id = request.match_info['upload_id']
+        index = request.match_info['index']
+
+        try:
+            writer = await execution_pools['io'].run(self.upload_store.open_part, upload_id, index)
+        except KeyError:
+            raise web.HTTPNotFound(text="Upload not found")
+        except ValueError as e:
+            raise web.HTTPBadRequest(text=str(e))
+
+        try:
+            async for chunk in request.content.iter_chunked(1024*1024):
+                await execution_pools['io'].run(writer.write, chunk)
+            await execution_pools['io'].run(writer.close, False)
+            result = await execution_pools['io'].run(self.upload_store.commit_part, upload_id, index, writer)
+        except ValueError as e:
+            raise web.HTTPBadRequest(text=str(e))
+        except BaseException:
+            # the client disconnected, the partial part is discarded and can be sent again
+            await asyncio.shield(execution_pools['io'].run(writer.discard))
+            raise
+
+        return web.json_response(result)
+
+    async def upload_complete(self, request):
+        try:
+            result = await execution_pools['io'].run(self.upload_store.complete, request.match_info['upload_id'])
+        except KeyError:
+            raise web.HTTPNotFound(text="Upload not found")
+        except ValueError as e:
+            raise web.HTTPBadRequest(text=str(e))
+
+        self.file_index.invalidate(self.upload_store.root)
+        return web.json_response(result)
+
+    async def upload_abort(self, request):
+        try:
+            await execution_pools['io'].run(self.upload_store.abort, request.match_info['upload_id'])
+        except ValueError:
+            raise web.HTTPNotFound(text="Upload not found")
+
+        return web.json_response({ "uploadId": request.match_info['upload_id'], "aborted": True })
 
     async def get_file(self, request):
         try:
             filename = request.match_info['filename']
-            file_path = os.path.join(os.getcwd(), 'data', 'files', filename)
+            base_path = os.path.join(os.getcwd(), 'data', 'files')
+            file_path = os.path.realpath(os.path.join(base_path, filename))
+
+            if not file_path.startswith(os.path.realpath(base_path) + os.sep):
+                raise web.HTTPForbidden(text=f"Access to this file is not allowed: {filename}")
             
             # logger.info(f"Attempting to serve file: {file_path}")
             
-            if not os.path.exists(file_path):
+            if not os.path.isfile(file_path):
                 # logger.error(f"File not found: {file_path}")
                 raise web.HTTPNotFound(text=f"File not found: {filename}")
             
             if not os.access(file_path, os.R_OK):
                 # logger.error(f"File not readable: {file_path}")
                 raise web.HTTPForbidden(text=f"File not readable: {filename}")
-                
-            file_size = os.path.getsize(file_path)
-            # logger.info(f"File exists and is readable. Size: {file_size} bytes")
-
-            if filename.lower().endswith('.mp4'):
-                with open(file_path, 'rb') as f:
-                    data = f.read()
-                response = web.Response(
-                    body=data,
-                    content_type='video/mp4',
-                    headers={
-                        "Content-Length": str(file_size),
-                        "Accept-Ranges": "bytes",
-                        "Cache-Control": "no-cache, no-store, must-revalidate",
-                        "Pragma": "no-cache",
-                        "Expires": "0"
-                    }
-                )
-                # logger.info("Serving MP4 file directly")
-                return response
-            
-            response = web.FileResponse(file_path)
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-            response.headers["Content-Length"] = str(file_size)
+
+            # FileResponse streams the file with sendfile (no full read in memory) and handles
+            # Range, If-Range, If-None-Match and If-Modified-Since requests
+            response = web.FileResponse(file_path, chunk_size=256*1024)
+            response.headers["Accept-Ranges"] = "bytes"
+            if GENERATED_FILE_RE.search(filename):
+                # generated outputs are saved under a random uuid and never change
+                response.headers["Cache-Control"] = "max-age=31536000, immutable"
+            else:
+                # uploads can be replaced under the same name, the browser must revalidate (cheap 304 thanks to the ETag)
+                response.headers["Cache-Control"] = "no-cache"
             
             # logger.info(f"Serving file with headers: {dict(response.headers)}")
             return response
@@ -811,7 +1418,8 @@ class WebServer:
             if not os.path.exists(file_path):
                 raise web.HTTPNotFound(text=f"File not found: {filename}")
             
-            os.remove(file_path)
+            await execution_pools['io'].run(self.upload_store.remove, filename)
+            self.file_index.invalidate(self.upload_store.root)
             return web.Response(text=f"File {filename} deleted successfully")
         except web.HTTPException:
             raise
@@ -836,6 +1444,7 @@ class WebServer:
 
         self.ws_clients[sid] = ws
         await ws.send_json({"type": "welcome", "sid": sid})
+        await self.client_queue.open(sid, ws)
 
         async for msg in ws:
             # print(f"msg: {msg}")
@@ -844,7 +1453,7 @@ class WebServer:
                 # print(f"data: {data}")
                 try:
                     if data["type"] == "ping":
-                        await ws.send_json({"type": "pong"})
+                        await self.client_queue.put({"client_id": sid, "data": {"type": "pong"}})
                     elif data["type"] == "close":
                         await ws.close()
                         break
@@ -852,12 +1461,15 @@ class WebServer:
                         raise ValueError("Invalid message type")
                 except Exception as e:
                     # logger.error(f"Unexpected error: {str(e)}")
-                    await ws.send_json({"type": "error", "message": "An unexpected error occurred"})
+                    await self.client_queue.put({"client_id": sid, "data": {"type": "error", "message": "An unexpected error occurred"}})
             elif msg.type == WSMsgType.ERROR:
                 # logger.error(f'WebSocket connection closed with exception {ws.exception()}')
                 pass # Silently ignore errors for now
 
-        del self.ws_clients[sid]
+        # the client might have already reconnected with the same sid
+        if self.ws_clients.get(sid) is ws:
+            del self.ws_clients[sid]
+        await self.client_queue.close(sid, ws)
         # logger.info(f'WebSocket connection {sid} closed')
         return ws
 
@@ -869,8 +1481,23 @@ class WebServer:
         else:
             ws_clients = self.ws_clients
 
-        for client in ws_clients:
-            await self.ws_clients[client].send_json(message)
+        # a stalled client waits on its own, the others get the message right away
+        await asyncio.gather(*(self.client_queue.put({"client_id": client, "data": message}) for client in list(ws_clients)))
+
+    def send_preview(self, client_id, node_id, step, image):
+        """
+        Send a live preview as a binary websocket frame. Can be called from the execution threads,
+        the image is encoded on the cpu pool.
+
+        Frame layout: 4 bytes big-endian header length, JSON header, WEBP image.
+        """
+        def encode():
+            body = encode_image(image, 'webp', 80, 1)
+            header = json.dumps({ "type": "preview", "nodeId": node_id, "step": step, "format": "webp" }).encode()
+            frame = len(header).to_bytes(4, 'big') + header + body
+            asyncio.run_coroutine_threadsafe(self.client_queue.put({ "client_id": client_id, "data": frame }), self.event_loop)
+
+        execution_pools['cpu'].submit(encode)
 
     def to_base64(self, type, value):
         if type == "image":
@@ -890,6 +1517,5 @@ class WebServer:
 
 # Then just instantiate the server as before.
 from modules import MODULE_MAP
-from config import config
 
 web_server = WebServer(MODULE_MAP, **config.server)
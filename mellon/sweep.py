@@ -0,0 +1,122 @@
+import itertools
+from copy import deepcopy
+from mellon.scheduler import get_dependencies
+import logging
+logger = logging.getLogger('mellon')
+
+# variant nodes are named <node_id>~<variant index>
+VARIANT_SEPARATOR = '~'
+
+def base_node(node):
+    return node.split(VARIANT_SEPARATOR, 1)[0]
+
+def variant_node(node, index):
+    return f"{node}{VARIANT_SEPARATOR}{index}"
+
+class SweepPlan:
+    def __init__(self, nodes, sweep, module_map):
+        """
+        Expansion of a parameter grid over a graph.
+
+        `sweep` is `{ node_id: { param: [values] } }`, every combination of the values is a variant.
+        Only the swept nodes and their descendants are duplicated for each variant, the unaffected
+        prefix (loaders, text encoders...) is shared and executed once.
+
+        Nodes can declare in the MODULE_MAP that a param is batchable with `'batch': { param: count_param }`
+        (eg: the SDXL sampler seeds), those sweeps are passed as a list to a single execution instead.
+        """
+        self.grid = []          # [(node, param, values)] expanded in variants
+        self.batched = []       # [(node, param, values)] executed as a single batch
+        self.variants = []      # [{ (node, param): value }]
+        self.affected = set()
+
+        for node, params in sweep.items():
+            if node not in nodes:
+                raise ValueError(f"Sweep of unknown node: {node}")
+            if not isinstance(params, dict):
+                raise ValueError(f"Sweep of node {node} must be an object")
+            entry = module_map.get(nodes[node]['module'], {}).get(nodes[node]['action'], {})
+            for param, values in params.items():
+                if not isinstance(values, list) or not values:
+                    raise ValueError(f"Sweep of {node}.{param} must be a non empty list")
+                if nodes[node]['params'].get(param, {}).get('sourceId'):
+                    raise ValueError(f"Cannot sweep the connected input {node}.{param}")
+                if param in entry.get('batch', {}):
+                    self.batched.append((node, param, values))
+                else:
+                    self.grid.append((node, param, values))
+
+        for combination in itertools.product(*[values for _, _, values in self.grid]):
+            self.variants.append({ (node, param): value for (node, param, _), value in zip(self.grid, combination) })
+
+        # everything downstream of a swept node depends on the variant
+        dependents = { node: set() for node in nodes }
+        for node in nodes:
+            for dep in get_dependencies(nodes[node]):
+                if dep in dependents:
+                    dependents[dep].add(node)
+
+        stack = list({ node for node, _, _ in self.grid })
+        while stack:
+            node = stack.pop()
+            if node not in self.affected:
+                self.affected.add(node)
+                stack.extend(dependents[node])
+
+        self.module_map = module_map
+
+    def expand(self, graph):
+        """
+        Return a copy of the graph with the affected nodes duplicated for each variant.
+        """
+        nodes = deepcopy(graph['nodes'])
+
+        for node, param, values in self.batched:
+            entry = self.module_map[nodes[node]['module']][nodes[node]['action']]
+            set_value(nodes[node], param, values)
+            set_value(nodes[node], entry['batch'][param], len(values))
+
+        expanded = { node: data for node, data in nodes.items() if node not in self.affected }
+        for index, variant in enumerate(self.variants):
+            for node in [n for n in nodes if n in self.affected]:
+                data = deepcopy(nodes[node])
+                for param in data['params'].values():
+                    if isinstance(param, dict) and param.get('sourceId') in self.affected:
+                        param['sourceId'] = variant_node(param['sourceId'], index)
+                for (swept_node, param), value in variant.items():
+                    if swept_node == node:
+                        set_value(data, param, value)
+                expanded[variant_node(node, index)] = data
+
+        graph = { **graph, 'nodes': expanded }
+        if graph.get('paths'):
+            graph['paths'] = [self.expand_nodes(path) for path in graph['paths']]
+        if graph.get('sinks'):
+            graph['sinks'] = self.expand_nodes(graph['sinks'])
+
+        return graph
+
+    def expand_nodes(self, node_list):
+        expanded = []
+        for node in node_list:
+            if node in self.affected:
+                expanded.extend(variant_node(node, index) for index in range(len(self.variants)))
+            else:
+                expanded.append(node)
+        return expanded
+
+    def to_dict(self):
+        return {
+            'variants': [
+                { f"{node}.{param}": value for (node, param), value in variant.items() }
+                for variant in self.variants
+            ],
+            'batched': { f"{node}.{param}": values for node, param, values in self.batched },
+            'affected': sorted(self.affected),
+        }
+
+def set_value(node, param, value):
+    node['params'].setdefault(param, {})['value'] = value
+    # a swept value must not be replaced by a random one
+    if f"__random__{param}" in node['params']:
+        node['params'][f"__random__{param}"]['value'] = False
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import nanoid
+import logging
+logger = logging.getLogger('mellon')
+
+DEFAULT_CHUNK_SIZE = 8*1024*1024
+HASH_ALGORITHM = 'sha256'
+DIGEST_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+def file_digest(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    h = hashlib.new(HASH_ALGORITHM)
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+def safe_filename(filename):
+    filename = os.path.basename((filename or '').replace('\\', '/')).strip()
+    if not filename or filename.startswith('.'):
+        raise ValueError(f"Invalid filename: {filename}")
+    return filename
+
+class UploadStore:
+    def __init__(self, root):
+        """
+        Content addressed storage for the files in `root` (data/files).
+
+        The content is stored once in `.blobs/<hash>`, the hash is always computed by the server. The user
+        visible names are copies of the blob (not hard links, editing a file must not change the blob), so a
+        client that already knows the hash of stored content doesn't need to upload it again.
+        Chunked uploads are staged in `.uploads/<upload_id>` until completed.
+        """
+        self.root = root
+        self.blobs = os.path.join(root, '.blobs')
+        self.uploads = os.path.join(root, '.uploads')
+        self.lock = threading.Lock()
+
+    def blob_path(self, digest):
+        # the digest may come from the client, never let it escape the blob store
+        if not isinstance(digest, str) or not DIGEST_PATTERN.match(digest):
+            raise ValueError(f"Invalid hash: {digest}")
+        return os.path.join(self.blobs, digest[:2], digest)
+
+    def has_blob(self, digest):
+        blob = self.blob_path(digest)
+        return os.path.isfile(blob) and not os.path.islink(blob)
+
+    """
+    Blobs
+    """
+
+    def add_file(self, temp_path, digest, filename):
+        """
+        Move a fully written temporary file into the blob store and link it under `filename`.
+        Returns the final filename and whether the content was already stored.
+        """
+        blob = self.blob_path(digest)
+        deduplicated = self.has_blob(digest)
+
+        if deduplicated:
+            os.remove(temp_path)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(temp_path, blob)
+
+        return self.copy(digest, safe_filename(filename)), deduplicated
+
+    def open_file(self):
+        os.makedirs(self.blobs, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.blobs, suffix='.tmp')
+        return PartWriter(os.fdopen(fd, 'wb'), temp_path)
+
+    def copy(self, digest, filename):
+        blob = self.blob_path(digest)
+        name, ext = os.path.splitext(filename)
+        final_filename = filename
+        counter = 1
+
+        while os.path.exists(os.path.join(self.root, final_filename)):
+            # the same content is already available under this name
+            path = os.path.join(self.root, final_filename)
+            if os.path.getsize(path) == os.path.getsize(blob) and file_digest(path) == digest:
+                return final_filename
+            final_filename = f"{name}_{counter}{ext}"
+            counter += 1
+
+        # write under a temporary name, a partial copy must never be visible
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix='.', suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(blob, temp_path)
+        os.replace(temp_path, os.path.join(self.root, final_filename))
+
+        return final_filename
+
+    def remove(self, filename):
+        """
+        Remove a name and the blob with the same content, the other names are independent copies.
+        """
+        path = os.path.join(self.root, safe_filename(filename))
+        blob = self.blob_path(file_digest(path))
+
+        os.remove(path)
+        if os.path.isfile(blob):
+            os.remove(blob)
+
+    """
+    Chunked uploads
+    """
+
+    def manifest_path(self, upload_id):
+        if not upload_id.replace('-', '').replace('_', '').isalnum():
+            raise ValueError(f"Invalid upload id: {upload_id}")
+        return os.path.join(self.uploads, upload_id, 'manifest.json')
+
+    def read_manifest(self, upload_id):
+        path = self.manifest_path(upload_id)
+        if not os.path.exists(path):
+            raise KeyError(upload_id)
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def write_manifest(self, manifest):
+        path = self.manifest_path(manifest['uploadId'])
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, path)
+
+    def create(self, filename, size, chunk_size=None, digest=None):
+        filename = safe_filename(filename)
+        size = int(size)
+        chunk_size = int(chunk_size or DEFAULT_CHUNK_SIZE)
+        if size < 0 or chunk_size <= 0:
+            raise ValueError("Invalid upload size")
+
+        # the client already knows the hash and we have the content, nothing to upload.
+        # blobs are named after the hash computed by the server when they were stored
+        if digest and self.has_blob(digest):
+            return {
+                'filename': self.copy(digest, filename),
+                'hash': digest,
+                'complete': True,
+                'deduplicated': True,
+            }
+
+        upload_id = nanoid.generate(alphabet='0123456789abcdefghijklmnopqrstuvwxyz', size=16)
+        os.makedirs(os.path.join(self.uploads, upload_id), exist_ok=True)
+        manifest = {
+            'uploadId': upload_id,
+            'filename': filename,
+            'size': size,
+            'chunkSize': chunk_size,
+            'parts': max(1, -(-size // chunk_size)),
+            'hash': digest,
+            'received': {},     # part index -> part hash
+            'created': time.time(),
+        }
+        self.write_manifest(manifest)
+        return self.status(upload_id)
+
+    def status(self, upload_id):
+        manifest = self.read_manifest(upload_id)
+        return {
+            'uploadId': upload_id,
+            'filename': manifest['filename'],
+            'size': manifest['size'],
+            'chunkSize': manifest['chunkSize'],
+            'parts': manifest['parts'],
+            'received': sorted(int(i) for i in manifest['received']),
+            'complete': False,
+        }
+
+    def part_path(self, upload_id, index):
+        return os.path.join(self.uploads, upload_id, f"{int(index)}.part")
+
+    def open_part(self, upload_id, index):
+        manifest = self.read_manifest(upload_id)
+        index = int(index)
+        if index < 0 or index >= manifest['parts']:
+            raise ValueError(f"Invalid part index: {index}")
+
+        fd, temp_path = tempfile.mkstemp(dir=os.path.join(self.uploads, upload_id), suffix='.tmp')
+        return PartWriter(os.fdopen(fd, 'wb'), temp_path)
+
+    def commit_part(self, upload_id, index, writer):
+        """
+        Atomically publish a fully received part. Parts can arrive in any order and in parallel.
+        """
+        manifest = self.read_manifest(upload_id)
+        index = int(index)
+        expected = min(manifest['chunkSize'], manifest['size'] - index * manifest['chunkSize'])
+        if writer.size != max(expected, 0):
+            os.remove(writer.path)
+            raise ValueError(f"Part {index} has size {writer.size}, expected {expected}")
+
+        os.replace(writer.path, self.part_path(upload_id, index))
+        # other parts may be committed in parallel
+        with self.lock:
+            manifest = self.read_manifest(upload_id)
+            manifest['received'][str(index)] = writer.hexdigest()
+            self.write_manifest(manifest)
+        return self.status(upload_id)
+
+    def complete(self, upload_id):
+        manifest = self.read_manifest(upload_id)
+        missing = [i for i in range(manifest['parts']) if str(i) not in manifest['received']]
+        if missing:
+            raise ValueError(f"Missing parts: {missing}")
+
+        # concatenate the parts into the final file, hashing the whole content on the way
+        h = hashlib.new(HASH_ALGORITHM)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.join(self.uploads, upload_id), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as out:
+            for i in range(manifest['parts']):
+                with open(self.part_path(upload_id, i), 'rb') as part:
+                    while chunk := part.read(DEFAULT_CHUNK_SIZE):
+                        h.update(chunk)
+                        out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+
+        digest = h.hexdigest()
+        if manifest['hash'] and manifest['hash'] != digest:
+            os.remove(temp_path)
+            raise ValueError("Content hash mismatch")
+
+        filename, deduplicated = self.add_file(temp_path, digest, manifest['filename'])
+        self.abort(upload_id)
+
+        return {
+            'filename': filename,
+            'hash': digest,
+            'complete': True,
+            'deduplicated': deduplicated,
+        }
+
+    def abort(self, upload_id):
+        self.manifest_path(upload_id) # validate the id
+        shutil.rmtree(os.path.join(self.uploads, upload_id), ignore_errors=True)
+
+class PartWriter:
+    def __init__(self, file, path):
+        """
+        Temporary file that hashes the content while it is written.
+        """
+        self.file = file
+        self.path = path
+        self.size = 0
+        self.hash = hashlib.new(HASH_ALGORITHM)
+
+    def write(self, chunk):
+        self.hash.update(chunk)
+        self.file.write(chunk)
+        self.size += len(chunk)
+
+    def close(self, sync=True):
+        if sync:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.file.close()
+
+    def discard(self):
+        self.file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+import threading
+
+class ViewCache:
+    def __init__(self, max_bytes):
+        """
+        LRU cache of encoded /view responses, bounded by the total size of the stored bodies.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, body, content_type):
+        if len(body) > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key)[0])
+
+            self.entries[key] = (body, content_type)
+            self.size += len(body)
+
+            while self.size > self.max_bytes:
+                _, (evicted, _) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'size': self.size,
+                'max_size': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+def encode_image(image, format, quality, scale):
+    from PIL.Image import Resampling
+    import io
+
+    if scale != 1:
+        width = int(image.width * scale)
+        height = int(image.height * scale)
+        image = image.resize((max(width, 1), max(height, 1)), resample=Resampling.BICUBIC)
+
+    byte_arr = io.BytesIO()
+    image.save(byte_arr, format=format.upper(), quality=quality)
+    return byte_arr.getvalue()
@@ -0,0 +1,133 @@
+import json
+import shlex
+import threading
+import time
+from utils.memory_manager import memory_manager
+import logging
+logger = logging.getLogger('mellon')
+
+def parse_spec(spec):
+    """
+    `Module.Action param=value ... device=cuda:0`, values are parsed as JSON when possible.
+    """
+    parts = shlex.split(spec)
+    if not parts or '.' not in parts[0]:
+        raise ValueError(f"Invalid warm pool entry: {spec}")
+
+    module_name, action_name = parts[0].rsplit('.', 1)
+    params = {}
+    for part in parts[1:]:
+        if '=' not in part:
+            raise ValueError(f"Invalid warm pool param: {part}")
+        key, value = part.split('=', 1)
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+
+    device = params.pop('device', None)
+    return module_name, action_name, params, device
+
+class WarmEntry:
+    def __init__(self, name, module_name, action_name, params, device):
+        self.name = name
+        self.module_name = module_name
+        self.action_name = action_name
+        self.params = params
+        self.device = device
+        self.status = 'pending'     # pending -> loading -> warm | failed
+        self.error = None
+        self.time = None
+        self.node = None            # the loader node, it holds the shared models as long as the server runs
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'node': f"{self.module_name}.{self.action_name}",
+            'params': self.params,
+            'device': self.device,
+            'status': self.status,
+            'error': self.error,
+            'time': round(self.time, 2) if self.time is not None else None,
+            'signatures': sorted(getattr(self.node, '_mm_shared', None) or []),
+        }
+
+class WarmPool:
+    def __init__(self, specs):
+        """
+        Models loaded at boot, before any graph asks for them.
+
+        Each entry runs the loader node with the configured params, so the models end up in the shared
+        registry of the memory manager under the same signature a graph would use (see NodeBase.mm_acquire)
+        and the first graph gets an instant hit. The warm pool is one more holder of the models, they are
+        never released.
+        """
+        self.entries = []
+        for name, spec in specs.items():
+            try:
+                self.entries.append(WarmEntry(name, *parse_spec(spec)))
+            except ValueError as e:
+                logger.error(str(e))
+
+        self.thread = None
+
+    def start(self, create_node, on_change=None):
+        """
+        Load the entries one at a time in a background thread. `create_node(node_id, module_name, action_name)`
+        returns the node used to load an entry, `on_change()` is called after each step.
+        """
+        if not self.entries:
+            return
+
+        def run():
+            start = time.perf_counter()
+            for entry in self.entries:
+                self.load(entry, create_node)
+                if on_change:
+                    on_change()
+            warm = sum(e.status == 'warm' for e in self.entries)
+            logger.info(f"Warm pool: {warm}/{len(self.entries)} entries loaded in {time.perf_counter() - start:.1f}s")
+
+        self.thread = threading.Thread(target=run, name="mellon-warm-pool", daemon=True)
+        self.thread.start()
+
+    def load(self, entry, create_node):
+        entry.status = 'loading'
+        logger.info(f"Warm pool: loading {entry.name} ({entry.module_name}.{entry.action_name})")
+        start = time.perf_counter()
+
+        try:
+            entry.node = create_node(f"warm:{entry.name}", entry.module_name, entry.action_name)
+            # worker mode, the entry is loaded by the worker of the target device
+            if hasattr(entry.node, '_device') and entry.device:
+                entry.node._device = entry.device
+            entry.node(**entry.params)
+
+            if entry.device and entry.device != 'cpu':
+                self.place(entry)
+
+            entry.status = 'warm'
+        except Exception as e:
+            logger.error(f"Warm pool: error loading {entry.name}: {str(e)}")
+            entry.status = 'failed'
+            entry.error = str(e)
+        finally:
+            entry.time = time.perf_counter() - start
+
+    def place(self, entry):
+        # move the models to the target device, they stay there until the memory manager needs the space
+        try:
+            for key in getattr(entry.node, '_mm_shared', ()):
+                for model_id in memory_manager.shared_model_ids(key):
+                    memory_manager.load_model(model_id, entry.device)
+        except Exception as e:
+            logger.warning(f"Warm pool: {entry.name} kept on the cpu: {str(e)}")
+        finally:
+            memory_manager.release_models()
+
+    def stats(self):
+        return {
+            'warm': sum(e.status == 'warm' for e in self.entries),
+            'total': len(self.entries),
+            'entries': [e.to_dict() for e in self.entries],
+        }
@@ -0,0 +1,433 @@
+import concurrent.futures
+import itertools
+import queue
+import threading
+import traceback
+from multiprocessing import shared_memory, resource_tracker
+import torch.multiprocessing as mp
+from torch.multiprocessing.reductions import ForkingPickler
+from utils.hash_utils import FINGERPRINT_ATTR, fingerprint, is_image, stamp_output
+from mellon.progress import node_events
+import logging
+logger = logging.getLogger('mellon')
+
+# the sampler callbacks and the CUDA runtime need fresh processes
+mp_context = mp.get_context('spawn')
+
+class WorkerCrashed(RuntimeError):
+    pass
+
+class RemoteRef:
+    def __init__(self, worker, node, key, generation):
+        """
+        Output value that can't leave the worker that created it (eg: a model). It can be used
+        as input only by the nodes running in the same worker.
+        """
+        self.worker = worker
+        self.node = node
+        self.key = key
+        # compared by are_different and fingerprint, a new execution of the node is a new value
+        self._MELLON_HASH = f"remote:{worker}:{node}:{key}:{generation}"
+        setattr(self, FINGERPRINT_ATTR, self._MELLON_HASH)
+
+    def __repr__(self):
+        return f"<RemoteRef {self.worker}:{self.node}.{self.key}>"
+
+class SharedImage:
+    def __init__(self, image):
+        """
+        PIL image copied in a shared memory block, the receiver unlinks the block.
+        """
+        data = image.tobytes()
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[:len(data)] = data
+        self.name = block.name
+        self.length = len(data)
+        self.mode = image.mode
+        self.size = image.size
+        self.palette = image.getpalette() if image.mode == 'P' else None
+        block.close()
+        try:
+            # the block is owned by the receiver, don't let the tracker of this process unlink it
+            resource_tracker.unregister(block._name, 'shared_memory')
+        except Exception:
+            pass
+
+    def load(self):
+        from PIL import Image
+
+        block = shared_memory.SharedMemory(name=self.name)
+        try:
+            image = Image.frombytes(self.mode, self.size, bytes(block.buf[:self.length]))
+        finally:
+            block.close()
+            block.unlink()
+        if self.palette:
+            image.putpalette(self.palette)
+        return image
+
+def is_model(value):
+    import torch
+    # models, pipelines and tokenizers stay where they have been loaded
+    return isinstance(value, torch.nn.Module) or hasattr(value, 'components') or hasattr(value, 'save_pretrained')
+
+def pack(value):
+    """
+    Prepare a value for the transfer: images are moved to shared memory, tensors are shared by
+    the torch reductions of the pickler.
+    """
+    if isinstance(value, list):
+        return [pack(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(pack(v) for v in value)
+    if isinstance(value, dict):
+        return { k: pack(v) for k, v in value.items() }
+    if is_image(value):
+        return SharedImage(value)
+    return value
+
+def unpack(value, resolve=None):
+    if isinstance(value, list):
+        return [unpack(v, resolve) for v in value]
+    if isinstance(value, tuple):
+        return tuple(unpack(v, resolve) for v in value)
+    if isinstance(value, dict):
+        return { k: unpack(v, resolve) for k, v in value.items() }
+    if isinstance(value, SharedImage):
+        return value.load()
+    if isinstance(value, RemoteRef) and resolve:
+        return resolve(value)
+    return value
+
+def contains_model(value):
+    if isinstance(value, (list, tuple)):
+        return any(contains_model(v) for v in value)
+    if isinstance(value, dict):
+        return any(contains_model(v) for v in value.values())
+    return is_model(value)
+
+def find_refs(value):
+    if isinstance(value, (list, tuple)):
+        return [r for v in value for r in find_refs(v)]
+    if isinstance(value, dict):
+        return [r for v in value.values() for r in find_refs(v)]
+    return [value] if isinstance(value, RemoteRef) else []
+
+def dumps(message):
+    return bytes(ForkingPickler.dumps(message))
+
+"""
+Worker process
+"""
+
+def worker_main(name, requests, responses):
+    from modules import load_node_class
+
+    # the web server is not built in the workers, the node events are forwarded to the coordinator
+    node_events.on_progress = lambda client_id, node_id, progress: responses.put(dumps(('progress', client_id, node_id, progress)))
+    node_events.on_preview = lambda client_id, node_id, step, image: responses.put(dumps(('preview', client_id, node_id, step, SharedImage(image))))
+
+    nodes = {}
+    generation = itertools.count()
+
+    def resolve(ref):
+        if ref.worker != name or ref.node not in nodes:
+            raise ValueError(f"The output {ref.node}.{ref.key} is not available in the worker {name}")
+        return nodes[ref.node].output[ref.key]
+
+    while True:
+        message = ForkingPickler.loads(requests.get())
+        op = message['op']
+
+        if op == 'shutdown':
+            break
+
+        if op == 'release':
+            nodes.pop(message['node'], None)
+            continue
+
+        if op != 'execute':
+            continue
+
+        try:
+            node_id = message['node']
+            if node_id not in nodes:
+                nodes[node_id] = load_node_class(message['module'], message['action'])(node_id)
+            instance = nodes[node_id]
+            instance._client_id = message['sid']
+
+            args = unpack(message['args'], resolve)
+            try:
+                output = instance(**args)
+            except StopIteration:
+                output = instance.output
+
+            # each output value is sent to the coordinator unless it's a model or it can't be pickled
+            gen = next(generation)
+            packed = {}
+            for key, value in (output or {}).items():
+                if not contains_model(value):
+                    try:
+                        packed[key] = dumps(pack(value))
+                        continue
+                    except Exception:
+                        pass
+                packed[key] = dumps(RemoteRef(name, node_id, key, gen))
+
+            responses.put(dumps(('result', message['id'], packed, instance._execution_time)))
+        except BaseException as e:
+            responses.put(dumps(('error', message['id'], f"{type(e).__name__}: {str(e)}", traceback.format_exc())))
+
+"""
+Coordinator
+"""
+
+class Worker:
+    def __init__(self, name, timeout=None):
+        """
+        A worker process executing the nodes of one device.
+        """
+        self.name = name
+        self.timeout = timeout or None
+        self.ids = itertools.count()
+        self.pending = {}       # request id -> Future
+        self.lock = threading.Lock()
+        self.epoch = 0          # incremented at each restart, the outputs of the previous process are lost
+        self.restarts = 0
+        self.executed = 0
+        self.failed = 0
+        self.stopping = False
+        self.process = None
+
+    def start(self):
+        # queues are not reused, a crashed process may have left them in a broken state
+        self.requests = mp_context.Queue()
+        self.responses = mp_context.Queue()
+        self.process = mp_context.Process(
+            target=worker_main,
+            args=(self.name, self.requests, self.responses),
+            name=f"mellon-worker-{self.name}",
+            daemon=True,
+        )
+        self.process.start()
+        logger.info(f"Worker {self.name} started (pid {self.process.pid})")
+
+        if not hasattr(self, 'reader'):
+            self.reader = threading.Thread(target=self.read, name=f"mellon-worker-{self.name}-reader", daemon=True)
+            self.reader.start()
+
+    def read(self):
+        while not self.stopping:
+            try:
+                message = ForkingPickler.loads(self.responses.get(timeout=1))
+            except queue.Empty:
+                if not self.process.is_alive() and not self.stopping:
+                    self.crashed()
+                continue
+            except Exception as e:
+                logger.error(f"Invalid message from worker {self.name}: {str(e)}")
+                continue
+
+            self.handle(message)
+
+    def handle(self, message):
+        kind = message[0]
+        if kind == 'progress':
+            node_events.progress(*message[1:])
+        elif kind == 'preview':
+            client_id, node_id, step, image = message[1:]
+            node_events.preview(client_id, node_id, step, image.load())
+        elif kind in ('result', 'error'):
+            with self.lock:
+                future = self.pending.pop(message[1], None)
+            if future is None:
+                return
+            if kind == 'result':
+                self.executed += 1
+                future.set_result(message[2:])
+            else:
+                self.failed += 1
+                logger.debug(f"Worker {self.name} error: {message[3]}")
+                future.set_exception(RuntimeError(message[2]))
+
+    def crashed(self):
+        exitcode = self.process.exitcode
+        logger.error(f"Worker {self.name} died (exit code {exitcode}), restarting it")
+
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.epoch += 1
+            self.restarts += 1
+        for future in pending.values():
+            future.set_exception(WorkerCrashed(f"The worker {self.name} crashed (exit code {exitcode})"))
+
+        self.start()
+
+    def call(self, message):
+        """
+        Send a request and wait for the response, blocking. Run it in a pool thread.
+        """
+        future = concurrent.futures.Future()
+        with self.lock:
+            message['id'] = next(self.ids)
+            epoch = self.epoch
+            self.pending[message['id']] = future
+        try:
+            self.requests.put(dumps(message))
+        except Exception:
+            with self.lock:
+                self.pending.pop(message['id'], None)
+            raise
+
+        try:
+            return (*future.result(timeout=self.timeout), epoch)
+        except concurrent.futures.TimeoutError:
+            self.hung()
+            raise WorkerCrashed(f"The worker {self.name} did not answer in {self.timeout}s")
+
+    def hung(self):
+        logger.error(f"Worker {self.name} did not answer in {self.timeout}s, killing it")
+        # the reader thread sees the dead process, fails the other pending requests and restarts it
+        if self.process and self.process.is_alive():
+            self.process.kill()
+
+    def send(self, message):
+        try:
+            self.requests.put(dumps(message))
+        except Exception:
+            pass
+
+    def stop(self):
+        self.stopping = True
+        self.send({ 'op': 'shutdown' })
+        if self.process:
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.kill()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'pid': self.process.pid if self.process else None,
+                'alive': bool(self.process and self.process.is_alive()),
+                'pending': len(self.pending),
+                'executed': self.executed,
+                'failed': self.failed,
+                'restarts': self.restarts,
+            }
+
+class RemoteNode:
+    def __init__(self, pool, node_id, module_name, class_name):
+        """
+        Stand-in for a NodeBase instance living in a worker process. The web server uses it exactly
+        like a local node: calling it runs the node in the worker and brings the output back.
+        """
+        self.pool = pool
+        self.node_id = node_id
+        self.module_name = module_name
+        self.class_name = class_name
+        self.params = {}
+        self.output = {}
+        self.worker = None
+        self.epoch = None
+
+        self._client_id = None
+        self._device = 'cpu'
+        self._execution_time = 0
+        self._output_fingerprint = None
+        self._cache_key = None
+
+    def __call__(self, **kwargs):
+        # nodes that take a model as input run where the model has been loaded, the others on their device
+        refs = find_refs(kwargs)
+        workers = { ref.worker for ref in refs }
+        if len(workers) > 1:
+            raise ValueError(f"The inputs of node {self.node_id} are loaded in different workers: {', '.join(workers)}")
+        worker = self.pool.get(workers.pop() if workers else self._device)
+
+        if self.worker is not None and self.worker is not worker:
+            self.release()
+        self.worker = worker
+
+        try:
+            packed, execution_time, epoch = worker.call({
+                'op': 'execute',
+                'node': self.node_id,
+                'module': self.module_name,
+                'action': self.class_name,
+                'sid': self._client_id,
+                'args': pack(kwargs),
+            })
+        except Exception:
+            self.params = {}
+            self.output = {}
+            self._output_fingerprint = None
+            raise
+
+        self.output = { key: unpack(ForkingPickler.loads(value)) for key, value in packed.items() }
+        stamp_output(self.output)
+        # the same validated values the node stores in the worker
+        self.params = self._validate_params(kwargs)
+        self.epoch = epoch
+        self._execution_time = execution_time
+        self._output_fingerprint = None
+        self._cache_key = None
+        return self.output
+
+    # the change detection is the one of the local nodes (defaults, type casting, tool nodes)
+    def _validate_params(self, values):
+        from mellon.NodeBase import NodeBase
+        return NodeBase._validate_params(self, values)
+
+    def _has_changed(self, values):
+        from mellon.NodeBase import NodeBase
+        return NodeBase._has_changed(self, values)
+
+    def _is_output_empty(self):
+        return all(value is None for value in self.output.values())
+
+    def _is_cached(self, values):
+        # the outputs kept in the worker are lost when it restarts
+        if self.worker is None or self.epoch != self.worker.epoch:
+            return False
+
+        from mellon.NodeBase import NodeBase
+        return NodeBase._is_cached(self, values)
+
+    def _get_output_fingerprint(self):
+        if self._output_fingerprint is None:
+            self._output_fingerprint = fingerprint(self.output)
+        return self._output_fingerprint
+
+    def release(self):
+        if self.worker is not None:
+            self.worker.send({ 'op': 'release', 'node': self.node_id })
+
+    def __del__(self):
+        self.release()
+
+class WorkerPool:
+    def __init__(self, timeout=None):
+        """
+        One worker process per device, started on first use.
+        """
+        self.timeout = timeout
+        self.workers = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        with self.lock:
+            if name not in self.workers:
+                self.workers[name] = Worker(name, self.timeout)
+                self.workers[name].start()
+            return self.workers[name]
+
+    def node(self, node_id, module_name, class_name):
+        return RemoteNode(self, node_id, module_name, class_name)
+
+    def stats(self):
+        return { name: worker.stats() for name, worker in self.workers.items() }
+
+    def shutdown(self):
+        for worker in self.workers.values():
+            worker.stop()
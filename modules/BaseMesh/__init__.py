@@ -3,6 +3,7 @@ MODULE_MAP = {
     'MeshPreview': {
         'label': 'Mesh Preview',
         'category': '3D',
+        'executor': 'cpu',
         'params': {
             'mesh': {
                 'label': 'Mesh',
@@ -26,6 +27,7 @@ MODULE_MAP = {
     'MeshLoader': {
         'label': 'Load Mesh',
         'category': '3D',
+        'executor': 'cpu',
         'params': {
             'path': {
                 'label': 'Path',
@@ -42,6 +44,7 @@ MODULE_MAP = {
     'MeshSave': {
         'label': 'Save Mesh',
         'category': '3D',
+        'executor': 'cpu',
         'params': {
             'mesh': {
                 'label': 'Mesh',
@@ -58,6 +61,7 @@ MODULE_MAP = {
     'ReduceFaces': {
         'label': 'Reduce Faces',
         'category': '3D',
+        'executor': 'cpu',
         'description': 'Use `meshing_decimation_quadric_edge_collapse` PyMeshLab filter to reduce the number of faces in the mesh',
         'params': {
             'mesh': {
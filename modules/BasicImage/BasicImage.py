@@ -1,15 +1,19 @@
 from PIL import Image
 import torch
-from utils.torch_utils import toTensor, toPIL
+from utils.torch_utils import toTensor, toPIL, latentToRGB
 from mellon.NodeBase import NodeBase
 from modules.VAE.VAE import VAEDecode
 
 class Preview(VAEDecode):
-    def execute(self, images, vae, device):
-        if isinstance(images, torch.Tensor):
-            if not vae:
+    def execute(self, images, vae, device, approximate):
+        if isinstance(images, torch.Tensor) and not vae:
+            if not approximate:
                 raise ValueError("VAE is required to decode latents")
 
+            # fast approximation of the decoded image, no VAE needed
+            images = latentToRGB(images, scale_factor=8)
+
+        elif isinstance(images, torch.Tensor):
             if hasattr(vae, 'vae'):
                 vae = vae.vae
 
@@ -10,7 +10,7 @@ MODULE_MAP = {
                 'label': 'VAE | Pipeline',
                 'display': 'input',
                 'type': ['pipeline', 'vae'],
-                'description': 'VAE to decode latents. Required only if input images are latents.',
+                'description': 'VAE to decode latents. Required only if input images are latents and approximate decode is disabled.',
             },
             'images': {
                 'label': 'Images | Latents',
@@ -44,6 +44,12 @@ MODULE_MAP = {
                 'options': device_list,
                 'default': default_device,
             },
+            'approximate': {
+                'label': 'Approximate decode without VAE',
+                'type': 'boolean',
+                'default': False,
+                'description': 'Decode latents with a fast approximation when no VAE is connected',
+            },
         },
     },
 
@@ -51,6 +57,7 @@ MODULE_MAP = {
         'label': 'Save Image',
         'description': 'Save an image',
         'category': 'image',
+        'executor': 'cpu',
         'params': {
             'images': {
                 'label': 'Images',
@@ -64,6 +71,7 @@ MODULE_MAP = {
         'label': 'Load Image',
         'description': 'Load an image from path',
         'category': 'image',
+        'executor': 'cpu',
         'params': {
             'path': {
                 'label': 'Path',
@@ -83,6 +91,7 @@ MODULE_MAP = {
         'label': 'Resize to Divisible',
         'description': 'Resize an image to be divisible by a given number',
         'category': 'image',
+        'executor': 'cpu',
         'style': {
             'maxWidth': 300,
         },
@@ -120,6 +129,7 @@ MODULE_MAP = {
         'label': 'Resize',
         'description': 'Resize an image',
         'category': 'image',
+        'executor': 'cpu',
         'params': {
             'images': {
                 'label': 'Images',
@@ -172,6 +182,7 @@ MODULE_MAP = {
         'label': 'Scale By',
         'description': 'Scale an image by a given factor',
         'category': 'image',
+        'executor': 'cpu',
         'style': {
             'maxWidth': 300,
         },
@@ -207,6 +218,7 @@ MODULE_MAP = {
         'label': 'Blend Images',
         'description': 'Blend two images',
         'category': 'image',
+        'executor': 'cpu',
         'params': {
             'source': {
                 'label': 'Source',
@@ -8,6 +8,7 @@ from utils.hf_utils import is_local_files_only, get_repo_path
 from utils.diffusers_utils import get_clip_prompt_embeds, get_t5_prompt_embeds
 from config import config
 from mellon.quantization import NodeQuantization
+from mellon.batcher import sampler_batcher, BatchRequest, batch_slices
 import math
 
 HF_TOKEN = config.hf['token']
@@ -70,28 +71,34 @@ class SD3PipelineLoader(NodeBase):
 
         model_id = model_id or 'stabilityai/stable-diffusion-3.5-large'
 
-        pipeline = StableDiffusion3Pipeline.from_pretrained(
-            model_id,
-            **kwargs,
-            torch_dtype=dtype,
-            token=HF_TOKEN,
-            local_files_only=is_local_files_only(model_id),
-        )
+        def load():
+            pipeline = StableDiffusion3Pipeline.from_pretrained(
+                model_id,
+                **kwargs,
+                torch_dtype=dtype,
+                token=HF_TOKEN,
+                local_files_only=is_local_files_only(model_id),
+            )
 
-        if not hasattr(pipeline.transformer, '_mm_id'):
-            pipeline.transformer._mm_id = self.mm_add(pipeline.transformer, priority=3)
+            if not hasattr(pipeline.transformer, '_mm_id'):
+                pipeline.transformer._mm_id = self.mm_add(pipeline.transformer, priority=3)
 
-        if not hasattr(pipeline.text_encoder, '_mm_id'):
-            pipeline.text_encoder._mm_id = self.mm_add(pipeline.text_encoder, priority=1)
+            if not hasattr(pipeline.text_encoder, '_mm_id'):
+                pipeline.text_encoder._mm_id = self.mm_add(pipeline.text_encoder, priority=1)
 
-        if not hasattr(pipeline.text_encoder_2, '_mm_id'):
-            pipeline.text_encoder_2._mm_id = self.mm_add(pipeline.text_encoder_2, priority=1)
+            if not hasattr(pipeline.text_encoder_2, '_mm_id'):
+                pipeline.text_encoder_2._mm_id = self.mm_add(pipeline.text_encoder_2, priority=1)
 
-        if load_t5 and not hasattr(pipeline.text_encoder_3, '_mm_id'):
-            pipeline.text_encoder_3._mm_id = self.mm_add(pipeline.text_encoder_3, priority=1)
+            if load_t5 and not hasattr(pipeline.text_encoder_3, '_mm_id'):
+                pipeline.text_encoder_3._mm_id = self.mm_add(pipeline.text_encoder_3, priority=1)
 
-        if not hasattr(pipeline.vae, '_mm_id'):
-            pipeline.vae._mm_id = self.mm_add(pipeline.vae, priority=2)
+            if not hasattr(pipeline.vae, '_mm_id'):
+                pipeline.vae._mm_id = self.mm_add(pipeline.vae, priority=2)
+
+            return pipeline
+
+        # the connected models are part of the signature, the pipeline is built around them
+        pipeline = self.mm_acquire(('sd3_pipeline', model_id, dtype, load_t5, transformer_in, text_encoders_in, vae_in), load)
 
         return {
             'pipeline': pipeline,
@@ -115,26 +122,32 @@ class SD3TransformerLoader(NodeBase, NodeQuantization):
             from mellon.quantization import bitsandbytes
             quantization_config = bitsandbytes(kwargs['bitsandbytes_weights'], dtype=dtype, double_quant=kwargs['bitsandbytes_double_quant'])
 
-        transformer_model = SD3Transformer2DModel.from_pretrained(
-            model_path,
-            torch_dtype=dtype,
-            subfolder="transformer" if not local_files_only else None,
-            token=HF_TOKEN,
-            local_files_only=local_files_only,
-            quantization_config=quantization_config,
-        )
+        def load():
+            transformer_model = SD3Transformer2DModel.from_pretrained(
+                model_path,
+                torch_dtype=dtype,
+                subfolder="transformer" if not local_files_only else None,
+                token=HF_TOKEN,
+                local_files_only=local_files_only,
+                quantization_config=quantization_config,
+            )
+
+            transformer_model._mm_id = self.mm_add(transformer_model, priority=3)
+
+            if quantization != 'none' and not quantization_config:
+                transformer_model = self.quantize(quantization, model=transformer_model._mm_id, **kwargs)
 
-        transformer_model._mm_id = self.mm_add(transformer_model, priority=3)
+            if compile:
+                from utils.memory_manager import memory_manager
+                from utils.torch_utils import compile as compile_model
+                memory_manager.unload_all(exclude=transformer_model._mm_id)
+                transformer_model = compile_model(transformer_model)
+                self.mm_update(transformer_model._mm_id, model=transformer_model)
 
-        if quantization != 'none' and not quantization_config:
-            transformer_model = self.quantize(quantization, model=transformer_model._mm_id, **kwargs)
+            return transformer_model
 
-        if compile:
-            from utils.memory_manager import memory_manager
-            from utils.torch_utils import compile
-            memory_manager.unload_all(exclude=transformer_model._mm_id)
-            transformer_model = compile(transformer_model)
-            self.mm_update(transformer_model._mm_id, model=transformer_model)
+        signature = ('sd3_transformer', model_id, dtype, compile, quantization, tuple(sorted(kwargs.items())))
+        transformer_model = self.mm_acquire(signature, load)
 
         return { 'model': transformer_model }
 
@@ -150,36 +163,41 @@ class SD3TextEncodersLoader(NodeBase, NodeQuantization):
             #'use_safetensors': True,
         }
 
-        text_encoder = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder", **model_cfg)
-        tokenizer = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer", **model_cfg)
-        text_encoder_2 = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder_2", **model_cfg)
-        tokenizer_2 = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer_2", **model_cfg)
-
-        text_encoder._mm_id = self.mm_add(text_encoder, priority=1)
-        text_encoder_2._mm_id = self.mm_add(text_encoder_2, priority=1)
-
-        t5_encoder = None
-        t5_tokenizer = None
-        if load_t5:
-            if quantization == 'bitsandbytes':
-                from mellon.quantization import bitsandbytes
-                model_cfg['quantization_config'] = bitsandbytes(kwargs['bitsandbytes_weights'], dtype=dtype, double_quant=kwargs['bitsandbytes_double_quant'])
-
-            t5_encoder = T5EncoderModel.from_pretrained(model_id, subfolder="text_encoder_3", **model_cfg)
-            t5_tokenizer = T5TokenizerFast.from_pretrained(model_id, subfolder="tokenizer_3", **model_cfg)
-            t5_encoder._mm_id = self.mm_add(t5_encoder, priority=0)
-
-            if quantization != 'none' and not 'quantization_config' in model_cfg:
-                self.quantize(quantization, model=t5_encoder._mm_id, **kwargs)
-
-        return { 'model': {
-            'text_encoder': text_encoder,
-            'tokenizer': tokenizer,
-            'text_encoder_2': text_encoder_2,
-            'tokenizer_2': tokenizer_2,
-            'text_encoder_3': t5_encoder,
-            'tokenizer_3': t5_tokenizer,
-        }}
+        def load():
+            text_encoder = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder", **model_cfg)
+            tokenizer = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer", **model_cfg)
+            text_encoder_2 = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder_2", **model_cfg)
+            tokenizer_2 = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer_2", **model_cfg)
+
+            text_encoder._mm_id = self.mm_add(text_encoder, priority=1)
+            text_encoder_2._mm_id = self.mm_add(text_encoder_2, priority=1)
+
+            t5_encoder = None
+            t5_tokenizer = None
+            if load_t5:
+                if quantization == 'bitsandbytes':
+                    from mellon.quantization import bitsandbytes
+                    model_cfg['quantization_config'] = bitsandbytes(kwargs['bitsandbytes_weights'], dtype=dtype, double_quant=kwargs['bitsandbytes_double_quant'])
+
+                t5_encoder = T5EncoderModel.from_pretrained(model_id, subfolder="text_encoder_3", **model_cfg)
+                t5_tokenizer = T5TokenizerFast.from_pretrained(model_id, subfolder="tokenizer_3", **model_cfg)
+                t5_encoder._mm_id = self.mm_add(t5_encoder, priority=0)
+
+                if quantization != 'none' and not 'quantization_config' in model_cfg:
+                    self.quantize(quantization, model=t5_encoder._mm_id, **kwargs)
+
+            return {
+                'text_encoder': text_encoder,
+                'tokenizer': tokenizer,
+                'text_encoder_2': text_encoder_2,
+                'tokenizer_2': tokenizer_2,
+                'text_encoder_3': t5_encoder,
+                'tokenizer_3': t5_tokenizer,
+            }
+
+        signature = ('sd3_text_encoders', model_id, dtype, load_t5, quantization, tuple(sorted(kwargs.items())))
+        # the prompt encoders replace the entries of the dict with the loaded models, each node gets its own copy
+        return { 'model': dict(self.mm_acquire(signature, load)) }
 
 class SD3PromptEncoder(NodeBase):
     def execute(self,
@@ -333,7 +351,8 @@ class SD3Sampler(NodeBase):
                 denoise_range,
                 shift,
                 use_dynamic_shifting,
-                device):
+                device,
+                preview_steps): # preview_steps is used by pipe_callback
 
         generator = torch.Generator(device=device).manual_seed(seed)
 
@@ -375,10 +394,10 @@ class SD3Sampler(NodeBase):
         elif positive['prompt_embeds'].shape[1] < negative['prompt_embeds'].shape[1]:
             positive['prompt_embeds'] = torch.nn.functional.pad(positive['prompt_embeds'], (0, 0, 0, negative['prompt_embeds'].shape[1] - positive['prompt_embeds'].shape[1]))
 
-        # 3. Run the denoise loop
+        # 3. Run the denoise loop, the compatible txt2img calls of concurrent graphs are batched together
         pipelineCls = StableDiffusion3Pipeline if latents_in is None else StableDiffusion3Img2ImgPipeline
 
-        def sampling():
+        def sampling(requests):
             dummy_vae = AutoencoderKL(
                 in_channels=3,
                 out_channels=3,
@@ -403,18 +422,30 @@ class SD3Sampler(NodeBase):
                 vae=dummy_vae.to(device),
             )
 
+            if len(requests) == 1:
+                inputs = requests[0].inputs
+                batch_generator = inputs['generator']
+                callback = self.pipe_callback
+            else:
+                inputs = {
+                    side: { key: torch.cat([r.inputs[side][key] for r in requests]) for key in ('prompt_embeds', 'pooled_prompt_embeds') }
+                    for side in ('positive', 'negative')
+                }
+                batch_generator = [r.inputs['generator'] for r in requests]
+                callback = sampler_batcher.pipe_callback(requests, batch_slices(requests))
+
             sampling_config = {
-                'generator': generator,
-                'prompt_embeds': positive['prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
-                'pooled_prompt_embeds': positive['pooled_prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
-                'negative_prompt_embeds': negative['prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
-                'negative_pooled_prompt_embeds': negative['pooled_prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
+                'generator': batch_generator,
+                'prompt_embeds': inputs['positive']['prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
+                'pooled_prompt_embeds': inputs['positive']['pooled_prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
+                'negative_prompt_embeds': inputs['negative']['prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
+                'negative_pooled_prompt_embeds': inputs['negative']['pooled_prompt_embeds'].to(device, dtype=pipeline.transformer.dtype),
                 'width': width,
                 'height': height,
                 'guidance_scale': cfg,
                 'num_inference_steps': steps,
                 'output_type': "latent",
-                'callback_on_step_end': self.pipe_callback,
+                'callback_on_step_end': callback,
                 'mu': mu,
             }
 
@@ -426,14 +457,26 @@ class SD3Sampler(NodeBase):
 
             latents = sampling_pipe(**sampling_config).images
             del sampling_pipe, sampling_config, dummy_vae
-            return latents
+            return [latents[start:end] for start, end in batch_slices(requests)]
 
-        self.mm_load(pipeline.transformer, device)
-        latents = self.mm_inference(
-            sampling,
-            device,
-            exclude=pipeline.transformer
-        )
+        def run_batch(requests):
+            # only the thread running the batch takes the transformer, the other requests of the batch must not wait for it
+            self.mm_load(pipeline.transformer, device)
+            return self.mm_inference(
+                lambda: sampling(requests),
+                device,
+                exclude=pipeline.transformer
+            )
+
+        request = BatchRequest({ 'positive': positive, 'negative': negative, 'generator': generator }, 1, self)
+        if latents_in is None and positive['prompt_embeds'].shape[0] == 1:
+            batch_key = (
+                'SD3Sampler', id(pipeline), scheduler, steps, cfg, width, height, shift, use_dynamic_shifting, device,
+                tuple(positive['prompt_embeds'].shape), tuple(negative['prompt_embeds'].shape),
+            )
+            latents = sampler_batcher.run(batch_key, device, request, run_batch)
+        else:
+            latents = run_batch([request])[0]
         latents = latents.to('cpu')
 
         return { 'latents': latents, 'pipeline_out': pipeline }
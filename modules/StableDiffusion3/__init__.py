@@ -5,6 +5,7 @@ MODULE_MAP = {
     'SD3PipelineLoader': {
         'label': 'SD3 Pipeline Loader',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'pipeline': {
                 'label': 'SD3 Pipeline',
@@ -53,6 +54,7 @@ MODULE_MAP = {
         'label': 'SD3 Transformer loader',
         'description': 'Load the Transformer of an SD3 model',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'model': {
                 'label': 'Transformer',
@@ -85,6 +87,7 @@ MODULE_MAP = {
         'label': 'SD3 Text Encoders Loader',
         'description': 'Load both the CLIP and T5 Text Encoders',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'model': {
                 'label': 'SD3 Encoders',
@@ -116,6 +119,7 @@ MODULE_MAP = {
     'SD3PromptEncoder': {
         'label': 'SD3 Prompt Encoder',
         'category': 'text-encoders',
+        'cacheable': True,
         'params': {
             'text_encoders': {
                 'label': 'SD3 Encoders | SD3 Pipeline',
@@ -216,6 +220,10 @@ MODULE_MAP = {
         'style': {
             'maxWidth': '360px',
         },
+        'cacheable': True,
+        'cache_passthrough': { 'pipeline_out': 'pipeline' },
+        'dynamic_batching': True,
+        'prefetch': [ 'pipeline.transformer' ],
         'params': {
             'pipeline': {
                 'label': 'Transformer | Pipeline',
@@ -342,6 +350,14 @@ MODULE_MAP = {
                 'options': device_list,
                 'default': default_device,
             },
+            'preview_steps': {
+                'label': 'Live Preview Every N Steps',
+                'type': 'int',
+                'default': 0,
+                'min': 0,
+                'max': 100,
+                'description': 'Stream an approximate preview of the latents every N steps, 0 to disable',
+            },
         },
     },
 }
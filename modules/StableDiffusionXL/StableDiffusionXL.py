@@ -6,6 +6,7 @@ from utils.hf_utils import is_local_files_only
 from utils.diffusers_utils import get_clip_prompt_embeds
 import torch
 from modules.VAE.VAE import VAEEncode
+from mellon.batcher import sampler_batcher, BatchRequest, batch_slices
 import random
 import logging
 logger = logging.getLogger('mellon')
@@ -24,34 +25,40 @@ class SDXLPipelineLoader(NodeBase):
 
         model_id = model_id or 'stabilityai/stable-diffusion-xl-base-1.0'
 
-        pipeline = StableDiffusionXLPipeline.from_pretrained(
-            model_id,
-            **kwargs,
-            torch_dtype=dtype,
-            token=HF_TOKEN,
-            local_files_only=is_local_files_only(model_id),
-            variant=variant,
-            add_watermarker=False,
-        )
+        def load():
+            pipeline = StableDiffusionXLPipeline.from_pretrained(
+                model_id,
+                **kwargs,
+                torch_dtype=dtype,
+                token=HF_TOKEN,
+                local_files_only=is_local_files_only(model_id),
+                variant=variant,
+                add_watermarker=False,
+            )
 
-        if text_encoders:
-            pipeline.text_encoder = text_encoders['text_encoder'] if pipeline.text_encoder is not None else None
-            pipeline.text_encoder_2 = text_encoders['text_encoder_2']
-            pipeline.tokenizer = text_encoders['tokenizer'] if pipeline.tokenizer is not None else None
-            pipeline.tokenizer_2 = text_encoders['tokenizer_2']
-        
-        if not hasattr(pipeline.unet, '_mm_id'):
-            pipeline.unet._mm_id = self.mm_add(pipeline.unet, priority=3)
+            if text_encoders:
+                pipeline.text_encoder = text_encoders['text_encoder'] if pipeline.text_encoder is not None else None
+                pipeline.text_encoder_2 = text_encoders['text_encoder_2']
+                pipeline.tokenizer = text_encoders['tokenizer'] if pipeline.tokenizer is not None else None
+                pipeline.tokenizer_2 = text_encoders['tokenizer_2']
+            
+            if not hasattr(pipeline.unet, '_mm_id'):
+                pipeline.unet._mm_id = self.mm_add(pipeline.unet, priority=3)
+
+            # the refiner doesn't have the first text encoder
+            if pipeline.text_encoder and not hasattr(pipeline.text_encoder, '_mm_id'):
+                pipeline.text_encoder._mm_id = self.mm_add(pipeline.text_encoder, priority=1)
 
-        # the refiner doesn't have the first text encoder
-        if pipeline.text_encoder and not hasattr(pipeline.text_encoder, '_mm_id'):
-            pipeline.text_encoder._mm_id = self.mm_add(pipeline.text_encoder, priority=1)
+            if not hasattr(pipeline.text_encoder_2, '_mm_id'):
+                pipeline.text_encoder_2._mm_id = self.mm_add(pipeline.text_encoder_2, priority=1)
 
-        if not hasattr(pipeline.text_encoder_2, '_mm_id'):
-            pipeline.text_encoder_2._mm_id = self.mm_add(pipeline.text_encoder_2, priority=1)
+            if not hasattr(pipeline.vae, '_mm_id'):
+                pipeline.vae._mm_id = self.mm_add(pipeline.vae, priority=2)
 
-        if not hasattr(pipeline.vae, '_mm_id'):
-            pipeline.vae._mm_id = self.mm_add(pipeline.vae, priority=2)
+            return pipeline
+
+        # the connected models are part of the signature, the pipeline is built around them
+        pipeline = self.mm_acquire(('sdxl_pipeline', model_id, dtype, variant, unet, vae, text_encoders), load)
 
         return {
             'pipeline': pipeline,
@@ -74,20 +81,24 @@ class SDXLUnetLoader(NodeBase):
         if not variant:
             variant = None
 
-        unet = UNet2DConditionModel.from_pretrained(
-            model_id,
-            torch_dtype=dtype,
-            subfolder="unet",
-            token=HF_TOKEN,
-            local_files_only=local_files_only,
-            variant=variant,
-        )
+        def load():
+            unet = UNet2DConditionModel.from_pretrained(
+                model_id,
+                torch_dtype=dtype,
+                subfolder="unet",
+                token=HF_TOKEN,
+                local_files_only=local_files_only,
+                variant=variant,
+            )
 
-        #if not is_file_cached(model_id, 'model_index.json'):
-        #    from huggingface_hub import hf_hub_download
-        #    hf_hub_download(repo_id=model_id, filename='model_index.json', token=HF_TOKEN)
+            #if not is_file_cached(model_id, 'model_index.json'):
+            #    from huggingface_hub import hf_hub_download
+            #    hf_hub_download(repo_id=model_id, filename='model_index.json', token=HF_TOKEN)
 
-        unet._mm_id = self.mm_add(unet, priority=3)
+            unet._mm_id = self.mm_add(unet, priority=3)
+            return unet
+
+        unet = self.mm_acquire(('sdxl_unet', model_id, dtype, variant), load)
 
         return { 'model': unet }
 
@@ -101,20 +112,24 @@ class SDXLTextEncodersLoader(NodeBase):
             'local_files_only': is_local_files_only(model_id),
         }
 
-        text_encoder = CLIPTextModel.from_pretrained(model_id, subfolder="text_encoder", **model_cfg)
-        tokenizer = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer", **model_cfg)
-        text_encoder_2 = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder_2", **model_cfg)
-        tokenizer_2 = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer_2", **model_cfg)
-        
-        text_encoder._mm_id = self.mm_add(text_encoder, priority=1)
-        text_encoder_2._mm_id = self.mm_add(text_encoder_2, priority=1)
+        def load():
+            text_encoder = CLIPTextModel.from_pretrained(model_id, subfolder="text_encoder", **model_cfg)
+            tokenizer = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer", **model_cfg)
+            text_encoder_2 = CLIPTextModelWithProjection.from_pretrained(model_id, subfolder="text_encoder_2", **model_cfg)
+            tokenizer_2 = CLIPTokenizer.from_pretrained(model_id, subfolder="tokenizer_2", **model_cfg)
+            
+            text_encoder._mm_id = self.mm_add(text_encoder, priority=1)
+            text_encoder_2._mm_id = self.mm_add(text_encoder_2, priority=1)
+
+            return {
+                'text_encoder': text_encoder,
+                'tokenizer': tokenizer,
+                'text_encoder_2': text_encoder_2,
+                'tokenizer_2': tokenizer_2,
+            }
 
-        return { 'model': {
-            'text_encoder': text_encoder,
-            'tokenizer': tokenizer,
-            'text_encoder_2': text_encoder_2,
-            'tokenizer_2': tokenizer_2,
-        }}      
+        # the prompt encoders replace the entries of the dict with the loaded models, each node gets its own copy
+        return { 'model': dict(self.mm_acquire(('sdxl_text_encoders', model_id, dtype), load)) }
 
 
 class SDXLSinglePromptEncoder(NodeBase):
@@ -245,17 +260,23 @@ class SDXLSampler(NodeBase):
                 denoise_range,
                 device,
                 sync_latents,
+                preview_steps, # used by pipe_callback
         ):
         #generator = [torch.Generator(device=device).manual_seed(seed + i) for i in range(num_images)]
         generator = []
 
-        random_state = random.getstate()
-        random.seed(seed)
-        for _ in range(num_images):
-            generator.append(torch.Generator(device=device).manual_seed(seed))
-            # there is a very slight chance that the seed is the same as the previous one, I don't think it's a big deal
-            seed = random.randint(0, (1<<53)-1)
-        random.setstate(random_state)
+        if isinstance(seed, list):
+            # batched seed sweep, one image per seed
+            generator = [torch.Generator(device=device).manual_seed(s) for s in seed]
+            num_images = len(seed)
+        else:
+            random_state = random.getstate()
+            random.seed(seed)
+            for _ in range(num_images):
+                generator.append(torch.Generator(device=device).manual_seed(seed))
+                # there is a very slight chance that the seed is the same as the previous one, I don't think it's a big deal
+                seed = random.randint(0, (1<<53)-1)
+            random.setstate(random_state)
 
         denoise_range_start = denoise_range[0] if denoise_range[0] > 0 else None
         denoise_range_end = denoise_range[1] if denoise_range[1] < 1 else None
@@ -310,8 +331,8 @@ class SDXLSampler(NodeBase):
             denoising_end = max(denoising_end, denoising_start + 0.01)
             logger.warning(f"Denoise range value error. Denoising end increased to: {denoising_end}")
 
-        # 4. Run the denoise loop
-        def denoise():
+        # 4. Run the denoise loop, the compatible txt2img calls of concurrent graphs are batched together
+        def denoise(requests):
             # We don't need the VAE for sampling, but we need to pass something to the pipeline
             dummy_vae = AutoencoderKL(
                 in_channels=3,
@@ -323,21 +344,36 @@ class SDXLSampler(NodeBase):
                 latent_channels=4,
             )
 
+            if len(requests) == 1:
+                inputs = requests[0].inputs
+                batch_generator = inputs['generator']
+                num_images_per_prompt = requests[0].size
+                callback = self.pipe_callback
+            else:
+                # each prompt is repeated for the number of images of its request
+                inputs = {
+                    side: { key: torch.cat([r.inputs[side][key].repeat_interleave(r.size, dim=0) for r in requests]) for key in ('prompt_embeds', 'pooled_prompt_embeds') }
+                    for side in ('positive', 'negative')
+                }
+                batch_generator = [g for r in requests for g in r.inputs['generator']]
+                num_images_per_prompt = 1
+                callback = sampler_batcher.pipe_callback(requests, batch_slices(requests))
+
             sampling_config = {
-                'generator': generator,
-                'prompt_embeds': positive['prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
-                'pooled_prompt_embeds': positive['pooled_prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
-                'negative_prompt_embeds': negative['prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
-                'negative_pooled_prompt_embeds': negative['pooled_prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
+                'generator': batch_generator,
+                'prompt_embeds': inputs['positive']['prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
+                'pooled_prompt_embeds': inputs['positive']['pooled_prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
+                'negative_prompt_embeds': inputs['negative']['prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
+                'negative_pooled_prompt_embeds': inputs['negative']['pooled_prompt_embeds'].to(device, dtype=pipeline.unet.dtype),
                 'width': width,
                 'height': height,
                 'guidance_scale': cfg,
                 'num_inference_steps': steps,
                 'output_type': "latent",
-                'callback_on_step_end': self.pipe_callback,
+                'callback_on_step_end': callback,
                 'denoising_start': denoising_start,
                 'denoising_end': denoising_end,
-                'num_images_per_prompt': num_images,
+                'num_images_per_prompt': num_images_per_prompt,
             }
 
             if image_latents is not None:
@@ -374,14 +410,26 @@ class SDXLSampler(NodeBase):
 
             latents = sampling_pipe(**sampling_config).images
             del sampling_pipe, sampling_config, dummy_vae
-            return latents
+            return [latents[start:end] for start, end in batch_slices(requests)]
 
-        self.mm_load(pipeline.unet, device)
-        latents = self.mm_inference(
-            denoise,
-            device,
-            exclude=pipeline.unet
-        )
+        def run_batch(requests):
+            # only the thread running the batch takes the unet, the other requests of the batch must not wait for it
+            self.mm_load(pipeline.unet, device)
+            return self.mm_inference(
+                lambda: denoise(requests),
+                device,
+                exclude=pipeline.unet
+            )
+
+        request = BatchRequest({ 'positive': positive, 'negative': negative, 'generator': generator }, num_images, self)
+        if image_latents is None and positive['prompt_embeds'].shape[0] == 1:
+            batch_key = (
+                'SDXLSampler', id(pipeline), scheduler, steps, cfg, width, height, denoising_end, device,
+                tuple(positive['prompt_embeds'].shape), tuple(negative['prompt_embeds'].shape),
+            )
+            latents = sampler_batcher.run(batch_key, device, request, run_batch)
+        else:
+            latents = run_batch([request])[0]
         latents = latents.to('cpu')
 
         if denoising_end:
@@ -6,6 +6,7 @@ MODULE_MAP = {
         'label': 'SDXL Pipeline Loader',
         'description': 'Load the SDXL Pipeline',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'unet_out': {
                 'label': 'UNet',
@@ -71,6 +72,7 @@ MODULE_MAP = {
     'SDXLPromptsEncoder': {
         'label': 'SDXL Prompts Encoder',
         'category': 'text-encoders',
+        'cacheable': True,
         'params': {
             'text_encoders': {
                 'label': 'SDXL Encoders | Pipeline',
@@ -146,6 +148,12 @@ MODULE_MAP = {
         'style': {
             'maxWidth': '360px',
         },
+        'cacheable': True,
+        # the pipeline is passed along, only the latents are stored in the output cache
+        'cache_passthrough': { 'pipeline_out': 'pipeline' },
+        'dynamic_batching': True,
+        'batch': { 'seed': 'num_images' },
+        'prefetch': [ 'pipeline.unet' ],
         'params': {
             'pipeline': {
                 'label': 'Pipeline',
@@ -314,6 +322,14 @@ MODULE_MAP = {
                 'options': device_list,
                 'default': default_device,
             },
+            'preview_steps': {
+                'label': 'Live Preview Every N Steps',
+                'type': 'int',
+                'default': 0,
+                'min': 0,
+                'max': 100,
+                'description': 'Stream an approximate preview of the latents every N steps, 0 to disable',
+            },
         },
     },
 
@@ -321,6 +337,7 @@ MODULE_MAP = {
         'label': 'SDXL UNet Loader',
         'description': 'Load the UNet of an SDXL model',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'model': {
                 'label': 'UNet',
@@ -356,6 +373,7 @@ MODULE_MAP = {
         'label': 'SDXL Text Encoders Loader',
         'description': 'Load the CLIP Text Encoders',
         'category': 'loaders',
+        'cache_key': True,
         'params': {
             'model': {
                 'label': 'SDXL Encoders',
@@ -386,6 +404,7 @@ MODULE_MAP = {
     'SDXLSinglePromptEncoder': {
         'label': 'SDXL Single Prompt Encoder',
         'category': 'text-encoders',
+        'cacheable': True,
         'params': {
             'text_encoders': {
                 'label': 'SDXL Encoders | SDXL Pipeline',
@@ -12,13 +12,17 @@ class LoadVAE(NodeBase):
         #if not compile and self.is_compiled:
         #    self.mm_unload(vae)
 
-        vae = AutoencoderKL.from_pretrained(
-            model_id, 
-            subfolder="vae", 
-            local_files_only=is_local_files_only(model_id),
-        )
+        def load():
+            vae = AutoencoderKL.from_pretrained(
+                model_id, 
+                subfolder="vae", 
+                local_files_only=is_local_files_only(model_id),
+            )
+
+            vae._mm_id = self.mm_add(vae, priority=2)
+            return vae
 
-        vae._mm_id = self.mm_add(vae, priority=2)
+        vae = self.mm_acquire(('vae', model_id), load)
 
         """
         if compile:
@@ -5,6 +5,7 @@ MODULE_MAP = {
         'label': 'VAE Loader',
         'description': 'Load the VAE of a Stable Diffusion model',
         'category': 'vae',
+        'cache_key': True,
         'params': {
             'model': {
                 'label': 'VAE',
@@ -27,6 +28,7 @@ MODULE_MAP = {
         'style': {
             'maxWidth': 300,
         },
+        'cacheable': True,
         'params': {
             'model': {
                 'label': 'VAE | Pipeline',
@@ -62,6 +64,7 @@ MODULE_MAP = {
         'label': 'VAE Decode',
         'description': 'Decode a latent space into an image',
         'category': 'vae',
+        'cacheable': True,
         'params': {
             'model': {
                 'label': 'VAE | Pipeline',
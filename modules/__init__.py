@@ -1,24 +1,94 @@
 from os import scandir
 from importlib import import_module
+import sys
+import threading
+import time
 import logging
 logger = logging.getLogger('mellon')
 
+# The node catalogues (modules/X/__init__.py) only hold the MODULE_MAP metadata and are loaded at startup.
+# The implementations (modules/X/X.py) pull in diffusers, transformers, etc. and are imported on first
+# execution or by the background warm-up.
+
+# seconds spent importing each catalogue and implementation
+IMPORT_TIMES = { 'catalogues': {}, 'implementations': {} }
+
+def timed_import(kind, module_name, import_name):
+    start = time.perf_counter()
+    mod = import_module(import_name)
+    IMPORT_TIMES[kind].setdefault(module_name, time.perf_counter() - start)
+    return mod
+
 logger.debug("Loading modules...")
 
 MODULE_MAP = {}
 
 for m in scandir("modules"):
     if m.is_dir() and not m.name.startswith(("__", ".")) and m.name not in globals():
-        MODULE_MAP[m.name] = import_module(f"modules.{m.name}").MODULE_MAP
+        MODULE_MAP[m.name] = timed_import('catalogues', m.name, f"modules.{m.name}").MODULE_MAP
         logger.debug(f"Loaded module: {m.name}")
 
 logger.debug("Loading custom modules...")
 
 for m in scandir("custom"):
     if m.is_dir() and not m.name.startswith(("__", ".")) and m.name not in globals():
-        MODULE_MAP[f"{m.name}.custom"] = import_module(f"custom.{m.name}").MODULE_MAP
+        MODULE_MAP[f"{m.name}.custom"] = timed_import('catalogues', f"{m.name}.custom", f"custom.{m.name}").MODULE_MAP
         logger.debug(f"Loaded custom module: {m.name}")
 
+logger.debug(f"Loaded {len(MODULE_MAP)} node catalogues in {sum(IMPORT_TIMES['catalogues'].values()):.2f}s")
+
+def implementation_name(module_name):
+    if module_name.endswith(".custom"):
+        name = module_name.replace('.custom', '')
+        return f"custom.{name}.{name}"
+    return f"modules.{module_name}.{module_name}"
+
+def load_implementation(module_name):
+    """
+    Import the implementation of a module on first use.
+    """
+    import_name = implementation_name(module_name)
+    if import_name in sys.modules:
+        return sys.modules[import_name]
+
+    mod = timed_import('implementations', module_name, import_name)
+    logger.debug(f"Imported {import_name} in {IMPORT_TIMES['implementations'][module_name]:.2f}s")
+    return mod
+
+def load_node_class(module_name, action_name):
+    if module_name not in MODULE_MAP:
+        raise ValueError("Invalid module")
+    if action_name not in MODULE_MAP[module_name]:
+        raise ValueError("Invalid action")
+
+    return getattr(load_implementation(module_name), action_name)
+
+def warm_up(module_names=None):
+    """
+    Import the implementations in a background thread, all of them if `module_names` is None.
+    """
+    module_names = [m for m in (module_names or MODULE_MAP) if m in MODULE_MAP]
+
+    def run():
+        start = time.perf_counter()
+        for module_name in module_names:
+            try:
+                load_implementation(module_name)
+            except Exception as e:
+                logger.warning(f"Error importing module {module_name}: {str(e)}")
+        logger.debug(f"Warm-up: {len(module_names)} modules imported in {time.perf_counter() - start:.2f}s")
+
+    thread = threading.Thread(target=run, name="mellon-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+def import_report():
+    # slowest first
+    return {
+        kind: { name: round(seconds, 3) for name, seconds in sorted(times.items(), key=lambda t: -t[1]) }
+        for kind, times in IMPORT_TIMES.items()
+    }
+
 
 # Add random helper fields
 def create_random_field(param):
@@ -0,0 +1,183 @@
+import heapq
+
+class IndexedHeap:
+    def __init__(self):
+        """
+        Binary min-heap of `(key, id)` with an index of the positions, the key of an id can be
+        updated or removed in O(log n) without rebuilding the heap.
+        """
+        self.heap = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, id):
+        return id in self.index
+
+    def key(self, id):
+        return self.heap[self.index[id]][0] if id in self.index else None
+
+    def push(self, id, key):
+        if id in self.index:
+            pos = self.index[id]
+            old = self.heap[pos][0]
+            self.heap[pos] = (key, id)
+            if key < old:
+                self._up(pos)
+            else:
+                self._down(pos)
+            return
+
+        self.heap.append((key, id))
+        self.index[id] = len(self.heap) - 1
+        self._up(len(self.heap) - 1)
+
+    def remove(self, id):
+        if id not in self.index:
+            return
+        pos = self.index.pop(id)
+        last = self.heap.pop()
+        if pos < len(self.heap):
+            self.heap[pos] = last
+            self.index[last[1]] = pos
+            self._up(pos)
+            self._down(self.index[last[1]])
+
+    def ordered(self):
+        """
+        Ids from the lowest key, lazily: taking the first k costs O(k log n).
+        """
+        frontier = [(self.heap[0], 0)] if self.heap else []
+        while frontier:
+            (key, id), pos = frontier[0]
+            yield id
+            # the children of a popped node are the only new candidates
+            heapq.heappop(frontier)
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < len(self.heap):
+                    heapq.heappush(frontier, (self.heap[child], child))
+
+    def _swap(self, a, b):
+        self.heap[a], self.heap[b] = self.heap[b], self.heap[a]
+        self.index[self.heap[a][1]] = a
+        self.index[self.heap[b][1]] = b
+
+    def _up(self, pos):
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if self.heap[pos] >= self.heap[parent]:
+                break
+            self._swap(pos, parent)
+            pos = parent
+
+    def _down(self, pos):
+        size = len(self.heap)
+        while True:
+            smallest = pos
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < size and self.heap[child] < self.heap[smallest]:
+                    smallest = child
+            if smallest == pos:
+                break
+            self._swap(pos, smallest)
+            pos = smallest
+
+class EvictionPolicy:
+    name = None
+
+    def __init__(self, manager):
+        """
+        Order in which the memory manager evicts the models of a device, lowest key first.
+        The keys are kept in one indexed heap per device and updated when a model changes.
+        """
+        self.manager = manager
+        self.heaps = {}
+        self.devices = {}       # model id -> device of its heap
+        self.hits = 0           # load_model found the model already on the device
+        self.misses = 0         # the model had to be moved
+        self.evictions = 0
+
+    def key(self, model_id, entry):
+        raise NotImplementedError
+
+    def update(self, model_id, entry):
+        device = entry['device']
+        if self.devices.get(model_id, device) != device:
+            self.heaps[self.devices[model_id]].remove(model_id)
+        self.devices[model_id] = device
+        self.heaps.setdefault(device, IndexedHeap()).push(model_id, self.key(model_id, entry))
+
+    def remove(self, model_id):
+        device = self.devices.pop(model_id, None)
+        if device is not None:
+            self.heaps[device].remove(model_id)
+
+    def reset(self):
+        self.heaps = {}
+        self.devices = {}
+
+    def evicted(self, model_id):
+        self.evictions += 1
+
+    def candidates(self, device):
+        return self.heaps[device].ordered() if device in self.heaps else iter(())
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+class LRUPolicy(EvictionPolicy):
+    name = 'lru'
+
+    def key(self, model_id, entry):
+        return (entry['priority'], entry['last_used'])
+
+class LFUPolicy(EvictionPolicy):
+    name = 'lfu'
+
+    def key(self, model_id, entry):
+        return (entry['priority'], entry['uses'], entry['last_used'])
+
+class CostAwarePolicy(EvictionPolicy):
+    name = 'cost'
+
+    def __init__(self, manager):
+        """
+        GreedyDual: the key of a model is its reload cost (size / measured bandwidth of the device)
+        plus the key of the last model evicted from the device when it was last used. Cheap models
+        go first but an expensive model that is not used anymore ages out as the device clock moves.
+        """
+        super().__init__(manager)
+        self.clocks = {}        # device -> key of the last evicted model
+        self.used = {}          # model id -> last_used the credit was computed for
+
+    def key(self, model_id, entry):
+        heap = self.heaps.get(entry['device'])
+        # the credit is renewed only on use, other updates (eg: priority) keep the current one
+        if heap is not None and model_id in heap and entry['last_used'] == self.used.get(model_id):
+            credit = heap.key(model_id)[1]
+        else:
+            credit = self.clocks.get(entry['device'], 0) + self.manager.reload_cost(entry)
+        self.used[model_id] = entry['last_used']
+        return (entry['priority'], credit)
+
+    def remove(self, model_id):
+        super().remove(model_id)
+        self.used.pop(model_id, None)
+
+    def reset(self):
+        super().reset()
+        self.clocks = {}
+        self.used = {}
+
+    def evicted(self, model_id):
+        super().evicted(model_id)
+        device = self.devices.get(model_id)
+        if device is not None and model_id in self.heaps[device]:
+            self.clocks[device] = max(self.clocks.get(device, 0), self.heaps[device].key(model_id)[1])
+
+EVICTION_POLICIES = { policy.name: policy for policy in (LRUPolicy, LFUPolicy, CostAwarePolicy) }
@@ -0,0 +1,215 @@
+import hashlib
+import itertools
+import uuid
+
+# attribute used to memoize the digest on the hashed object
+FINGERPRINT_ATTR = '_mellon_fingerprint'
+# execution that produced an output value, see stamp_output
+GENERATION_ATTR = '_mellon_generation'
+
+generations = itertools.count(1)
+
+def memoize(obj, digest):
+    try:
+        setattr(obj, FINGERPRINT_ATTR, digest)
+    except (AttributeError, TypeError):
+        pass
+
+    return digest
+
+def is_image(value):
+    return hasattr(value, 'getdata') and hasattr(value, 'mode') and hasattr(value, 'tobytes')
+
+def stamp_output(value):
+    """
+    Mark the images and tensors of a node output with a new generation, called every time a node
+    produces its output. PIL images and inference tensors have no version counter, their digest is
+    memoized only until the next stamp.
+    """
+    import torch
+
+    generation = next(generations)
+
+    def stamp(value):
+        if isinstance(value, (list, tuple)):
+            for v in value:
+                stamp(v)
+        elif isinstance(value, dict):
+            for v in value.values():
+                stamp(v)
+        elif isinstance(value, torch.Tensor) or is_image(value):
+            try:
+                setattr(value, GENERATION_ATTR, generation)
+            except (AttributeError, TypeError):
+                pass
+
+    stamp(value)
+
+def memoized(value, key):
+    cached = getattr(value, FINGERPRINT_ATTR, None)
+    return cached[1] if key is not None and isinstance(cached, tuple) and cached[0] == key else None
+
+def image_fingerprint(image):
+    """
+    Content hash of a PIL image, memoized for the generation of the output it belongs to (see stamp_output).
+    PIL images are routinely modified in place (paste, putpixel, ImageDraw) and have no version counter,
+    images that are not part of an output are hashed every time.
+    """
+    key = getattr(image, GENERATION_ATTR, None)
+    digest = memoized(image, key)
+    if digest:
+        return digest
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{image.mode}:{image.width}x{image.height}:".encode())
+    h.update(image.tobytes())
+    digest = h.hexdigest()
+
+    if key is not None:
+        memoize(image, (key, digest))
+    return digest
+
+def bytes_fingerprint(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# buffers are hashed in chunks so that huge tensors are never copied in one piece
+HASH_CHUNK_SIZE = 16*1024*1024
+
+# tensors smaller than this are simply copied to the host, larger ones are reduced on the device
+DEVICE_HASH_THRESHOLD = 1024*1024
+DEVICE_HASH_CHUNK_SIZE = 4*1024*1024
+
+def buffer_digest(h, buffer):
+    """
+    Streaming update of `h` with a flat uint8 buffer (numpy array or memoryview), without copies.
+    """
+    view = memoryview(buffer).cast('B')
+    for i in range(0, len(view), HASH_CHUNK_SIZE):
+        h.update(view[i:i + HASH_CHUNK_SIZE])
+
+def mix64(x):
+    # splitmix64 finalizer, wrapping int64 arithmetic
+    x = x ^ (x >> 30)
+    x = x * -4658895280553007687    # 0xbf58476d1ce4e5b9
+    x = x ^ (x >> 27)
+    x = x * -7723592293110705685    # 0x94d049bb133111eb
+    return x ^ (x >> 31)
+
+def device_digest(h, data):
+    """
+    Hash a flat uint8 tensor where it lives (eg: on the GPU) and transfer only a few bytes per chunk.
+    Each chunk is reduced to two position-weighted sums with pseudo-random weights. It is not a
+    cryptographic hash but it is more than enough to detect changes.
+    """
+    import torch
+
+    sums = []
+    for i in range(0, data.numel(), DEVICE_HASH_CHUNK_SIZE):
+        chunk = data[i:i + DEVICE_HASH_CHUNK_SIZE].to(torch.int64)
+        position = torch.arange(i, i + chunk.numel(), device=data.device, dtype=torch.int64)
+        sums.append(torch.stack([
+            (chunk * mix64(position)).sum(),
+            (chunk * mix64(position ^ 0x5bd1e995)).sum(),
+        ]))
+
+    h.update(torch.stack(sums).cpu().numpy().tobytes())
+
+def tensor_fingerprint(tensor):
+    """
+    Content hash of a tensor. The digest is stored with the tensor version counter
+    so that in-place modifications invalidate it.
+    """
+    import torch
+
+    # inference tensors have no version counter (`_version` raises), use the output generation
+    if tensor.is_inference():
+        generation = getattr(tensor, GENERATION_ATTR, None)
+        key = ('generation', generation) if generation is not None else None
+    else:
+        key = ('version', tensor._version)
+    digest = memoized(tensor, key)
+    if digest:
+        return digest
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{tensor.dtype}:{tuple(tensor.shape)}:".encode())
+    data = tensor.detach().contiguous().view(-1)
+    if data.numel():
+        data = data.view(torch.uint8)
+        if data.device.type != 'cpu' and data.numel() > DEVICE_HASH_THRESHOLD:
+            h.update(f"{data.device.type}:".encode())
+            device_digest(h, data)
+        else:
+            buffer_digest(h, data.cpu().numpy())
+    digest = h.hexdigest()
+
+    if key is not None:
+        memoize(tensor, (key, digest))
+    return digest
+
+def array_fingerprint(array):
+    import numpy as np
+
+    if array.dtype.hasobject:
+        return combine_fingerprints('array', [fingerprint(v) for v in array.ravel().tolist()])
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{array.dtype}:{array.shape}:".encode())
+    array = np.ascontiguousarray(array)
+    if array.size:
+        buffer_digest(h, array.reshape(-1).view(np.uint8))
+    return h.hexdigest()
+
+def mesh_fingerprint(mesh):
+    # not memoized, meshes are often modified in place
+    parts = [fingerprint(mesh.vertices)]
+    if hasattr(mesh, 'faces'):
+        parts.append(fingerprint(mesh.faces))
+    if hasattr(mesh, 'visual') and hasattr(mesh.visual, 'material') and hasattr(mesh.visual.material, 'image'):
+        parts.append(fingerprint(mesh.visual.material.image))
+
+    return combine_fingerprints('mesh', parts)
+
+def combine_fingerprints(kind, parts):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(kind.encode())
+    for part in parts:
+        h.update(b'\0' + str(part).encode())
+    return h.hexdigest()
+
+def fingerprint(value):
+    """
+    Cheap content hash of a node output value: tensors, arrays, images, meshes and any nesting of
+    lists, tuples and dicts. The digest of large objects is memoized on the object itself.
+
+    Objects that can't be hashed by content (eg: models, pipelines) get a unique token on first use,
+    so they compare equal only to themselves.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return combine_fingerprints(type(value).__name__, [repr(value)])
+    if isinstance(value, (bytes, bytearray)):
+        return bytes_fingerprint(bytes(value))
+    if isinstance(value, (list, tuple)):
+        return combine_fingerprints(type(value).__name__, [fingerprint(v) for v in value])
+    if isinstance(value, dict):
+        return combine_fingerprints('dict', [f"{k!r}={fingerprint(v)}" for k, v in value.items()])
+
+    import torch
+
+    if isinstance(value, torch.Tensor):
+        return tensor_fingerprint(value)
+    if type(value).__module__.startswith('numpy') and hasattr(value, 'tobytes'):
+        return array_fingerprint(value) if hasattr(value, 'shape') else combine_fingerprints('numpy', [repr(value)])
+    if is_image(value):
+        return image_fingerprint(value)
+    if hasattr(value, 'vertices') and hasattr(value.vertices, 'shape'):
+        return mesh_fingerprint(value)
+
+    digest = getattr(value, FINGERPRINT_ATTR, None)
+    if digest:
+        return digest
+    try:
+        setattr(value, FINGERPRINT_ATTR, f"object:{uuid.uuid4().hex}")
+        return getattr(value, FINGERPRINT_ATTR)
+    except (AttributeError, TypeError):
+        return f"object:{type(value).__qualname__}:{id(value)}"
@@ -2,12 +2,30 @@ from huggingface_hub import scan_cache_dir
 from config import config
 import os
 import json
+import threading
+import time
 from pathlib import Path
 import re
 
+# scanning the cache walks every file of every model, the result is shared for a few seconds
+# so that the node catalogues loaded at startup scan it only once
+SCAN_TTL = 10
+scan_lock = threading.Lock()
+scan_results = {}
+
+def scan_cache(cache_dir):
+    with scan_lock:
+        cached = scan_results.get(cache_dir)
+        if cached and time.monotonic() - cached[0] < SCAN_TTL:
+            return cached[1]
+
+        cache_info = scan_cache_dir(cache_dir)
+        scan_results[cache_dir] = (time.monotonic(), cache_info)
+        return cache_info
+
 def is_file_cached(repo_id, filename):
     cache_dir = config.hf['cache_dir']
-    cache_info = scan_cache_dir(cache_dir)
+    cache_info = scan_cache(cache_dir)
 
     for repo in cache_info.repos:
         if repo.repo_id == repo_id:
@@ -21,7 +39,7 @@ def is_file_cached(repo_id, filename):
 # TODO: find better strategy to find different kinds of models
 def list_local_models(config_file='model_index.json', filters={"_class_name": r"Pipeline$"}):
     cache_dir = config.hf['cache_dir']
-    cache_info = scan_cache_dir(cache_dir)
+    cache_info = scan_cache(cache_dir)
     local_models = [] #[model.repo_id for model in cache_info.repos]
 
     if not isinstance(config_file, list):
@@ -71,7 +89,7 @@ def list_local_models(config_file='model_index.json', filters={"_class_name": r"
 
 def get_repo_path(model_id):
     cache_dir = config.hf['cache_dir']
-    cache_info = scan_cache_dir(cache_dir)
+    cache_info = scan_cache(cache_dir)
     for repo in cache_info.repos:
         if repo.repo_id == model_id:
             latest_revision = list(repo.revisions)[-1] if repo.revisions else None
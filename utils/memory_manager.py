@@ -1,7 +1,13 @@
 import torch
 import gc
+import os
 import time
+import threading
+from itertools import chain
+from config import config
 from utils.torch_utils import device_list
+from utils.hash_utils import fingerprint
+from utils.eviction import EVICTION_POLICIES
 from enum import Enum
 import logging
 logger = logging.getLogger('mellon')
@@ -21,27 +27,356 @@ def memory_flush(gc_collect=False, reset=False):
                 torch.cuda.reset_max_memory_allocated(d['index'])
                 torch.cuda.reset_peak_memory_stats(d['index'])
 
+def model_tensors(model):
+    """
+    Parameters and buffers of a model, pipelines return the ones of all their modules.
+    """
+    if isinstance(model, torch.nn.Module):
+        return chain(model.parameters(), model.buffers())
+    if isinstance(model, torch.Tensor):
+        return [model]
+    if hasattr(model, 'components'):
+        return chain.from_iterable(model_tensors(c) for c in model.components.values() if c is not None and c is not model)
+    return []
+
+def model_size(model):
+    """
+    Bytes used by the parameters and buffers of a model, pipelines count all their modules.
+    """
+    return sum(t.numel() * t.element_size() for t in model_tensors(model))
+
+def model_ids(value):
+    # ids of the managed models referenced by a node input
+    if hasattr(value, '_mm_id'):
+        return [value._mm_id]
+    if isinstance(value, dict):
+        return [id for v in value.values() for id in model_ids(v)]
+    if isinstance(value, (list, tuple)):
+        return [id for v in value for id in model_ids(v)]
+    return []
+
+def total_memory(device):
+    if device == 'cpu':
+        try:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError, AttributeError):
+            return None
+    if device in device_list and device_list[device]['total_memory']:
+        return device_list[device]['total_memory']
+    return torch.cuda.get_device_properties(device).total_memory if torch.cuda.is_available() else None
+
+# assumed transfer speed to a device until a model large enough to measure it has been moved
+DEFAULT_BANDWIDTH = 4 * 1024**3
+MIN_MEASURED_SIZE = 64 * 1024**2
+
 class MemoryManager:
-    def __init__(self, memory_threshold=.9):
+    def __init__(self, memory_threshold=.9, eviction='lru'):
         self.cache = {}
+        # fraction of the memory of each device the models can use, evictions are planned to stay below it
         self.memory_threshold = memory_threshold
-
-    def add_model(self, model, model_id, device='cpu', priority=2):
+        self.planned_evictions = 0
+        self.oom_evictions = 0
+        self.cpu_over_budget = False
+        self.bandwidth = {}         # device -> measured bytes/s of the transfers to the device
+
+        self.streams = {}           # device -> side stream of the prefetches
+        self.prefetching = {}       # model id -> (device, size) of the transfers in flight
+        self.prefetched = set()     # models moved by a prefetch and not yet used
+        self.prefetch_counts = { 'completed': 0, 'skipped': 0, 'failed': 0, 'used': 0, 'wasted': 0 }
+
+        # nodes may run concurrently on different devices (see WebServer.parallel_graph_execution),
+        # a model that is being used by a node can't be moved by another thread until the node is done
+        self.lock = threading.RLock()
+        self.released = threading.Condition(self.lock)
+        self.waiting = {}           # thread -> model id it's waiting for, to detect the deadlocks
+        self.transfers = {}         # model id -> (device, size) of the loads in flight
+
+        # models loaded through the shared registry, keyed by their load signature
+        self.shared = {}
+
+        self.policies = {}
+        self.set_policy(eviction)
+
+    def set_policy(self, name):
+        """
+        Change the eviction policy, the counters of each policy are kept across changes.
+        """
+        if name not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {name}, available: {', '.join(EVICTION_POLICIES)}")
+
+        with self.lock:
+            if name not in self.policies:
+                self.policies[name] = EVICTION_POLICIES[name](self)
+            self.policy = self.policies[name]
+            self.policy.reset()
+            for model_id, entry in self.cache.items():
+                self.policy.update(model_id, entry)
+
+    def reload_cost(self, entry):
+        # seconds needed to bring the model back on its device once evicted
+        return entry['size'] / self.bandwidth.get(entry['device'], DEFAULT_BANDWIDTH)
+
+    def measure_bandwidth(self, device, size, elapsed):
+        if size < MIN_MEASURED_SIZE or elapsed <= 0:
+            return
+        bandwidth = size / elapsed
+        # moving average, the first transfers include the CUDA context warm up
+        self.bandwidth[device] = bandwidth if device not in self.bandwidth else .8 * self.bandwidth[device] + .2 * bandwidth
+
+    def add_model(self, model, model_id, device='cpu', priority=2, shared=None):
         priority = priority if isinstance(priority, int) else 2
 
-        if model_id not in self.cache:
-            self.cache[model_id] = {
-                'model': model,
-                'device': device,           # device the model is currently on
-                'priority': priority,       # priority, lower priority models are unloaded first
-                'last_used': time.time(),   # time the model was last used
-            }
+        with self.lock:
+            if model_id not in self.cache:
+                self.cache[model_id] = {
+                    'model': model,
+                    'device': device,           # device the model is currently on
+                    'priority': priority,       # priority, lower priority models are unloaded first
+                    'last_used': time.time(),   # time the model was last used
+                    'owner': None,              # thread that is currently using the model
+                    'size': model_size(model),  # bytes of weights, used to plan the evictions
+                    'uses': 0,                  # number of load_model calls
+                }
+                self.policy.update(model_id, self.cache[model_id])
+                if device == 'cpu':
+                    self.check_cpu_budget()
+
+            # the model belongs to a shared load and is deleted when the last holder releases it
+            if shared in self.shared:
+                self.shared[shared]['model_ids'].append(model_id)
 
         return model_id
 
+    def shared_key(self, signature):
+        # readable key of a load signature, values that are not plain (eg: models passed as input) are fingerprinted
+        signature = signature if isinstance(signature, (list, tuple)) else [signature]
+        return '|'.join(
+            str(v) if v is None or isinstance(v, (bool, int, float, str, torch.dtype)) else fingerprint(v)
+            for v in signature
+        )
+
+    def acquire_shared(self, key, holder, factory):
+        """
+        Return the value loaded with `key`, `factory` is called only by the first holder.
+        Concurrent requests for the same key wait for the first load to complete.
+        """
+        with self.lock:
+            entry = self.shared.get(key)
+            first = entry is None
+            if first:
+                entry = self.shared[key] = {
+                    'value': None,
+                    'model_ids': [],
+                    'holders': set(),
+                    'loaded': threading.Event(),
+                    'error': None,
+                    'created': time.time(),
+                }
+            entry['holders'].add(holder)
+
+        if first:
+            logger.debug(f"Loading shared model {key}")
+            try:
+                entry['value'] = factory()
+            except BaseException as e:
+                entry['error'] = e
+                with self.lock:
+                    self.shared.pop(key, None)
+                self.delete_model(entry['model_ids'])
+                raise
+            finally:
+                entry['loaded'].set()
+        else:
+            entry['loaded'].wait()
+            if entry['error'] is not None:
+                raise entry['error']
+            logger.debug(f"Reusing shared model {key} ({len(entry['holders'])} holders)")
+
+        return entry['value']
+
+    def release_shared(self, key, holder, unload=True):
+        # the weights are deleted only when the last holder releases them
+        with self.lock:
+            entry = self.shared.get(key)
+            if entry is None:
+                return
+
+            entry['holders'].discard(holder)
+            if entry['holders'] or not entry['loaded'].is_set():
+                return
+
+            del self.shared[key]
+
+        logger.debug(f"Releasing shared model {key}")
+        self.delete_model(entry['model_ids'], unload=unload)
+
+    def shared_model_ids(self, key):
+        with self.lock:
+            return list(self.shared[key]['model_ids']) if key in self.shared else []
+
+    def shared_stats(self):
+        with self.lock:
+            return [{
+                'signature': key,
+                'holders': sorted(entry['holders']),
+                'models': list(entry['model_ids']),
+            } for key, entry in self.shared.items()]
+
     def get_available_memory(self, device):
         return torch.cuda.get_device_properties(device).total_memory - torch.cuda.memory_allocated(device)
 
+    def device_budget(self, device):
+        total = total_memory(device)
+        return int(total * self.memory_threshold) if total else None
+
+    def device_usage(self, device):
+        # on cuda the allocator knows better, it includes the tensors that are not managed here
+        if device != 'cpu' and torch.cuda.is_available():
+            return torch.cuda.memory_allocated(device)
+        return sum(m['size'] for m in self.cache.values() if m['device'] == device)
+
+    def plan_eviction(self, device, size, exclude=[]):
+        """
+        Models to move off `device` so that `size` more bytes fit in its budget, in the order of the
+        eviction policy. Models in use by other threads are never evicted.
+        """
+        budget = self.device_budget(device)
+        if budget is None:
+            return []
+
+        excess = self.device_usage(device) + self.in_flight(device) + size - budget
+        if excess <= 0:
+            return []
+
+        evict = []
+        for id in self.eviction_candidates(device, exclude):
+            if excess <= 0:
+                break
+            evict.append(id)
+            excess -= self.cache[id]['size']
+
+        if excess > 0:
+            logger.debug(f"Not enough evictable models on {device}, {excess / 1024**2:.0f}MB over budget")
+
+        return evict
+
+    def in_flight(self, device):
+        # bytes being copied to the device, not yet counted by device_usage
+        return sum(size for d, size in chain(self.transfers.values(), self.prefetching.values()) if d == device)
+
+    def eviction_candidates(self, device, exclude=[]):
+        return (id for id in self.policy.candidates(device) if id not in exclude and self.is_available(id))
+
+    def evicted(self, model_id):
+        with self.lock:
+            self.policy.evicted(model_id)
+            if model_id in self.prefetched:
+                self.prefetched.discard(model_id)
+                self.prefetch_counts['wasted'] += 1
+
+    def evict(self, model_id, flush=True):
+        self.evicted(model_id)
+        self.unload_model(model_id, flush=flush)
+
+    def prefetch_stream(self, device):
+        if not torch.cuda.is_available() or not str(device).startswith('cuda'):
+            return None
+        if device not in self.streams:
+            self.streams[device] = torch.cuda.Stream(device)
+        return self.streams[device]
+
+    def prefetch_model(self, model_id, device):
+        """
+        Move a model to `device` before the node that needs it calls load_model. Blocking, run it in a
+        pool thread. A prefetch never evicts: it's skipped if the model doesn't fit in the free budget.
+        The prefetch doesn't own the model, a node loading it waits for the transfer in acquire_model
+        without giving up its other models.
+        """
+        with self.lock:
+            entry = self.cache.get(model_id)
+            if entry is None or entry['device'] == device or entry['owner'] is not None or model_id in self.prefetching or model_id in self.transfers:
+                return False
+
+            budget = self.device_budget(device)
+            if budget is None or self.device_usage(device) + self.in_flight(device) + entry['size'] > budget:
+                self.prefetch_counts['skipped'] += 1
+                return False
+
+            self.prefetching[model_id] = (device, entry['size'])
+
+        x = entry['model']
+        moved = False
+        start = time.perf_counter()
+        try:
+            stream = self.prefetch_stream(device)
+            if stream is not None:
+                # the copy runs on a side stream, overlapped with the kernels of the node being executed
+                with torch.cuda.stream(stream):
+                    x = x.to(device)
+                stream.synchronize()
+                # the memory allocated on the side stream is used and freed on the default stream,
+                # don't let the caching allocator give it back to the side stream before that work is done
+                current = torch.cuda.current_stream(device)
+                for t in model_tensors(x):
+                    if t.is_cuda:
+                        t.record_stream(current)
+            else:
+                x = x.to(device)
+            moved = True
+        except Exception as e:
+            logger.debug(f"Prefetch of {model_id} to {device} failed: {str(e)}")
+            # a failed transfer may have moved only part of the model
+            entry['model'].to(entry['device'])
+            memory_flush()
+        finally:
+            with self.lock:
+                del self.prefetching[model_id]
+                if moved:
+                    self.measure_bandwidth(device, entry['size'], time.perf_counter() - start)
+                    # tensors are not moved in place
+                    entry['model'] = x
+                    entry['device'] = device
+                    if model_id in self.cache:
+                        self.policy.update(model_id, entry)
+                        self.prefetched.add(model_id)
+                self.prefetch_counts['completed' if moved else 'failed'] += 1
+                self.released.notify_all()
+
+        if moved:
+            logger.debug(f"Prefetched {model_id} to {device} in {time.perf_counter() - start:.2f}s")
+        return moved
+
+    def check_cpu_budget(self):
+        # models can't be evicted from the RAM, warn once each time the budget is exceeded
+        budget = self.device_budget('cpu')
+        if budget is None:
+            return
+        over = self.device_usage('cpu') > budget
+        if over and not self.cpu_over_budget:
+            logger.warning(f"The models on the cpu exceed {self.memory_threshold:.0%} of the system memory")
+        self.cpu_over_budget = over
+
+    def memory_stats(self):
+        with self.lock:
+            devices = set(device_list) | { m['device'] for m in self.cache.values() }
+            return {
+                device: {
+                    'budget': self.device_budget(device),
+                    'used': self.device_usage(device),
+                    'models': sum(m['size'] for m in self.cache.values() if m['device'] == device),
+                    'count': sum(m['device'] == device for m in self.cache.values()),
+                } for device in sorted(devices)
+            } | {
+                'planned_evictions': self.planned_evictions,
+                'oom_evictions': self.oom_evictions,
+                'bandwidth': dict(self.bandwidth),
+                'prefetch': { **self.prefetch_counts, 'in_flight': len(self.prefetching) },
+                'eviction': {
+                    'policy': self.policy.name,
+                    'policies': { name: policy.stats() for name, policy in self.policies.items() },
+                },
+            }
+
     def get_model(self, model_id):
         return self.cache[model_id]['model'] if model_id in self.cache else None
 
@@ -49,85 +384,233 @@ class MemoryManager:
         return self.cache[model_id] if model_id in self.cache else None
 
     def load_model(self, model_id, device):
-        self.cache[model_id]['last_used'] = time.time()
-        x = self.cache[model_id]['model']
-
-        if device == str(x.device):
-            return x
-
-        if device == 'cpu':
-            return self.unload_model(model_id)
-
-        cache_priority = []
-        # Sort models by priority and last_used
-        for id, model in self.cache.items():
-            if model['device'] == device:
-                cache_priority.append((model['priority'], model['last_used'], id))
-
-        cache_priority.sort()
-        memory_flush()
-
+        """
+        Move a model to `device` and claim it for the current thread until release_models.
+        The ownership is taken under the lock but the copies run outside of it, a transfer on one
+        device doesn't block the memory manager for the other lanes.
+        """
+        with self.lock:
+            restore = self.acquire_model(model_id)
+            entry = self.cache[model_id]
+            entry['last_used'] = time.time()
+            entry['uses'] += 1
+            x = entry['model']
+
+            if device == str(x.device):
+                if model_id in self.prefetched:
+                    self.prefetched.discard(model_id)
+                    self.prefetch_counts['used'] += 1
+                self.policy.hits += 1
+                self.policy.update(model_id, entry)
+                evict = None
+            else:
+                self.policy.misses += 1
+                # make room for the model in a single step, before moving it
+                evict = self.plan_eviction(device, entry['size'], exclude=[model_id]) if device != 'cpu' else []
+                claimed = self.claim(evict)
+                self.planned_evictions += len(evict)
+                self.transfers[model_id] = (device, entry['size'])
+
+        if evict is not None:
+            try:
+                for id in evict:
+                    logger.debug(f"Unloading {id} to make room for {model_id} on {device}")
+                    self.evicted(id)
+                    self.transfer(id, 'cpu')
+                self.unclaim(claimed)
+                if evict:
+                    memory_flush()
+
+                x = self.transfer_with_retry(model_id, device)
+            finally:
+                with self.lock:
+                    self.transfers.pop(model_id, None)
+                    self.unclaim(claimed)
+
+        # the models given up to break a deadlock go back where the node left them
+        for id, previous_device in restore.items():
+            self.load_model(id, previous_device)
+
+        return x
+
+    def transfer(self, model_id, device):
+        # the caller owns the model, the lock is not held during the copy
+        with self.lock:
+            entry = self.cache.get(model_id)
+        if entry is None or not hasattr(entry['model'], 'to'):
+            return entry['model'] if entry else None
+
+        start = time.perf_counter()
+        x = entry['model'].to(device)
+        with self.lock:
+            entry['model'] = x
+            entry['device'] = device
+            if device == 'cpu':
+                self.check_cpu_budget()
+            else:
+                self.measure_bandwidth(device, entry['size'], time.perf_counter() - start)
+            if model_id in self.cache:
+                self.policy.update(model_id, entry)
+        return x
+
+    def transfer_with_retry(self, model_id, device):
         while True:
-            # Attempt to load the model
             try:
-                x = x.to(device)
-                self.cache[model_id]['device'] = device
-                return x
-            
+                return self.transfer(model_id, device)
             except torch.OutOfMemoryError as e:
-                if not cache_priority:
-                    logger.debug("No more models to unload, cannot free sufficient memory")
-                    raise e
-
-                next_model_id = cache_priority.pop(0)[2]
-                logger.debug(f"OOM error, unloading lower priority model: {next_model_id}")
-                self.unload_model(next_model_id)
-
-            except Exception as e:
-                raise e
-
-
-    def unload_model(self, model_id):
-        if model_id in self.cache and hasattr(self.cache[model_id]['model'], 'to'):
-            model = self.cache[model_id]['model'].to('cpu')
-            self.cache[model_id]['model'] = None
-            self.cache[model_id]['model'] = model
-            self.cache[model_id]['device'] = 'cpu'
-            memory_flush()
+                # only if the memory is used outside of the budget (eg: by other processes)
+                with self.lock:
+                    next_model_id = next(self.eviction_candidates(device, exclude=[model_id]), None)
+                    if next_model_id is None:
+                        logger.debug("No more models to unload, cannot free sufficient memory")
+                        raise e
+                    claimed = self.claim([next_model_id])
+                    self.oom_evictions += 1
+
+                logger.warning(f"Unplanned OOM error, unloading lower priority model: {next_model_id}")
+                try:
+                    self.evicted(next_model_id)
+                    self.transfer(next_model_id, 'cpu')
+                    memory_flush()
+                finally:
+                    with self.lock:
+                        self.unclaim(claimed)
+
+    def claim(self, model_ids):
+        # temporary ownership of the models being evicted, returns the ones that were not owned yet
+        claimed = [id for id in model_ids if self.cache[id]['owner'] is None]
+        for id in claimed:
+            self.cache[id]['owner'] = threading.get_ident()
+        return claimed
+
+    def unclaim(self, claimed):
+        with self.lock:
+            for id in claimed:
+                if id in self.cache and self.cache[id]['owner'] == threading.get_ident():
+                    self.cache[id]['owner'] = None
+            claimed.clear()
+            self.released.notify_all()
+
+    def acquire_model(self, model_id):
+        """
+        Wait until the model is not used by a node running on another thread, the models already held
+        by the current thread are kept. Only when waiting would deadlock (the owner is itself waiting,
+        directly or not, for a model of this thread) the models of this thread are given up. They are
+        claimed again once the model is acquired, returns those that must be moved back `{ id: device }`.
+        """
+        restore = {}
+        with self.lock:
+            me = threading.get_ident()
+            # a prefetch of the model is in flight, wait for it to land
+            while model_id in self.prefetching:
+                self.released.wait()
+
+            held = {}
+            while not self.is_available(model_id):
+                if self.would_deadlock(model_id):
+                    logger.debug(f"Deadlock waiting for {model_id}, giving up the models of the current thread")
+                    held.update({ id: m['device'] for id, m in self.cache.items() if m['owner'] == me })
+                    self.release_models()
+
+                self.waiting[me] = model_id
+                try:
+                    self.released.wait()
+                finally:
+                    del self.waiting[me]
+
+            if model_id in self.cache:
+                self.cache[model_id]['owner'] = me
+
+            for id, device in held.items():
+                if id == model_id or id not in self.cache:
+                    continue
+                restore.update(self.acquire_model(id))
+                if self.cache[id]['device'] != device:
+                    restore[id] = device
+
+        return restore
+
+    def would_deadlock(self, model_id):
+        me = threading.get_ident()
+        owner = self.cache[model_id]['owner'] if model_id in self.cache else None
+        seen = set()
+        while owner is not None and owner not in seen:
+            if owner == me:
+                return True
+            seen.add(owner)
+            waiting_for = self.waiting.get(owner)
+            owner = self.cache[waiting_for]['owner'] if waiting_for in self.cache else None
+        return False
+
+    def release_models(self):
+        # release all the models held by the current thread, called when a node is done executing
+        with self.lock:
+            owner = threading.get_ident()
+            for model in self.cache.values():
+                if model['owner'] == owner:
+                    model['owner'] = None
+            self.released.notify_all()
+
+    def is_available(self, model_id):
+        if model_id in self.prefetching:
+            return False
+        owner = self.cache[model_id]['owner'] if model_id in self.cache else None
+        return owner is None or owner == threading.get_ident()
+
+    def unload_model(self, model_id, flush=True):
+        with self.lock:
+            if model_id in self.cache and hasattr(self.cache[model_id]['model'], 'to'):
+                model = self.cache[model_id]['model'].to('cpu')
+                self.cache[model_id]['model'] = None
+                self.cache[model_id]['model'] = model
+                self.cache[model_id]['device'] = 'cpu'
+                self.policy.update(model_id, self.cache[model_id])
+                self.check_cpu_budget()
+                if flush:
+                    memory_flush()
 
-        return self.cache[model_id]['model']
+            return self.cache[model_id]['model']
     
     def unload_all(self, exclude=[]):
         if not isinstance(exclude, list):
             exclude = [exclude]
 
-        for model_id in self.cache:
-            if model_id not in exclude:
-                self.unload_model(model_id)
+        with self.lock:
+            for model_id in self.cache:
+                if model_id not in exclude and self.is_available(model_id):
+                    self.unload_model(model_id)
 
     def delete_model(self, model_id, unload=False):
         model_id = model_id if isinstance(model_id, list) else [model_id]
 
-        for m in model_id:
-            if m in self.cache:
-                classname = self.cache[m]['model'].__class__.__name__ if hasattr(self.cache[m]['model'], '__class__') else 'Unknown'
-                logger.debug(f"Deleting model {classname}, id: {m}")
-                if unload:
-                    self.unload_model(m)
-                self.cache[m]['model'] = None
-                del self.cache[m]
+        with self.lock:
+            for m in model_id:
+                if m in self.cache:
+                    classname = self.cache[m]['model'].__class__.__name__ if hasattr(self.cache[m]['model'], '__class__') else 'Unknown'
+                    logger.debug(f"Deleting model {classname}, id: {m}")
+                    if unload:
+                        self.unload_model(m)
+                    self.cache[m]['model'] = None
+                    del self.cache[m]
+                    self.policy.remove(m)
+                    self.prefetched.discard(m)
+
+            self.released.notify_all()
 
         memory_flush(gc_collect=True)
 
     def update_model(self, model_id, model=None, priority=None, unload=True):
-        if model_id in self.cache:
-            if model:
-                if unload:
-                    self.unload_model(model_id)
-                self.cache[model_id]['model'] = model
-                memory_flush()
-            if priority:
-                self.cache[model_id]['priority'] = priority
+        with self.lock:
+            if model_id in self.cache:
+                if model:
+                    if unload:
+                        self.unload_model(model_id)
+                    self.cache[model_id]['model'] = model
+                    self.cache[model_id]['size'] = model_size(model)
+                    memory_flush()
+                if priority:
+                    self.cache[model_id]['priority'] = priority
+                self.policy.update(model_id, self.cache[model_id])
 
     def is_cached(self, model_id):
         return model_id in self.cache
@@ -149,16 +632,12 @@ class MemoryManager:
         if not isinstance(exclude, list):
             exclude = [exclude]
 
-        # Sort models by priority and last_used
-        cache_priority = []
-        for id, model in self.cache.items():
-            if model['device'] == device and id not in exclude:
-                cache_priority.append((model['priority'], model['last_used'], id))
-
-        cache_priority.sort()
-        next_model_id = cache_priority.pop(0)[2]
+        with self.lock:
+            next_model_id = next(self.eviction_candidates(device, exclude), None)
+            if next_model_id is None:
+                return False
 
-        self.unload_model(next_model_id)
+            self.evict(next_model_id)
         return True
 
-memory_manager = MemoryManager()
+memory_manager = MemoryManager(config.memory['threshold'], config.memory['eviction'])
@@ -86,6 +86,63 @@ def toLatent(image):
 
     return image
 
+# linear approximation of the VAE decoder, maps each latent channel to RGB.
+# Indexed by the number of latent channels: 4 for SD/SDXL, 16 for SD3
+LATENT_RGB_FACTORS = {
+    4: {
+        'factors': [
+            [ 0.3651,  0.4232,  0.4341],
+            [-0.2533, -0.0042,  0.1068],
+            [ 0.1076,  0.1111, -0.0362],
+            [-0.3165, -0.2492, -0.2188],
+        ],
+        'bias': [0.1084, -0.0175, -0.0011],
+    },
+    16: {
+        'factors': [
+            [-0.0922, -0.0175,  0.0749],
+            [ 0.0311,  0.0633,  0.0954],
+            [ 0.1994,  0.0927,  0.0458],
+            [ 0.0856,  0.0339,  0.0902],
+            [ 0.0587,  0.0272, -0.0496],
+            [-0.0006,  0.1104,  0.0309],
+            [ 0.0978,  0.0306,  0.0427],
+            [-0.0042,  0.1038,  0.1358],
+            [-0.0194,  0.0020,  0.0669],
+            [-0.0488,  0.0130, -0.0268],
+            [ 0.0922,  0.0580,  0.0233],
+            [ 0.0408,  0.0152,  0.0304],
+            [ 0.0521,  0.0155,  0.0106],
+            [ 0.0063, -0.0056, -0.0073],
+            [ 0.1189,  0.0577, -0.0055],
+            [ 0.0220,  0.0244, -0.0096],
+        ],
+        'bias': [0.2394, 0.2135, 0.1925],
+    },
+}
+
+def latentToRGB(latents, scale_factor=1):
+    """
+    Fast approximate decode of the latents without the VAE. The output is a list of PIL images
+    of the size of the latents multiplied by `scale_factor` (use 8 to get the full image size).
+    """
+    if len(latents.shape) == 3:
+        latents = latents.unsqueeze(0)
+
+    channels = latents.shape[1]
+    if channels not in LATENT_RGB_FACTORS:
+        raise ValueError(f"Approximate decoding is not supported for latents with {channels} channels")
+
+    factors = torch.tensor(LATENT_RGB_FACTORS[channels]['factors'], device=latents.device, dtype=torch.float32)
+    bias = torch.tensor(LATENT_RGB_FACTORS[channels]['bias'], device=latents.device, dtype=torch.float32)
+
+    with torch.no_grad():
+        rgb = torch.einsum('bchw,cr->brhw', latents.float(), factors) + bias.view(1, 3, 1, 1)
+        if scale_factor != 1:
+            rgb = torch.nn.functional.interpolate(rgb, scale_factor=scale_factor, mode='bilinear')
+
+    return toPIL(((rgb + 1) / 2).cpu())
+
 def compile(model):
     torch._inductor.config.conv_1x1_as_mm = True
     torch._inductor.config.coordinate_descent_tuning = True
@@ -61,7 +61,7 @@ theme.breakpoints = createBreakpoints(theme.breakpoints || {});
 theme.transitions = createTransitions(theme.transitions || {});
 
 export default theme;`}function gl(e={},...t){const{breakpoints:n,mixins:o={},spacing:r,palette:i={},transitions:s={},typography:a={},shape:l,...c}=e;if(e.vars)throw new Error(An(20));const d=vc(i),u=sa(e);let p=yt(u,{mixins:QC(u.breakpoints,o),palette:d,shadows:rk.slice(),typography:qh(d,a),transitions:ak(s),zIndex:{...lk}});return p=yt(p,c),p=t.reduce((f,m)=>yt(f,m),p),p.unstable_sxConfig={...si,...c?.unstable_sxConfig},p.unstable_sx=function(m){return Kn({sx:m,theme:this})},p.toRuntimeSource=Zh,p}function ml(e){let t;return e<1?t=5.11916*e**2:t=4.5*Math.log(e+1)+2,Math.round(t*10)/1e3}const uk=[...Array(25)].map((e,t)=>{if(t===0)return"none";const n=ml(t);return`linear-gradient(rgba(255 255 255 / ${n}), rgba(255 255 255 / ${n}))`});function Jh(e){return{inputPlaceholder:e==="dark"?.5:.42,inputUnderline:e==="dark"?.7:.42,switchTrackDisabled:e==="dark"?.2:.12,switchTrack:e==="dark"?.3:.38}}function Qh(e){return e==="dark"?uk:[]}function dk(e){const{palette:t={mode:"light"},opacity:n,overlays:o,...r}=e,i=vc(t);return{palette:i,opacity:{...Jh(i.mode),...n},overlays:o||Qh(i.mode),...r}}function pk(e){return!!e[0].match(/(cssVarPrefix|colorSchemeSelector|rootSelector|typography|mixins|breakpoints|direction|transitions)/)||!!e[0].match(/sxConfig$/)||e[0]==="palette"&&!!e[1]?.match(/(mode|contrastThreshold|tonalOffset)/)}const fk=e=>[...[...Array(25)].map((t,n)=>`--${e?`${e}-`:""}overlays-${n}`),`--${e?`${e}-`:""}palette-AppBar-darkBg`,`--${e?`${e}-`:""}palette-AppBar-darkColor`],hk=e=>(t,n)=>{const o=e.rootSelector||":root",r=e.colorSchemeSelector;let i=r;if(r==="class"&&(i=".%s"),r==="data"&&(i="[data-%s]"),r?.startsWith("data-")&&!r.includes("%s")&&(i=`[${r}="%s"]`),e.defaultColorScheme===t){if(t==="dark"){const s={};return fk(e.cssVarPrefix).forEach(a=>{s[a]=n[a],delete n[a]}),i==="media"?{[o]:n,"@media (prefers-color-scheme: dark)":{[o]:s}}:i?{[i.replace("%s",t)]:s,[`${o}, ${i.replace("%s",t)}`]:n}:{[o]:{...n,...s}}}if(i&&i!=="media")return`${o}, ${i.replace("%s",String(t))}`}else if(t){if(i==="media")return{[`@media (prefers-color-scheme: ${String(t)})`]:{[o]:n}};if(i)return i.replace("%s",String(t))}return o};function gk(e,t){t.forEach(n=>{e[n]||(e[n]={})})}function H(e,t,n){!e[t]&&n&&(e[t]=n)}function wr(e){return typeof e!="string"||!e.startsWith("hsl")?e:_h(e)}function kn(e,t){`${t}Channel`in e||(e[`${t}Channel`]=xr(wr(e[t]),`MUI: Can't create \`palette.${t}Channel\` because \`palette.${t}\` is not one of these formats: #nnn, #nnnnnn, rgb(), rgba(), hsl(), hsla(), color().
-To suppress this warning, you need to explicitly provide the \`palette.${t}Channel\` as a string (in rgb format, for example "12 12 12") or undefined if you want to remove the channel token.`))}function mk(e){return typeof e=="number"?`${e}px`:typeof e=="string"||typeof e=="function"||Array.isArray(e)?e:"8px"}const fn=e=>{try{return e()}catch{}},yk=(e="mui")=>AC(e);function ja(e,t,n,o){if(!t)return;t=t===!0?{}:t;const r=o==="dark"?"dark":"light";if(!n){e[o]=dk({...t,palette:{mode:r,...t?.palette}});return}const{palette:i,...s}=gl({...n,palette:{mode:r,...t?.palette}});return e[o]={...t,palette:i,opacity:{...Jh(r),...t?.opacity},overlays:t?.overlays||Qh(r)},s}function bk(e={},...t){const{colorSchemes:n={light:!0},defaultColorScheme:o,disableCssColorScheme:r=!1,cssVarPrefix:i="mui",shouldSkipGeneratingVar:s=pk,colorSchemeSelector:a=n.light&&n.dark?"media":void 0,rootSelector:l=":root",...c}=e,d=Object.keys(n)[0],u=o||(n.light&&d!=="light"?"light":d),p=yk(i),{[u]:f,light:m,dark:g,...S}=n,w={...S};let P=f;if((u==="dark"&&!("dark"in n)||u==="light"&&!("light"in n))&&(P=!0),!P)throw new Error(An(21,u));const x=ja(w,P,c,u);m&&!w.light&&ja(w,m,void 0,"light"),g&&!w.dark&&ja(w,g,void 0,"dark");let y={defaultColorScheme:u,...x,cssVarPrefix:i,colorSchemeSelector:a,rootSelector:l,getCssVar:p,colorSchemes:w,font:{...JC(x.typography),...x.font},spacing:mk(c.spacing)};Object.keys(y.colorSchemes).forEach(T=>{const v=y.colorSchemes[T].palette,A=L=>{const _=L.split("-"),C=_[1],R=_[2];return p(L,v[C][R])};if(v.mode==="light"&&(H(v.common,"background","#fff"),H(v.common,"onBackground","#000")),v.mode==="dark"&&(H(v.common,"background","#000"),H(v.common,"onBackground","#fff")),gk(v,["Alert","AppBar","Avatar","Button","Chip","FilledInput","LinearProgress","Skeleton","Slider","SnackbarContent","SpeedDialAction","StepConnector","StepContent","Switch","TableCell","Tooltip"]),v.mode==="light"){H(v.Alert,"errorColor",Ze(v.error.light,.6)),H(v.Alert,"infoColor",Ze(v.info.light,.6)),H(v.Alert,"successColor",Ze(v.success.light,.6)),H(v.Alert,"warningColor",Ze(v.warning.light,.6)),H(v.Alert,"errorFilledBg",A("palette-error-main")),H(v.Alert,"infoFilledBg",A("palette-info-main")),H(v.Alert,"successFilledBg",A("palette-success-main")),H(v.Alert,"warningFilledBg",A("palette-warning-main")),H(v.Alert,"errorFilledColor",fn(()=>v.getContrastText(v.error.main))),H(v.Alert,"infoFilledColor",fn(()=>v.getContrastText(v.info.main))),H(v.Alert,"successFilledColor",fn(()=>v.getContrastText(v.success.main))),H(v.Alert,"warningFilledColor",fn(()=>v.getContrastText(v.warning.main))),H(v.Alert,"errorStandardBg",Je(v.error.light,.9)),H(v.Alert,"infoStandardBg",Je(v.info.light,.9)),H(v.Alert,"successStandardBg",Je(v.success.light,.9)),H(v.Alert,"warningStandardBg",Je(v.warning.light,.9)),H(v.Alert,"errorIconColor",A("palette-error-main")),H(v.Alert,"infoIconColor",A("palette-info-main")),H(v.Alert,"successIconColor",A("palette-success-main")),H(v.Alert,"warningIconColor",A("palette-warning-main")),H(v.AppBar,"defaultBg",A("palette-grey-100")),H(v.Avatar,"defaultBg",A("palette-grey-400")),H(v.Button,"inheritContainedBg",A("palette-grey-300")),H(v.Button,"inheritContainedHoverBg",A("palette-grey-A100")),H(v.Chip,"defaultBorder",A("palette-grey-400")),H(v.Chip,"defaultAvatarColor",A("palette-grey-700")),H(v.Chip,"defaultIconColor",A("palette-grey-700")),H(v.FilledInput,"bg","rgba(0, 0, 0, 0.06)"),H(v.FilledInput,"hoverBg","rgba(0, 0, 0, 0.09)"),H(v.FilledInput,"disabledBg","rgba(0, 0, 0, 0.12)"),H(v.LinearProgress,"primaryBg",Je(v.primary.main,.62)),H(v.LinearProgress,"secondaryBg",Je(v.secondary.main,.62)),H(v.LinearProgress,"errorBg",Je(v.error.main,.62)),H(v.LinearProgress,"infoBg",Je(v.info.main,.62)),H(v.LinearProgress,"successBg",Je(v.success.main,.62)),H(v.LinearProgress,"warningBg",Je(v.warning.main,.62)),H(v.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.11)`),H(v.Slider,"primaryTrack",Je(v.primary.main,.62)),H(v.Slider,"secondaryTrack",Je(v.secondary.main,.62)),H(v.Slider,"errorTrack",Je(v.error.main,.62)),H(v.Slider,"infoTrack",Je(v.info.main,.62)),H(v.Slider,"successTrack",Je(v.success.main,.62)),H(v.Slider,"warningTrack",Je(v.warning.main,.62));const L=Pi(v.background.default,.8);H(v.SnackbarContent,"bg",L),H(v.SnackbarContent,"color",fn(()=>v.getContrastText(L))),H(v.SpeedDialAction,"fabHoverBg",Pi(v.background.paper,.15)),H(v.StepConnector,"border",A("palette-grey-400")),H(v.StepContent,"border",A("palette-grey-400")),H(v.Switch,"defaultColor",A("palette-common-white")),H(v.Switch,"defaultDisabledColor",A("palette-grey-100")),H(v.Switch,"primaryDisabledColor",Je(v.primary.main,.62)),H(v.Switch,"secondaryDisabledColor",Je(v.secondary.main,.62)),H(v.Switch,"errorDisabledColor",Je(v.error.main,.62)),H(v.Switch,"infoDisabledColor",Je(v.info.main,.62)),H(v.Switch,"successDisabledColor",Je(v.success.main,.62)),H(v.Switch,"warningDisabledColor",Je(v.warning.main,.62)),H(v.TableCell,"border",Je($i(v.divider,1),.88)),H(v.Tooltip,"bg",$i(v.grey[700],.92))}if(v.mode==="dark"){H(v.Alert,"errorColor",Je(v.error.light,.6)),H(v.Alert,"infoColor",Je(v.info.light,.6)),H(v.Alert,"successColor",Je(v.success.light,.6)),H(v.Alert,"warningColor",Je(v.warning.light,.6)),H(v.Alert,"errorFilledBg",A("palette-error-dark")),H(v.Alert,"infoFilledBg",A("palette-info-dark")),H(v.Alert,"successFilledBg",A("palette-success-dark")),H(v.Alert,"warningFilledBg",A("palette-warning-dark")),H(v.Alert,"errorFilledColor",fn(()=>v.getContrastText(v.error.dark))),H(v.Alert,"infoFilledColor",fn(()=>v.getContrastText(v.info.dark))),H(v.Alert,"successFilledColor",fn(()=>v.getContrastText(v.success.dark))),H(v.Alert,"warningFilledColor",fn(()=>v.getContrastText(v.warning.dark))),H(v.Alert,"errorStandardBg",Ze(v.error.light,.9)),H(v.Alert,"infoStandardBg",Ze(v.info.light,.9)),H(v.Alert,"successStandardBg",Ze(v.success.light,.9)),H(v.Alert,"warningStandardBg",Ze(v.warning.light,.9)),H(v.Alert,"errorIconColor",A("palette-error-main")),H(v.Alert,"infoIconColor",A("palette-info-main")),H(v.Alert,"successIconColor",A("palette-success-main")),H(v.Alert,"warningIconColor",A("palette-warning-main")),H(v.AppBar,"defaultBg",A("palette-grey-900")),H(v.AppBar,"darkBg",A("palette-background-paper")),H(v.AppBar,"darkColor",A("palette-text-primary")),H(v.Avatar,"defaultBg",A("palette-grey-600")),H(v.Button,"inheritContainedBg",A("palette-grey-800")),H(v.Button,"inheritContainedHoverBg",A("palette-grey-700")),H(v.Chip,"defaultBorder",A("palette-grey-700")),H(v.Chip,"defaultAvatarColor",A("palette-grey-300")),H(v.Chip,"defaultIconColor",A("palette-grey-300")),H(v.FilledInput,"bg","rgba(255, 255, 255, 0.09)"),H(v.FilledInput,"hoverBg","rgba(255, 255, 255, 0.13)"),H(v.FilledInput,"disabledBg","rgba(255, 255, 255, 0.12)"),H(v.LinearProgress,"primaryBg",Ze(v.primary.main,.5)),H(v.LinearProgress,"secondaryBg",Ze(v.secondary.main,.5)),H(v.LinearProgress,"errorBg",Ze(v.error.main,.5)),H(v.LinearProgress,"infoBg",Ze(v.info.main,.5)),H(v.LinearProgress,"successBg",Ze(v.success.main,.5)),H(v.LinearProgress,"warningBg",Ze(v.warning.main,.5)),H(v.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.13)`),H(v.Slider,"primaryTrack",Ze(v.primary.main,.5)),H(v.Slider,"secondaryTrack",Ze(v.secondary.main,.5)),H(v.Slider,"errorTrack",Ze(v.error.main,.5)),H(v.Slider,"infoTrack",Ze(v.info.main,.5)),H(v.Slider,"successTrack",Ze(v.success.main,.5)),H(v.Slider,"warningTrack",Ze(v.warning.main,.5));const L=Pi(v.background.default,.98);H(v.SnackbarContent,"bg",L),H(v.SnackbarContent,"color",fn(()=>v.getContrastText(L))),H(v.SpeedDialAction,"fabHoverBg",Pi(v.background.paper,.15)),H(v.StepConnector,"border",A("palette-grey-600")),H(v.StepContent,"border",A("palette-grey-600")),H(v.Switch,"defaultColor",A("palette-grey-300")),H(v.Switch,"defaultDisabledColor",A("palette-grey-600")),H(v.Switch,"primaryDisabledColor",Ze(v.primary.main,.55)),H(v.Switch,"secondaryDisabledColor",Ze(v.secondary.main,.55)),H(v.Switch,"errorDisabledColor",Ze(v.error.main,.55)),H(v.Switch,"infoDisabledColor",Ze(v.info.main,.55)),H(v.Switch,"successDisabledColor",Ze(v.success.main,.55)),H(v.Switch,"warningDisabledColor",Ze(v.warning.main,.55)),H(v.TableCell,"border",Ze($i(v.divider,1),.68)),H(v.Tooltip,"bg",$i(v.grey[700],.92))}kn(v.background,"default"),kn(v.background,"paper"),kn(v.common,"background"),kn(v.common,"onBackground"),kn(v,"divider"),Object.keys(v).forEach(L=>{const _=v[L];L!=="tonalOffset"&&_&&typeof _=="object"&&(_.main&&H(v[L],"mainChannel",xr(wr(_.main))),_.light&&H(v[L],"lightChannel",xr(wr(_.light))),_.dark&&H(v[L],"darkChannel",xr(wr(_.dark))),_.contrastText&&H(v[L],"contrastTextChannel",xr(wr(_.contrastText))),L==="text"&&(kn(v[L],"primary"),kn(v[L],"secondary")),L==="action"&&(_.active&&kn(v[L],"active"),_.selected&&kn(v[L],"selected")))})}),y=t.reduce((T,v)=>yt(T,v),y);const E={prefix:i,disableCssColorScheme:r,shouldSkipGeneratingVar:s,getSelector:hk(y)},{vars:$,generateThemeVars:I,generateStyleSheets:M}=LC(y,E);return y.vars=$,Object.entries(y.colorSchemes[y.defaultColorScheme]).forEach(([T,v])=>{y[T]=v}),y.generateThemeVars=I,y.generateStyleSheets=M,y.generateSpacing=function(){return Rh(c.spacing,ea(this))},y.getColorSchemeSelector=_C(a),y.spacing=y.generateSpacing(),y.shouldSkipGeneratingVar=s,y.unstable_sxConfig={...si,...c?.unstable_sxConfig},y.unstable_sx=function(v){return Kn({sx:v,theme:this})},y.toRuntimeSource=Zh,y}function wd(e,t,n){e.colorSchemes&&n&&(e.colorSchemes[t]={...n!==!0&&n,palette:vc({...n===!0?{}:n.palette,mode:t})})}function ua(e={},...t){const{palette:n,cssVariables:o=!1,colorSchemes:r=n?void 0:{light:!0},defaultColorScheme:i=n?.mode,...s}=e,a=i||"light",l=r?.[a],c={...r,...n?{[a]:{...typeof l!="boolean"&&l,palette:n}}:void 0};if(o===!1){if(!("colorSchemes"in e))return gl(e,...t);let d=n;"palette"in e||c[a]&&(c[a]!==!0?d=c[a].palette:a==="dark"&&(d={mode:"dark"}));const u=gl({...e,palette:d},...t);return u.defaultColorScheme=a,u.colorSchemes=c,u.palette.mode==="light"&&(u.colorSchemes.light={...c.light!==!0&&c.light,palette:u.palette},wd(u,"dark",c.dark)),u.palette.mode==="dark"&&(u.colorSchemes.dark={...c.dark!==!0&&c.dark,palette:u.palette},wd(u,"light",c.light)),u}return!n&&!("light"in c)&&a==="light"&&(c.light=!0),bk({...s,colorSchemes:c,defaultColorScheme:a,...typeof o!="boolean"&&o},...t)}const xc=ua();function St(){const e=aa(xc);return e[bn]||e}function da(e){return e!=="ownerState"&&e!=="theme"&&e!=="sx"&&e!=="as"}const Nt=e=>da(e)&&e!=="classes",Y=Lh({themeId:bn,defaultTheme:xc,rootShouldForwardProp:Nt});function Sd({theme:e,...t}){const n=bn in e?e[bn]:void 0;return h.jsx(Uh,{...t,themeId:n?bn:void 0,theme:n||e})}const Ii={attribute:"data-mui-color-scheme",colorSchemeStorageKey:"mui-color-scheme",defaultLightColorScheme:"light",defaultDarkColorScheme:"dark",modeStorageKey:"mui-mode"},{CssVarsProvider:vk,useColorScheme:BT,getInitColorSchemeScript:zT}=TC({themeId:bn,theme:()=>ua({cssVariables:!0}),colorSchemeStorageKey:Ii.colorSchemeStorageKey,modeStorageKey:Ii.modeStorageKey,defaultColorScheme:{light:Ii.defaultLightColorScheme,dark:Ii.defaultDarkColorScheme},resolveTheme:e=>{const t={...e,typography:qh(e.palette,e.typography)};return t.unstable_sx=function(o){return Kn({sx:o,theme:this})},t}}),xk=vk;function wk({theme:e,...t}){return typeof e=="function"?h.jsx(Sd,{theme:e,...t}):"colorSchemes"in(bn in e?e[bn]:e)?h.jsx(xk,{theme:e,...t}):h.jsx(Sd,{theme:e,...t})}function Sk(e){return h.jsx(US,{...e,defaultTheme:xc,themeId:bn})}function wc(e){return function(n){return h.jsx(Sk,{styles:typeof e=="function"?o=>e({theme:o,...n}):e})}}function Ck(){return pc}function Te(e){return kC(e)}const yl=typeof wc({})=="function",kk=(e,t)=>({WebkitFontSmoothing:"antialiased",MozOsxFontSmoothing:"grayscale",boxSizing:"border-box",WebkitTextSizeAdjust:"100%",...t&&!e.vars&&{colorScheme:e.palette.mode}}),Ek=e=>({color:(e.vars||e).palette.text.primary,...e.typography.body1,backgroundColor:(e.vars||e).palette.background.default,"@media print":{backgroundColor:(e.vars||e).palette.common.white}}),eg=(e,t=!1)=>{const n={};t&&e.colorSchemes&&typeof e.getColorSchemeSelector=="function"&&Object.entries(e.colorSchemes).forEach(([i,s])=>{const a=e.getColorSchemeSelector(i);a.startsWith("@")?n[a]={":root":{colorScheme:s.palette?.mode}}:n[a.replace(/\s*&/,"")]={colorScheme:s.palette?.mode}});let o={html:kk(e,t),"*, *::before, *::after":{boxSizing:"inherit"},"strong, b":{fontWeight:e.typography.fontWeightBold},body:{margin:0,...Ek(e),"&::backdrop":{backgroundColor:(e.vars||e).palette.background.default}},...n};const r=e.components?.MuiCssBaseline?.styleOverrides;return r&&(o=[o,r]),o},Xi="mui-ecs",$k=e=>{const t=eg(e,!1),n=Array.isArray(t)?t[0]:t;return!e.vars&&n&&(n.html[`:root:has(${Xi})`]={colorScheme:e.palette.mode}),e.colorSchemes&&Object.entries(e.colorSchemes).forEach(([o,r])=>{const i=e.getColorSchemeSelector(o);i.startsWith("@")?n[i]={[`:root:not(:has(.${Xi}))`]:{colorScheme:r.palette?.mode}}:n[i.replace(/\s*&/,"")]={[`&:not(:has(.${Xi}))`]:{colorScheme:r.palette?.mode}}}),t},Pk=wc(yl?({theme:e,enableColorScheme:t})=>eg(e,t):({theme:e})=>$k(e));function Ik(e){const t=Te({props:e,name:"MuiCssBaseline"}),{children:n,enableColorScheme:o=!1}=t;return h.jsxs(b.Fragment,{children:[yl&&h.jsx(Pk,{enableColorScheme:o}),!yl&&!o&&h.jsx("span",{className:Xi,style:{display:"none"}}),n]})}const{useSyncExternalStoreWithSelector:Rk}=gp,Mk=e=>e;function Tk(e,t=Mk,n){const o=Rk(e.subscribe,e.getState,e.getInitialState,t,n);return Zt.useDebugValue(o),o}const Cd=(e,t)=>{const n=Yg(e),o=(r,i=t)=>Tk(n,r,i);return Object.assign(o,n),o},Sc=(e,t)=>e?Cd(e,t):Cd,Ak="useandom-26T198340PX75pxJACKVERYMINDBUSHWOLF_GQZbfghjklqvwyzrict";let Cc=(e=21)=>{let t="",n=crypto.getRandomValues(new Uint8Array(e|=0));for(;e--;)t+=Ak[n[e]&63];return t};const Qn={serverAddress:window.location.origin.split("://")[1]},Nk=(e,t)=>{const n=t.filter(r=>r.target===e.id),o={};return Object.entries(e.data.params).forEach(([r,i])=>{if(i.display==="output")return;const s=n.find(a=>a.targetHandle===r);o[r]={sourceId:s?.source??void 0,sourceKey:(s?s.sourceHandle:i.source)??void 0,value:i.value??void 0,display:i.display??void 0,type:i.type??void 0}}),{module:e.data.module,action:e.data.action,params:o}},tg=(e,t,n,o=new Set)=>{if(o.has(e))return[];o.add(e);const r=t.find(a=>a.id===e);if(!r)return[];const i=Mb(r,t,n);return i.length===0?[e]:[...i.flatMap(a=>tg(a.id,t,n,new Set(o))),e]},Un=Sc((e,t)=>({nodes:JSON.parse(localStorage.getItem("workflow")||'{"nodes":[]}').nodes||[],edges:JSON.parse(localStorage.getItem("workflow")||'{"edges":[]}').edges||[],onNodesChange:async n=>{const o=If(n,t().nodes);e({nodes:o});const r=localStorage.getItem("workflow"),{viewport:i}=r?JSON.parse(r):{viewport:{x:0,y:0,zoom:1}},s={nodes:o,edges:t().edges,viewport:i};if(localStorage.setItem("workflow",JSON.stringify(s)),n.some(a=>a.type==="remove")){const a=n.filter(l=>l.type==="remove").map(l=>l.id);try{await fetch("http://"+Qn.serverAddress+"/clearNodeCache",{method:"DELETE",body:JSON.stringify({nodeId:a})})}catch(l){console.error("Can't connect to server to clear cache:",l)}}},onEdgesChange:n=>{const o=Rf(n,t().edges),r=n.filter(i=>i.type==="remove");for(const i of r){const s=t().edges.find(l=>l.id===i.id),a=t().getParam(s?.target,s?.targetHandle,"spawn");s&&a&&t().nodes.find(c=>c.id===s.target)&&e({nodes:t().nodes.map(c=>{if(c.id===s.target){const{[s.targetHandle]:d,...u}=c.data.params;return{...c,data:{...c.data,params:u}}}return c})})}e({edges:o}),t().updateLocalStorage()},onEdgeDoubleClick:n=>{const o={id:n,type:"remove"};t().onEdgesChange([o])},onConnect:n=>{const o=t().edges.filter(d=>!(d.target===n.target&&d.targetHandle===n.targetHandle)),r=document.getElementById(n.target)?.querySelector(`[data-key="${n.targetHandle}"] .react-flow__handle`),i=r?window.getComputedStyle(r).backgroundColor:"#aaaaaa",s={...n,id:Cc(),style:{stroke:i}},a=[...o,s],l=t().getParam(n.target,n.targetHandle,"spawn"),c=t().edges.some(d=>d.target===n.target&&d.targetHandle===n.targetHandle);if(l&&!c){const d=t().nodes.find(u=>u.id===n.target);if(d){const u=n.targetHandle.replace(/(\[\d*\])?$/,""),p=Object.keys(d.data.params).filter(w=>w.startsWith(u));if(p.length>32)return;const f=Math.max(...p.map(w=>{const P=w.match(/\[\d*\]$/);return P?parseInt(P[0].replace("[","").replace("]","")||"0"):0})),m=`${u}[${f+1}]`,g=d.data.params[n.targetHandle],S={};Object.entries(d.data.params).forEach(([w,P])=>{S[w]=P,w===n.targetHandle&&(S[m]={...g})}),e({nodes:t().nodes.map(w=>w.id===n.target?{...w,data:{...w.data,params:S}}:w)})}}e({edges:a}),t().updateLocalStorage()},addNode:n=>{n.data?.params&&Object.keys(n.data.params).forEach(i=>{const s=n.data.params[i];n.data.params[i]={...s,value:s.value??s.default}});const o=[...t().nodes,n];e({nodes:o});const r={nodes:o,edges:t().edges};localStorage.setItem("workflow",JSON.stringify(r))},setParamValue:(n,o,r)=>{e({nodes:t().nodes.map(i=>i.id===n?{...i,data:{...i.data,params:{...i.data.params,[o]:{...i.data.params[o],value:r}}}}:i)}),t().updateLocalStorage()},updateLocalStorage:()=>{const n=localStorage.getItem("workflow"),{viewport:o}=n?JSON.parse(n):{viewport:{x:0,y:0,zoom:1}},r={nodes:t().nodes,edges:t().edges,viewport:o};localStorage.setItem("workflow",JSON.stringify(r))},setParam:(n,o,r,i)=>{const s=i??"value";e(s!=="group"?{nodes:t().nodes.map(a=>a.id===n?{...a,data:{...a.data,params:{...a.data.params,[o]:{...a.data.params[o],[s]:r}}}}:a)}:{nodes:t().nodes.map(a=>a.id===n?{...a,data:{...a.data,groups:{...a.data.groups,[o]:{...a.data.groups?.[o],...r}}}}:a)}),t().updateLocalStorage()},getParam:(n,o,r)=>t().nodes.find(s=>s.id===n)?.data.params[o][r],setNodeExecuted:(n,o,r,i)=>{e({nodes:t().nodes.map(s=>s.id===n?{...s,data:{...s.data,cache:o,time:r,memory:i}}:s)})},exportGraph:n=>{const{nodes:o,edges:r}=t(),s=o.filter(c=>Rb(c,o,r).length===0).map(c=>tg(c.id,o,r)),a=o.reduce((c,d)=>({...c,[d.id]:Nk(d,r)}),{});return{sid:n??"",nodes:a,paths:s}}})),pa=Sc((e,t)=>({address:null,sid:null,socket:null,isConnected:!1,reconnectTimer:void 0,nodeProgress:{},updateNodeProgress:(n,o)=>{e(r=>({nodeProgress:{...r.nodeProgress,[n]:{value:o<0?0:o,type:o===-1?"indeterminate":o===-2?"disabled":"determinate"}}}))},threeData:{},updateThreeData:(n,o,r)=>{e(i=>({threeData:{...i.threeData,[`${n}-${o}`]:r}}))},connect:async n=>{const{reconnectTimer:o}=t();o&&(clearTimeout(o),e({reconnectTimer:void 0}));let{address:r,sid:i,socket:s}=t();if(s){console.info("WebSocket already created.");return}if(!r&&!n){console.error("Cannot connect to WebSocket. No address specified.");return}n&&n!==r&&(r=n,e({address:r})),i||(i=Cc(10),e({sid:i})),s=new WebSocket(`${r}?sid=${i}`),e({socket:s});const a=()=>{e({isConnected:!0,reconnectTimer:void 0}),console.info("WebSocket connection established")},l=()=>{clearTimeout(t().reconnectTimer),e({socket:null,isConnected:!1,reconnectTimer:void 0}),console.info("WebSocket connection closed");const d=setTimeout(()=>{console.info("Trying to reconnect..."),t().connect()},500);e({reconnectTimer:d})},c=d=>{const u=JSON.parse(d.data);if(u.type==="welcome"){if(!u.sid){console.error("Invalid welcome message.");return}u.sid!==i&&(console.info("Session ID mismatch. Updating.",u.sid,i),e({sid:u.sid})),console.info("WebSocket connection established")}else if(u.type==="progress"){if(!u.progress||!u.nodeId)return;t().updateNodeProgress(u.nodeId,u.progress)}else if(u.type==="image"){if(!u.nodeId||!u.key||!u.data){console.error("Invalid image message. Ignoring.");return}Un.getState().setParam(u.nodeId,u.key,u.data)}else if(u.type==="3d"){if(!u.nodeId||!u.key){console.error("Invalid 3D model message. Ignoring.");return}const p=u.data||{url:null};Un.getState().setParam(u.nodeId,u.key,p)}else if(u.type==="text"){if(!u.nodeId||!u.key||!u.data){console.error("Invalid text message. Ignoring.");return}Un.getState().setParam(u.nodeId,u.key,u.data)}else if(u.type==="executed"){if(console.info("executed",u),!u.nodeId){console.error("Invalid executed message. Ignoring.");return}Un.getState().setNodeExecuted(u.nodeId,!0,u.time||0,u.memory||0),t().updateNodeProgress(u.nodeId,-2)}else if(u.type==="updateValues"){if(!u.nodeId||!u.key||!u.value){console.error("Invalid updateValues message. Ignoring.");return}Un.getState().setParamValue(u.nodeId,u.key,u.value)}else u.type==="error"&&(console.error("Error:",u.error),e({nodeProgress:{}}))};s.addEventListener("open",a),s.addEventListener("close",l),s.addEventListener("message",c)},disconnect:async()=>{const{reconnectTimer:n}=t();n&&clearTimeout(n),e(o=>(o.socket&&o.socket.close(),{socket:null,isConnected:!1,reconnectTimer:void 0}))},destroy:async()=>{t().disconnect(),e({address:null,sid:null})}})),Ok=b.createContext(null);function Lk({children:e}){const t=pa();return h.jsx(Ok.Provider,{value:t,children:e})}const ng=Sc(e=>({nodeRegistry:{},updateNodeRegistry:async()=>{try{const n=await(await fetch("http://"+Qn.serverAddress+"/nodes")).json();e({nodeRegistry:n})}catch(t){console.error("Can't connect to route `/nodes`",t)}}})),_k=Ce("MuiBox",["root"]),jk=ua(),ke=YS({themeId:bn,defaultTheme:jk,defaultClassName:_k.root,generateClassName:Th.generate}),ve=EC;function Bk(e){return Pe("MuiSvgIcon",e)}Ce("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);const zk=e=>{const{color:t,fontSize:n,classes:o}=e,r={root:["root",t!=="inherit"&&`color${q(t)}`,`fontSize${q(n)}`]};return Ie(r,Bk,o)},Dk=Y("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.color!=="inherit"&&t[`color${q(n.color)}`],t[`fontSize${q(n.fontSize)}`]]}})(ve(({theme:e})=>({userSelect:"none",width:"1em",height:"1em",display:"inline-block",flexShrink:0,transition:e.transitions?.create?.("fill",{duration:(e.vars??e).transitions?.duration?.shorter}),variants:[{props:t=>!t.hasSvgAsChild,style:{fill:"currentColor"}},{props:{fontSize:"inherit"},style:{fontSize:"inherit"}},{props:{fontSize:"small"},style:{fontSize:e.typography?.pxToRem?.(20)||"1.25rem"}},{props:{fontSize:"medium"},style:{fontSize:e.typography?.pxToRem?.(24)||"1.5rem"}},{props:{fontSize:"large"},style:{fontSize:e.typography?.pxToRem?.(35)||"2.1875rem"}},...Object.entries((e.vars??e).palette).filter(([,t])=>t&&t.main).map(([t])=>({props:{color:t},style:{color:(e.vars??e).palette?.[t]?.main}})),{props:{color:"action"},style:{color:(e.vars??e).palette?.action?.active}},{props:{color:"disabled"},style:{color:(e.vars??e).palette?.action?.disabled}},{props:{color:"inherit"},style:{color:void 0}}]}))),cs=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiSvgIcon"}),{children:r,className:i,color:s="inherit",component:a="svg",fontSize:l="medium",htmlColor:c,inheritViewBox:d=!1,titleAccess:u,viewBox:p="0 0 24 24",...f}=o,m=b.isValidElement(r)&&r.type==="svg",g={...o,color:s,component:a,fontSize:l,instanceFontSize:t.fontSize,inheritViewBox:d,viewBox:p,hasSvgAsChild:m},S={};d||(S.viewBox=p);const w=zk(g);return h.jsxs(Dk,{as:a,className:re(w.root,i),focusable:"false",color:c,"aria-hidden":u?void 0:!0,role:u?"img":void 0,ref:n,...S,...f,...m&&r.props,ownerState:g,children:[m?r.props.children:r,u?h.jsx("title",{children:u}):null]})});cs.muiName="SvgIcon";function st(e,t){function n(o,r){return h.jsx(cs,{"data-testid":`${t}Icon`,ref:r,...o,children:e})}return n.muiName=cs.muiName,b.memo(b.forwardRef(n))}const Fk=st(h.jsx("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");class us{static create(){return new us}static use(){const t=jh(us.create).current,[n,o]=b.useState(!1);return t.shouldMount=n,t.setShouldMount=o,b.useEffect(t.mountEffect,[n]),t}constructor(){this.ref={current:null},this.mounted=null,this.didMount=!1,this.shouldMount=!1,this.setShouldMount=null}mount(){return this.mounted||(this.mounted=Wk(),this.shouldMount=!0,this.setShouldMount(this.shouldMount)),this.mounted}mountEffect=()=>{this.shouldMount&&!this.didMount&&this.ref.current!==null&&(this.didMount=!0,this.mounted.resolve())};start(...t){this.mount().then(()=>this.ref.current?.start(...t))}stop(...t){this.mount().then(()=>this.ref.current?.stop(...t))}pulsate(...t){this.mount().then(()=>this.ref.current?.pulsate(...t))}}function Hk(){return us.use()}function Wk(){let e,t;const n=new Promise((o,r)=>{e=o,t=r});return n.resolve=e,n.reject=t,n}function og(e,t){if(e==null)return{};var n={};for(var o in e)if({}.hasOwnProperty.call(e,o)){if(t.includes(o))continue;n[o]=e[o]}return n}function bl(e,t){return bl=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(n,o){return n.__proto__=o,n},bl(e,t)}function rg(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,bl(e,t)}const kd={disabled:!1},ds=Zt.createContext(null);var Vk=function(t){return t.scrollTop},Sr="unmounted",co="exited",uo="entering",Oo="entered",vl="exiting",pn=function(e){rg(t,e);function t(o,r){var i;i=e.call(this,o,r)||this;var s=r,a=s&&!s.isMounting?o.enter:o.appear,l;return i.appearStatus=null,o.in?a?(l=co,i.appearStatus=uo):l=Oo:o.unmountOnExit||o.mountOnEnter?l=Sr:l=co,i.state={status:l},i.nextCallback=null,i}t.getDerivedStateFromProps=function(r,i){var s=r.in;return s&&i.status===Sr?{status:co}:null};var n=t.prototype;return n.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},n.componentDidUpdate=function(r){var i=null;if(r!==this.props){var s=this.state.status;this.props.in?s!==uo&&s!==Oo&&(i=uo):(s===uo||s===Oo)&&(i=vl)}this.updateStatus(!1,i)},n.componentWillUnmount=function(){this.cancelNextCallback()},n.getTimeouts=function(){var r=this.props.timeout,i,s,a;return i=s=a=r,r!=null&&typeof r!="number"&&(i=r.exit,s=r.enter,a=r.appear!==void 0?r.appear:s),{exit:i,enter:s,appear:a}},n.updateStatus=function(r,i){if(r===void 0&&(r=!1),i!==null)if(this.cancelNextCallback(),i===uo){if(this.props.unmountOnExit||this.props.mountOnEnter){var s=this.props.nodeRef?this.props.nodeRef.current:gi.findDOMNode(this);s&&Vk(s)}this.performEnter(r)}else this.performExit();else this.props.unmountOnExit&&this.state.status===co&&this.setState({status:Sr})},n.performEnter=function(r){var i=this,s=this.props.enter,a=this.context?this.context.isMounting:r,l=this.props.nodeRef?[a]:[gi.findDOMNode(this),a],c=l[0],d=l[1],u=this.getTimeouts(),p=a?u.appear:u.enter;if(!r&&!s||kd.disabled){this.safeSetState({status:Oo},function(){i.props.onEntered(c)});return}this.props.onEnter(c,d),this.safeSetState({status:uo},function(){i.props.onEntering(c,d),i.onTransitionEnd(p,function(){i.safeSetState({status:Oo},function(){i.props.onEntered(c,d)})})})},n.performExit=function(){var r=this,i=this.props.exit,s=this.getTimeouts(),a=this.props.nodeRef?void 0:gi.findDOMNode(this);if(!i||kd.disabled){this.safeSetState({status:co},function(){r.props.onExited(a)});return}this.props.onExit(a),this.safeSetState({status:vl},function(){r.props.onExiting(a),r.onTransitionEnd(s.exit,function(){r.safeSetState({status:co},function(){r.props.onExited(a)})})})},n.cancelNextCallback=function(){this.nextCallback!==null&&(this.nextCallback.cancel(),this.nextCallback=null)},n.safeSetState=function(r,i){i=this.setNextCallback(i),this.setState(r,i)},n.setNextCallback=function(r){var i=this,s=!0;return this.nextCallback=function(a){s&&(s=!1,i.nextCallback=null,r(a))},this.nextCallback.cancel=function(){s=!1},this.nextCallback},n.onTransitionEnd=function(r,i){this.setNextCallback(i);var s=this.props.nodeRef?this.props.nodeRef.current:gi.findDOMNode(this),a=r==null&&!this.props.addEndListener;if(!s||a){setTimeout(this.nextCallback,0);return}if(this.props.addEndListener){var l=this.props.nodeRef?[this.nextCallback]:[s,this.nextCallback],c=l[0],d=l[1];this.props.addEndListener(c,d)}r!=null&&setTimeout(this.nextCallback,r)},n.render=function(){var r=this.state.status;if(r===Sr)return null;var i=this.props,s=i.children;i.in,i.mountOnEnter,i.unmountOnExit,i.appear,i.enter,i.exit,i.timeout,i.addEndListener,i.onEnter,i.onEntering,i.onEntered,i.onExit,i.onExiting,i.onExited,i.nodeRef;var a=og(i,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]);return Zt.createElement(ds.Provider,{value:null},typeof s=="function"?s(r,a):Zt.cloneElement(Zt.Children.only(s),a))},t}(Zt.Component);pn.contextType=ds;pn.propTypes={};function To(){}pn.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:To,onEntering:To,onEntered:To,onExit:To,onExiting:To,onExited:To};pn.UNMOUNTED=Sr;pn.EXITED=co;pn.ENTERING=uo;pn.ENTERED=Oo;pn.EXITING=vl;function Uk(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function kc(e,t){var n=function(i){return t&&b.isValidElement(i)?t(i):i},o=Object.create(null);return e&&b.Children.map(e,function(r){return r}).forEach(function(r){o[r.key]=n(r)}),o}function Gk(e,t){e=e||{},t=t||{};function n(d){return d in t?t[d]:e[d]}var o=Object.create(null),r=[];for(var i in e)i in t?r.length&&(o[i]=r,r=[]):r.push(i);var s,a={};for(var l in t){if(o[l])for(s=0;s<o[l].length;s++){var c=o[l][s];a[o[l][s]]=n(c)}a[l]=n(l)}for(s=0;s<r.length;s++)a[r[s]]=n(r[s]);return a}function fo(e,t,n){return n[t]!=null?n[t]:e.props[t]}function Xk(e,t){return kc(e.children,function(n){return b.cloneElement(n,{onExited:t.bind(null,n),in:!0,appear:fo(n,"appear",e),enter:fo(n,"enter",e),exit:fo(n,"exit",e)})})}function Yk(e,t,n){var o=kc(e.children),r=Gk(t,o);return Object.keys(r).forEach(function(i){var s=r[i];if(b.isValidElement(s)){var a=i in t,l=i in o,c=t[i],d=b.isValidElement(c)&&!c.props.in;l&&(!a||d)?r[i]=b.cloneElement(s,{onExited:n.bind(null,s),in:!0,exit:fo(s,"exit",e),enter:fo(s,"enter",e)}):!l&&a&&!d?r[i]=b.cloneElement(s,{in:!1}):l&&a&&b.isValidElement(c)&&(r[i]=b.cloneElement(s,{onExited:n.bind(null,s),in:c.props.in,exit:fo(s,"exit",e),enter:fo(s,"enter",e)}))}}),r}var qk=Object.values||function(e){return Object.keys(e).map(function(t){return e[t]})},Kk={component:"div",childFactory:function(t){return t}},Ec=function(e){rg(t,e);function t(o,r){var i;i=e.call(this,o,r)||this;var s=i.handleExited.bind(Uk(i));return i.state={contextValue:{isMounting:!0},handleExited:s,firstRender:!0},i}var n=t.prototype;return n.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},n.componentWillUnmount=function(){this.mounted=!1},t.getDerivedStateFromProps=function(r,i){var s=i.children,a=i.handleExited,l=i.firstRender;return{children:l?Xk(r,a):Yk(r,s,a),firstRender:!1}},n.handleExited=function(r,i){var s=kc(this.props.children);r.key in s||(r.props.onExited&&r.props.onExited(i),this.mounted&&this.setState(function(a){var l=mp({},a.children);return delete l[r.key],{children:l}}))},n.render=function(){var r=this.props,i=r.component,s=r.childFactory,a=og(r,["component","childFactory"]),l=this.state.contextValue,c=qk(this.state.children).map(s);return delete a.appear,delete a.enter,delete a.exit,i===null?Zt.createElement(ds.Provider,{value:l},c):Zt.createElement(ds.Provider,{value:l},Zt.createElement(i,a,c))},t}(Zt.Component);Ec.propTypes={};Ec.defaultProps=Kk;function Zk(e){const{className:t,classes:n,pulsate:o=!1,rippleX:r,rippleY:i,rippleSize:s,in:a,onExited:l,timeout:c}=e,[d,u]=b.useState(!1),p=re(t,n.ripple,n.rippleVisible,o&&n.ripplePulsate),f={width:s,height:s,top:-(s/2)+i,left:-(s/2)+r},m=re(n.child,d&&n.childLeaving,o&&n.childPulsate);return!a&&!d&&u(!0),b.useEffect(()=>{if(!a&&l!=null){const g=setTimeout(l,c);return()=>{clearTimeout(g)}}},[l,a,c]),h.jsx("span",{className:p,style:f,children:h.jsx("span",{className:m})})}const qt=Ce("MuiTouchRipple",["root","ripple","rippleVisible","ripplePulsate","child","childLeaving","childPulsate"]),xl=550,Jk=80,Qk=Jn`
+To suppress this warning, you need to explicitly provide the \`palette.${t}Channel\` as a string (in rgb format, for example "12 12 12") or undefined if you want to remove the channel token.`))}function mk(e){return typeof e=="number"?`${e}px`:typeof e=="string"||typeof e=="function"||Array.isArray(e)?e:"8px"}const fn=e=>{try{return e()}catch{}},yk=(e="mui")=>AC(e);function ja(e,t,n,o){if(!t)return;t=t===!0?{}:t;const r=o==="dark"?"dark":"light";if(!n){e[o]=dk({...t,palette:{mode:r,...t?.palette}});return}const{palette:i,...s}=gl({...n,palette:{mode:r,...t?.palette}});return e[o]={...t,palette:i,opacity:{...Jh(r),...t?.opacity},overlays:t?.overlays||Qh(r)},s}function bk(e={},...t){const{colorSchemes:n={light:!0},defaultColorScheme:o,disableCssColorScheme:r=!1,cssVarPrefix:i="mui",shouldSkipGeneratingVar:s=pk,colorSchemeSelector:a=n.light&&n.dark?"media":void 0,rootSelector:l=":root",...c}=e,d=Object.keys(n)[0],u=o||(n.light&&d!=="light"?"light":d),p=yk(i),{[u]:f,light:m,dark:g,...S}=n,w={...S};let P=f;if((u==="dark"&&!("dark"in n)||u==="light"&&!("light"in n))&&(P=!0),!P)throw new Error(An(21,u));const x=ja(w,P,c,u);m&&!w.light&&ja(w,m,void 0,"light"),g&&!w.dark&&ja(w,g,void 0,"dark");let y={defaultColorScheme:u,...x,cssVarPrefix:i,colorSchemeSelector:a,rootSelector:l,getCssVar:p,colorSchemes:w,font:{...JC(x.typography),...x.font},spacing:mk(c.spacing)};Object.keys(y.colorSchemes).forEach(T=>{const v=y.colorSchemes[T].palette,A=L=>{const _=L.split("-"),C=_[1],R=_[2];return p(L,v[C][R])};if(v.mode==="light"&&(H(v.common,"background","#fff"),H(v.common,"onBackground","#000")),v.mode==="dark"&&(H(v.common,"background","#000"),H(v.common,"onBackground","#fff")),gk(v,["Alert","AppBar","Avatar","Button","Chip","FilledInput","LinearProgress","Skeleton","Slider","SnackbarContent","SpeedDialAction","StepConnector","StepContent","Switch","TableCell","Tooltip"]),v.mode==="light"){H(v.Alert,"errorColor",Ze(v.error.light,.6)),H(v.Alert,"infoColor",Ze(v.info.light,.6)),H(v.Alert,"successColor",Ze(v.success.light,.6)),H(v.Alert,"warningColor",Ze(v.warning.light,.6)),H(v.Alert,"errorFilledBg",A("palette-error-main")),H(v.Alert,"infoFilledBg",A("palette-info-main")),H(v.Alert,"successFilledBg",A("palette-success-main")),H(v.Alert,"warningFilledBg",A("palette-warning-main")),H(v.Alert,"errorFilledColor",fn(()=>v.getContrastText(v.error.main))),H(v.Alert,"infoFilledColor",fn(()=>v.getContrastText(v.info.main))),H(v.Alert,"successFilledColor",fn(()=>v.getContrastText(v.success.main))),H(v.Alert,"warningFilledColor",fn(()=>v.getContrastText(v.warning.main))),H(v.Alert,"errorStandardBg",Je(v.error.light,.9)),H(v.Alert,"infoStandardBg",Je(v.info.light,.9)),H(v.Alert,"successStandardBg",Je(v.success.light,.9)),H(v.Alert,"warningStandardBg",Je(v.warning.light,.9)),H(v.Alert,"errorIconColor",A("palette-error-main")),H(v.Alert,"infoIconColor",A("palette-info-main")),H(v.Alert,"successIconColor",A("palette-success-main")),H(v.Alert,"warningIconColor",A("palette-warning-main")),H(v.AppBar,"defaultBg",A("palette-grey-100")),H(v.Avatar,"defaultBg",A("palette-grey-400")),H(v.Button,"inheritContainedBg",A("palette-grey-300")),H(v.Button,"inheritContainedHoverBg",A("palette-grey-A100")),H(v.Chip,"defaultBorder",A("palette-grey-400")),H(v.Chip,"defaultAvatarColor",A("palette-grey-700")),H(v.Chip,"defaultIconColor",A("palette-grey-700")),H(v.FilledInput,"bg","rgba(0, 0, 0, 0.06)"),H(v.FilledInput,"hoverBg","rgba(0, 0, 0, 0.09)"),H(v.FilledInput,"disabledBg","rgba(0, 0, 0, 0.12)"),H(v.LinearProgress,"primaryBg",Je(v.primary.main,.62)),H(v.LinearProgress,"secondaryBg",Je(v.secondary.main,.62)),H(v.LinearProgress,"errorBg",Je(v.error.main,.62)),H(v.LinearProgress,"infoBg",Je(v.info.main,.62)),H(v.LinearProgress,"successBg",Je(v.success.main,.62)),H(v.LinearProgress,"warningBg",Je(v.warning.main,.62)),H(v.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.11)`),H(v.Slider,"primaryTrack",Je(v.primary.main,.62)),H(v.Slider,"secondaryTrack",Je(v.secondary.main,.62)),H(v.Slider,"errorTrack",Je(v.error.main,.62)),H(v.Slider,"infoTrack",Je(v.info.main,.62)),H(v.Slider,"successTrack",Je(v.success.main,.62)),H(v.Slider,"warningTrack",Je(v.warning.main,.62));const L=Pi(v.background.default,.8);H(v.SnackbarContent,"bg",L),H(v.SnackbarContent,"color",fn(()=>v.getContrastText(L))),H(v.SpeedDialAction,"fabHoverBg",Pi(v.background.paper,.15)),H(v.StepConnector,"border",A("palette-grey-400")),H(v.StepContent,"border",A("palette-grey-400")),H(v.Switch,"defaultColor",A("palette-common-white")),H(v.Switch,"defaultDisabledColor",A("palette-grey-100")),H(v.Switch,"primaryDisabledColor",Je(v.primary.main,.62)),H(v.Switch,"secondaryDisabledColor",Je(v.secondary.main,.62)),H(v.Switch,"errorDisabledColor",Je(v.error.main,.62)),H(v.Switch,"infoDisabledColor",Je(v.info.main,.62)),H(v.Switch,"successDisabledColor",Je(v.success.main,.62)),H(v.Switch,"warningDisabledColor",Je(v.warning.main,.62)),H(v.TableCell,"border",Je($i(v.divider,1),.88)),H(v.Tooltip,"bg",$i(v.grey[700],.92))}if(v.mode==="dark"){H(v.Alert,"errorColor",Je(v.error.light,.6)),H(v.Alert,"infoColor",Je(v.info.light,.6)),H(v.Alert,"successColor",Je(v.success.light,.6)),H(v.Alert,"warningColor",Je(v.warning.light,.6)),H(v.Alert,"errorFilledBg",A("palette-error-dark")),H(v.Alert,"infoFilledBg",A("palette-info-dark")),H(v.Alert,"successFilledBg",A("palette-success-dark")),H(v.Alert,"warningFilledBg",A("palette-warning-dark")),H(v.Alert,"errorFilledColor",fn(()=>v.getContrastText(v.error.dark))),H(v.Alert,"infoFilledColor",fn(()=>v.getContrastText(v.info.dark))),H(v.Alert,"successFilledColor",fn(()=>v.getContrastText(v.success.dark))),H(v.Alert,"warningFilledColor",fn(()=>v.getContrastText(v.warning.dark))),H(v.Alert,"errorStandardBg",Ze(v.error.light,.9)),H(v.Alert,"infoStandardBg",Ze(v.info.light,.9)),H(v.Alert,"successStandardBg",Ze(v.success.light,.9)),H(v.Alert,"warningStandardBg",Ze(v.warning.light,.9)),H(v.Alert,"errorIconColor",A("palette-error-main")),H(v.Alert,"infoIconColor",A("palette-info-main")),H(v.Alert,"successIconColor",A("palette-success-main")),H(v.Alert,"warningIconColor",A("palette-warning-main")),H(v.AppBar,"defaultBg",A("palette-grey-900")),H(v.AppBar,"darkBg",A("palette-background-paper")),H(v.AppBar,"darkColor",A("palette-text-primary")),H(v.Avatar,"defaultBg",A("palette-grey-600")),H(v.Button,"inheritContainedBg",A("palette-grey-800")),H(v.Button,"inheritContainedHoverBg",A("palette-grey-700")),H(v.Chip,"defaultBorder",A("palette-grey-700")),H(v.Chip,"defaultAvatarColor",A("palette-grey-300")),H(v.Chip,"defaultIconColor",A("palette-grey-300")),H(v.FilledInput,"bg","rgba(255, 255, 255, 0.09)"),H(v.FilledInput,"hoverBg","rgba(255, 255, 255, 0.13)"),H(v.FilledInput,"disabledBg","rgba(255, 255, 255, 0.12)"),H(v.LinearProgress,"primaryBg",Ze(v.primary.main,.5)),H(v.LinearProgress,"secondaryBg",Ze(v.secondary.main,.5)),H(v.LinearProgress,"errorBg",Ze(v.error.main,.5)),H(v.LinearProgress,"infoBg",Ze(v.info.main,.5)),H(v.LinearProgress,"successBg",Ze(v.success.main,.5)),H(v.LinearProgress,"warningBg",Ze(v.warning.main,.5)),H(v.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.13)`),H(v.Slider,"primaryTrack",Ze(v.primary.main,.5)),H(v.Slider,"secondaryTrack",Ze(v.secondary.main,.5)),H(v.Slider,"errorTrack",Ze(v.error.main,.5)),H(v.Slider,"infoTrack",Ze(v.info.main,.5)),H(v.Slider,"successTrack",Ze(v.success.main,.5)),H(v.Slider,"warningTrack",Ze(v.warning.main,.5));const L=Pi(v.background.default,.98);H(v.SnackbarContent,"bg",L),H(v.SnackbarContent,"color",fn(()=>v.getContrastText(L))),H(v.SpeedDialAction,"fabHoverBg",Pi(v.background.paper,.15)),H(v.StepConnector,"border",A("palette-grey-600")),H(v.StepContent,"border",A("palette-grey-600")),H(v.Switch,"defaultColor",A("palette-grey-300")),H(v.Switch,"defaultDisabledColor",A("palette-grey-600")),H(v.Switch,"primaryDisabledColor",Ze(v.primary.main,.55)),H(v.Switch,"secondaryDisabledColor",Ze(v.secondary.main,.55)),H(v.Switch,"errorDisabledColor",Ze(v.error.main,.55)),H(v.Switch,"infoDisabledColor",Ze(v.info.main,.55)),H(v.Switch,"successDisabledColor",Ze(v.success.main,.55)),H(v.Switch,"warningDisabledColor",Ze(v.warning.main,.55)),H(v.TableCell,"border",Ze($i(v.divider,1),.68)),H(v.Tooltip,"bg",$i(v.grey[700],.92))}kn(v.background,"default"),kn(v.background,"paper"),kn(v.common,"background"),kn(v.common,"onBackground"),kn(v,"divider"),Object.keys(v).forEach(L=>{const _=v[L];L!=="tonalOffset"&&_&&typeof _=="object"&&(_.main&&H(v[L],"mainChannel",xr(wr(_.main))),_.light&&H(v[L],"lightChannel",xr(wr(_.light))),_.dark&&H(v[L],"darkChannel",xr(wr(_.dark))),_.contrastText&&H(v[L],"contrastTextChannel",xr(wr(_.contrastText))),L==="text"&&(kn(v[L],"primary"),kn(v[L],"secondary")),L==="action"&&(_.active&&kn(v[L],"active"),_.selected&&kn(v[L],"selected")))})}),y=t.reduce((T,v)=>yt(T,v),y);const E={prefix:i,disableCssColorScheme:r,shouldSkipGeneratingVar:s,getSelector:hk(y)},{vars:$,generateThemeVars:I,generateStyleSheets:M}=LC(y,E);return y.vars=$,Object.entries(y.colorSchemes[y.defaultColorScheme]).forEach(([T,v])=>{y[T]=v}),y.generateThemeVars=I,y.generateStyleSheets=M,y.generateSpacing=function(){return Rh(c.spacing,ea(this))},y.getColorSchemeSelector=_C(a),y.spacing=y.generateSpacing(),y.shouldSkipGeneratingVar=s,y.unstable_sxConfig={...si,...c?.unstable_sxConfig},y.unstable_sx=function(v){return Kn({sx:v,theme:this})},y.toRuntimeSource=Zh,y}function wd(e,t,n){e.colorSchemes&&n&&(e.colorSchemes[t]={...n!==!0&&n,palette:vc({...n===!0?{}:n.palette,mode:t})})}function ua(e={},...t){const{palette:n,cssVariables:o=!1,colorSchemes:r=n?void 0:{light:!0},defaultColorScheme:i=n?.mode,...s}=e,a=i||"light",l=r?.[a],c={...r,...n?{[a]:{...typeof l!="boolean"&&l,palette:n}}:void 0};if(o===!1){if(!("colorSchemes"in e))return gl(e,...t);let d=n;"palette"in e||c[a]&&(c[a]!==!0?d=c[a].palette:a==="dark"&&(d={mode:"dark"}));const u=gl({...e,palette:d},...t);return u.defaultColorScheme=a,u.colorSchemes=c,u.palette.mode==="light"&&(u.colorSchemes.light={...c.light!==!0&&c.light,palette:u.palette},wd(u,"dark",c.dark)),u.palette.mode==="dark"&&(u.colorSchemes.dark={...c.dark!==!0&&c.dark,palette:u.palette},wd(u,"light",c.light)),u}return!n&&!("light"in c)&&a==="light"&&(c.light=!0),bk({...s,colorSchemes:c,defaultColorScheme:a,...typeof o!="boolean"&&o},...t)}const xc=ua();function St(){const e=aa(xc);return e[bn]||e}function da(e){return e!=="ownerState"&&e!=="theme"&&e!=="sx"&&e!=="as"}const Nt=e=>da(e)&&e!=="classes",Y=Lh({themeId:bn,defaultTheme:xc,rootShouldForwardProp:Nt});function Sd({theme:e,...t}){const n=bn in e?e[bn]:void 0;return h.jsx(Uh,{...t,themeId:n?bn:void 0,theme:n||e})}const Ii={attribute:"data-mui-color-scheme",colorSchemeStorageKey:"mui-color-scheme",defaultLightColorScheme:"light",defaultDarkColorScheme:"dark",modeStorageKey:"mui-mode"},{CssVarsProvider:vk,useColorScheme:BT,getInitColorSchemeScript:zT}=TC({themeId:bn,theme:()=>ua({cssVariables:!0}),colorSchemeStorageKey:Ii.colorSchemeStorageKey,modeStorageKey:Ii.modeStorageKey,defaultColorScheme:{light:Ii.defaultLightColorScheme,dark:Ii.defaultDarkColorScheme},resolveTheme:e=>{const t={...e,typography:qh(e.palette,e.typography)};return t.unstable_sx=function(o){return Kn({sx:o,theme:this})},t}}),xk=vk;function wk({theme:e,...t}){return typeof e=="function"?h.jsx(Sd,{theme:e,...t}):"colorSchemes"in(bn in e?e[bn]:e)?h.jsx(xk,{theme:e,...t}):h.jsx(Sd,{theme:e,...t})}function Sk(e){return h.jsx(US,{...e,defaultTheme:xc,themeId:bn})}function wc(e){return function(n){return h.jsx(Sk,{styles:typeof e=="function"?o=>e({theme:o,...n}):e})}}function Ck(){return pc}function Te(e){return kC(e)}const yl=typeof wc({})=="function",kk=(e,t)=>({WebkitFontSmoothing:"antialiased",MozOsxFontSmoothing:"grayscale",boxSizing:"border-box",WebkitTextSizeAdjust:"100%",...t&&!e.vars&&{colorScheme:e.palette.mode}}),Ek=e=>({color:(e.vars||e).palette.text.primary,...e.typography.body1,backgroundColor:(e.vars||e).palette.background.default,"@media print":{backgroundColor:(e.vars||e).palette.common.white}}),eg=(e,t=!1)=>{const n={};t&&e.colorSchemes&&typeof e.getColorSchemeSelector=="function"&&Object.entries(e.colorSchemes).forEach(([i,s])=>{const a=e.getColorSchemeSelector(i);a.startsWith("@")?n[a]={":root":{colorScheme:s.palette?.mode}}:n[a.replace(/\s*&/,"")]={colorScheme:s.palette?.mode}});let o={html:kk(e,t),"*, *::before, *::after":{boxSizing:"inherit"},"strong, b":{fontWeight:e.typography.fontWeightBold},body:{margin:0,...Ek(e),"&::backdrop":{backgroundColor:(e.vars||e).palette.background.default}},...n};const r=e.components?.MuiCssBaseline?.styleOverrides;return r&&(o=[o,r]),o},Xi="mui-ecs",$k=e=>{const t=eg(e,!1),n=Array.isArray(t)?t[0]:t;return!e.vars&&n&&(n.html[`:root:has(${Xi})`]={colorScheme:e.palette.mode}),e.colorSchemes&&Object.entries(e.colorSchemes).forEach(([o,r])=>{const i=e.getColorSchemeSelector(o);i.startsWith("@")?n[i]={[`:root:not(:has(.${Xi}))`]:{colorScheme:r.palette?.mode}}:n[i.replace(/\s*&/,"")]={[`&:not(:has(.${Xi}))`]:{colorScheme:r.palette?.mode}}}),t},Pk=wc(yl?({theme:e,enableColorScheme:t})=>eg(e,t):({theme:e})=>$k(e));function Ik(e){const t=Te({props:e,name:"MuiCssBaseline"}),{children:n,enableColorScheme:o=!1}=t;return h.jsxs(b.Fragment,{children:[yl&&h.jsx(Pk,{enableColorScheme:o}),!yl&&!o&&h.jsx("span",{className:Xi,style:{display:"none"}}),n]})}const{useSyncExternalStoreWithSelector:Rk}=gp,Mk=e=>e;function Tk(e,t=Mk,n){const o=Rk(e.subscribe,e.getState,e.getInitialState,t,n);return Zt.useDebugValue(o),o}const Cd=(e,t)=>{const n=Yg(e),o=(r,i=t)=>Tk(n,r,i);return Object.assign(o,n),o},Sc=(e,t)=>e?Cd(e,t):Cd,Ak="useandom-26T198340PX75pxJACKVERYMINDBUSHWOLF_GQZbfghjklqvwyzrict";let Cc=(e=21)=>{let t="",n=crypto.getRandomValues(new Uint8Array(e|=0));for(;e--;)t+=Ak[n[e]&63];return t};const Qn={serverAddress:window.location.origin.split("://")[1]},Nk=(e,t)=>{const n=t.filter(r=>r.target===e.id),o={};return Object.entries(e.data.params).forEach(([r,i])=>{if(i.display==="output")return;const s=n.find(a=>a.targetHandle===r);o[r]={sourceId:s?.source??void 0,sourceKey:(s?s.sourceHandle:i.source)??void 0,value:i.value??void 0,display:i.display??void 0,type:i.type??void 0}}),{module:e.data.module,action:e.data.action,params:o}},tg=(e,t,n,o=new Set)=>{if(o.has(e))return[];o.add(e);const r=t.find(a=>a.id===e);if(!r)return[];const i=Mb(r,t,n);return i.length===0?[e]:[...i.flatMap(a=>tg(a.id,t,n,new Set(o))),e]},Un=Sc((e,t)=>({nodes:JSON.parse(localStorage.getItem("workflow")||'{"nodes":[]}').nodes||[],edges:JSON.parse(localStorage.getItem("workflow")||'{"edges":[]}').edges||[],onNodesChange:async n=>{const o=If(n,t().nodes);e({nodes:o});const r=localStorage.getItem("workflow"),{viewport:i}=r?JSON.parse(r):{viewport:{x:0,y:0,zoom:1}},s={nodes:o,edges:t().edges,viewport:i};if(localStorage.setItem("workflow",JSON.stringify(s)),n.some(a=>a.type==="remove")){const a=n.filter(l=>l.type==="remove").map(l=>l.id);try{await fetch("http://"+Qn.serverAddress+"/clearNodeCache",{method:"DELETE",body:JSON.stringify({nodeId:a})})}catch(l){console.error("Can't connect to server to clear cache:",l)}}},onEdgesChange:n=>{const o=Rf(n,t().edges),r=n.filter(i=>i.type==="remove");for(const i of r){const s=t().edges.find(l=>l.id===i.id),a=t().getParam(s?.target,s?.targetHandle,"spawn");s&&a&&t().nodes.find(c=>c.id===s.target)&&e({nodes:t().nodes.map(c=>{if(c.id===s.target){const{[s.targetHandle]:d,...u}=c.data.params;return{...c,data:{...c.data,params:u}}}return c})})}e({edges:o}),t().updateLocalStorage()},onEdgeDoubleClick:n=>{const o={id:n,type:"remove"};t().onEdgesChange([o])},onConnect:n=>{const o=t().edges.filter(d=>!(d.target===n.target&&d.targetHandle===n.targetHandle)),r=document.getElementById(n.target)?.querySelector(`[data-key="${n.targetHandle}"] .react-flow__handle`),i=r?window.getComputedStyle(r).backgroundColor:"#aaaaaa",s={...n,id:Cc(),style:{stroke:i}},a=[...o,s],l=t().getParam(n.target,n.targetHandle,"spawn"),c=t().edges.some(d=>d.target===n.target&&d.targetHandle===n.targetHandle);if(l&&!c){const d=t().nodes.find(u=>u.id===n.target);if(d){const u=n.targetHandle.replace(/(\[\d*\])?$/,""),p=Object.keys(d.data.params).filter(w=>w.startsWith(u));if(p.length>32)return;const f=Math.max(...p.map(w=>{const P=w.match(/\[\d*\]$/);return P?parseInt(P[0].replace("[","").replace("]","")||"0"):0})),m=`${u}[${f+1}]`,g=d.data.params[n.targetHandle],S={};Object.entries(d.data.params).forEach(([w,P])=>{S[w]=P,w===n.targetHandle&&(S[m]={...g})}),e({nodes:t().nodes.map(w=>w.id===n.target?{...w,data:{...w.data,params:S}}:w)})}}e({edges:a}),t().updateLocalStorage()},addNode:n=>{n.data?.params&&Object.keys(n.data.params).forEach(i=>{const s=n.data.params[i];n.data.params[i]={...s,value:s.value??s.default}});const o=[...t().nodes,n];e({nodes:o});const r={nodes:o,edges:t().edges};localStorage.setItem("workflow",JSON.stringify(r))},setParamValue:(n,o,r)=>{e({nodes:t().nodes.map(i=>i.id===n?{...i,data:{...i.data,params:{...i.data.params,[o]:{...i.data.params[o],value:r}}}}:i)}),t().updateLocalStorage()},updateLocalStorage:()=>{const n=localStorage.getItem("workflow"),{viewport:o}=n?JSON.parse(n):{viewport:{x:0,y:0,zoom:1}},r={nodes:t().nodes,edges:t().edges,viewport:o};localStorage.setItem("workflow",JSON.stringify(r))},setParam:(n,o,r,i)=>{const s=i??"value";e(s!=="group"?{nodes:t().nodes.map(a=>a.id===n?{...a,data:{...a.data,params:{...a.data.params,[o]:{...a.data.params[o],[s]:r}}}}:a)}:{nodes:t().nodes.map(a=>a.id===n?{...a,data:{...a.data,groups:{...a.data.groups,[o]:{...a.data.groups?.[o],...r}}}}:a)}),t().updateLocalStorage()},getParam:(n,o,r)=>t().nodes.find(s=>s.id===n)?.data.params[o][r],setNodeExecuted:(n,o,r,i)=>{e({nodes:t().nodes.map(s=>s.id===n?{...s,data:{...s.data,cache:o,time:r,memory:i}}:s)})},exportGraph:n=>{const{nodes:o,edges:r}=t(),s=o.filter(c=>Rb(c,o,r).length===0).map(c=>tg(c.id,o,r)),a=o.reduce((c,d)=>({...c,[d.id]:Nk(d,r)}),{});return{sid:n??"",nodes:a,paths:s}}})),pa=Sc((e,t)=>({address:null,sid:null,socket:null,isConnected:!1,reconnectTimer:void 0,nodeProgress:{},updateNodeProgress:(n,o)=>{e(r=>({nodeProgress:{...r.nodeProgress,[n]:{value:o<0?0:o,type:o===-1?"indeterminate":o===-2?"disabled":"determinate"}}}))},nodePreview:{},updateNodePreview:(n,o)=>{const r=t().nodePreview[n];r&&URL.revokeObjectURL(r),e(i=>{const s={...i.nodePreview};return o?s[n]=URL.createObjectURL(o):delete s[n],{nodePreview:s}})},threeData:{},updateThreeData:(n,o,r)=>{e(i=>({threeData:{...i.threeData,[`${n}-${o}`]:r}}))},connect:async n=>{const{reconnectTimer:o}=t();o&&(clearTimeout(o),e({reconnectTimer:void 0}));let{address:r,sid:i,socket:s}=t();if(s){console.info("WebSocket already created.");return}if(!r&&!n){console.error("Cannot connect to WebSocket. No address specified.");return}n&&n!==r&&(r=n,e({address:r})),i||(i=Cc(10),e({sid:i})),s=new WebSocket(`${r}?sid=${i}`),s.binaryType="arraybuffer",e({socket:s});const a=()=>{e({isConnected:!0,reconnectTimer:void 0}),console.info("WebSocket connection established")},l=()=>{clearTimeout(t().reconnectTimer),e({socket:null,isConnected:!1,reconnectTimer:void 0}),console.info("WebSocket connection closed");const d=setTimeout(()=>{console.info("Trying to reconnect..."),t().connect()},500);e({reconnectTimer:d})},c=d=>{if(d.data instanceof ArrayBuffer){const p=new DataView(d.data).getUint32(0),m=JSON.parse(new TextDecoder().decode(d.data.slice(4,4+p)));if(m.type==="preview"&&m.nodeId){if(t().nodeProgress[m.nodeId]?.type!=="determinate")return;const f=new Blob([d.data.slice(4+p)],{type:`image/${m.format||"webp"}`});t().updateNodePreview(m.nodeId,f)}return}const u=JSON.parse(d.data);if(u.type==="welcome"){if(!u.sid){console.error("Invalid welcome message.");return}u.sid!==i&&(console.info("Session ID mismatch. Updating.",u.sid,i),e({sid:u.sid})),console.info("WebSocket connection established")}else if(u.type==="progress"){if(!u.progress||!u.nodeId)return;t().updateNodeProgress(u.nodeId,u.progress)}else if(u.type==="progressBatch"){if(!Array.isArray(u.updates))return;u.updates.forEach(({nodeId:p,progress:m})=>{p&&m&&t().updateNodeProgress(p,m)})}else if(u.type==="image"){if(!u.nodeId||!u.key||!u.data){console.error("Invalid image message. Ignoring.");return}Un.getState().setParam(u.nodeId,u.key,u.data)}else if(u.type==="3d"){if(!u.nodeId||!u.key){console.error("Invalid 3D model message. Ignoring.");return}const p=u.data||{url:null};Un.getState().setParam(u.nodeId,u.key,p)}else if(u.type==="text"){if(!u.nodeId||!u.key||!u.data){console.error("Invalid text message. Ignoring.");return}Un.getState().setParam(u.nodeId,u.key,u.data)}else if(u.type==="executed"){if(console.info("executed",u),!u.nodeId){console.error("Invalid executed message. Ignoring.");return}Un.getState().setNodeExecuted(u.nodeId,!0,u.time||0,u.memory||0),t().updateNodeProgress(u.nodeId,-2),t().updateNodePreview(u.nodeId,null)}else if(u.type==="updateValues"){if(!u.nodeId||!u.key||!u.value){console.error("Invalid updateValues message. Ignoring.");return}Un.getState().setParamValue(u.nodeId,u.key,u.value)}else u.type==="error"&&(console.error("Error:",u.error),e({nodeProgress:{}}))};s.addEventListener("open",a),s.addEventListener("close",l),s.addEventListener("message",c)},disconnect:async()=>{const{reconnectTimer:n}=t();n&&clearTimeout(n),e(o=>(o.socket&&o.socket.close(),{socket:null,isConnected:!1,reconnectTimer:void 0}))},destroy:async()=>{t().disconnect(),e({address:null,sid:null})}})),Ok=b.createContext(null);function Lk({children:e}){const t=pa();return h.jsx(Ok.Provider,{value:t,children:e})}const ng=Sc(e=>({nodeRegistry:{},updateNodeRegistry:async()=>{try{const n=await(await fetch("http://"+Qn.serverAddress+"/nodes")).json();e({nodeRegistry:n})}catch(t){console.error("Can't connect to route `/nodes`",t)}}})),_k=Ce("MuiBox",["root"]),jk=ua(),ke=YS({themeId:bn,defaultTheme:jk,defaultClassName:_k.root,generateClassName:Th.generate}),ve=EC;function Bk(e){return Pe("MuiSvgIcon",e)}Ce("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);const zk=e=>{const{color:t,fontSize:n,classes:o}=e,r={root:["root",t!=="inherit"&&`color${q(t)}`,`fontSize${q(n)}`]};return Ie(r,Bk,o)},Dk=Y("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.color!=="inherit"&&t[`color${q(n.color)}`],t[`fontSize${q(n.fontSize)}`]]}})(ve(({theme:e})=>({userSelect:"none",width:"1em",height:"1em",display:"inline-block",flexShrink:0,transition:e.transitions?.create?.("fill",{duration:(e.vars??e).transitions?.duration?.shorter}),variants:[{props:t=>!t.hasSvgAsChild,style:{fill:"currentColor"}},{props:{fontSize:"inherit"},style:{fontSize:"inherit"}},{props:{fontSize:"small"},style:{fontSize:e.typography?.pxToRem?.(20)||"1.25rem"}},{props:{fontSize:"medium"},style:{fontSize:e.typography?.pxToRem?.(24)||"1.5rem"}},{props:{fontSize:"large"},style:{fontSize:e.typography?.pxToRem?.(35)||"2.1875rem"}},...Object.entries((e.vars??e).palette).filter(([,t])=>t&&t.main).map(([t])=>({props:{color:t},style:{color:(e.vars??e).palette?.[t]?.main}})),{props:{color:"action"},style:{color:(e.vars??e).palette?.action?.active}},{props:{color:"disabled"},style:{color:(e.vars??e).palette?.action?.disabled}},{props:{color:"inherit"},style:{color:void 0}}]}))),cs=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiSvgIcon"}),{children:r,className:i,color:s="inherit",component:a="svg",fontSize:l="medium",htmlColor:c,inheritViewBox:d=!1,titleAccess:u,viewBox:p="0 0 24 24",...f}=o,m=b.isValidElement(r)&&r.type==="svg",g={...o,color:s,component:a,fontSize:l,instanceFontSize:t.fontSize,inheritViewBox:d,viewBox:p,hasSvgAsChild:m},S={};d||(S.viewBox=p);const w=zk(g);return h.jsxs(Dk,{as:a,className:re(w.root,i),focusable:"false",color:c,"aria-hidden":u?void 0:!0,role:u?"img":void 0,ref:n,...S,...f,...m&&r.props,ownerState:g,children:[m?r.props.children:r,u?h.jsx("title",{children:u}):null]})});cs.muiName="SvgIcon";function st(e,t){function n(o,r){return h.jsx(cs,{"data-testid":`${t}Icon`,ref:r,...o,children:e})}return n.muiName=cs.muiName,b.memo(b.forwardRef(n))}const Fk=st(h.jsx("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");class us{static create(){return new us}static use(){const t=jh(us.create).current,[n,o]=b.useState(!1);return t.shouldMount=n,t.setShouldMount=o,b.useEffect(t.mountEffect,[n]),t}constructor(){this.ref={current:null},this.mounted=null,this.didMount=!1,this.shouldMount=!1,this.setShouldMount=null}mount(){return this.mounted||(this.mounted=Wk(),this.shouldMount=!0,this.setShouldMount(this.shouldMount)),this.mounted}mountEffect=()=>{this.shouldMount&&!this.didMount&&this.ref.current!==null&&(this.didMount=!0,this.mounted.resolve())};start(...t){this.mount().then(()=>this.ref.current?.start(...t))}stop(...t){this.mount().then(()=>this.ref.current?.stop(...t))}pulsate(...t){this.mount().then(()=>this.ref.current?.pulsate(...t))}}function Hk(){return us.use()}function Wk(){let e,t;const n=new Promise((o,r)=>{e=o,t=r});return n.resolve=e,n.reject=t,n}function og(e,t){if(e==null)return{};var n={};for(var o in e)if({}.hasOwnProperty.call(e,o)){if(t.includes(o))continue;n[o]=e[o]}return n}function bl(e,t){return bl=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(n,o){return n.__proto__=o,n},bl(e,t)}function rg(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,bl(e,t)}const kd={disabled:!1},ds=Zt.createContext(null);var Vk=function(t){return t.scrollTop},Sr="unmounted",co="exited",uo="entering",Oo="entered",vl="exiting",pn=function(e){rg(t,e);function t(o,r){var i;i=e.call(this,o,r)||this;var s=r,a=s&&!s.isMounting?o.enter:o.appear,l;return i.appearStatus=null,o.in?a?(l=co,i.appearStatus=uo):l=Oo:o.unmountOnExit||o.mountOnEnter?l=Sr:l=co,i.state={status:l},i.nextCallback=null,i}t.getDerivedStateFromProps=function(r,i){var s=r.in;return s&&i.status===Sr?{status:co}:null};var n=t.prototype;return n.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},n.componentDidUpdate=function(r){var i=null;if(r!==this.props){var s=this.state.status;this.props.in?s!==uo&&s!==Oo&&(i=uo):(s===uo||s===Oo)&&(i=vl)}this.updateStatus(!1,i)},n.componentWillUnmount=function(){this.cancelNextCallback()},n.getTimeouts=function(){var r=this.props.timeout,i,s,a;return i=s=a=r,r!=null&&typeof r!="number"&&(i=r.exit,s=r.enter,a=r.appear!==void 0?r.appear:s),{exit:i,enter:s,appear:a}},n.updateStatus=function(r,i){if(r===void 0&&(r=!1),i!==null)if(this.cancelNextCallback(),i===uo){if(this.props.unmountOnExit||this.props.mountOnEnter){var s=this.props.nodeRef?this.props.nodeRef.current:gi.findDOMNode(this);s&&Vk(s)}this.performEnter(r)}else this.performExit();else this.props.unmountOnExit&&this.state.status===co&&this.setState({status:Sr})},n.performEnter=function(r){var i=this,s=this.props.enter,a=this.context?this.context.isMounting:r,l=this.props.nodeRef?[a]:[gi.findDOMNode(this),a],c=l[0],d=l[1],u=this.getTimeouts(),p=a?u.appear:u.enter;if(!r&&!s||kd.disabled){this.safeSetState({status:Oo},function(){i.props.onEntered(c)});return}this.props.onEnter(c,d),this.safeSetState({status:uo},function(){i.props.onEntering(c,d),i.onTransitionEnd(p,function(){i.safeSetState({status:Oo},function(){i.props.onEntered(c,d)})})})},n.performExit=function(){var r=this,i=this.props.exit,s=this.getTimeouts(),a=this.props.nodeRef?void 0:gi.findDOMNode(this);if(!i||kd.disabled){this.safeSetState({status:co},function(){r.props.onExited(a)});return}this.props.onExit(a),this.safeSetState({status:vl},function(){r.props.onExiting(a),r.onTransitionEnd(s.exit,function(){r.safeSetState({status:co},function(){r.props.onExited(a)})})})},n.cancelNextCallback=function(){this.nextCallback!==null&&(this.nextCallback.cancel(),this.nextCallback=null)},n.safeSetState=function(r,i){i=this.setNextCallback(i),this.setState(r,i)},n.setNextCallback=function(r){var i=this,s=!0;return this.nextCallback=function(a){s&&(s=!1,i.nextCallback=null,r(a))},this.nextCallback.cancel=function(){s=!1},this.nextCallback},n.onTransitionEnd=function(r,i){this.setNextCallback(i);var s=this.props.nodeRef?this.props.nodeRef.current:gi.findDOMNode(this),a=r==null&&!this.props.addEndListener;if(!s||a){setTimeout(this.nextCallback,0);return}if(this.props.addEndListener){var l=this.props.nodeRef?[this.nextCallback]:[s,this.nextCallback],c=l[0],d=l[1];this.props.addEndListener(c,d)}r!=null&&setTimeout(this.nextCallback,r)},n.render=function(){var r=this.state.status;if(r===Sr)return null;var i=this.props,s=i.children;i.in,i.mountOnEnter,i.unmountOnExit,i.appear,i.enter,i.exit,i.timeout,i.addEndListener,i.onEnter,i.onEntering,i.onEntered,i.onExit,i.onExiting,i.onExited,i.nodeRef;var a=og(i,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]);return Zt.createElement(ds.Provider,{value:null},typeof s=="function"?s(r,a):Zt.cloneElement(Zt.Children.only(s),a))},t}(Zt.Component);pn.contextType=ds;pn.propTypes={};function To(){}pn.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:To,onEntering:To,onEntered:To,onExit:To,onExiting:To,onExited:To};pn.UNMOUNTED=Sr;pn.EXITED=co;pn.ENTERING=uo;pn.ENTERED=Oo;pn.EXITING=vl;function Uk(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function kc(e,t){var n=function(i){return t&&b.isValidElement(i)?t(i):i},o=Object.create(null);return e&&b.Children.map(e,function(r){return r}).forEach(function(r){o[r.key]=n(r)}),o}function Gk(e,t){e=e||{},t=t||{};function n(d){return d in t?t[d]:e[d]}var o=Object.create(null),r=[];for(var i in e)i in t?r.length&&(o[i]=r,r=[]):r.push(i);var s,a={};for(var l in t){if(o[l])for(s=0;s<o[l].length;s++){var c=o[l][s];a[o[l][s]]=n(c)}a[l]=n(l)}for(s=0;s<r.length;s++)a[r[s]]=n(r[s]);return a}function fo(e,t,n){return n[t]!=null?n[t]:e.props[t]}function Xk(e,t){return kc(e.children,function(n){return b.cloneElement(n,{onExited:t.bind(null,n),in:!0,appear:fo(n,"appear",e),enter:fo(n,"enter",e),exit:fo(n,"exit",e)})})}function Yk(e,t,n){var o=kc(e.children),r=Gk(t,o);return Object.keys(r).forEach(function(i){var s=r[i];if(b.isValidElement(s)){var a=i in t,l=i in o,c=t[i],d=b.isValidElement(c)&&!c.props.in;l&&(!a||d)?r[i]=b.cloneElement(s,{onExited:n.bind(null,s),in:!0,exit:fo(s,"exit",e),enter:fo(s,"enter",e)}):!l&&a&&!d?r[i]=b.cloneElement(s,{in:!1}):l&&a&&b.isValidElement(c)&&(r[i]=b.cloneElement(s,{onExited:n.bind(null,s),in:c.props.in,exit:fo(s,"exit",e),enter:fo(s,"enter",e)}))}}),r}var qk=Object.values||function(e){return Object.keys(e).map(function(t){return e[t]})},Kk={component:"div",childFactory:function(t){return t}},Ec=function(e){rg(t,e);function t(o,r){var i;i=e.call(this,o,r)||this;var s=i.handleExited.bind(Uk(i));return i.state={contextValue:{isMounting:!0},handleExited:s,firstRender:!0},i}var n=t.prototype;return n.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},n.componentWillUnmount=function(){this.mounted=!1},t.getDerivedStateFromProps=function(r,i){var s=i.children,a=i.handleExited,l=i.firstRender;return{children:l?Xk(r,a):Yk(r,s,a),firstRender:!1}},n.handleExited=function(r,i){var s=kc(this.props.children);r.key in s||(r.props.onExited&&r.props.onExited(i),this.mounted&&this.setState(function(a){var l=mp({},a.children);return delete l[r.key],{children:l}}))},n.render=function(){var r=this.props,i=r.component,s=r.childFactory,a=og(r,["component","childFactory"]),l=this.state.contextValue,c=qk(this.state.children).map(s);return delete a.appear,delete a.enter,delete a.exit,i===null?Zt.createElement(ds.Provider,{value:l},c):Zt.createElement(ds.Provider,{value:l},Zt.createElement(i,a,c))},t}(Zt.Component);Ec.propTypes={};Ec.defaultProps=Kk;function Zk(e){const{className:t,classes:n,pulsate:o=!1,rippleX:r,rippleY:i,rippleSize:s,in:a,onExited:l,timeout:c}=e,[d,u]=b.useState(!1),p=re(t,n.ripple,n.rippleVisible,o&&n.ripplePulsate),f={width:s,height:s,top:-(s/2)+i,left:-(s/2)+r},m=re(n.child,d&&n.childLeaving,o&&n.childPulsate);return!a&&!d&&u(!0),b.useEffect(()=>{if(!a&&l!=null){const g=setTimeout(l,c);return()=>{clearTimeout(g)}}},[l,a,c]),h.jsx("span",{className:p,style:f,children:h.jsx("span",{className:m})})}const qt=Ce("MuiTouchRipple",["root","ripple","rippleVisible","ripplePulsate","child","childLeaving","childPulsate"]),xl=550,Jk=80,Qk=Jn`
   0% {
     transform: scale(0);
     opacity: 0.1;
@@ -213,4 +213,4 @@ To suppress this warning, you need to explicitly provide the \`palette.${t}Chann
         animation: ${Ol} 1.4s linear infinite;
       `:null,ZI=typeof Ll!="string"?or`
         animation: ${Ll} 1.4s ease-in-out infinite;
-      `:null,JI=e=>{const{classes:t,variant:n,color:o,disableShrink:r}=e,i={root:["root",n,`color${q(o)}`],svg:["svg"],circle:["circle",`circle${q(n)}`,r&&"circleDisableShrink"]};return Ie(i,qI,t)},QI=Y("span",{name:"MuiCircularProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`color${q(n.color)}`]]}})(ve(({theme:e})=>({display:"inline-block",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("transform")}},{props:{variant:"indeterminate"},style:KI||{animation:`${Ol} 1.4s linear infinite`}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}}))]}))),eR=Y("svg",{name:"MuiCircularProgress",slot:"Svg",overridesResolver:(e,t)=>t.svg})({display:"block"}),tR=Y("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.circle,t[`circle${q(n.variant)}`],n.disableShrink&&t.circleDisableShrink]}})(ve(({theme:e})=>({stroke:"currentColor",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("stroke-dashoffset")}},{props:{variant:"indeterminate"},style:{strokeDasharray:"80px, 200px",strokeDashoffset:0}},{props:({ownerState:t})=>t.variant==="indeterminate"&&!t.disableShrink,style:ZI||{animation:`${Ll} 1.4s ease-in-out infinite`}}]}))),Fc=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiCircularProgress"}),{className:r,color:i="primary",disableShrink:s=!1,size:a=40,style:l,thickness:c=3.6,value:d=0,variant:u="indeterminate",...p}=o,f={...o,color:i,disableShrink:s,size:a,thickness:c,value:d,variant:u},m=JI(f),g={},S={},w={};if(u==="determinate"){const P=2*Math.PI*((Hn-c)/2);g.strokeDasharray=P.toFixed(3),w["aria-valuenow"]=Math.round(d),g.strokeDashoffset=`${((100-d)/100*P).toFixed(3)}px`,S.transform="rotate(-90deg)"}return h.jsx(QI,{className:re(m.root,r),style:{width:a,height:a,...S,...l},ownerState:f,ref:n,role:"progressbar",...w,...p,children:h.jsx(eR,{className:m.svg,ownerState:f,viewBox:`${Hn/2} ${Hn/2} ${Hn} ${Hn}`,children:h.jsx(tR,{className:m.circle,style:g,ownerState:f,cx:Hn,cy:Hn,r:(Hn-c)/2,fill:"none",strokeWidth:c})})})});function nR(e){return Pe("MuiIconButton",e)}const ep=Ce("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge","loading","loadingIndicator","loadingWrapper"]),oR=e=>{const{classes:t,disabled:n,color:o,edge:r,size:i,loading:s}=e,a={root:["root",s&&"loading",n&&"disabled",o!=="default"&&`color${q(o)}`,r&&`edge${q(r)}`,`size${q(i)}`],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]};return Ie(a,nR,t)},rR=Y(Nn,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.loading&&t.loading,n.color!=="default"&&t[`color${q(n.color)}`],n.edge&&t[`edge${q(n.edge)}`],t[`size${q(n.size)}`]]}})(ve(({theme:e})=>({textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:8,borderRadius:"50%",color:(e.vars||e).palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),variants:[{props:t=>!t.disableRipple,style:{"--IconButton-hoverBg":e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.action.active,e.palette.action.hoverOpacity),"&:hover":{backgroundColor:"var(--IconButton-hoverBg)","@media (hover: none)":{backgroundColor:"transparent"}}}},{props:{edge:"start"},style:{marginLeft:-12}},{props:{edge:"start",size:"small"},style:{marginLeft:-3}},{props:{edge:"end"},style:{marginRight:-12}},{props:{edge:"end",size:"small"},style:{marginRight:-3}}]})),ve(({theme:e})=>({variants:[{props:{color:"inherit"},style:{color:"inherit"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}})),...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{"--IconButton-hoverBg":e.vars?`rgba(${(e.vars||e).palette[t].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He((e.vars||e).palette[t].main,e.palette.action.hoverOpacity)}})),{props:{size:"small"},style:{padding:5,fontSize:e.typography.pxToRem(18)}},{props:{size:"large"},style:{padding:12,fontSize:e.typography.pxToRem(28)}}],[`&.${ep.disabled}`]:{backgroundColor:"transparent",color:(e.vars||e).palette.action.disabled},[`&.${ep.loading}`]:{color:"transparent"}}))),iR=Y("span",{name:"MuiIconButton",slot:"LoadingIndicator",overridesResolver:(e,t)=>t.loadingIndicator})(({theme:e})=>({display:"none",position:"absolute",visibility:"visible",top:"50%",left:"50%",transform:"translate(-50%, -50%)",color:(e.vars||e).palette.action.disabled,variants:[{props:{loading:!0},style:{display:"flex"}}]})),Mn=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiIconButton"}),{edge:r=!1,children:i,className:s,color:a="default",disabled:l=!1,disableFocusRipple:c=!1,size:d="medium",id:u,loading:p=null,loadingIndicator:f,...m}=o,g=rr(u),S=f??h.jsx(Fc,{"aria-labelledby":g,color:"inherit",size:16}),w={...o,edge:r,color:a,disabled:l,disableFocusRipple:c,loading:p,loadingIndicator:S,size:d},P=oR(w);return h.jsxs(rR,{id:g,className:re(P.root,s),centerRipple:!0,focusRipple:!c,disabled:l||p,ref:n,...m,ownerState:w,children:[typeof p=="boolean"&&h.jsx("span",{className:P.loadingWrapper,style:{display:"contents"},children:h.jsx(iR,{className:P.loadingIndicator,ownerState:w,children:p&&S})}),i]})}),sR=st(h.jsx("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");function aR(e){return Pe("MuiAutocomplete",e)}const _e=Ce("MuiAutocomplete",["root","expanded","fullWidth","focused","focusVisible","tag","tagSizeSmall","tagSizeMedium","hasPopupIcon","hasClearIcon","inputRoot","input","inputFocused","endAdornment","clearIndicator","popupIndicator","popupIndicatorOpen","popper","popperDisablePortal","paper","listbox","loading","noOptions","option","groupLabel","groupUl"]);var tp,np;const lR=e=>{const{classes:t,disablePortal:n,expanded:o,focused:r,fullWidth:i,hasClearIcon:s,hasPopupIcon:a,inputFocused:l,popupOpen:c,size:d}=e,u={root:["root",o&&"expanded",r&&"focused",i&&"fullWidth",s&&"hasClearIcon",a&&"hasPopupIcon"],inputRoot:["inputRoot"],input:["input",l&&"inputFocused"],tag:["tag",`tagSize${q(d)}`],endAdornment:["endAdornment"],clearIndicator:["clearIndicator"],popupIndicator:["popupIndicator",c&&"popupIndicatorOpen"],popper:["popper",n&&"popperDisablePortal"],paper:["paper"],listbox:["listbox"],loading:["loading"],noOptions:["noOptions"],option:["option"],groupLabel:["groupLabel"],groupUl:["groupUl"]};return Ie(u,aR,t)},cR=Y("div",{name:"MuiAutocomplete",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{fullWidth:o,hasClearIcon:r,hasPopupIcon:i,inputFocused:s,size:a}=n;return[{[`& .${_e.tag}`]:t.tag},{[`& .${_e.tag}`]:t[`tagSize${q(a)}`]},{[`& .${_e.inputRoot}`]:t.inputRoot},{[`& .${_e.input}`]:t.input},{[`& .${_e.input}`]:s&&t.inputFocused},t.root,o&&t.fullWidth,i&&t.hasPopupIcon,r&&t.hasClearIcon]}})({[`&.${_e.focused} .${_e.clearIndicator}`]:{visibility:"visible"},"@media (pointer: fine)":{[`&:hover .${_e.clearIndicator}`]:{visibility:"visible"}},[`& .${_e.tag}`]:{margin:3,maxWidth:"calc(100% - 6px)"},[`& .${_e.inputRoot}`]:{[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:30},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:56},[`& .${_e.input}`]:{width:0,minWidth:30}},[`& .${Gn.root}`]:{paddingBottom:1,"& .MuiInput-input":{padding:"4px 4px 4px 0px"}},[`& .${Gn.root}.${Lt.sizeSmall}`]:{[`& .${Gn.input}`]:{padding:"2px 4px 3px 0"}},[`& .${Yt.root}`]:{padding:9,[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:39},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:65},[`& .${_e.input}`]:{padding:"7.5px 4px 7.5px 5px"},[`& .${_e.endAdornment}`]:{right:9}},[`& .${Yt.root}.${Lt.sizeSmall}`]:{paddingTop:6,paddingBottom:6,paddingLeft:6,[`& .${_e.input}`]:{padding:"2.5px 4px 2.5px 8px"}},[`& .${_t.root}`]:{paddingTop:19,paddingLeft:8,[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:39},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:65},[`& .${_t.input}`]:{padding:"7px 4px"},[`& .${_e.endAdornment}`]:{right:9}},[`& .${_t.root}.${Lt.sizeSmall}`]:{paddingBottom:1,[`& .${_t.input}`]:{padding:"2.5px 4px"}},[`& .${Lt.hiddenLabel}`]:{paddingTop:8},[`& .${_t.root}.${Lt.hiddenLabel}`]:{paddingTop:0,paddingBottom:0,[`& .${_e.input}`]:{paddingTop:16,paddingBottom:17}},[`& .${_t.root}.${Lt.hiddenLabel}.${Lt.sizeSmall}`]:{[`& .${_e.input}`]:{paddingTop:8,paddingBottom:9}},[`& .${_e.input}`]:{flexGrow:1,textOverflow:"ellipsis",opacity:0},variants:[{props:{fullWidth:!0},style:{width:"100%"}},{props:{size:"small"},style:{[`& .${_e.tag}`]:{margin:2,maxWidth:"calc(100% - 4px)"}}},{props:{inputFocused:!0},style:{[`& .${_e.input}`]:{opacity:1}}},{props:{multiple:!0},style:{[`& .${_e.inputRoot}`]:{flexWrap:"wrap"}}}]}),uR=Y("div",{name:"MuiAutocomplete",slot:"EndAdornment",overridesResolver:(e,t)=>t.endAdornment})({position:"absolute",right:0,top:"50%",transform:"translate(0, -50%)"}),dR=Y(Mn,{name:"MuiAutocomplete",slot:"ClearIndicator",overridesResolver:(e,t)=>t.clearIndicator})({marginRight:-2,padding:4,visibility:"hidden"}),pR=Y(Mn,{name:"MuiAutocomplete",slot:"PopupIndicator",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.popupIndicator,n.popupOpen&&t.popupIndicatorOpen]}})({padding:2,marginRight:-2,variants:[{props:{popupOpen:!0},style:{transform:"rotate(180deg)"}}]}),fR=Y(Og,{name:"MuiAutocomplete",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${_e.option}`]:t.option},t.popper,n.disablePortal&&t.popperDisablePortal]}})(ve(({theme:e})=>({zIndex:(e.vars||e).zIndex.modal,variants:[{props:{disablePortal:!0},style:{position:"absolute"}}]}))),hR=Y(sr,{name:"MuiAutocomplete",slot:"Paper",overridesResolver:(e,t)=>t.paper})(ve(({theme:e})=>({...e.typography.body1,overflow:"auto"}))),gR=Y("div",{name:"MuiAutocomplete",slot:"Loading",overridesResolver:(e,t)=>t.loading})(ve(({theme:e})=>({color:(e.vars||e).palette.text.secondary,padding:"14px 16px"}))),mR=Y("div",{name:"MuiAutocomplete",slot:"NoOptions",overridesResolver:(e,t)=>t.noOptions})(ve(({theme:e})=>({color:(e.vars||e).palette.text.secondary,padding:"14px 16px"}))),yR=Y("ul",{name:"MuiAutocomplete",slot:"Listbox",overridesResolver:(e,t)=>t.listbox})(ve(({theme:e})=>({listStyle:"none",margin:0,padding:"8px 0",maxHeight:"40vh",overflow:"auto",position:"relative",[`& .${_e.option}`]:{minHeight:48,display:"flex",overflow:"hidden",justifyContent:"flex-start",alignItems:"center",cursor:"pointer",paddingTop:6,boxSizing:"border-box",outline:"0",WebkitTapHighlightColor:"transparent",paddingBottom:6,paddingLeft:16,paddingRight:16,[e.breakpoints.up("sm")]:{minHeight:"auto"},[`&.${_e.focused}`]:{backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},'&[aria-disabled="true"]':{opacity:(e.vars||e).palette.action.disabledOpacity,pointerEvents:"none"},[`&.${_e.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},'&[aria-selected="true"]':{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity),[`&.${_e.focused}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:(e.vars||e).palette.action.selected}},[`&.${_e.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}}}}))),bR=Y(Nl,{name:"MuiAutocomplete",slot:"GroupLabel",overridesResolver:(e,t)=>t.groupLabel})(ve(({theme:e})=>({backgroundColor:(e.vars||e).palette.background.paper,top:-8}))),vR=Y("ul",{name:"MuiAutocomplete",slot:"GroupUl",overridesResolver:(e,t)=>t.groupUl})({padding:0,[`& .${_e.option}`]:{paddingLeft:24}}),Lg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiAutocomplete"}),{autoComplete:r=!1,autoHighlight:i=!1,autoSelect:s=!1,blurOnSelect:a=!1,ChipProps:l,className:c,clearIcon:d=tp||(tp=h.jsx(sR,{fontSize:"small"})),clearOnBlur:u=!o.freeSolo,clearOnEscape:p=!1,clearText:f="Clear",closeText:m="Close",componentsProps:g,defaultValue:S=o.multiple?[]:null,disableClearable:w=!1,disableCloseOnSelect:P=!1,disabled:x=!1,disabledItemsFocusable:y=!1,disableListWrap:E=!1,disablePortal:$=!1,filterOptions:I,filterSelectedOptions:M=!1,forcePopupIcon:T="auto",freeSolo:v=!1,fullWidth:A=!1,getLimitTagsText:L=We=>`+${We}`,getOptionDisabled:_,getOptionKey:C,getOptionLabel:R,isOptionEqualToValue:k,groupBy:N,handleHomeEndKeys:j=!o.freeSolo,id:O,includeInputInList:B=!1,inputValue:z,limitTags:G=-1,ListboxComponent:Z,ListboxProps:K,loading:V=!1,loadingText:F="Loading…",multiple:te=!1,noOptionsText:D="No options",onChange:ne,onClose:oe,onHighlightChange:ie,onInputChange:X,onOpen:se,open:ae,openOnFocus:ge=!1,openText:le="Open",options:ye,PaperComponent:he,PopperComponent:je,popupIcon:Ee=np||(np=h.jsx(Sg,{})),readOnly:Ae=!1,renderGroup:ce,renderInput:Re,renderOption:$e,renderTags:J,selectOnFocus:ee=!o.freeSolo,size:fe="medium",slots:be={},slotProps:de={},value:xe,...Se}=o,{getRootProps:Ye,getInputProps:Fe,getInputLabelProps:ue,getPopupIndicatorProps:Q,getClearProps:pe,getTagProps:Me,getListboxProps:Oe,getOptionProps:ze,value:et,dirty:ft,expanded:De,id:qe,popupOpen:xt,focused:Vt,focusedTag:Ct,anchorEl:Bn,setAnchorEl:ar,inputValue:ko,groupedOptions:zn}=TP({...o,componentName:"Autocomplete"}),no=!w&&!x&&ft&&!Ae,oo=(!v||T===!0)&&T!==!1,{onMouseDown:lr}=Fe(),{ref:cr,...Eo}=Oe(),ro=R||(We=>We.label??We),mt={...o,disablePortal:$,expanded:De,focused:Vt,fullWidth:A,getOptionLabel:ro,hasClearIcon:no,hasPopupIcon:oo,inputFocused:Ct===-1,popupOpen:xt,size:fe},lt=lR(mt),Ut={slots:{paper:he,popper:je,...be},slotProps:{chip:l,listbox:K,...g,...de}},[U,W]=ot("listbox",{elementType:yR,externalForwardedProps:Ut,ownerState:mt,className:lt.listbox,additionalProps:Eo,ref:cr}),[me,Ne]=ot("paper",{elementType:sr,externalForwardedProps:Ut,ownerState:mt,className:lt.paper}),[Le,tt]=ot("popper",{elementType:Og,externalForwardedProps:Ut,ownerState:mt,className:lt.popper,additionalProps:{disablePortal:$,style:{width:Bn?Bn.clientWidth:null},role:"presentation",anchorEl:Bn,open:xt}});let Ue;if(te&&et.length>0){const We=Gt=>({className:lt.tag,disabled:x,...Me(Gt)});J?Ue=J(et,We,mt):Ue=et.map((Gt,rn)=>{const{key:so,...wa}=We({index:rn});return h.jsx(wl,{label:ro(Gt),size:fe,...wa,...Ut.slotProps.chip},so)})}if(G>-1&&Array.isArray(Ue)){const We=Ue.length-G;!Vt&&We>0&&(Ue=Ue.splice(0,G),Ue.push(h.jsx("span",{className:lt.tag,children:L(We)},Ue.length)))}const io=ce||(We=>h.jsxs("li",{children:[h.jsx(bR,{className:lt.groupLabel,ownerState:mt,component:"div",children:We.group}),h.jsx(vR,{className:lt.groupUl,ownerState:mt,children:We.children})]},We.key)),xa=$e||((We,Gt)=>{const{key:rn,...so}=We;return h.jsx("li",{...so,children:ro(Gt)},rn)}),pi=(We,Gt)=>{const rn=ze({option:We,index:Gt});return xa({...rn,className:lt.option},We,{selected:rn["aria-selected"],index:Gt,inputValue:ko},mt)},fi=Ut.slotProps.clearIndicator,hi=Ut.slotProps.popupIndicator;return h.jsxs(b.Fragment,{children:[h.jsx(cR,{ref:n,className:re(lt.root,c),ownerState:mt,...Ye(Se),children:Re({id:qe,disabled:x,fullWidth:!0,size:fe==="small"?"small":void 0,InputLabelProps:ue(),InputProps:{ref:ar,className:lt.inputRoot,startAdornment:Ue,onMouseDown:We=>{We.target===We.currentTarget&&lr(We)},...(no||oo)&&{endAdornment:h.jsxs(uR,{className:lt.endAdornment,ownerState:mt,children:[no?h.jsx(dR,{...pe(),"aria-label":f,title:f,ownerState:mt,...fi,className:re(lt.clearIndicator,fi?.className),children:d}):null,oo?h.jsx(pR,{...Q(),disabled:x,"aria-label":xt?m:le,title:xt?m:le,ownerState:mt,...hi,className:re(lt.popupIndicator,hi?.className),children:Ee}):null]})}},inputProps:{className:lt.input,disabled:x,readOnly:Ae,...Fe()}})}),Bn?h.jsx(fR,{as:Le,...tt,children:h.jsxs(hR,{as:me,...Ne,children:[V&&zn.length===0?h.jsx(gR,{className:lt.loading,ownerState:mt,children:F}):null,zn.length===0&&!v&&!V?h.jsx(mR,{className:lt.noOptions,ownerState:mt,role:"presentation",onMouseDown:We=>{We.preventDefault()},children:D}):null,zn.length>0?h.jsx(U,{as:Z,...W,children:zn.map((We,Gt)=>N?io({key:We.key,group:We.group,children:We.options.map((rn,so)=>pi(rn,We.index+so))}):pi(We,Gt))}):null]})}):null]})}),xR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,no_validation:s,options:a,updateStore:l})=>h.jsx(ke,{"data-key":e,sx:{minWidth:"320px",...n},className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Lg,{disablePortal:!0,freeSolo:s,options:a,renderInput:c=>h.jsx(li,{...c,label:i}),onChange:(c,d)=>l?.(e,d),value:t,size:"small",sx:{"& + .MuiAutocomplete-popper .MuiAutocomplete-option":{fontSize:"12px"}}})}),wR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,options:s,updateStore:a,onChangeAction:l})=>{const c=(u,p)=>{Object.entries(p).forEach(([f,m])=>{const g=f!==u;m&&(Array.isArray(m)||(m=[m]),m.forEach(S=>{S.endsWith("_group")?a?.(S,{hidden:g},"group"):a?.(S,g,"hidden")}))})},d=Array.isArray(s)?s.map((u,p)=>h.jsx("option",{value:u,children:u},`${e}-${p}`)):Object.entries(s).map(([u,p])=>h.jsx("option",{value:u,children:typeof p=="object"?p.label:p},`${e}-${u}`));return b.useEffect(()=>{l?.action==="show"&&c(t,l?.target)},[t]),h.jsx(ke,{"data-key":e,className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsxs(pg,{fullWidth:!0,children:[h.jsx(dg,{children:i}),h.jsx(Nc,{fullWidth:!0,size:"small",label:i,value:t||"",native:!0,onChange:u=>a?.(e,u.target.value),children:d})]})})},SR=st(h.jsx("path",{d:"M7.5 5.6 10 7 8.6 4.5 10 2 7.5 3.4 5 2l1.4 2.5L5 7zm12 9.8L17 14l1.4 2.5L17 19l2.5-1.4L22 19l-1.4-2.5L22 14zM22 2l-2.5 1.4L17 2l1.4 2.5L17 7l2.5-1.4L22 7l-1.4-2.5zm-7.63 5.29a.996.996 0 0 0-1.41 0L1.29 18.96c-.39.39-.39 1.02 0 1.41l2.34 2.34c.39.39 1.02.39 1.41 0L16.7 11.05c.39-.39.39-1.02 0-1.41zm-1.03 5.49-2.12-2.12 2.44-2.44 2.12 2.12z"}),"AutoFixHigh"),CR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,icon:s,onChangeAction:a,updateStore:l})=>{const c=St(),d={random:h.jsx(SR,{})},u={icon:d[s],checkedIcon:d[s]},p=(f,m)=>{const g=Array.isArray(m.true)?m.true:[m.true],S=Array.isArray(m.false)?m.false:[m.false];g.forEach(w=>{l?.(w,f,"disabled")}),S.forEach(w=>{l?.(w,!f,"disabled")})};return b.useEffect(()=>{a&&a.action==="disable"&&p(t,a.target)},[t]),h.jsx(ke,{"data-key":e,className:`flex-auto nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsx(kg,{size:"small",...u,checked:t,title:i,onChange:f=>l?.(e,f.target.checked),disableRipple:!0,sx:{p:1.1,m:0,border:1,borderRadius:1,borderColor:"rgba(255,255,255,0.25)","&.Mui-checked":{backgroundColor:c.palette.secondary.main,color:c.palette.background.paper,borderColor:c.palette.secondary.main}}})})},kR=st(h.jsx("path",{d:"M15.41 7.41 14 6l-6 6 6 6 1.41-1.41L10.83 12z"}),"ChevronLeft"),ER=st(h.jsx("path",{d:"M10 6 8.59 7.41 13.17 12l-4.58 4.59L10 18l6-6z"}),"ChevronRight"),$R=e=>{if(!e)return 1;const t=e.toString();if(t.includes("e-")){const[o,r]=t.split("e-");return(o.includes(".")?o.split(".")[1].length:0)+Number(r)}const n=t.split(".")[1];return n?n.length:0},PR=({fieldKey:e,fieldType:t,dataType:n,value:o,style:r,disabled:i,hidden:s,label:a,min:l,max:c,step:d,updateStore:u})=>{const p=St(),f=b.useRef(),m=b.useRef({x:0,value:0}),g=b.useRef(!1),[S,w]=b.useState(!1),P=t==="slider"&&l!==void 0&&c!==void 0,x=l!==void 0?l:-Number.MAX_SAFE_INTEGER,y=c!==void 0?c:Number.MAX_SAFE_INTEGER,E=n==="float"?$R(d):0,$=d!==void 0?d:n==="float"?.1:1,I=k=>{if(S)return k;const N=isNaN(Number(k))?0:Number(k);return Math.min(y,Math.max(x,N)).toFixed(E)},M=I(o||0),T=()=>{if(!P)return{};const k=isNaN(Number(M))?0:(Number(M)-x)/(y-x)*100;return{background:`linear-gradient(to right, rgba(255,255,255,0.15) ${k}%, rgba(255,255,255,0.0) ${k}%)`}},v=k=>{k.preventDefault(),k.stopPropagation();const N=k.clientX-m.current.x;if(Math.abs(N)<2)return;g.current||(g.current=!0);const j=f.current;document.activeElement===j&&(j?.blur(),w(!1));const B=(y-x)/$||100,z=P?B/250*N:N,G=m.current.value+z*$;u?.(e,I(G))},A=k=>{document.removeEventListener("mousemove",v),document.removeEventListener("mouseup",A);const N=k.target.closest(".numberField"),j=k.target.closest("button");if(N&&P&&!g.current&&!j){const O=N.getBoundingClientRect(),B=k.clientX-O.left,z=Math.max(0,Math.min(1,B/O.width)),G=I(x+(y-x)*z);u?.(e,G)}g.current=!1},L=k=>{k.preventDefault(),k.stopPropagation(),k.button===0&&(S||(document.activeElement?.blur(),m.current={x:k.clientX,value:Number(M)},document.addEventListener("mousemove",v),document.addEventListener("mouseup",A)))},_=()=>{const k=f.current;if(w(!1),!k)return;Number(k.value)!==Number(M)&&u?.(e,I(k.value));const N=k.value;u?.(e,I(" "+N)),u?.(e,I(N)),k.removeEventListener("keydown",C)},C=k=>{const N=f.current;if(N){if(k.key==="Enter"||k.key==="Escape")N.removeEventListener("keydown",C),w(!1),u?.(e,I(N.value||"")),N.blur();else if(k.key==="ArrowUp"){k.preventDefault();const j=Math.min(y,Math.max(x,Number(N.value)+$)).toFixed(E);N.value=String(j),u?.(e,j)}else if(k.key==="ArrowDown"){k.preventDefault();const j=Math.min(y,Math.max(x,Number(N.value)-$)).toFixed(E);N.value=String(j),u?.(e,j)}}},R=k=>{if(k.target.closest("button"))return;const N=f.current;N&&(N.focus(),N.select(),w(!0),N.addEventListener("keydown",C))};return b.useEffect(()=>{const k=f.current;return k===document.activeElement?(k.focus(),w(!0)):(k?.blur(),w(!1)),()=>{document.removeEventListener("mousemove",v),document.removeEventListener("mouseup",A);const N=f.current;N&&N.removeEventListener("keydown",C)}},[S,f]),h.jsx(ke,{className:`${s?"mellon-hidden":""} ${i?"mellon-disabled":""}`,children:h.jsxs(So,{"data-key":e,direction:"row",spacing:.5,className:"numberField nodrag",onMouseDown:L,onDoubleClick:R,sx:{mb:0,p:.6,width:"100%",justifyContent:"space-between",alignItems:"center",borderRadius:1,overflow:"hidden",userSelect:"none",cursor:"default",outline:S?`2px solid ${p.palette.primary.main}`:"1px solid #4f4f4f","&:hover":{outline:S?`2px solid ${p.palette.primary.main}`:`1px solid ${p.palette.common.white}`},...T(),...r},children:[h.jsx(Mn,{size:"small",disableRipple:!0,onClick:()=>{f.current?.blur(),u?.(e,I(Number(f.current?.value)-$))},sx:{p:.5,borderRadius:1,opacity:Number(M)<=x?.4:1,"&:hover":{background:Number(M)<=x?"":"rgba(255,255,255,0.15)"}},children:h.jsx(kR,{fontSize:"small"})}),h.jsx(ke,{sx:{maxWidth:"50%",pointerEvents:"none"},children:h.jsx(Rt,{sx:{fontSize:13,color:p.palette.text.secondary,textOverflow:"ellipsis",overflow:"hidden",whiteSpace:"nowrap"},title:a,children:a})}),h.jsx(ya,{inputRef:f,value:M,size:"small",onChange:k=>u?.(e,I(k.target.value)),onBlur:_,sx:{flexGrow:1,pointerEvents:"none"},slotProps:{input:{sx:{textAlign:"right",p:0,cursor:"default"}}}}),h.jsx(Mn,{size:"small",disableRipple:!0,onClick:()=>{f.current?.blur(),u?.(e,I(Number(f.current?.value)+$))},sx:{p:.5,borderRadius:1,opacity:Number(M)>=y?.4:1,"&:hover":{background:Number(M)>=y?"":"rgba(255,255,255,0.15)"}},children:h.jsx(ER,{fontSize:"small"})})]})})};function IR(e,t,n=(o,r)=>o===r){return e.length===t.length&&e.every((o,r)=>n(o,t[r]))}const RR=2;function Ao(e,t,n,o,r){return n===1?Math.min(e+t,r):Math.max(e-t,o)}function _g(e,t){return e-t}function op(e,t){const{index:n}=e.reduce((o,r,i)=>{const s=Math.abs(t-r);return o===null||s<o.distance||s===o.distance?{distance:s,index:i}:o},null)??{};return n}function Ni(e,t){if(t.current!==void 0&&e.changedTouches){const n=e;for(let o=0;o<n.changedTouches.length;o+=1){const r=n.changedTouches[o];if(r.identifier===t.current)return{x:r.clientX,y:r.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function hs(e,t,n){return(e-t)*100/(n-t)}function MR(e,t,n){return(n-t)*e+t}function TR(e){if(Math.abs(e)<1){const n=e.toExponential().split("e-"),o=n[0].split(".")[1];return(o?o.length:0)+parseInt(n[1],10)}const t=e.toString().split(".")[1];return t?t.length:0}function AR(e,t,n){const o=Math.round((e-n)/t)*t+n;return Number(o.toFixed(TR(t)))}function rp({values:e,newValue:t,index:n}){const o=e.slice();return o[n]=t,o.sort(_g)}function Oi({sliderRef:e,activeIndex:t,setActive:n}){const o=bt(e.current);(!e.current?.contains(o.activeElement)||Number(o?.activeElement?.getAttribute("data-index"))!==t)&&e.current?.querySelector(`[type="range"][data-index="${t}"]`).focus(),n&&n(t)}function Li(e,t){return typeof e=="number"&&typeof t=="number"?e===t:typeof e=="object"&&typeof t=="object"?IR(e,t):!1}const NR={horizontal:{offset:e=>({left:`${e}%`}),leap:e=>({width:`${e}%`})},"horizontal-reverse":{offset:e=>({right:`${e}%`}),leap:e=>({width:`${e}%`})},vertical:{offset:e=>({bottom:`${e}%`}),leap:e=>({height:`${e}%`})}},OR=e=>e;let _i;function ip(){return _i===void 0&&(typeof CSS<"u"&&typeof CSS.supports=="function"?_i=CSS.supports("touch-action","none"):_i=!0),_i}function LR(e){const{"aria-labelledby":t,defaultValue:n,disabled:o=!1,disableSwap:r=!1,isRtl:i=!1,marks:s=!1,max:a=100,min:l=0,name:c,onChange:d,onChangeCommitted:u,orientation:p="horizontal",rootRef:f,scale:m=OR,step:g=1,shiftStep:S=10,tabIndex:w,value:P}=e,x=b.useRef(void 0),[y,E]=b.useState(-1),[$,I]=b.useState(-1),[M,T]=b.useState(!1),v=b.useRef(0),A=b.useRef(null),[L,_]=Yn({controlled:P,default:n??l,name:"Slider"}),C=d&&((J,ee,fe)=>{const be=J.nativeEvent||J,de=new be.constructor(be.type,be);Object.defineProperty(de,"target",{writable:!0,value:{value:ee,name:c}}),A.current=ee,d(de,ee,fe)}),R=Array.isArray(L);let k=R?L.slice().sort(_g):[L];k=k.map(J=>J==null?l:No(J,l,a));const N=s===!0&&g!==null?[...Array(Math.floor((a-l)/g)+1)].map((J,ee)=>({value:l+g*ee})):s||[],j=N.map(J=>J.value),[O,B]=b.useState(-1),z=b.useRef(null),G=at(f,z),Z=J=>ee=>{const fe=Number(ee.currentTarget.getAttribute("data-index"));ls(ee.target)&&B(fe),I(fe),J?.onFocus?.(ee)},K=J=>ee=>{ls(ee.target)||B(-1),I(-1),J?.onBlur?.(ee)},V=(J,ee)=>{const fe=Number(J.currentTarget.getAttribute("data-index")),be=k[fe],de=j.indexOf(be);let xe=ee;if(N&&g==null){const Se=j[j.length-1];xe>Se?xe=Se:xe<j[0]?xe=j[0]:xe=xe<be?j[de-1]:j[de+1]}if(xe=No(xe,l,a),R){r&&(xe=No(xe,k[fe-1]||-1/0,k[fe+1]||1/0));const Se=xe;xe=rp({values:k,newValue:xe,index:fe});let Ye=fe;r||(Ye=xe.indexOf(Se)),Oi({sliderRef:z,activeIndex:Ye})}_(xe),B(fe),C&&!Li(xe,L)&&C(J,xe,fe),u&&u(J,A.current??xe)},F=J=>ee=>{if(["ArrowUp","ArrowDown","ArrowLeft","ArrowRight","PageUp","PageDown","Home","End"].includes(ee.key)){ee.preventDefault();const fe=Number(ee.currentTarget.getAttribute("data-index")),be=k[fe];let de=null;if(g!=null){const xe=ee.shiftKey?S:g;switch(ee.key){case"ArrowUp":de=Ao(be,xe,1,l,a);break;case"ArrowRight":de=Ao(be,xe,i?-1:1,l,a);break;case"ArrowDown":de=Ao(be,xe,-1,l,a);break;case"ArrowLeft":de=Ao(be,xe,i?1:-1,l,a);break;case"PageUp":de=Ao(be,S,1,l,a);break;case"PageDown":de=Ao(be,S,-1,l,a);break;case"Home":de=l;break;case"End":de=a;break}}else if(N){const xe=j[j.length-1],Se=j.indexOf(be),Ye=[i?"ArrowRight":"ArrowLeft","ArrowDown","PageDown","Home"],Fe=[i?"ArrowLeft":"ArrowRight","ArrowUp","PageUp","End"];Ye.includes(ee.key)?Se===0?de=j[0]:de=j[Se-1]:Fe.includes(ee.key)&&(Se===j.length-1?de=xe:de=j[Se+1])}de!=null&&V(ee,de)}J?.onKeyDown?.(ee)};Ft(()=>{o&&z.current.contains(document.activeElement)&&document.activeElement?.blur()},[o]),o&&y!==-1&&E(-1),o&&O!==-1&&B(-1);const te=J=>ee=>{J.onChange?.(ee),V(ee,ee.target.valueAsNumber)},D=b.useRef(void 0);let ne=p;i&&p==="horizontal"&&(ne+="-reverse");const oe=({finger:J,move:ee=!1})=>{const{current:fe}=z,{width:be,height:de,bottom:xe,left:Se}=fe.getBoundingClientRect();let Ye;ne.startsWith("vertical")?Ye=(xe-J.y)/de:Ye=(J.x-Se)/be,ne.includes("-reverse")&&(Ye=1-Ye);let Fe;if(Fe=MR(Ye,l,a),g)Fe=AR(Fe,g,l);else{const Q=op(j,Fe);Fe=j[Q]}Fe=No(Fe,l,a);let ue=0;if(R){ee?ue=D.current:ue=op(k,Fe),r&&(Fe=No(Fe,k[ue-1]||-1/0,k[ue+1]||1/0));const Q=Fe;Fe=rp({values:k,newValue:Fe,index:ue}),r&&ee||(ue=Fe.indexOf(Q),D.current=ue)}return{newValue:Fe,activeIndex:ue}},ie=Et(J=>{const ee=Ni(J,x);if(!ee)return;if(v.current+=1,J.type==="mousemove"&&J.buttons===0){X(J);return}const{newValue:fe,activeIndex:be}=oe({finger:ee,move:!0});Oi({sliderRef:z,activeIndex:be,setActive:E}),_(fe),!M&&v.current>RR&&T(!0),C&&!Li(fe,L)&&C(J,fe,be)}),X=Et(J=>{const ee=Ni(J,x);if(T(!1),!ee)return;const{newValue:fe}=oe({finger:ee,move:!0});E(-1),J.type==="touchend"&&I(-1),u&&u(J,A.current??fe),x.current=void 0,ae()}),se=Et(J=>{if(o)return;ip()||J.preventDefault();const ee=J.changedTouches[0];ee!=null&&(x.current=ee.identifier);const fe=Ni(J,x);if(fe!==!1){const{newValue:de,activeIndex:xe}=oe({finger:fe});Oi({sliderRef:z,activeIndex:xe,setActive:E}),_(de),C&&!Li(de,L)&&C(J,de,xe)}v.current=0;const be=bt(z.current);be.addEventListener("touchmove",ie,{passive:!0}),be.addEventListener("touchend",X,{passive:!0})}),ae=b.useCallback(()=>{const J=bt(z.current);J.removeEventListener("mousemove",ie),J.removeEventListener("mouseup",X),J.removeEventListener("touchmove",ie),J.removeEventListener("touchend",X)},[X,ie]);b.useEffect(()=>{const{current:J}=z;return J.addEventListener("touchstart",se,{passive:ip()}),()=>{J.removeEventListener("touchstart",se),ae()}},[ae,se]),b.useEffect(()=>{o&&ae()},[o,ae]);const ge=J=>ee=>{if(J.onMouseDown?.(ee),o||ee.defaultPrevented||ee.button!==0)return;ee.preventDefault();const fe=Ni(ee,x);if(fe!==!1){const{newValue:de,activeIndex:xe}=oe({finger:fe});Oi({sliderRef:z,activeIndex:xe,setActive:E}),_(de),C&&!Li(de,L)&&C(ee,de,xe)}v.current=0;const be=bt(z.current);be.addEventListener("mousemove",ie,{passive:!0}),be.addEventListener("mouseup",X)},le=hs(R?k[0]:l,l,a),ye=hs(k[k.length-1],l,a)-le,he=(J={})=>{const ee=Pr(J),fe={onMouseDown:ge(ee||{})},be={...ee,...fe};return{...J,ref:G,...be}},je=J=>ee=>{J.onMouseOver?.(ee);const fe=Number(ee.currentTarget.getAttribute("data-index"));I(fe)},Ee=J=>ee=>{J.onMouseLeave?.(ee),I(-1)},Ae=(J={})=>{const ee=Pr(J),fe={onMouseOver:je(ee||{}),onMouseLeave:Ee(ee||{})};return{...J,...ee,...fe}},ce=J=>({pointerEvents:y!==-1&&y!==J?"none":void 0});let Re;return p==="vertical"&&(Re=i?"vertical-rl":"vertical-lr"),{active:y,axis:ne,axisProps:NR,dragging:M,focusedThumbIndex:O,getHiddenInputProps:(J={})=>{const ee=Pr(J),fe={onChange:te(ee||{}),onFocus:Z(ee||{}),onBlur:K(ee||{}),onKeyDown:F(ee||{})},be={...ee,...fe};return{tabIndex:w,"aria-labelledby":t,"aria-orientation":p,"aria-valuemax":m(a),"aria-valuemin":m(l),name:c,type:"range",min:e.min,max:e.max,step:e.step===null&&e.marks?"any":e.step??void 0,disabled:o,...J,...be,style:{...gC,direction:i?"rtl":"ltr",width:"100%",height:"100%",writingMode:Re}}},getRootProps:he,getThumbProps:Ae,marks:N,open:$,range:R,rootRef:G,trackLeap:ye,trackOffset:le,values:k,getThumbStyle:ce}}const _R=e=>!e||!Rn(e);function jR(e){return Pe("MuiSlider",e)}const Jt=Ce("MuiSlider",["root","active","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","disabled","dragging","focusVisible","mark","markActive","marked","markLabel","markLabelActive","rail","sizeSmall","thumb","thumbColorPrimary","thumbColorSecondary","thumbColorError","thumbColorSuccess","thumbColorInfo","thumbColorWarning","track","trackInverted","trackFalse","thumbSizeSmall","valueLabel","valueLabelOpen","valueLabelCircle","valueLabelLabel","vertical"]),BR=e=>{const{open:t}=e;return{offset:re(t&&Jt.valueLabelOpen),circle:Jt.valueLabelCircle,label:Jt.valueLabelLabel}};function zR(e){const{children:t,className:n,value:o}=e,r=BR(e);return t?b.cloneElement(t,{className:re(t.props.className)},h.jsxs(b.Fragment,{children:[t.props.children,h.jsx("span",{className:re(r.offset,n),"aria-hidden":!0,children:h.jsx("span",{className:r.circle,children:h.jsx("span",{className:r.label,children:o})})})]})):null}function sp(e){return e}const DR=Y("span",{name:"MuiSlider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`color${q(n.color)}`],n.size!=="medium"&&t[`size${q(n.size)}`],n.marked&&t.marked,n.orientation==="vertical"&&t.vertical,n.track==="inverted"&&t.trackInverted,n.track===!1&&t.trackFalse]}})(ve(({theme:e})=>({borderRadius:12,boxSizing:"content-box",display:"inline-block",position:"relative",cursor:"pointer",touchAction:"none",WebkitTapHighlightColor:"transparent","@media print":{colorAdjust:"exact"},[`&.${Jt.disabled}`]:{pointerEvents:"none",cursor:"default",color:(e.vars||e).palette.grey[400]},[`&.${Jt.dragging}`]:{[`& .${Jt.thumb}, & .${Jt.track}`]:{transition:"none"}},variants:[...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}})),{props:{orientation:"horizontal"},style:{height:4,width:"100%",padding:"13px 0","@media (pointer: coarse)":{padding:"20px 0"}}},{props:{orientation:"horizontal",size:"small"},style:{height:2}},{props:{orientation:"horizontal",marked:!0},style:{marginBottom:20}},{props:{orientation:"vertical"},style:{height:"100%",width:4,padding:"0 13px","@media (pointer: coarse)":{padding:"0 20px"}}},{props:{orientation:"vertical",size:"small"},style:{width:2}},{props:{orientation:"vertical",marked:!0},style:{marginRight:44}}]}))),FR=Y("span",{name:"MuiSlider",slot:"Rail",overridesResolver:(e,t)=>t.rail})({display:"block",position:"absolute",borderRadius:"inherit",backgroundColor:"currentColor",opacity:.38,variants:[{props:{orientation:"horizontal"},style:{width:"100%",height:"inherit",top:"50%",transform:"translateY(-50%)"}},{props:{orientation:"vertical"},style:{height:"100%",width:"inherit",left:"50%",transform:"translateX(-50%)"}},{props:{track:"inverted"},style:{opacity:1}}]}),HR=Y("span",{name:"MuiSlider",slot:"Track",overridesResolver:(e,t)=>t.track})(ve(({theme:e})=>({display:"block",position:"absolute",borderRadius:"inherit",border:"1px solid currentColor",backgroundColor:"currentColor",transition:e.transitions.create(["left","width","bottom","height"],{duration:e.transitions.duration.shortest}),variants:[{props:{size:"small"},style:{border:"none"}},{props:{orientation:"horizontal"},style:{height:"inherit",top:"50%",transform:"translateY(-50%)"}},{props:{orientation:"vertical"},style:{width:"inherit",left:"50%",transform:"translateX(-50%)"}},{props:{track:!1},style:{display:"none"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t,track:"inverted"},style:{...e.vars?{backgroundColor:e.vars.palette.Slider[`${t}Track`],borderColor:e.vars.palette.Slider[`${t}Track`]}:{backgroundColor:wo(e.palette[t].main,.62),borderColor:wo(e.palette[t].main,.62),...e.applyStyles("dark",{backgroundColor:xo(e.palette[t].main,.5)}),...e.applyStyles("dark",{borderColor:xo(e.palette[t].main,.5)})}}}))]}))),WR=Y("span",{name:"MuiSlider",slot:"Thumb",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.thumb,t[`thumbColor${q(n.color)}`],n.size!=="medium"&&t[`thumbSize${q(n.size)}`]]}})(ve(({theme:e})=>({position:"absolute",width:20,height:20,boxSizing:"border-box",borderRadius:"50%",outline:0,backgroundColor:"currentColor",display:"flex",alignItems:"center",justifyContent:"center",transition:e.transitions.create(["box-shadow","left","bottom"],{duration:e.transitions.duration.shortest}),"&::before":{position:"absolute",content:'""',borderRadius:"inherit",width:"100%",height:"100%",boxShadow:(e.vars||e).shadows[2]},"&::after":{position:"absolute",content:'""',borderRadius:"50%",width:42,height:42,top:"50%",left:"50%",transform:"translate(-50%, -50%)"},[`&.${Jt.disabled}`]:{"&:hover":{boxShadow:"none"}},variants:[{props:{size:"small"},style:{width:12,height:12,"&::before":{boxShadow:"none"}}},{props:{orientation:"horizontal"},style:{top:"50%",transform:"translate(-50%, -50%)"}},{props:{orientation:"vertical"},style:{left:"50%",transform:"translate(-50%, 50%)"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{[`&:hover, &.${Jt.focusVisible}`]:{...e.vars?{boxShadow:`0px 0px 0px 8px rgba(${e.vars.palette[t].mainChannel} / 0.16)`}:{boxShadow:`0px 0px 0px 8px ${He(e.palette[t].main,.16)}`},"@media (hover: none)":{boxShadow:"none"}},[`&.${Jt.active}`]:{...e.vars?{boxShadow:`0px 0px 0px 14px rgba(${e.vars.palette[t].mainChannel} / 0.16)`}:{boxShadow:`0px 0px 0px 14px ${He(e.palette[t].main,.16)}`}}}}))]}))),VR=Y(zR,{name:"MuiSlider",slot:"ValueLabel",overridesResolver:(e,t)=>t.valueLabel})(ve(({theme:e})=>({zIndex:1,whiteSpace:"nowrap",...e.typography.body2,fontWeight:500,transition:e.transitions.create(["transform"],{duration:e.transitions.duration.shortest}),position:"absolute",backgroundColor:(e.vars||e).palette.grey[600],borderRadius:2,color:(e.vars||e).palette.common.white,display:"flex",alignItems:"center",justifyContent:"center",padding:"0.25rem 0.75rem",variants:[{props:{orientation:"horizontal"},style:{transform:"translateY(-100%) scale(0)",top:"-10px",transformOrigin:"bottom center","&::before":{position:"absolute",content:'""',width:8,height:8,transform:"translate(-50%, 50%) rotate(45deg)",backgroundColor:"inherit",bottom:0,left:"50%"},[`&.${Jt.valueLabelOpen}`]:{transform:"translateY(-100%) scale(1)"}}},{props:{orientation:"vertical"},style:{transform:"translateY(-50%) scale(0)",right:"30px",top:"50%",transformOrigin:"right center","&::before":{position:"absolute",content:'""',width:8,height:8,transform:"translate(-50%, -50%) rotate(45deg)",backgroundColor:"inherit",right:-8,top:"50%"},[`&.${Jt.valueLabelOpen}`]:{transform:"translateY(-50%) scale(1)"}}},{props:{size:"small"},style:{fontSize:e.typography.pxToRem(12),padding:"0.25rem 0.5rem"}},{props:{orientation:"vertical",size:"small"},style:{right:"20px"}}]}))),UR=Y("span",{name:"MuiSlider",slot:"Mark",shouldForwardProp:e=>da(e)&&e!=="markActive",overridesResolver:(e,t)=>{const{markActive:n}=e;return[t.mark,n&&t.markActive]}})(ve(({theme:e})=>({position:"absolute",width:2,height:2,borderRadius:1,backgroundColor:"currentColor",variants:[{props:{orientation:"horizontal"},style:{top:"50%",transform:"translate(-1px, -50%)"}},{props:{orientation:"vertical"},style:{left:"50%",transform:"translate(-50%, 1px)"}},{props:{markActive:!0},style:{backgroundColor:(e.vars||e).palette.background.paper,opacity:.8}}]}))),GR=Y("span",{name:"MuiSlider",slot:"MarkLabel",shouldForwardProp:e=>da(e)&&e!=="markLabelActive",overridesResolver:(e,t)=>t.markLabel})(ve(({theme:e})=>({...e.typography.body2,color:(e.vars||e).palette.text.secondary,position:"absolute",whiteSpace:"nowrap",variants:[{props:{orientation:"horizontal"},style:{top:30,transform:"translateX(-50%)","@media (pointer: coarse)":{top:40}}},{props:{orientation:"vertical"},style:{left:36,transform:"translateY(50%)","@media (pointer: coarse)":{left:44}}},{props:{markLabelActive:!0},style:{color:(e.vars||e).palette.text.primary}}]}))),XR=e=>{const{disabled:t,dragging:n,marked:o,orientation:r,track:i,classes:s,color:a,size:l}=e,c={root:["root",t&&"disabled",n&&"dragging",o&&"marked",r==="vertical"&&"vertical",i==="inverted"&&"trackInverted",i===!1&&"trackFalse",a&&`color${q(a)}`,l&&`size${q(l)}`],rail:["rail"],track:["track"],mark:["mark"],markActive:["markActive"],markLabel:["markLabel"],markLabelActive:["markLabelActive"],valueLabel:["valueLabel"],thumb:["thumb",t&&"disabled",l&&`thumbSize${q(l)}`,a&&`thumbColor${q(a)}`],active:["active"],disabled:["disabled"],focusVisible:["focusVisible"]};return Ie(c,jR,s)},YR=({children:e})=>e,jg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiSlider"}),r=ir(),{"aria-label":i,"aria-valuetext":s,"aria-labelledby":a,component:l="span",components:c={},componentsProps:d={},color:u="primary",classes:p,className:f,disableSwap:m=!1,disabled:g=!1,getAriaLabel:S,getAriaValueText:w,marks:P=!1,max:x=100,min:y=0,name:E,onChange:$,onChangeCommitted:I,orientation:M="horizontal",shiftStep:T=10,size:v="medium",step:A=1,scale:L=sp,slotProps:_,slots:C,tabIndex:R,track:k="normal",value:N,valueLabelDisplay:j="off",valueLabelFormat:O=sp,...B}=o,z={...o,isRtl:r,max:x,min:y,classes:p,disabled:g,disableSwap:m,orientation:M,marks:P,color:u,size:v,step:A,shiftStep:T,scale:L,track:k,valueLabelDisplay:j,valueLabelFormat:O},{axisProps:G,getRootProps:Z,getHiddenInputProps:K,getThumbProps:V,open:F,active:te,axis:D,focusedThumbIndex:ne,range:oe,dragging:ie,marks:X,values:se,trackOffset:ae,trackLeap:ge,getThumbStyle:le}=LR({...z,rootRef:n});z.marked=X.length>0&&X.some(De=>De.label),z.dragging=ie,z.focusedThumbIndex=ne;const ye=XR(z),he=C?.root??c.Root??DR,je=C?.rail??c.Rail??FR,Ee=C?.track??c.Track??HR,Ae=C?.thumb??c.Thumb??WR,ce=C?.valueLabel??c.ValueLabel??VR,Re=C?.mark??c.Mark??UR,$e=C?.markLabel??c.MarkLabel??GR,J=C?.input??c.Input??"input",ee=_?.root??d.root,fe=_?.rail??d.rail,be=_?.track??d.track,de=_?.thumb??d.thumb,xe=_?.valueLabel??d.valueLabel,Se=_?.mark??d.mark,Ye=_?.markLabel??d.markLabel,Fe=_?.input??d.input,ue=Pt({elementType:he,getSlotProps:Z,externalSlotProps:ee,externalForwardedProps:B,additionalProps:{..._R(he)&&{as:l}},ownerState:{...z,...ee?.ownerState},className:[ye.root,f]}),Q=Pt({elementType:je,externalSlotProps:fe,ownerState:z,className:ye.rail}),pe=Pt({elementType:Ee,externalSlotProps:be,additionalProps:{style:{...G[D].offset(ae),...G[D].leap(ge)}},ownerState:{...z,...be?.ownerState},className:ye.track}),Me=Pt({elementType:Ae,getSlotProps:V,externalSlotProps:de,ownerState:{...z,...de?.ownerState},className:ye.thumb}),Oe=Pt({elementType:ce,externalSlotProps:xe,ownerState:{...z,...xe?.ownerState},className:ye.valueLabel}),ze=Pt({elementType:Re,externalSlotProps:Se,ownerState:z,className:ye.mark}),et=Pt({elementType:$e,externalSlotProps:Ye,ownerState:z,className:ye.markLabel}),ft=Pt({elementType:J,getSlotProps:K,externalSlotProps:Fe,ownerState:z});return h.jsxs(he,{...ue,children:[h.jsx(je,{...Q}),h.jsx(Ee,{...pe}),X.filter(De=>De.value>=y&&De.value<=x).map((De,qe)=>{const xt=hs(De.value,y,x),Vt=G[D].offset(xt);let Ct;return k===!1?Ct=se.includes(De.value):Ct=k==="normal"&&(oe?De.value>=se[0]&&De.value<=se[se.length-1]:De.value<=se[0])||k==="inverted"&&(oe?De.value<=se[0]||De.value>=se[se.length-1]:De.value>=se[0]),h.jsxs(b.Fragment,{children:[h.jsx(Re,{"data-index":qe,...ze,...!Rn(Re)&&{markActive:Ct},style:{...Vt,...ze.style},className:re(ze.className,Ct&&ye.markActive)}),De.label!=null?h.jsx($e,{"aria-hidden":!0,"data-index":qe,...et,...!Rn($e)&&{markLabelActive:Ct},style:{...Vt,...et.style},className:re(ye.markLabel,et.className,Ct&&ye.markLabelActive),children:De.label}):null]},qe)}),se.map((De,qe)=>{const xt=hs(De,y,x),Vt=G[D].offset(xt),Ct=j==="off"?YR:ce;return h.jsx(Ct,{...!Rn(Ct)&&{valueLabelFormat:O,valueLabelDisplay:j,value:typeof O=="function"?O(L(De),qe):O,index:qe,open:F===qe||te===qe||j==="on",disabled:g},...Oe,children:h.jsx(Ae,{"data-index":qe,...Me,className:re(ye.thumb,Me.className,te===qe&&ye.active,ne===qe&&ye.focusVisible),style:{...Vt,...le(qe),...Me.style},children:h.jsx(J,{"data-index":qe,"aria-label":S?S(qe):i,"aria-valuenow":L(De),"aria-labelledby":a,"aria-valuetext":w?w(L(De),qe):s,value:se[qe],...ft})})},qe)})]})}),qR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,min:s,max:a,step:l,updateStore:c})=>{const d=St();return h.jsxs(ke,{"data-key":e,sx:{pt:0,pb:1,pl:1,pr:1,...n},className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:[h.jsx(Rt,{gutterBottom:!0,children:i}),h.jsx(jg,{value:t||[0,1],onChange:(u,p)=>c?.(e,p),min:s||0,max:a||1,step:l||.01,valueLabelDisplay:"auto",color:"secondary",disableSwap:!0,sx:{"& .MuiSlider-thumb":{color:d.palette.secondary.main}}})]},e)};function KR(e){return Pe("MuiButton",e)}const ao=Ce("MuiButton",["root","text","textInherit","textPrimary","textSecondary","textSuccess","textError","textInfo","textWarning","outlined","outlinedInherit","outlinedPrimary","outlinedSecondary","outlinedSuccess","outlinedError","outlinedInfo","outlinedWarning","contained","containedInherit","containedPrimary","containedSecondary","containedSuccess","containedError","containedInfo","containedWarning","disableElevation","focusVisible","disabled","colorInherit","colorPrimary","colorSecondary","colorSuccess","colorError","colorInfo","colorWarning","textSizeSmall","textSizeMedium","textSizeLarge","outlinedSizeSmall","outlinedSizeMedium","outlinedSizeLarge","containedSizeSmall","containedSizeMedium","containedSizeLarge","sizeMedium","sizeSmall","sizeLarge","fullWidth","startIcon","endIcon","icon","iconSizeSmall","iconSizeMedium","iconSizeLarge","loading","loadingWrapper","loadingIconPlaceholder","loadingIndicator","loadingPositionCenter","loadingPositionStart","loadingPositionEnd"]),ZR=b.createContext({}),JR=b.createContext(void 0),QR=e=>{const{color:t,disableElevation:n,fullWidth:o,size:r,variant:i,loading:s,loadingPosition:a,classes:l}=e,c={root:["root",s&&"loading",i,`${i}${q(t)}`,`size${q(r)}`,`${i}Size${q(r)}`,`color${q(t)}`,n&&"disableElevation",o&&"fullWidth",s&&`loadingPosition${q(a)}`],startIcon:["icon","startIcon",`iconSize${q(r)}`],endIcon:["icon","endIcon",`iconSize${q(r)}`],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]},d=Ie(c,KR,l);return{...l,...d}},Bg=[{props:{size:"small"},style:{"& > *:nth-of-type(1)":{fontSize:18}}},{props:{size:"medium"},style:{"& > *:nth-of-type(1)":{fontSize:20}}},{props:{size:"large"},style:{"& > *:nth-of-type(1)":{fontSize:22}}}],eM=Y(Nn,{shouldForwardProp:e=>Nt(e)||e==="classes",name:"MuiButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${q(n.color)}`],t[`size${q(n.size)}`],t[`${n.variant}Size${q(n.size)}`],n.color==="inherit"&&t.colorInherit,n.disableElevation&&t.disableElevation,n.fullWidth&&t.fullWidth,n.loading&&t.loading]}})(ve(({theme:e})=>{const t=e.palette.mode==="light"?e.palette.grey[300]:e.palette.grey[800],n=e.palette.mode==="light"?e.palette.grey.A100:e.palette.grey[700];return{...e.typography.button,minWidth:64,padding:"6px 16px",border:0,borderRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create(["background-color","box-shadow","border-color","color"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none"},[`&.${ao.disabled}`]:{color:(e.vars||e).palette.action.disabled},variants:[{props:{variant:"contained"},style:{color:"var(--variant-containedColor)",backgroundColor:"var(--variant-containedBg)",boxShadow:(e.vars||e).shadows[2],"&:hover":{boxShadow:(e.vars||e).shadows[4],"@media (hover: none)":{boxShadow:(e.vars||e).shadows[2]}},"&:active":{boxShadow:(e.vars||e).shadows[8]},[`&.${ao.focusVisible}`]:{boxShadow:(e.vars||e).shadows[6]},[`&.${ao.disabled}`]:{color:(e.vars||e).palette.action.disabled,boxShadow:(e.vars||e).shadows[0],backgroundColor:(e.vars||e).palette.action.disabledBackground}}},{props:{variant:"outlined"},style:{padding:"5px 15px",border:"1px solid currentColor",borderColor:"var(--variant-outlinedBorder, currentColor)",backgroundColor:"var(--variant-outlinedBg)",color:"var(--variant-outlinedColor)",[`&.${ao.disabled}`]:{border:`1px solid ${(e.vars||e).palette.action.disabledBackground}`}}},{props:{variant:"text"},style:{padding:"6px 8px",color:"var(--variant-textColor)",backgroundColor:"var(--variant-textBg)"}},...Object.entries(e.palette).filter(rt()).map(([o])=>({props:{color:o},style:{"--variant-textColor":(e.vars||e).palette[o].main,"--variant-outlinedColor":(e.vars||e).palette[o].main,"--variant-outlinedBorder":e.vars?`rgba(${e.vars.palette[o].mainChannel} / 0.5)`:He(e.palette[o].main,.5),"--variant-containedColor":(e.vars||e).palette[o].contrastText,"--variant-containedBg":(e.vars||e).palette[o].main,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":(e.vars||e).palette[o].dark,"--variant-textBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette[o].main,e.palette.action.hoverOpacity),"--variant-outlinedBorder":(e.vars||e).palette[o].main,"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette[o].main,e.palette.action.hoverOpacity)}}}})),{props:{color:"inherit"},style:{color:"inherit",borderColor:"currentColor","--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedBg:t,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedHoverBg:n,"--variant-textBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.text.primary,e.palette.action.hoverOpacity),"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.text.primary,e.palette.action.hoverOpacity)}}}},{props:{size:"small",variant:"text"},style:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"text"},style:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"outlined"},style:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"outlined"},style:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"contained"},style:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"contained"},style:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)}},{props:{disableElevation:!0},style:{boxShadow:"none","&:hover":{boxShadow:"none"},[`&.${ao.focusVisible}`]:{boxShadow:"none"},"&:active":{boxShadow:"none"},[`&.${ao.disabled}`]:{boxShadow:"none"}}},{props:{fullWidth:!0},style:{width:"100%"}},{props:{loadingPosition:"center"},style:{transition:e.transitions.create(["background-color","box-shadow","border-color"],{duration:e.transitions.duration.short}),[`&.${ao.loading}`]:{color:"transparent"}}}]}})),tM=Y("span",{name:"MuiButton",slot:"StartIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.startIcon,n.loading&&t.startIconLoadingStart,t[`iconSize${q(n.size)}`]]}})(({theme:e})=>({display:"inherit",marginRight:8,marginLeft:-4,variants:[{props:{size:"small"},style:{marginLeft:-2}},{props:{loadingPosition:"start",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"start",loading:!0,fullWidth:!0},style:{marginRight:-8}},...Bg]})),nM=Y("span",{name:"MuiButton",slot:"EndIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.endIcon,n.loading&&t.endIconLoadingEnd,t[`iconSize${q(n.size)}`]]}})(({theme:e})=>({display:"inherit",marginRight:-4,marginLeft:8,variants:[{props:{size:"small"},style:{marginRight:-2}},{props:{loadingPosition:"end",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"end",loading:!0,fullWidth:!0},style:{marginLeft:-8}},...Bg]})),oM=Y("span",{name:"MuiButton",slot:"LoadingIndicator",overridesResolver:(e,t)=>t.loadingIndicator})(({theme:e})=>({display:"none",position:"absolute",visibility:"visible",variants:[{props:{loading:!0},style:{display:"flex"}},{props:{loadingPosition:"start"},style:{left:14}},{props:{loadingPosition:"start",size:"small"},style:{left:10}},{props:{variant:"text",loadingPosition:"start"},style:{left:6}},{props:{loadingPosition:"center"},style:{left:"50%",transform:"translate(-50%)",color:(e.vars||e).palette.action.disabled}},{props:{loadingPosition:"end"},style:{right:14}},{props:{loadingPosition:"end",size:"small"},style:{right:10}},{props:{variant:"text",loadingPosition:"end"},style:{right:6}},{props:{loadingPosition:"start",fullWidth:!0},style:{position:"relative",left:-10}},{props:{loadingPosition:"end",fullWidth:!0},style:{position:"relative",right:-10}}]})),ap=Y("span",{name:"MuiButton",slot:"LoadingIconPlaceholder",overridesResolver:(e,t)=>t.loadingIconPlaceholder})({display:"inline-block",width:"1em",height:"1em"}),Wa=b.forwardRef(function(t,n){const o=b.useContext(ZR),r=b.useContext(JR),i=Ur(o,t),s=Te({props:i,name:"MuiButton"}),{children:a,color:l="primary",component:c="button",className:d,disabled:u=!1,disableElevation:p=!1,disableFocusRipple:f=!1,endIcon:m,focusVisibleClassName:g,fullWidth:S=!1,id:w,loading:P=null,loadingIndicator:x,loadingPosition:y="center",size:E="medium",startIcon:$,type:I,variant:M="text",...T}=s,v=rr(w),A=x??h.jsx(Fc,{"aria-labelledby":v,color:"inherit",size:16}),L={...s,color:l,component:c,disabled:u,disableElevation:p,disableFocusRipple:f,fullWidth:S,loading:P,loadingIndicator:A,loadingPosition:y,size:E,type:I,variant:M},_=QR(L),C=($||P&&y==="start")&&h.jsx(tM,{className:_.startIcon,ownerState:L,children:$||h.jsx(ap,{className:_.loadingIconPlaceholder,ownerState:L})}),R=(m||P&&y==="end")&&h.jsx(nM,{className:_.endIcon,ownerState:L,children:m||h.jsx(ap,{className:_.loadingIconPlaceholder,ownerState:L})}),k=r||"",N=typeof P=="boolean"?h.jsx("span",{className:_.loadingWrapper,style:{display:"contents"},children:P&&h.jsx(oM,{className:_.loadingIndicator,ownerState:L,children:A})}):null;return h.jsxs(eM,{ownerState:L,className:re(o.className,_.root,d,k),component:c,disabled:u||P,focusRipple:!f,focusVisibleClassName:re(_.focusVisible,g),ref:n,type:I,id:v,...T,classes:_,children:[C,y!=="end"&&N,a,y==="end"&&N,R]})});function rM(e){return Pe("MuiDialog",e)}const Va=Ce("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]),iM=b.createContext({}),sM=Y(mg,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),aM=e=>{const{classes:t,scroll:n,maxWidth:o,fullWidth:r,fullScreen:i}=e,s={root:["root"],container:["container",`scroll${q(n)}`],paper:["paper",`paperScroll${q(n)}`,`paperWidth${q(String(o))}`,r&&"paperFullWidth",i&&"paperFullScreen"]};return Ie(s,rM,t)},lM=Y(Mc,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),cM=Y("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.container,t[`scroll${q(n.scroll)}`]]}})({height:"100%","@media print":{height:"auto"},outline:0,variants:[{props:{scroll:"paper"},style:{display:"flex",justifyContent:"center",alignItems:"center"}},{props:{scroll:"body"},style:{overflowY:"auto",overflowX:"hidden",textAlign:"center","&::after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}}}]}),uM=Y(sr,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t[`scrollPaper${q(n.scroll)}`],t[`paperWidth${q(String(n.maxWidth))}`],n.fullWidth&&t.paperFullWidth,n.fullScreen&&t.paperFullScreen]}})(ve(({theme:e})=>({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"},variants:[{props:{scroll:"paper"},style:{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"}},{props:{scroll:"body"},style:{display:"inline-block",verticalAlign:"middle",textAlign:"initial"}},{props:({ownerState:t})=>!t.maxWidth,style:{maxWidth:"calc(100% - 64px)"}},{props:{maxWidth:"xs"},style:{maxWidth:e.breakpoints.unit==="px"?Math.max(e.breakpoints.values.xs,444):`max(${e.breakpoints.values.xs}${e.breakpoints.unit}, 444px)`,[`&.${Va.paperScrollBody}`]:{[e.breakpoints.down(Math.max(e.breakpoints.values.xs,444)+32*2)]:{maxWidth:"calc(100% - 64px)"}}}},...Object.keys(e.breakpoints.values).filter(t=>t!=="xs").map(t=>({props:{maxWidth:t},style:{maxWidth:`${e.breakpoints.values[t]}${e.breakpoints.unit}`,[`&.${Va.paperScrollBody}`]:{[e.breakpoints.down(e.breakpoints.values[t]+32*2)]:{maxWidth:"calc(100% - 64px)"}}}})),{props:({ownerState:t})=>t.fullWidth,style:{width:"calc(100% - 64px)"}},{props:({ownerState:t})=>t.fullScreen,style:{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${Va.paperScrollBody}`]:{margin:0,maxWidth:"100%"}}}]}))),dM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiDialog"}),r=St(),i={enter:r.transitions.duration.enteringScreen,exit:r.transitions.duration.leavingScreen},{"aria-describedby":s,"aria-labelledby":a,"aria-modal":l=!0,BackdropComponent:c,BackdropProps:d,children:u,className:p,disableEscapeKeyDown:f=!1,fullScreen:m=!1,fullWidth:g=!1,maxWidth:S="sm",onBackdropClick:w,onClick:P,onClose:x,open:y,PaperComponent:E=sr,PaperProps:$={},scroll:I="paper",slots:M={},slotProps:T={},TransitionComponent:v=Rl,transitionDuration:A=i,TransitionProps:L,..._}=o,C={...o,disableEscapeKeyDown:f,fullScreen:m,fullWidth:g,maxWidth:S,scroll:I},R=aM(C),k=b.useRef(),N=ae=>{k.current=ae.target===ae.currentTarget},j=ae=>{P&&P(ae),k.current&&(k.current=null,w&&w(ae),x&&x(ae,"backdropClick"))},O=rr(a),B=b.useMemo(()=>({titleId:O}),[O]),z={transition:v,...M},G={transition:L,paper:$,backdrop:d,...T},Z={slots:z,slotProps:G},[K,V]=ot("root",{elementType:lM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C,className:re(R.root,p),ref:n}),[F,te]=ot("backdrop",{elementType:sM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C}),[D,ne]=ot("paper",{elementType:uM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C,className:re(R.paper,$.className)}),[oe,ie]=ot("container",{elementType:cM,externalForwardedProps:Z,ownerState:C,className:re(R.container)}),[X,se]=ot("transition",{elementType:Rl,externalForwardedProps:Z,ownerState:C,additionalProps:{appear:!0,in:y,timeout:A,role:"presentation"}});return h.jsx(K,{closeAfterTransition:!0,slots:{backdrop:F},slotProps:{backdrop:{transitionDuration:A,as:c,...te}},disableEscapeKeyDown:f,onClose:x,open:y,onClick:j,...V,..._,children:h.jsx(X,{...se,children:h.jsx(oe,{onMouseDown:N,...ie,children:h.jsx(D,{as:E,elevation:24,role:"dialog","aria-describedby":s,"aria-labelledby":O,"aria-modal":l,...ne,children:h.jsx(iM.Provider,{value:B,children:u})})})})})});function pM(e){return Pe("MuiDivider",e)}const lp=Ce("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]),fM=e=>{const{absolute:t,children:n,classes:o,flexItem:r,light:i,orientation:s,textAlign:a,variant:l}=e;return Ie({root:["root",t&&"absolute",l,i&&"light",s==="vertical"&&"vertical",r&&"flexItem",n&&"withChildren",n&&s==="vertical"&&"withChildrenVertical",a==="right"&&s!=="vertical"&&"textAlignRight",a==="left"&&s!=="vertical"&&"textAlignLeft"],wrapper:["wrapper",s==="vertical"&&"wrapperVertical"]},pM,o)},hM=Y("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,n.orientation==="vertical"&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&n.orientation==="vertical"&&t.withChildrenVertical,n.textAlign==="right"&&n.orientation!=="vertical"&&t.textAlignRight,n.textAlign==="left"&&n.orientation!=="vertical"&&t.textAlignLeft]}})(ve(({theme:e})=>({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(e.vars||e).palette.divider,borderBottomWidth:"thin",variants:[{props:{absolute:!0},style:{position:"absolute",bottom:0,left:0,width:"100%"}},{props:{light:!0},style:{borderColor:e.vars?`rgba(${e.vars.palette.dividerChannel} / 0.08)`:He(e.palette.divider,.08)}},{props:{variant:"inset"},style:{marginLeft:72}},{props:{variant:"middle",orientation:"horizontal"},style:{marginLeft:e.spacing(2),marginRight:e.spacing(2)}},{props:{variant:"middle",orientation:"vertical"},style:{marginTop:e.spacing(1),marginBottom:e.spacing(1)}},{props:{orientation:"vertical"},style:{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"}},{props:{flexItem:!0},style:{alignSelf:"stretch",height:"auto"}},{props:({ownerState:t})=>!!t.children,style:{display:"flex",textAlign:"center",border:0,borderTopStyle:"solid",borderLeftStyle:"solid","&::before, &::after":{content:'""',alignSelf:"center"}}},{props:({ownerState:t})=>t.children&&t.orientation!=="vertical",style:{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(e.vars||e).palette.divider}`,borderTopStyle:"inherit"}}},{props:({ownerState:t})=>t.orientation==="vertical"&&t.children,style:{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(e.vars||e).palette.divider}`,borderLeftStyle:"inherit"}}},{props:({ownerState:t})=>t.textAlign==="right"&&t.orientation!=="vertical",style:{"&::before":{width:"90%"},"&::after":{width:"10%"}}},{props:({ownerState:t})=>t.textAlign==="left"&&t.orientation!=="vertical",style:{"&::before":{width:"10%"},"&::after":{width:"90%"}}}]}))),gM=Y("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,n.orientation==="vertical"&&t.wrapperVertical]}})(ve(({theme:e})=>({display:"inline-block",paddingLeft:`calc(${e.spacing(1)} * 1.2)`,paddingRight:`calc(${e.spacing(1)} * 1.2)`,whiteSpace:"nowrap",variants:[{props:{orientation:"vertical"},style:{paddingTop:`calc(${e.spacing(1)} * 1.2)`,paddingBottom:`calc(${e.spacing(1)} * 1.2)`}}]}))),_l=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiDivider"}),{absolute:r=!1,children:i,className:s,orientation:a="horizontal",component:l=i||a==="vertical"?"div":"hr",flexItem:c=!1,light:d=!1,role:u=l!=="hr"?"separator":void 0,textAlign:p="center",variant:f="fullWidth",...m}=o,g={...o,absolute:r,component:l,flexItem:c,light:d,orientation:a,role:u,textAlign:p,variant:f},S=fM(g);return h.jsx(hM,{as:l,className:re(S.root,s),role:u,ref:n,ownerState:g,"aria-orientation":u==="separator"&&(l!=="hr"||a==="vertical")?a:void 0,...m,children:i?h.jsx(gM,{className:S.wrapper,ownerState:g,children:i}):null})});_l&&(_l.muiSkipListHighlight=!0);function mM(e){return Pe("MuiListItem",e)}Ce("MuiListItem",["root","container","dense","alignItemsFlexStart","divider","gutters","padding","secondaryAction"]);const yM=Ce("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function bM(e){return Pe("MuiListItemSecondaryAction",e)}Ce("MuiListItemSecondaryAction",["root","disableGutters"]);const vM=e=>{const{disableGutters:t,classes:n}=e;return Ie({root:["root",t&&"disableGutters"]},bM,n)},xM=Y("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)",variants:[{props:({ownerState:e})=>e.disableGutters,style:{right:0}}]}),zg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItemSecondaryAction"}),{className:r,...i}=o,s=b.useContext(qn),a={...o,disableGutters:s.disableGutters},l=vM(a);return h.jsx(xM,{className:re(l.root,r),ownerState:a,ref:n,...i})});zg.muiName="ListItemSecondaryAction";const wM=(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,n.alignItems==="flex-start"&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.hasSecondaryAction&&t.secondaryAction]},SM=e=>{const{alignItems:t,classes:n,dense:o,disableGutters:r,disablePadding:i,divider:s,hasSecondaryAction:a}=e;return Ie({root:["root",o&&"dense",!r&&"gutters",!i&&"padding",s&&"divider",t==="flex-start"&&"alignItemsFlexStart",a&&"secondaryAction"],container:["container"]},mM,n)},CM=Y("div",{name:"MuiListItem",slot:"Root",overridesResolver:wM})(ve(({theme:e})=>({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left",variants:[{props:({ownerState:t})=>!t.disablePadding,style:{paddingTop:8,paddingBottom:8}},{props:({ownerState:t})=>!t.disablePadding&&t.dense,style:{paddingTop:4,paddingBottom:4}},{props:({ownerState:t})=>!t.disablePadding&&!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>!t.disablePadding&&!!t.secondaryAction,style:{paddingRight:48}},{props:({ownerState:t})=>!!t.secondaryAction,style:{[`& > .${yM.root}`]:{paddingRight:48}}},{props:{alignItems:"flex-start"},style:{alignItems:"flex-start"}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>t.button,style:{transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}}}},{props:({ownerState:t})=>t.hasSecondaryAction,style:{paddingRight:48}}]}))),kM=Y("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),EM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItem"}),{alignItems:r="center",children:i,className:s,component:a,components:l={},componentsProps:c={},ContainerComponent:d="li",ContainerProps:{className:u,...p}={},dense:f=!1,disableGutters:m=!1,disablePadding:g=!1,divider:S=!1,secondaryAction:w,slotProps:P={},slots:x={},...y}=o,E=b.useContext(qn),$=b.useMemo(()=>({dense:f||E.dense||!1,alignItems:r,disableGutters:m}),[r,E.dense,f,m]),I=b.useRef(null),M=b.Children.toArray(i),T=M.length&&Gi(M[M.length-1],["ListItemSecondaryAction"]),v={...o,alignItems:r,dense:$.dense,disableGutters:m,disablePadding:g,divider:S,hasSecondaryAction:T},A=SM(v),L=at(I,n),_=x.root||l.Root||CM,C=P.root||c.root||{},R={className:re(A.root,C.className,s),...y};let k=a||"li";return T?(k=!R.component&&!a?"div":k,d==="li"&&(k==="li"?k="div":R.component==="li"&&(R.component="div")),h.jsx(qn.Provider,{value:$,children:h.jsxs(kM,{as:d,className:re(A.container,u),ref:L,ownerState:v,...p,children:[h.jsx(_,{...C,...!Rn(_)&&{as:k,ownerState:{...v,...C.ownerState}},...R,children:M}),M.pop()]})})):h.jsx(qn.Provider,{value:$,children:h.jsxs(_,{...C,as:k,ref:L,...!Rn(_)&&{ownerState:{...v,...C.ownerState}},...R,children:[M,w&&h.jsx(zg,{children:w})]})})}),cp=Ce("MuiListItemIcon",["root","alignItemsFlexStart"]);function $M(e){return Pe("MuiListItemText",e)}const Bo=Ce("MuiListItemText",["root","multiline","dense","inset","primary","secondary"]),PM=e=>{const{classes:t,inset:n,primary:o,secondary:r,dense:i}=e;return Ie({root:["root",n&&"inset",i&&"dense",o&&r&&"multiline"],primary:["primary"],secondary:["secondary"]},$M,t)},IM=Y("div",{name:"MuiListItemText",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${Bo.primary}`]:t.primary},{[`& .${Bo.secondary}`]:t.secondary},t.root,n.inset&&t.inset,n.primary&&n.secondary&&t.multiline,n.dense&&t.dense]}})({flex:"1 1 auto",minWidth:0,marginTop:4,marginBottom:4,[`.${$d.root}:where(& .${Bo.primary})`]:{display:"block"},[`.${$d.root}:where(& .${Bo.secondary})`]:{display:"block"},variants:[{props:({ownerState:e})=>e.primary&&e.secondary,style:{marginTop:6,marginBottom:6}},{props:({ownerState:e})=>e.inset,style:{paddingLeft:56}}]}),RM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItemText"}),{children:r,className:i,disableTypography:s=!1,inset:a=!1,primary:l,primaryTypographyProps:c,secondary:d,secondaryTypographyProps:u,slots:p={},slotProps:f={},...m}=o,{dense:g}=b.useContext(qn);let S=l??r,w=d;const P={...o,disableTypography:s,inset:a,primary:!!S,secondary:!!w,dense:g},x=PM(P),y={slots:p,slotProps:{primary:c,secondary:u,...f}},[E,$]=ot("primary",{className:x.primary,elementType:Rt,externalForwardedProps:y,ownerState:P}),[I,M]=ot("secondary",{className:x.secondary,elementType:Rt,externalForwardedProps:y,ownerState:P});return S!=null&&S.type!==Rt&&!s&&(S=h.jsx(E,{variant:g?"body2":"body1",component:$?.variant?void 0:"span",...$,children:S})),w!=null&&w.type!==Rt&&!s&&(w=h.jsx(I,{variant:"body2",color:"textSecondary",...M,children:w})),h.jsxs(IM,{className:re(x.root,i),ownerState:P,ref:n,...m,children:[S,w]})});function MM(e){return Pe("MuiMenuItem",e)}const yr=Ce("MuiMenuItem",["root","focusVisible","dense","disabled","divider","gutters","selected"]),TM=(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,n.divider&&t.divider,!n.disableGutters&&t.gutters]},AM=e=>{const{disabled:t,dense:n,divider:o,disableGutters:r,selected:i,classes:s}=e,l=Ie({root:["root",n&&"dense",t&&"disabled",!r&&"gutters",o&&"divider",i&&"selected"]},MM,s);return{...s,...l}},NM=Y(Nn,{shouldForwardProp:e=>Nt(e)||e==="classes",name:"MuiMenuItem",slot:"Root",overridesResolver:TM})(ve(({theme:e})=>({...e.typography.body1,display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",minHeight:48,paddingTop:6,paddingBottom:6,boxSizing:"border-box",whiteSpace:"nowrap","&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${yr.selected}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity),[`&.${yr.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}},[`&.${yr.selected}:hover`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity)}},[`&.${yr.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},[`&.${yr.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity},[`& + .${lp.root}`]:{marginTop:e.spacing(1),marginBottom:e.spacing(1)},[`& + .${lp.inset}`]:{marginLeft:52},[`& .${Bo.root}`]:{marginTop:0,marginBottom:0},[`& .${Bo.inset}`]:{paddingLeft:36},[`& .${cp.root}`]:{minWidth:36},variants:[{props:({ownerState:t})=>!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>!t.dense,style:{[e.breakpoints.up("sm")]:{minHeight:"auto"}}},{props:({ownerState:t})=>t.dense,style:{minHeight:32,paddingTop:4,paddingBottom:4,...e.typography.body2,[`& .${cp.root} svg`]:{fontSize:"1.25rem"}}}]}))),OM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiMenuItem"}),{autoFocus:r=!1,component:i="li",dense:s=!1,divider:a=!1,disableGutters:l=!1,focusVisibleClassName:c,role:d="menuitem",tabIndex:u,className:p,...f}=o,m=b.useContext(qn),g=b.useMemo(()=>({dense:s||m.dense||!1,disableGutters:l}),[m.dense,s,l]),S=b.useRef(null);Ft(()=>{r&&S.current&&S.current.focus()},[r]);const w={...o,dense:g.dense,divider:a,disableGutters:l},P=AM(o),x=at(S,n);let y;return o.disabled||(y=u!==void 0?u:-1),h.jsx(qn.Provider,{value:g,children:h.jsx(NM,{ref:x,role:d,tabIndex:y,component:i,focusVisibleClassName:re(P.focusVisible,c),className:re(P.root,p),...f,ownerState:w,classes:P})})});function LM(e){return Pe("MuiTab",e)}const Xt=Ce("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper","icon"]),_M=e=>{const{classes:t,textColor:n,fullWidth:o,wrapped:r,icon:i,label:s,selected:a,disabled:l}=e,c={root:["root",i&&s&&"labelIcon",`textColor${q(n)}`,o&&"fullWidth",r&&"wrapped",a&&"selected",l&&"disabled"],icon:["iconWrapper","icon"]};return Ie(c,LM,t)},jM=Y(Nn,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.label&&n.icon&&t.labelIcon,t[`textColor${q(n.textColor)}`],n.fullWidth&&t.fullWidth,n.wrapped&&t.wrapped,{[`& .${Xt.iconWrapper}`]:t.iconWrapper},{[`& .${Xt.icon}`]:t.icon}]}})(ve(({theme:e})=>({...e.typography.button,maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center",lineHeight:1.25,variants:[{props:({ownerState:t})=>t.label&&(t.iconPosition==="top"||t.iconPosition==="bottom"),style:{flexDirection:"column"}},{props:({ownerState:t})=>t.label&&t.iconPosition!=="top"&&t.iconPosition!=="bottom",style:{flexDirection:"row"}},{props:({ownerState:t})=>t.icon&&t.label,style:{minHeight:72,paddingTop:9,paddingBottom:9}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="top",style:{[`& > .${Xt.icon}`]:{marginBottom:6}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="bottom",style:{[`& > .${Xt.icon}`]:{marginTop:6}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="start",style:{[`& > .${Xt.icon}`]:{marginRight:e.spacing(1)}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="end",style:{[`& > .${Xt.icon}`]:{marginLeft:e.spacing(1)}}},{props:{textColor:"inherit"},style:{color:"inherit",opacity:.6,[`&.${Xt.selected}`]:{opacity:1},[`&.${Xt.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity}}},{props:{textColor:"primary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Xt.selected}`]:{color:(e.vars||e).palette.primary.main},[`&.${Xt.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:{textColor:"secondary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Xt.selected}`]:{color:(e.vars||e).palette.secondary.main},[`&.${Xt.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:({ownerState:t})=>t.fullWidth,style:{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"}},{props:({ownerState:t})=>t.wrapped,style:{fontSize:e.typography.pxToRem(12)}}]}))),up=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTab"}),{className:r,disabled:i=!1,disableFocusRipple:s=!1,fullWidth:a,icon:l,iconPosition:c="top",indicator:d,label:u,onChange:p,onClick:f,onFocus:m,selected:g,selectionFollowsFocus:S,textColor:w="inherit",value:P,wrapped:x=!1,...y}=o,E={...o,disabled:i,disableFocusRipple:s,selected:g,icon:!!l,iconPosition:c,label:!!u,fullWidth:a,textColor:w,wrapped:x},$=_M(E),I=l&&u&&b.isValidElement(l)?b.cloneElement(l,{className:re($.icon,l.props.className)}):l,M=v=>{!g&&p&&p(v,P),f&&f(v)},T=v=>{S&&!g&&p&&p(v,P),m&&m(v)};return h.jsxs(jM,{focusRipple:!s,className:re($.root,r),ref:n,role:"tab","aria-selected":g,disabled:i,onClick:M,onFocus:T,ownerState:E,tabIndex:g?0:-1,...y,children:[c==="top"||c==="start"?h.jsxs(b.Fragment,{children:[I,u]}):h.jsxs(b.Fragment,{children:[u,I]}),d]})}),BM=st(h.jsx("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),zM=st(h.jsx("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function DM(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}function FM(e,t,n,o={},r=()=>{}){const{ease:i=DM,duration:s=300}=o;let a=null;const l=t[e];let c=!1;const d=()=>{c=!0},u=p=>{if(c){r(new Error("Animation cancelled"));return}a===null&&(a=p);const f=Math.min(1,(p-a)/s);if(t[e]=i(f)*(n-l)+l,f>=1){requestAnimationFrame(()=>{r(null)});return}requestAnimationFrame(u)};return l===n?(r(new Error("Element already at target position")),d):(requestAnimationFrame(u),d)}const HM={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};function WM(e){const{onChange:t,...n}=e,o=b.useRef(),r=b.useRef(null),i=()=>{o.current=r.current.offsetHeight-r.current.clientHeight};return Ft(()=>{const s=ca(()=>{const l=o.current;i(),l!==o.current&&t(o.current)}),a=un(r.current);return a.addEventListener("resize",s),()=>{s.clear(),a.removeEventListener("resize",s)}},[t]),b.useEffect(()=>{i(),t(o.current)},[t]),h.jsx("div",{style:HM,...n,ref:r})}function VM(e){return Pe("MuiTabScrollButton",e)}const UM=Ce("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),GM=e=>{const{classes:t,orientation:n,disabled:o}=e;return Ie({root:["root",n,o&&"disabled"]},VM,t)},XM=Y(Nn,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.orientation&&t[n.orientation]]}})({width:40,flexShrink:0,opacity:.8,[`&.${UM.disabled}`]:{opacity:0},variants:[{props:{orientation:"vertical"},style:{width:"100%",height:40,"& svg":{transform:"var(--TabScrollButton-svgRotate)"}}}]}),YM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTabScrollButton"}),{className:r,slots:i={},slotProps:s={},direction:a,orientation:l,disabled:c,...d}=o,u=ir(),p={isRtl:u,...o},f=GM(p),m=i.StartScrollButtonIcon??BM,g=i.EndScrollButtonIcon??zM,S=Pt({elementType:m,externalSlotProps:s.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:p}),w=Pt({elementType:g,externalSlotProps:s.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:p});return h.jsx(XM,{component:"div",className:re(f.root,r),ref:n,role:null,ownerState:p,tabIndex:null,...d,style:{...d.style,...l==="vertical"&&{"--TabScrollButton-svgRotate":`rotate(${u?-90:90}deg)`}},children:a==="left"?h.jsx(m,{...S}):h.jsx(g,{...w})})});function qM(e){return Pe("MuiTabs",e)}const Ua=Ce("MuiTabs",["root","vertical","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),dp=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,pp=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,ji=(e,t,n)=>{let o=!1,r=n(e,t);for(;r;){if(r===e.firstChild){if(o)return;o=!0}const i=r.disabled||r.getAttribute("aria-disabled")==="true";if(!r.hasAttribute("tabindex")||i)r=n(e,r);else{r.focus();return}}},KM=e=>{const{vertical:t,fixed:n,hideScrollbar:o,scrollableX:r,scrollableY:i,centered:s,scrollButtonsHideMobile:a,classes:l}=e;return Ie({root:["root",t&&"vertical"],scroller:["scroller",n&&"fixed",o&&"hideScrollbar",r&&"scrollableX",i&&"scrollableY"],flexContainer:["flexContainer",t&&"flexContainerVertical",s&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",a&&"scrollButtonsHideMobile"],scrollableX:[r&&"scrollableX"],hideScrollbar:[o&&"hideScrollbar"]},qM,l)},ZM=Y("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${Ua.scrollButtons}`]:t.scrollButtons},{[`& .${Ua.scrollButtons}`]:n.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,n.vertical&&t.vertical]}})(ve(({theme:e})=>({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex",variants:[{props:({ownerState:t})=>t.vertical,style:{flexDirection:"column"}},{props:({ownerState:t})=>t.scrollButtonsHideMobile,style:{[`& .${Ua.scrollButtons}`]:{[e.breakpoints.down("sm")]:{display:"none"}}}}]}))),JM=Y("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.scroller,n.fixed&&t.fixed,n.hideScrollbar&&t.hideScrollbar,n.scrollableX&&t.scrollableX,n.scrollableY&&t.scrollableY]}})({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap",variants:[{props:({ownerState:e})=>e.fixed,style:{overflowX:"hidden",width:"100%"}},{props:({ownerState:e})=>e.hideScrollbar,style:{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}},{props:({ownerState:e})=>e.scrollableX,style:{overflowX:"auto",overflowY:"hidden"}},{props:({ownerState:e})=>e.scrollableY,style:{overflowY:"auto",overflowX:"hidden"}}]}),QM=Y("div",{name:"MuiTabs",slot:"FlexContainer",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.flexContainer,n.vertical&&t.flexContainerVertical,n.centered&&t.centered]}})({display:"flex",variants:[{props:({ownerState:e})=>e.vertical,style:{flexDirection:"column"}},{props:({ownerState:e})=>e.centered,style:{justifyContent:"center"}}]}),eT=Y("span",{name:"MuiTabs",slot:"Indicator",overridesResolver:(e,t)=>t.indicator})(ve(({theme:e})=>({position:"absolute",height:2,bottom:0,width:"100%",transition:e.transitions.create(),variants:[{props:{indicatorColor:"primary"},style:{backgroundColor:(e.vars||e).palette.primary.main}},{props:{indicatorColor:"secondary"},style:{backgroundColor:(e.vars||e).palette.secondary.main}},{props:({ownerState:t})=>t.vertical,style:{height:"100%",width:2,right:0}}]}))),tT=Y(WM)({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),fp={},nT=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTabs"}),r=St(),i=ir(),{"aria-label":s,"aria-labelledby":a,action:l,centered:c=!1,children:d,className:u,component:p="div",allowScrollButtonsMobile:f=!1,indicatorColor:m="primary",onChange:g,orientation:S="horizontal",ScrollButtonComponent:w=YM,scrollButtons:P="auto",selectionFollowsFocus:x,slots:y={},slotProps:E={},TabIndicatorProps:$={},TabScrollButtonProps:I={},textColor:M="primary",value:T,variant:v="standard",visibleScrollbar:A=!1,...L}=o,_=v==="scrollable",C=S==="vertical",R=C?"scrollTop":"scrollLeft",k=C?"top":"left",N=C?"bottom":"right",j=C?"clientHeight":"clientWidth",O=C?"height":"width",B={...o,component:p,allowScrollButtonsMobile:f,indicatorColor:m,orientation:S,vertical:C,scrollButtons:P,textColor:M,variant:v,visibleScrollbar:A,fixed:!_,hideScrollbar:_&&!A,scrollableX:_&&!C,scrollableY:_&&C,centered:c&&!_,scrollButtonsHideMobile:!f},z=KM(B),G=Pt({elementType:y.StartScrollButtonIcon,externalSlotProps:E.startScrollButtonIcon,ownerState:B}),Z=Pt({elementType:y.EndScrollButtonIcon,externalSlotProps:E.endScrollButtonIcon,ownerState:B}),[K,V]=b.useState(!1),[F,te]=b.useState(fp),[D,ne]=b.useState(!1),[oe,ie]=b.useState(!1),[X,se]=b.useState(!1),[ae,ge]=b.useState({overflow:"hidden",scrollbarWidth:0}),le=new Map,ye=b.useRef(null),he=b.useRef(null),je=()=>{const Q=ye.current;let pe;if(Q){const Oe=Q.getBoundingClientRect();pe={clientWidth:Q.clientWidth,scrollLeft:Q.scrollLeft,scrollTop:Q.scrollTop,scrollWidth:Q.scrollWidth,top:Oe.top,bottom:Oe.bottom,left:Oe.left,right:Oe.right}}let Me;if(Q&&T!==!1){const Oe=he.current.children;if(Oe.length>0){const ze=Oe[le.get(T)];Me=ze?ze.getBoundingClientRect():null}}return{tabsMeta:pe,tabMeta:Me}},Ee=Et(()=>{const{tabsMeta:Q,tabMeta:pe}=je();let Me=0,Oe;C?(Oe="top",pe&&Q&&(Me=pe.top-Q.top+Q.scrollTop)):(Oe=i?"right":"left",pe&&Q&&(Me=(i?-1:1)*(pe[Oe]-Q[Oe]+Q.scrollLeft)));const ze={[Oe]:Me,[O]:pe?pe[O]:0};if(typeof F[Oe]!="number"||typeof F[O]!="number")te(ze);else{const et=Math.abs(F[Oe]-ze[Oe]),ft=Math.abs(F[O]-ze[O]);(et>=1||ft>=1)&&te(ze)}}),Ae=(Q,{animation:pe=!0}={})=>{pe?FM(R,ye.current,Q,{duration:r.transitions.duration.standard}):ye.current[R]=Q},ce=Q=>{let pe=ye.current[R];C?pe+=Q:pe+=Q*(i?-1:1),Ae(pe)},Re=()=>{const Q=ye.current[j];let pe=0;const Me=Array.from(he.current.children);for(let Oe=0;Oe<Me.length;Oe+=1){const ze=Me[Oe];if(pe+ze[j]>Q){Oe===0&&(pe=Q);break}pe+=ze[j]}return pe},$e=()=>{ce(-1*Re())},J=()=>{ce(Re())},ee=b.useCallback(Q=>{ge({overflow:null,scrollbarWidth:Q})},[]),fe=()=>{const Q={};Q.scrollbarSizeListener=_?h.jsx(tT,{onChange:ee,className:re(z.scrollableX,z.hideScrollbar)}):null;const Me=_&&(P==="auto"&&(D||oe)||P===!0);return Q.scrollButtonStart=Me?h.jsx(w,{slots:{StartScrollButtonIcon:y.StartScrollButtonIcon},slotProps:{startScrollButtonIcon:G},orientation:S,direction:i?"right":"left",onClick:$e,disabled:!D,...I,className:re(z.scrollButtons,I.className)}):null,Q.scrollButtonEnd=Me?h.jsx(w,{slots:{EndScrollButtonIcon:y.EndScrollButtonIcon},slotProps:{endScrollButtonIcon:Z},orientation:S,direction:i?"left":"right",onClick:J,disabled:!oe,...I,className:re(z.scrollButtons,I.className)}):null,Q},be=Et(Q=>{const{tabsMeta:pe,tabMeta:Me}=je();if(!(!Me||!pe)){if(Me[k]<pe[k]){const Oe=pe[R]+(Me[k]-pe[k]);Ae(Oe,{animation:Q})}else if(Me[N]>pe[N]){const Oe=pe[R]+(Me[N]-pe[N]);Ae(Oe,{animation:Q})}}}),de=Et(()=>{_&&P!==!1&&se(!X)});b.useEffect(()=>{const Q=ca(()=>{ye.current&&Ee()});let pe;const Me=et=>{et.forEach(ft=>{ft.removedNodes.forEach(De=>{pe?.unobserve(De)}),ft.addedNodes.forEach(De=>{pe?.observe(De)})}),Q(),de()},Oe=un(ye.current);Oe.addEventListener("resize",Q);let ze;return typeof ResizeObserver<"u"&&(pe=new ResizeObserver(Q),Array.from(he.current.children).forEach(et=>{pe.observe(et)})),typeof MutationObserver<"u"&&(ze=new MutationObserver(Me),ze.observe(he.current,{childList:!0})),()=>{Q.clear(),Oe.removeEventListener("resize",Q),ze?.disconnect(),pe?.disconnect()}},[Ee,de]),b.useEffect(()=>{const Q=Array.from(he.current.children),pe=Q.length;if(typeof IntersectionObserver<"u"&&pe>0&&_&&P!==!1){const Me=Q[0],Oe=Q[pe-1],ze={root:ye.current,threshold:.99},et=xt=>{ne(!xt[0].isIntersecting)},ft=new IntersectionObserver(et,ze);ft.observe(Me);const De=xt=>{ie(!xt[0].isIntersecting)},qe=new IntersectionObserver(De,ze);return qe.observe(Oe),()=>{ft.disconnect(),qe.disconnect()}}},[_,P,X,d?.length]),b.useEffect(()=>{V(!0)},[]),b.useEffect(()=>{Ee()}),b.useEffect(()=>{be(fp!==F)},[be,F]),b.useImperativeHandle(l,()=>({updateIndicator:Ee,updateScrollButtons:de}),[Ee,de]);const xe=h.jsx(eT,{...$,className:re(z.indicator,$.className),ownerState:B,style:{...F,...$.style}});let Se=0;const Ye=b.Children.map(d,Q=>{if(!b.isValidElement(Q))return null;const pe=Q.props.value===void 0?Se:Q.props.value;le.set(pe,Se);const Me=pe===T;return Se+=1,b.cloneElement(Q,{fullWidth:v==="fullWidth",indicator:Me&&!K&&xe,selected:Me,selectionFollowsFocus:x,onChange:g,textColor:M,value:pe,...Se===1&&T===!1&&!Q.props.tabIndex?{tabIndex:0}:{}})}),Fe=Q=>{const pe=he.current,Me=bt(pe).activeElement;if(Me.getAttribute("role")!=="tab")return;let ze=S==="horizontal"?"ArrowLeft":"ArrowUp",et=S==="horizontal"?"ArrowRight":"ArrowDown";switch(S==="horizontal"&&i&&(ze="ArrowRight",et="ArrowLeft"),Q.key){case ze:Q.preventDefault(),ji(pe,Me,pp);break;case et:Q.preventDefault(),ji(pe,Me,dp);break;case"Home":Q.preventDefault(),ji(pe,null,dp);break;case"End":Q.preventDefault(),ji(pe,null,pp);break}},ue=fe();return h.jsxs(ZM,{className:re(z.root,u),ownerState:B,ref:n,as:p,...L,children:[ue.scrollButtonStart,ue.scrollbarSizeListener,h.jsxs(JM,{className:z.scroller,ownerState:B,style:{overflow:ae.overflow,[C?`margin${i?"Left":"Right"}`:"marginBottom"]:A?void 0:-ae.scrollbarWidth},ref:ye,children:[h.jsx(QM,{"aria-label":s,"aria-labelledby":a,"aria-orientation":S==="vertical"?"vertical":null,className:z.flexContainer,ownerState:B,onKeyDown:Fe,ref:he,role:"tablist",children:Ye}),K&&xe]}),ue.scrollButtonEnd]})}),oT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s})=>h.jsx(ke,{"data-key":e,className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{minWidth:"320px",...n},children:h.jsx(li,{variant:"outlined",type:"text",size:"small",fullWidth:!0,multiline:!0,minRows:3,maxRows:12,label:i,value:t,onChange:a=>s?.(e,a.target.value)})},e),rT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,no_validation:s,options:a,updateStore:l})=>{const c=typeof t=="string"?[t]:t||[];return h.jsx(ke,{"data-key":e,sx:{minWidth:"320px",...n},className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Lg,{multiple:!0,disablePortal:!0,filterSelectedOptions:!0,handleHomeEndKeys:!0,freeSolo:s,options:a,renderInput:d=>h.jsx(li,{...d,label:i}),onChange:(d,u)=>l?.(e,u),value:c,size:"small"})})},iT=({component:e,props:t})=>{const[n,o]=b.useState(null),r=window,i=e?.split("/").pop();return!e||!i?(console.error("The component must be in the format of `module/component`"),h.jsx(ke,{children:"Error loading component"})):(b.useEffect(()=>{r.React===void 0&&(r.React=Zt),r.mellonCustomScripts===void 0&&(r.mellonCustomScripts=new Map);const s=async()=>{try{const l=r.mellonCustomScripts.get(e);if(l)await l;else{const d=new Promise((u,p)=>{const f=document.createElement("script");f.src=`http://${Qn.serverAddress}/custom_component/${e}`,f.async=!0,f.onload=u,f.onerror=p,f.id=i,document.body.appendChild(f)});r.mellonCustomScripts.set(e,d),await d}const c=r[i];if(!c)throw new Error(`Component ${i} failed to load properly`);o(()=>c)}catch(l){console.error("Error loading component:",l),r.mellonCustomScripts.delete(e)}},a=r[i];return a?o(()=>a):s(),()=>{const l=document.getElementById(i);l&&!document.querySelector(`[data-component="${i}"]`)&&(document.body.removeChild(l),r.mellonCustomScripts.delete(e)),r.mellonCustomScripts.size===0&&(delete r.mellonCustomScripts,delete r.React)}},[e,i]),n?h.jsx(ke,{"data-component":i,children:h.jsx(n,{...t})}):h.jsx(ke,{children:"Loading..."}))},sT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s,source:a})=>{const l=d=>s?.(e,d),c=St();return h.jsx(ke,{"data-key":e,className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsx(iT,{component:a,props:{fieldKey:e,value:t,label:i,setValue:l,theme:c}})})},aT=st(h.jsx("path",{d:"M12 8c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2m0 2c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2m0 6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2"}),"MoreVert"),lT=({fieldKey:e,style:t,disabled:n,hidden:o,label:r,options:i,updateStore:s,onChangeAction:a})=>{const[l,c]=b.useState(null),d=!!l,u=Array.isArray(a?.target)?a?.target:[a?.target],p=St(),f=g=>{c(g.currentTarget)},m=g=>{if(c(null),g<0)return;const S=Array.isArray(i[g].value)?i[g].value:[i[g].value];u.forEach((w,P)=>{s?.(w,S[P])})};return h.jsxs(ke,{"data-key":e,className:`flex-auto nodrag ${n?"mellon-disabled":""} ${o?"mellon-hidden":""}`,sx:{...t},children:[h.jsx(Mn,{onClick:f,title:r,children:h.jsx(aT,{})}),h.jsx(bg,{anchorEl:l,open:d,onClose:()=>m(-1),slotProps:{paper:{sx:{maxHeight:"640px",lineHeight:"0","& li:hover":{backgroundColor:p.palette.secondary.main}},elevation:8}},children:i.map((g,S)=>g.label?.startsWith("---")?h.jsx(_l,{sx:{borderColor:"rgba(255, 255, 255, 0.5)"}},S):h.jsx(OM,{sx:{lineHeight:"1.2",pl:1,pr:1},onClick:()=>m(S),children:g.label},S))})]})},cT=st(h.jsx("path",{d:"M20 11H7.83l5.59-5.59L12 4l-8 8 8 8 1.41-1.41L7.83 13H20z"}),"ArrowBack"),uT=st(h.jsx("path",{d:"m12 4-1.41 1.41L16.17 11H4v2h12.17l-5.58 5.59L12 20l8-8z"}),"ArrowForward"),dT=st(h.jsx("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),pT=b.memo(({urls:e,index:t,label:n,onClose:o})=>{const r=St(),[i,s]=b.useState(-1),[a,l]=b.useState(1),[c,d]=b.useState({x:0,y:0}),u=b.useRef(!1),p=b.useRef({x:0,y:0}),f=b.useRef(0),m=$=>{a!==1&&(u.current=!0,p.current={x:$.clientX-c.x,y:$.clientY-c.y})},g=$=>{if(!u.current)return;const I=$.clientX-p.current.x,M=$.clientY-p.current.y,T={x:Math.min(Math.max(I,-(a-1)*500),(a-1)*500),y:Math.min(Math.max(M,-(a-1)*500),(a-1)*500)};d(T)},S=$=>{u.current=!1};b.useEffect(()=>{d({x:0,y:0})},[a,i]),b.useEffect(()=>{f.current=Date.now()},[e]),b.useEffect(()=>{l(1),d({x:0,y:0}),s(t)},[t]);const w=b.useCallback($=>{i!==-1&&($.key==="ArrowLeft"||$.key==="ArrowRight")&&($.preventDefault(),$.stopPropagation(),$.key==="ArrowLeft"&&i>0&&s(i-1),$.key==="ArrowRight"&&i<e.length-1&&s(i+1))},[i,e.length]),P=b.useCallback($=>{i!==-1&&l(I=>Math.min(Math.max(1,I-$.deltaY*.005),4))},[i]),x=()=>i===-1?"":`http://${Qn.serverAddress}${e[i].url.split("?")[0].replace(/\/$/,"")}?t=${f.current}`,y=b.useCallback(()=>i>0&&s(i-1),[i]),E=b.useCallback(()=>i<e.length-1&&s(i+1),[i,e.length]);return h.jsx(Mc,{open:i>-1,onClose:o,onKeyDown:w,onWheel:P,"aria-labelledby":"lightbox",children:h.jsxs(ke,{sx:{position:"absolute",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"100vw",height:"100vh",display:"flex",flexDirection:"column",justifyContent:"center",alignItems:"center"},onClick:o,children:[h.jsxs(ke,{sx:{display:"flex",alignItems:"center",p:2,backgroundColor:r.palette.background.paper,borderRadius:1,mb:1,mt:2},onClick:$=>{$.stopPropagation(),$.preventDefault()},children:[h.jsx(Mn,{onClick:y,disabled:i===0,size:"small",children:h.jsx(cT,{})}),h.jsx(Mn,{onClick:E,disabled:i===e.length-1,size:"small",children:h.jsx(uT,{})}),h.jsx(jg,{value:a,onChange:($,I)=>l(I),min:1,max:4,step:.1,sx:{mx:2,width:200}}),h.jsx(ke,{sx:{flexGrow:1}}),h.jsx(Mn,{onClick:o,size:"small",children:h.jsx(dT,{})})]}),h.jsx(ke,{sx:{flexGrow:1,overflow:"hidden",display:"flex",justifyContent:"center",alignItems:"center",cursor:a>1?"grab":"default","&:active":{cursor:a>1?"grabbing":"default"},"& img":{maxWidth:"100%",maxHeight:"100%",objectFit:"contain",p:0,m:0,transform:`scale(${a}) translate(${c.x/a}px, ${c.y/a}px)`,transition:u.current?"none":"transform 0.2s",pointerEvents:"none",imageRendering:"pixelated"}},onMouseDown:m,onMouseMove:g,onMouseUp:S,onMouseLeave:S,onClick:$=>{$.stopPropagation(),$.preventDefault()},children:i>-1&&h.jsx("img",{src:x(),alt:`${n} ${i}`,width:`${e[i].width}`,height:`${e[i].height}`})})]})})},(e,t)=>!(e.index!==t.index||!Xr(e.urls,t.urls))),fT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i})=>{typeof t=="string"&&(t=[{url:t,width:0,height:0}]);const s=t.length>1?"1288px":"auto",a=t.length>4?"1360px":"auto",l=(p,f)=>t.length===1||p/f>1.6?"100%":"50%",[c,d]=b.useState(-1),u=p=>{d(p)};return h.jsxs(h.Fragment,{children:[h.jsx(ke,{"data-key":e,sx:{width:s,height:"auto",maxWidth:"2048px",maxHeight:a,overflow:t.length>4?"auto":"hidden",mb:2,...n},className:`${t.length>4?"nowheel":""} ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:t.map(({url:p,width:f,height:m},g)=>h.jsx(ke,{sx:{width:l(Number(f),Number(m)),height:"auto",display:"block",float:"left","& img":{width:"100%",height:"auto",display:"block",p:.25,cursor:"pointer"}},children:h.jsx("img",{src:`http://${Qn.serverAddress}${p}`,alt:`${i} ${g}`,onClick:()=>u(g)})},`${e}-${g}`))}),h.jsx(pT,{urls:t,index:c,label:i||"",onClose:()=>d(-1)})]})},hT=b.lazy(()=>Kg(()=>import("./UIThreePreview-BuvM6dme.js"),__vite__mapDeps([0,1]))),gT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r})=>h.jsx(ke,{"data-key":e,sx:{p:0,m:0,mt:1,mb:1,...n},className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(b.Suspense,{fallback:h.jsx(ke,{sx:{display:"flex",justifyContent:"center",alignItems:"center",width:"768px",height:"768px"},children:h.jsx(Fc,{})}),children:h.jsx(hT,{value:t})})}),mT=st(h.jsx("path",{d:"M20 6h-8l-2-2H4c-1.1 0-1.99.9-1.99 2L2 18c0 1.1.9 2 2 2h16c1.1 0 2-.9 2-2V8c0-1.1-.9-2-2-2m0 12H4V8h16z"}),"FolderOpenOutlined"),yT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s})=>{const[a,l]=b.useState(!1),c=()=>{l(!0)},d=()=>{l(!1)};return h.jsxs(ke,{"data-key":e,sx:{...n},className:`${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:[h.jsxs(So,{direction:"row",spacing:1,sx:{"& > .MuiBox-root":{flex:"1"},"& > .flex-auto":{flex:"0 0 auto"},justifyContent:"center",alignItems:"stretch"},children:[h.jsx(li,{onChange:u=>s?.(e,u.target.value),variant:"outlined",type:"text",size:"small",fullWidth:!0,label:i,value:t,className:"nodrag",autoComplete:"off"}),h.jsx(Mn,{onClick:c,children:h.jsx(mT,{})})]}),h.jsx(dM,{open:a,onClose:d,"aria-labelledby":"file-browser-dialog",children:h.jsx(ke,{children:"Not yet implemented"})})]})},bT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i})=>{const s=St(),a=t.value;return h.jsxs(ke,{children:[h.jsx(Rt,{sx:{fontSize:13,color:s.palette.text.secondary,fontWeight:"bold"},children:i}),h.jsx(ke,{component:"pre","data-key":e,sx:{color:s.palette.text.secondary,backgroundColor:"#111",border:`1px solid ${s.palette.divider}`,borderRadius:1,padding:1,m:0,mb:1,...n},className:`${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Rt,{children:a})})]})},gs=e=>Object.entries(e.fields).map(([t,n])=>{const o=(n.display||"").toLowerCase(),r=e.parentDisabled?!1:n.disabled||!1,i=n.hidden||!1,s=n.style||{},a=n.label||t;if(o==="group"){const g=e.groups?.[t],S=g?g.disabled!==void 0?g.disabled:r:!1,w=g?g.hidden!==void 0?g.hidden:i:!1;return h.jsx(rE,{fieldKey:t,label:n.label,direction:n.direction,disabled:S,hidden:w,style:s,updateStore:e.updateStore,fields:n.params},t)}if(o==="collapse"){const g=e.groups?.[t],S=g?g.open!==void 0?g.open:n.open:!1,w=g?g.disabled!==void 0?g.disabled:r:!1,P=g?g.hidden!==void 0?g.hidden:i:!1;return h.jsx(J2,{fieldKey:t,open:S,label:n.label,disabled:w,hidden:P,style:s,updateStore:e.updateStore,fields:n.params},t)}const l=(Array.isArray(n.type)&&n.type.length>0?n.type[0]:n.type||"string").toLowerCase(),c=xT(o,l,n),d=n.value===void 0?n.default||"":n.value,u=n.options||[],p=n.no_validation||!1,f=typeof n.onChange=="string"?{action:n.onChange}:n.onChange||null,m={fieldKey:t,fieldType:c,dataType:l,label:a,value:d,style:s,hidden:i,disabled:r,options:u,no_validation:p,updateStore:e.updateStore,onChangeAction:f,icon:n.icon,min:n.min,max:n.max,step:n.step,source:n.source};return h.jsx(vT,{...m},t)}),vT=b.memo(e=>{switch(e.fieldType){case"input":case"output":return h.jsx(aE,{...e});case"number":case"slider":return h.jsx(PR,{...e});case"checkbox":case"switch":return h.jsx($P,{...e});case"autocomplete":return h.jsx(xR,{...e});case"select":return h.jsx(wR,{...e});case"textarea":return h.jsx(oT,{...e});case"icontoggle":return h.jsx(CR,{...e});case"range":return h.jsx(qR,{...e});case"tags":return h.jsx(rT,{...e});case"custom":return h.jsx(sT,{...e});case"filebrowser":return h.jsx(yT,{...e});case"ui_image":return h.jsx(fT,{...e});case"ui_dropdownicon":return h.jsx(lT,{...e});case"ui_3d":return h.jsx(gT,{...e});case"ui_text":return h.jsx(bT,{...e});default:return h.jsx(K$,{...e})}},(e,t)=>Xr(e.value,t.value)&&e.disabled===t.disabled&&e.hidden===t.hidden),xT=(e,t,n)=>{if(e==="input"||e==="output")return e;if(t==="boolean"||t==="bool")return e==="checkbox"||e==="icontoggle"?e:"switch";if(e==="ui"){if(t==="image")return"ui_image";if(t.toLowerCase()==="dropdownicon")return"ui_dropdownicon";if(t.toLowerCase()==="3d")return"ui_3d";if(t.toLowerCase()==="text")return"ui_text"}return e||(n.options&&typeof n.options=="object"?"select":t==="int"||t==="integer"||t==="float"||t==="number"?e==="slider"?"slider":"number":"text")},wT=b.memo(e=>{const t=St(),{setParam:n,setNodeExecuted:o}=Un(p=>({setParam:p.setParam,setNodeExecuted:p.setNodeExecuted}),Xn),r=pa(p=>p.nodeProgress[e.id]||{value:0,type:"determinate"},Xn),i=async()=>{const p=e.id;try{(await fetch("http://"+Qn.serverAddress+"/clearNodeCache",{method:"DELETE",body:JSON.stringify({nodeId:p})})).ok&&o(p,!1,0,0)}catch(f){console.error("Error clearing cache:",f)}},s=e.id,a=e.data.label,l=M2(e.data.params),c=e.data.style||{},d=(p,f,m)=>{n(s,p,f,m)},u=h.jsx(L1,{style:{backgroundColor:"transparent",border:"none"},minWidth:200,minHeight:8,children:h.jsx(P2,{sx:{position:"absolute",right:"-6px",bottom:"-6px",transform:"rotate(90deg)",width:"26px",height:"26px",backgroundColor:t.palette.background.default,borderRadius:"0",padding:"2px",color:t.palette.text.secondary}})});return h.jsxs(ke,{id:s,className:`${e.data.module}-${e.data.action} category-${e.data.category} module-${e.data.module}`,sx:{position:"relative",boxShadow:4,outlineOffset:"5px",borderRadius:"0",minWidth:"200px",...c},children:[e.data.resizable&&u,h.jsx(ke,{component:"header",sx:{color:t.palette.common.white,padding:1,borderTopWidth:"6px",borderTopStyle:"solid",borderTopColor:"rgba(0, 0, 0)",backgroundColor:t.palette.background.default,fontSize:"16px",textShadow:"0px 2px 0px rgba(0, 0, 0, 0.75)"},children:a}),h.jsx(ke,{sx:{backgroundColor:t.palette.background.paper,pl:1,pr:1,pt:1,pb:0,"& > .MuiBox-root":{pb:1.5},"& .MuiAccordionDetails-root > .MuiBox-root":{pb:1.5},"& .MuiStack-root > .MuiBox-root":{pb:1.5},"& .numberField > .MuiBox-root":{pb:0},"& .labelled-group":{pb:0}},children:h.jsx(gs,{fields:l,updateStore:d,groups:e.data.groups})}),h.jsxs(ke,{component:"footer",sx:{p:0,backgroundColor:t.palette.background.default},children:[h.jsx(ke,{sx:{width:"100%"},children:h.jsx($2,{variant:r.type==="indeterminate"?"indeterminate":"determinate",color:"inherit",value:r.value,className:r.type==="disabled"?"progress-disabled":"",sx:{height:"4px","&.progress-disabled":{"& .MuiLinearProgress-bar":{display:"none"}},"& .MuiLinearProgress-bar1Indeterminate":{background:`repeating-linear-gradient(45deg, ${t.palette.primary.main} 0, ${t.palette.primary.main} 20px, ${t.palette.primary.dark} 20px, ${t.palette.primary.dark} 40px)`,backgroundSize:"60px 100%",backgroundPosition:"0 0",left:"0",right:"0",animation:"mellon-progress-ind 1s linear infinite"},"& .MuiLinearProgress-bar1Determinate":{transitionDuration:"80ms",background:`linear-gradient(100deg, ${t.palette.primary.main} 50%, #ff4259 90%)`},"& .MuiLinearProgress-bar2Indeterminate":{display:"none",animation:"none"}}})}),h.jsx(ke,{sx:{p:1},children:h.jsxs(So,{direction:"row",spacing:2,sx:{justifyContent:"space-between",alignItems:"center",pr:e.data.resizable?2.5:0},children:[h.jsx(wl,{icon:h.jsx(g2,{}),label:"Cache",title:"Clear Cache",onClick:i,disabled:!e.data.cache,color:"secondary",variant:"filled",sx:{height:"24px",borderRadius:.5,fontSize:"12px",span:{padding:"0px 8px 0px 10px"},"& .MuiChip-icon":{fontSize:"18px"}}}),h.jsx(wl,{icon:h.jsx(m2,{}),label:e.data.time?`${e.data.time}s`:"-",title:"Execution Time",sx:{color:t.palette.text.secondary,height:"24px",borderRadius:.5,fontSize:"12px",span:{padding:"0px 8px 0px 10px"},backgroundColor:"rgba(255, 255, 255, 0.1)","& .MuiChip-icon":{fontSize:"18px",color:t.palette.text.secondary}}})]})})]})]})},(e,t)=>{if(e.data.time!==t.data.time||e.data.cache!==t.data.cache||!Xr(e.data.groups,t.data.groups))return!1;const n=e.data.params,o=t.data.params,r=Object.keys(n),i=Object.keys(o);if(r.length!==i.length||!r.every(s=>s in o))return!1;for(const s of r){const a=n[s],l=o[s];if(!Xr(a.value,l.value)||a.disabled!==l.disabled||a.hidden!==l.hidden)return!1}return!0}),ST={custom:wT},CT=e=>({nodes:e.nodes,edges:e.edges,onNodesChange:e.onNodesChange,onEdgesChange:e.onEdgesChange,onEdgeDoubleClick:e.onEdgeDoubleClick,onConnect:e.onConnect,addNode:e.addNode,getParam:e.getParam}),kT=e=>({nodeRegistry:e.nodeRegistry,updateNodeRegistry:e.updateNodeRegistry}),ET=e=>({connect:e.connect}),$T=[0,0];function PT(){const{nodes:e,edges:t,onNodesChange:n,onEdgesChange:o,onEdgeDoubleClick:r,onConnect:i,addNode:s,getParam:a}=Un(CT,Xn),{nodeRegistry:l,updateNodeRegistry:c}=ng(kT,Xn),{connect:d}=pa(ET,Xn),{screenToFlowPosition:u,setNodes:p,setEdges:f,setViewport:m}=ti();b.useEffect(()=>{const E=localStorage.getItem("workflow");if(E){const{nodes:$,edges:I}=JSON.parse(E);p($||[]),f(I||[])}c(),d("ws://"+Qn.serverAddress+"/ws")},[]);const g=(E,$)=>{const I=JSON.parse(localStorage.getItem("workflow")||"{}");I.viewport=$,localStorage.setItem("workflow",JSON.stringify(I))},S=E=>{E.preventDefault();const $=E.dataTransfer.files[0];if($?.type!=="application/json")return;const I=new FileReader;I.onload=M=>{const T=JSON.parse(M.target?.result),{x:v=0,y:A=0,zoom:L=1}=T.viewport;m({x:v,y:A,zoom:L}),p(T.nodes),f(T.edges)},I.readAsText($)},w=E=>{if(E.preventDefault(),E.dataTransfer.types.includes("Files")){E.dataTransfer.dropEffect="copy";return}E.dataTransfer.dropEffect="move"},P=E=>{if(E.preventDefault(),E.dataTransfer.files.length>0){S(E);return}if(!l)return;const $=E.dataTransfer.getData("text/plain");if(!$||!l[$])return;const I=l[$],M=u({x:E.clientX,y:E.clientY}),T={id:Cc(),type:"custom",position:M,data:I};s(T)},x=E=>{if(!E.sourceHandle||!E.targetHandle||E.source===E.target)return!1;let $=a(E.source,E.sourceHandle,"type"),I=a(E.target,E.targetHandle,"type");return $=Array.isArray($)?$:[$],$.push("any"),I=Array.isArray(I)?I:[I],!!$.some(M=>I.includes(M))},y=(()=>{const E=localStorage.getItem("workflow");if(E){const{viewport:$}=JSON.parse(E);if($)return $}return{x:0,y:0,zoom:1}})();return h.jsx(d1,{nodes:e,edges:t,nodeTypes:ST,onNodesChange:n,onEdgesChange:o,onEdgeDoubleClick:(E,$)=>r($.id),isValidConnection:x,onConnect:i,nodeOrigin:$T,onDragOver:w,onDrop:P,onMoveEnd:g,edgesReconnectable:!0,defaultViewport:y,minZoom:.1,maxZoom:1.2,proOptions:{hideAttribution:!0},deleteKeyCode:["Backspace","Delete"],children:h.jsx(m1,{variant:In.Dots,gap:16,size:1,color:"rgba(255, 255, 255, 0.3)"})})}const IT=st(h.jsx("path",{d:"M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14"}),"Search"),RT=260,MT=e=>({nodeRegistry:e.nodeRegistry}),hp=(e,t)=>{const n=Object.entries(t).reduce((o,[r,i])=>{const s=i[e]||"default";return o[s]||(o[s]=[]),o[s].push({key:r,...i}),o},{});return e!=="module"&&Object.keys(n).forEach(o=>{n[o].sort((r,i)=>(r.label||r.key).localeCompare(i.label||i.key))}),Object.fromEntries(Object.entries(n).sort(([o],[r])=>o.localeCompare(r)))};function TT(){const e=St(),{nodeRegistry:t}=ng(MT,Xn),[n,o]=b.useState(""),r=b.useMemo(()=>{const d=n.toLowerCase().split(/\s+/).filter(u=>u.length>0);return d.length===0?null:Object.keys(t).filter(u=>{const p=t[u].label.toLowerCase();return d.every(f=>p.includes(f))})},[t,n]),i=(d,u)=>{d.dataTransfer.setData("text/plain",u),d.dataTransfer.effectAllowed="move"},[s,a]=b.useState(0),l=(d,u)=>{a(u)},c=b.useMemo(()=>{const d=hp(s===0?"module":"category",t);return r?Object.fromEntries(Object.entries(d).map(([u,p])=>[u,p.filter(f=>r.includes(f.key))]).filter(([u,p])=>p.length>0)):d},[t,r,s]);return h.jsxs(ke,{className:"left-sidebar",textAlign:"center",sx:{width:RT,height:"100%",display:"flex",flexDirection:"column",backgroundColor:e.palette.background.paper,borderRight:`1px solid ${e.palette.divider}`},children:[h.jsx(ke,{sx:{p:1.5,borderBottom:`1px solid ${e.palette.divider}`},children:h.jsx(ba,{startAdornment:h.jsx(IT,{fontSize:"small",sx:{marginRight:1}}),id:"main-module-search",placeholder:"Search",size:"small",value:n,onChange:d=>o(d.target.value),sx:{width:"100%",fontSize:"14px"}})}),h.jsx(ke,{sx:{width:"100%"},children:h.jsxs(nT,{value:s,onChange:l,variant:"fullWidth",sx:{lineHeight:"16px",minHeight:0,borderBottom:`1px solid ${e.palette.divider}`,".MuiButtonBase-root":{textTransform:"none",lineHeight:"16px",minHeight:0}},children:[h.jsx(up,{label:"Modules"}),h.jsx(up,{label:"Categories"})]})}),h.jsx(ke,{sx:{flex:1,overflowY:"auto",p:0,m:0},children:h.jsx(ke,{sx:{p:0,pb:0,m:0},children:Object.entries(c).map(([d,u])=>h.jsxs(ag,{disableGutters:!0,sx:{borderBottom:`1px solid ${e.palette.divider}`,boxShadow:"none",backgroundColor:"#1a1a1a",fontSize:12,p:0,m:0,"&:before":{backgroundColor:"transparent"},".MuiAccordionSummary-root":{backgroundColor:"#1a1a1a","&:hover":{backgroundColor:"rgba(255, 255, 255, 0.1)"}},".MuiAccordionDetails-root":{backgroundColor:"#1a1a1a",padding:"8px 4px"}},children:[h.jsx(lg,{expandIcon:h.jsx(ug,{}),children:d.replace(/[_-]/g," ").replace(/\b\w/g,p=>p.toUpperCase())}),h.jsx(cg,{children:h.jsx(fg,{dense:!0,sx:{p:1.5,pt:0,pb:0,m:0},children:u.map(p=>h.jsx(EM,{draggable:!0,className:`${p.key} category-${p.category} module-${p.module}`,onDragStart:f=>i(f,p.key),sx:{outline:`1px solid ${e.palette.divider}`,borderRadius:1,boxShadow:3,m:0,mb:1,p:.5,pl:1,borderLeftWidth:"8px",borderLeftStyle:"solid",cursor:"grab",display:!r||r.includes(p.key)?"flex":"none"},children:h.jsx(RM,{primary:p.label||p.key,sx:{"& .MuiTypography-root":{fontSize:12}}})},p.key))})})]},d))})})]})}const AT=st(h.jsx("path",{d:"M8 5v14l11-7z"}),"PlayArrow"),NT=st(h.jsx("path",{d:"M19 9h-4V3H9v6H5l7 7zM5 18v2h14v-2z"}),"GetApp"),OT=st(h.jsx("path",{d:"M14 2H6c-1.1 0-1.99.9-1.99 2L4 20c0 1.1.89 2 1.99 2H18c1.1 0 2-.9 2-2V8zM6 20V4h7v5h5v11z"}),"InsertDriveFileOutlined");function LT(){const{setNodes:e,setEdges:t,toObject:n,setViewport:o}=ti(),r=St(),{exportGraph:i}=Un(u=>({exportGraph:u.exportGraph}),Xn),{sid:s,isConnected:a}=pa(u=>({sid:u.sid,isConnected:u.isConnected}),Xn),l=async()=>{if(!a){console.error("Not connected to WebSocket server");return}const u=i(s??"");console.info(u);try{await fetch("http://"+Qn.serverAddress+"/graph",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(u)})}catch(p){console.error("Error connecting to API server:",p)}},c=b.useCallback(()=>{const u=n(),p=JSON.stringify(u,null,2),f=new Blob([p],{type:"application/json"}),m=URL.createObjectURL(f),g=document.createElement("a");g.href=m,g.download="workflow.json",document.body.appendChild(g),g.click(),document.body.removeChild(g),URL.revokeObjectURL(m)},[n]),d=b.useCallback(()=>{e([]),t([]),localStorage.removeItem("workflow");const u={x:0,y:0,zoom:1};localStorage.setItem("workflow",JSON.stringify({nodes:[],edges:[],viewport:u})),o(u)},[e,t]);return h.jsx(ke,{sx:{backgroundColor:r.palette.background.paper,padding:1,borderBottom:`1px solid ${r.palette.divider}`},children:h.jsxs(So,{direction:"row",spacing:0,sx:{justifyContent:"space-between",alignItems:"center"},children:[h.jsxs(So,{direction:"row",spacing:0,sx:{justifyContent:"space-between",alignItems:"center"},children:[h.jsx(ke,{sx:{display:"flex",alignItems:"center",ml:3},children:h.jsx(cs,{children:h.jsx("svg",{viewBox:"0 0 28 12",style:{width:"40px",height:"100%",marginRight:"4px"},xmlSpace:"preserve",xmlns:"http://www.w3.org/2000/svg",children:h.jsx("path",{style:{fill:`${r.palette.primary.main}`},d:"M1.815 11.95c0-.08.421-.784.936-1.565 1.217-1.848 2.4-5.662 2.161-6.965-.29-1.577-1.831-1.974-3.759-.97-1.334.696-1.513.496-.524-.578C1.682.725 3.286.007 4.807 0 6.57-.008 7.485 1.07 7.149 2.866c-.07.373-.077.665-.052.682.026.018.683-.505 1.368-1.122C10.205.861 11.458.232 13.026.266c2.323.054 2.982 1.899 3.153 2.636l.233 1.008 1.067-1.027C19.471.963 21.347.29 22.372.233c1.025-.058 1.686.18 2.376.915 1.69 1.801 1.441 4.275-.753 7.237-.963 1.3-1.166 1.726-.822 1.724.56.082 2.803-.211 3.602-.475.801-.262 1.16-.602 1.22-.507.047.072-.253.528-.4.695-.388.431-1.228 1.447-3.416 1.87-1.432.276-3.066.272-7.87.011-5.772-.312-8.614-.405-13.131.207-.75.101-1.364.12-1.364.041zM7.704 9.96c5.39-.463 5.243-.537 5.872-1.863 1.538-3.246-.245-6.387-3.297-5.802-1.09.209-2.7 1.904-4.049 4.262a522.55 522.55 0 0 1-1.532 2.666c-.286.489-.418.888-.296.886.123 0 1.609-.004 3.302-.149zm14.219-.594c.924-.558 1.842-2.346 1.842-3.592 0-1.864-1.516-3.591-3.15-3.591-1.511 0-2.565.904-4.441 3.81-.958 1.483-1.918 2.724-2.028 2.877-.328.462.122.959 4.76 1.064 1.702.038 2.42-.209 3.017-.568z"})})})}),h.jsx(ke,{sx:{mr:3},children:h.jsx(Rt,{variant:"h6",sx:{fontSize:"20px",padding:"0px 4px"},children:"Mellon"})}),h.jsxs(ke,{children:[h.jsx(Wa,{variant:"text",startIcon:h.jsx(OT,{}),onClick:d,sx:{mr:1},children:"New"}),h.jsx(Wa,{variant:"text",startIcon:h.jsx(NT,{}),onClick:c,children:"Export"})]})]}),h.jsx(ke,{children:h.jsx(Wa,{variant:"contained",startIcon:h.jsx(AT,{}),onClick:l,disabled:!a,sx:{background:`linear-gradient(100deg, ${r.palette.primary.main} 25%, #ff4259 90%)`,"&.Mui-disabled":{background:"linear-gradient(100deg, #6a6a6a, #303030)",color:"#1a1a1a"}},children:"Run"})}),h.jsx(ke,{})]})})}const _T=ua({components:{MuiAccordionSummary:{styleOverrides:{root:{fontFamily:"JetBrains Mono"}}}},palette:{mode:"dark",primary:{main:"#ffb300"},secondary:{main:"#00695f"},background:{default:"#121212",paper:"#1a1a1a"}},typography:{fontSize:14,fontFamily:"JetBrains Mono"}});Zg(document.getElementById("root")).render(h.jsx(b.StrictMode,{children:h.jsxs(wk,{theme:_T,children:[h.jsx(Ik,{}),h.jsx(eh,{children:h.jsxs(ke,{sx:{display:"flex",flexDirection:"column",height:"100vh",width:"100vw",overflow:"hidden"},children:[h.jsx(LT,{}),h.jsxs(ke,{sx:{display:"flex",flex:1,minHeight:0,height:"100%"},children:[h.jsx(TT,{}),h.jsx(ke,{sx:{flex:1,height:"100%"},children:h.jsx(Lk,{children:h.jsx(PT,{})})})]})]})})]})}));export{Wa as B,So as S,Nc as a,Qn as c,Ve as u};
+      `:null,JI=e=>{const{classes:t,variant:n,color:o,disableShrink:r}=e,i={root:["root",n,`color${q(o)}`],svg:["svg"],circle:["circle",`circle${q(n)}`,r&&"circleDisableShrink"]};return Ie(i,qI,t)},QI=Y("span",{name:"MuiCircularProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`color${q(n.color)}`]]}})(ve(({theme:e})=>({display:"inline-block",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("transform")}},{props:{variant:"indeterminate"},style:KI||{animation:`${Ol} 1.4s linear infinite`}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}}))]}))),eR=Y("svg",{name:"MuiCircularProgress",slot:"Svg",overridesResolver:(e,t)=>t.svg})({display:"block"}),tR=Y("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.circle,t[`circle${q(n.variant)}`],n.disableShrink&&t.circleDisableShrink]}})(ve(({theme:e})=>({stroke:"currentColor",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("stroke-dashoffset")}},{props:{variant:"indeterminate"},style:{strokeDasharray:"80px, 200px",strokeDashoffset:0}},{props:({ownerState:t})=>t.variant==="indeterminate"&&!t.disableShrink,style:ZI||{animation:`${Ll} 1.4s ease-in-out infinite`}}]}))),Fc=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiCircularProgress"}),{className:r,color:i="primary",disableShrink:s=!1,size:a=40,style:l,thickness:c=3.6,value:d=0,variant:u="indeterminate",...p}=o,f={...o,color:i,disableShrink:s,size:a,thickness:c,value:d,variant:u},m=JI(f),g={},S={},w={};if(u==="determinate"){const P=2*Math.PI*((Hn-c)/2);g.strokeDasharray=P.toFixed(3),w["aria-valuenow"]=Math.round(d),g.strokeDashoffset=`${((100-d)/100*P).toFixed(3)}px`,S.transform="rotate(-90deg)"}return h.jsx(QI,{className:re(m.root,r),style:{width:a,height:a,...S,...l},ownerState:f,ref:n,role:"progressbar",...w,...p,children:h.jsx(eR,{className:m.svg,ownerState:f,viewBox:`${Hn/2} ${Hn/2} ${Hn} ${Hn}`,children:h.jsx(tR,{className:m.circle,style:g,ownerState:f,cx:Hn,cy:Hn,r:(Hn-c)/2,fill:"none",strokeWidth:c})})})});function nR(e){return Pe("MuiIconButton",e)}const ep=Ce("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge","loading","loadingIndicator","loadingWrapper"]),oR=e=>{const{classes:t,disabled:n,color:o,edge:r,size:i,loading:s}=e,a={root:["root",s&&"loading",n&&"disabled",o!=="default"&&`color${q(o)}`,r&&`edge${q(r)}`,`size${q(i)}`],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]};return Ie(a,nR,t)},rR=Y(Nn,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.loading&&t.loading,n.color!=="default"&&t[`color${q(n.color)}`],n.edge&&t[`edge${q(n.edge)}`],t[`size${q(n.size)}`]]}})(ve(({theme:e})=>({textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:8,borderRadius:"50%",color:(e.vars||e).palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),variants:[{props:t=>!t.disableRipple,style:{"--IconButton-hoverBg":e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.action.active,e.palette.action.hoverOpacity),"&:hover":{backgroundColor:"var(--IconButton-hoverBg)","@media (hover: none)":{backgroundColor:"transparent"}}}},{props:{edge:"start"},style:{marginLeft:-12}},{props:{edge:"start",size:"small"},style:{marginLeft:-3}},{props:{edge:"end"},style:{marginRight:-12}},{props:{edge:"end",size:"small"},style:{marginRight:-3}}]})),ve(({theme:e})=>({variants:[{props:{color:"inherit"},style:{color:"inherit"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}})),...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{"--IconButton-hoverBg":e.vars?`rgba(${(e.vars||e).palette[t].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He((e.vars||e).palette[t].main,e.palette.action.hoverOpacity)}})),{props:{size:"small"},style:{padding:5,fontSize:e.typography.pxToRem(18)}},{props:{size:"large"},style:{padding:12,fontSize:e.typography.pxToRem(28)}}],[`&.${ep.disabled}`]:{backgroundColor:"transparent",color:(e.vars||e).palette.action.disabled},[`&.${ep.loading}`]:{color:"transparent"}}))),iR=Y("span",{name:"MuiIconButton",slot:"LoadingIndicator",overridesResolver:(e,t)=>t.loadingIndicator})(({theme:e})=>({display:"none",position:"absolute",visibility:"visible",top:"50%",left:"50%",transform:"translate(-50%, -50%)",color:(e.vars||e).palette.action.disabled,variants:[{props:{loading:!0},style:{display:"flex"}}]})),Mn=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiIconButton"}),{edge:r=!1,children:i,className:s,color:a="default",disabled:l=!1,disableFocusRipple:c=!1,size:d="medium",id:u,loading:p=null,loadingIndicator:f,...m}=o,g=rr(u),S=f??h.jsx(Fc,{"aria-labelledby":g,color:"inherit",size:16}),w={...o,edge:r,color:a,disabled:l,disableFocusRipple:c,loading:p,loadingIndicator:S,size:d},P=oR(w);return h.jsxs(rR,{id:g,className:re(P.root,s),centerRipple:!0,focusRipple:!c,disabled:l||p,ref:n,...m,ownerState:w,children:[typeof p=="boolean"&&h.jsx("span",{className:P.loadingWrapper,style:{display:"contents"},children:h.jsx(iR,{className:P.loadingIndicator,ownerState:w,children:p&&S})}),i]})}),sR=st(h.jsx("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");function aR(e){return Pe("MuiAutocomplete",e)}const _e=Ce("MuiAutocomplete",["root","expanded","fullWidth","focused","focusVisible","tag","tagSizeSmall","tagSizeMedium","hasPopupIcon","hasClearIcon","inputRoot","input","inputFocused","endAdornment","clearIndicator","popupIndicator","popupIndicatorOpen","popper","popperDisablePortal","paper","listbox","loading","noOptions","option","groupLabel","groupUl"]);var tp,np;const lR=e=>{const{classes:t,disablePortal:n,expanded:o,focused:r,fullWidth:i,hasClearIcon:s,hasPopupIcon:a,inputFocused:l,popupOpen:c,size:d}=e,u={root:["root",o&&"expanded",r&&"focused",i&&"fullWidth",s&&"hasClearIcon",a&&"hasPopupIcon"],inputRoot:["inputRoot"],input:["input",l&&"inputFocused"],tag:["tag",`tagSize${q(d)}`],endAdornment:["endAdornment"],clearIndicator:["clearIndicator"],popupIndicator:["popupIndicator",c&&"popupIndicatorOpen"],popper:["popper",n&&"popperDisablePortal"],paper:["paper"],listbox:["listbox"],loading:["loading"],noOptions:["noOptions"],option:["option"],groupLabel:["groupLabel"],groupUl:["groupUl"]};return Ie(u,aR,t)},cR=Y("div",{name:"MuiAutocomplete",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{fullWidth:o,hasClearIcon:r,hasPopupIcon:i,inputFocused:s,size:a}=n;return[{[`& .${_e.tag}`]:t.tag},{[`& .${_e.tag}`]:t[`tagSize${q(a)}`]},{[`& .${_e.inputRoot}`]:t.inputRoot},{[`& .${_e.input}`]:t.input},{[`& .${_e.input}`]:s&&t.inputFocused},t.root,o&&t.fullWidth,i&&t.hasPopupIcon,r&&t.hasClearIcon]}})({[`&.${_e.focused} .${_e.clearIndicator}`]:{visibility:"visible"},"@media (pointer: fine)":{[`&:hover .${_e.clearIndicator}`]:{visibility:"visible"}},[`& .${_e.tag}`]:{margin:3,maxWidth:"calc(100% - 6px)"},[`& .${_e.inputRoot}`]:{[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:30},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:56},[`& .${_e.input}`]:{width:0,minWidth:30}},[`& .${Gn.root}`]:{paddingBottom:1,"& .MuiInput-input":{padding:"4px 4px 4px 0px"}},[`& .${Gn.root}.${Lt.sizeSmall}`]:{[`& .${Gn.input}`]:{padding:"2px 4px 3px 0"}},[`& .${Yt.root}`]:{padding:9,[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:39},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:65},[`& .${_e.input}`]:{padding:"7.5px 4px 7.5px 5px"},[`& .${_e.endAdornment}`]:{right:9}},[`& .${Yt.root}.${Lt.sizeSmall}`]:{paddingTop:6,paddingBottom:6,paddingLeft:6,[`& .${_e.input}`]:{padding:"2.5px 4px 2.5px 8px"}},[`& .${_t.root}`]:{paddingTop:19,paddingLeft:8,[`.${_e.hasPopupIcon}&, .${_e.hasClearIcon}&`]:{paddingRight:39},[`.${_e.hasPopupIcon}.${_e.hasClearIcon}&`]:{paddingRight:65},[`& .${_t.input}`]:{padding:"7px 4px"},[`& .${_e.endAdornment}`]:{right:9}},[`& .${_t.root}.${Lt.sizeSmall}`]:{paddingBottom:1,[`& .${_t.input}`]:{padding:"2.5px 4px"}},[`& .${Lt.hiddenLabel}`]:{paddingTop:8},[`& .${_t.root}.${Lt.hiddenLabel}`]:{paddingTop:0,paddingBottom:0,[`& .${_e.input}`]:{paddingTop:16,paddingBottom:17}},[`& .${_t.root}.${Lt.hiddenLabel}.${Lt.sizeSmall}`]:{[`& .${_e.input}`]:{paddingTop:8,paddingBottom:9}},[`& .${_e.input}`]:{flexGrow:1,textOverflow:"ellipsis",opacity:0},variants:[{props:{fullWidth:!0},style:{width:"100%"}},{props:{size:"small"},style:{[`& .${_e.tag}`]:{margin:2,maxWidth:"calc(100% - 4px)"}}},{props:{inputFocused:!0},style:{[`& .${_e.input}`]:{opacity:1}}},{props:{multiple:!0},style:{[`& .${_e.inputRoot}`]:{flexWrap:"wrap"}}}]}),uR=Y("div",{name:"MuiAutocomplete",slot:"EndAdornment",overridesResolver:(e,t)=>t.endAdornment})({position:"absolute",right:0,top:"50%",transform:"translate(0, -50%)"}),dR=Y(Mn,{name:"MuiAutocomplete",slot:"ClearIndicator",overridesResolver:(e,t)=>t.clearIndicator})({marginRight:-2,padding:4,visibility:"hidden"}),pR=Y(Mn,{name:"MuiAutocomplete",slot:"PopupIndicator",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.popupIndicator,n.popupOpen&&t.popupIndicatorOpen]}})({padding:2,marginRight:-2,variants:[{props:{popupOpen:!0},style:{transform:"rotate(180deg)"}}]}),fR=Y(Og,{name:"MuiAutocomplete",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${_e.option}`]:t.option},t.popper,n.disablePortal&&t.popperDisablePortal]}})(ve(({theme:e})=>({zIndex:(e.vars||e).zIndex.modal,variants:[{props:{disablePortal:!0},style:{position:"absolute"}}]}))),hR=Y(sr,{name:"MuiAutocomplete",slot:"Paper",overridesResolver:(e,t)=>t.paper})(ve(({theme:e})=>({...e.typography.body1,overflow:"auto"}))),gR=Y("div",{name:"MuiAutocomplete",slot:"Loading",overridesResolver:(e,t)=>t.loading})(ve(({theme:e})=>({color:(e.vars||e).palette.text.secondary,padding:"14px 16px"}))),mR=Y("div",{name:"MuiAutocomplete",slot:"NoOptions",overridesResolver:(e,t)=>t.noOptions})(ve(({theme:e})=>({color:(e.vars||e).palette.text.secondary,padding:"14px 16px"}))),yR=Y("ul",{name:"MuiAutocomplete",slot:"Listbox",overridesResolver:(e,t)=>t.listbox})(ve(({theme:e})=>({listStyle:"none",margin:0,padding:"8px 0",maxHeight:"40vh",overflow:"auto",position:"relative",[`& .${_e.option}`]:{minHeight:48,display:"flex",overflow:"hidden",justifyContent:"flex-start",alignItems:"center",cursor:"pointer",paddingTop:6,boxSizing:"border-box",outline:"0",WebkitTapHighlightColor:"transparent",paddingBottom:6,paddingLeft:16,paddingRight:16,[e.breakpoints.up("sm")]:{minHeight:"auto"},[`&.${_e.focused}`]:{backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},'&[aria-disabled="true"]':{opacity:(e.vars||e).palette.action.disabledOpacity,pointerEvents:"none"},[`&.${_e.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},'&[aria-selected="true"]':{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity),[`&.${_e.focused}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:(e.vars||e).palette.action.selected}},[`&.${_e.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}}}}))),bR=Y(Nl,{name:"MuiAutocomplete",slot:"GroupLabel",overridesResolver:(e,t)=>t.groupLabel})(ve(({theme:e})=>({backgroundColor:(e.vars||e).palette.background.paper,top:-8}))),vR=Y("ul",{name:"MuiAutocomplete",slot:"GroupUl",overridesResolver:(e,t)=>t.groupUl})({padding:0,[`& .${_e.option}`]:{paddingLeft:24}}),Lg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiAutocomplete"}),{autoComplete:r=!1,autoHighlight:i=!1,autoSelect:s=!1,blurOnSelect:a=!1,ChipProps:l,className:c,clearIcon:d=tp||(tp=h.jsx(sR,{fontSize:"small"})),clearOnBlur:u=!o.freeSolo,clearOnEscape:p=!1,clearText:f="Clear",closeText:m="Close",componentsProps:g,defaultValue:S=o.multiple?[]:null,disableClearable:w=!1,disableCloseOnSelect:P=!1,disabled:x=!1,disabledItemsFocusable:y=!1,disableListWrap:E=!1,disablePortal:$=!1,filterOptions:I,filterSelectedOptions:M=!1,forcePopupIcon:T="auto",freeSolo:v=!1,fullWidth:A=!1,getLimitTagsText:L=We=>`+${We}`,getOptionDisabled:_,getOptionKey:C,getOptionLabel:R,isOptionEqualToValue:k,groupBy:N,handleHomeEndKeys:j=!o.freeSolo,id:O,includeInputInList:B=!1,inputValue:z,limitTags:G=-1,ListboxComponent:Z,ListboxProps:K,loading:V=!1,loadingText:F="Loading…",multiple:te=!1,noOptionsText:D="No options",onChange:ne,onClose:oe,onHighlightChange:ie,onInputChange:X,onOpen:se,open:ae,openOnFocus:ge=!1,openText:le="Open",options:ye,PaperComponent:he,PopperComponent:je,popupIcon:Ee=np||(np=h.jsx(Sg,{})),readOnly:Ae=!1,renderGroup:ce,renderInput:Re,renderOption:$e,renderTags:J,selectOnFocus:ee=!o.freeSolo,size:fe="medium",slots:be={},slotProps:de={},value:xe,...Se}=o,{getRootProps:Ye,getInputProps:Fe,getInputLabelProps:ue,getPopupIndicatorProps:Q,getClearProps:pe,getTagProps:Me,getListboxProps:Oe,getOptionProps:ze,value:et,dirty:ft,expanded:De,id:qe,popupOpen:xt,focused:Vt,focusedTag:Ct,anchorEl:Bn,setAnchorEl:ar,inputValue:ko,groupedOptions:zn}=TP({...o,componentName:"Autocomplete"}),no=!w&&!x&&ft&&!Ae,oo=(!v||T===!0)&&T!==!1,{onMouseDown:lr}=Fe(),{ref:cr,...Eo}=Oe(),ro=R||(We=>We.label??We),mt={...o,disablePortal:$,expanded:De,focused:Vt,fullWidth:A,getOptionLabel:ro,hasClearIcon:no,hasPopupIcon:oo,inputFocused:Ct===-1,popupOpen:xt,size:fe},lt=lR(mt),Ut={slots:{paper:he,popper:je,...be},slotProps:{chip:l,listbox:K,...g,...de}},[U,W]=ot("listbox",{elementType:yR,externalForwardedProps:Ut,ownerState:mt,className:lt.listbox,additionalProps:Eo,ref:cr}),[me,Ne]=ot("paper",{elementType:sr,externalForwardedProps:Ut,ownerState:mt,className:lt.paper}),[Le,tt]=ot("popper",{elementType:Og,externalForwardedProps:Ut,ownerState:mt,className:lt.popper,additionalProps:{disablePortal:$,style:{width:Bn?Bn.clientWidth:null},role:"presentation",anchorEl:Bn,open:xt}});let Ue;if(te&&et.length>0){const We=Gt=>({className:lt.tag,disabled:x,...Me(Gt)});J?Ue=J(et,We,mt):Ue=et.map((Gt,rn)=>{const{key:so,...wa}=We({index:rn});return h.jsx(wl,{label:ro(Gt),size:fe,...wa,...Ut.slotProps.chip},so)})}if(G>-1&&Array.isArray(Ue)){const We=Ue.length-G;!Vt&&We>0&&(Ue=Ue.splice(0,G),Ue.push(h.jsx("span",{className:lt.tag,children:L(We)},Ue.length)))}const io=ce||(We=>h.jsxs("li",{children:[h.jsx(bR,{className:lt.groupLabel,ownerState:mt,component:"div",children:We.group}),h.jsx(vR,{className:lt.groupUl,ownerState:mt,children:We.children})]},We.key)),xa=$e||((We,Gt)=>{const{key:rn,...so}=We;return h.jsx("li",{...so,children:ro(Gt)},rn)}),pi=(We,Gt)=>{const rn=ze({option:We,index:Gt});return xa({...rn,className:lt.option},We,{selected:rn["aria-selected"],index:Gt,inputValue:ko},mt)},fi=Ut.slotProps.clearIndicator,hi=Ut.slotProps.popupIndicator;return h.jsxs(b.Fragment,{children:[h.jsx(cR,{ref:n,className:re(lt.root,c),ownerState:mt,...Ye(Se),children:Re({id:qe,disabled:x,fullWidth:!0,size:fe==="small"?"small":void 0,InputLabelProps:ue(),InputProps:{ref:ar,className:lt.inputRoot,startAdornment:Ue,onMouseDown:We=>{We.target===We.currentTarget&&lr(We)},...(no||oo)&&{endAdornment:h.jsxs(uR,{className:lt.endAdornment,ownerState:mt,children:[no?h.jsx(dR,{...pe(),"aria-label":f,title:f,ownerState:mt,...fi,className:re(lt.clearIndicator,fi?.className),children:d}):null,oo?h.jsx(pR,{...Q(),disabled:x,"aria-label":xt?m:le,title:xt?m:le,ownerState:mt,...hi,className:re(lt.popupIndicator,hi?.className),children:Ee}):null]})}},inputProps:{className:lt.input,disabled:x,readOnly:Ae,...Fe()}})}),Bn?h.jsx(fR,{as:Le,...tt,children:h.jsxs(hR,{as:me,...Ne,children:[V&&zn.length===0?h.jsx(gR,{className:lt.loading,ownerState:mt,children:F}):null,zn.length===0&&!v&&!V?h.jsx(mR,{className:lt.noOptions,ownerState:mt,role:"presentation",onMouseDown:We=>{We.preventDefault()},children:D}):null,zn.length>0?h.jsx(U,{as:Z,...W,children:zn.map((We,Gt)=>N?io({key:We.key,group:We.group,children:We.options.map((rn,so)=>pi(rn,We.index+so))}):pi(We,Gt))}):null]})}):null]})}),xR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,no_validation:s,options:a,updateStore:l})=>h.jsx(ke,{"data-key":e,sx:{minWidth:"320px",...n},className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Lg,{disablePortal:!0,freeSolo:s,options:a,renderInput:c=>h.jsx(li,{...c,label:i}),onChange:(c,d)=>l?.(e,d),value:t,size:"small",sx:{"& + .MuiAutocomplete-popper .MuiAutocomplete-option":{fontSize:"12px"}}})}),wR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,options:s,updateStore:a,onChangeAction:l})=>{const c=(u,p)=>{Object.entries(p).forEach(([f,m])=>{const g=f!==u;m&&(Array.isArray(m)||(m=[m]),m.forEach(S=>{S.endsWith("_group")?a?.(S,{hidden:g},"group"):a?.(S,g,"hidden")}))})},d=Array.isArray(s)?s.map((u,p)=>h.jsx("option",{value:u,children:u},`${e}-${p}`)):Object.entries(s).map(([u,p])=>h.jsx("option",{value:u,children:typeof p=="object"?p.label:p},`${e}-${u}`));return b.useEffect(()=>{l?.action==="show"&&c(t,l?.target)},[t]),h.jsx(ke,{"data-key":e,className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsxs(pg,{fullWidth:!0,children:[h.jsx(dg,{children:i}),h.jsx(Nc,{fullWidth:!0,size:"small",label:i,value:t||"",native:!0,onChange:u=>a?.(e,u.target.value),children:d})]})})},SR=st(h.jsx("path",{d:"M7.5 5.6 10 7 8.6 4.5 10 2 7.5 3.4 5 2l1.4 2.5L5 7zm12 9.8L17 14l1.4 2.5L17 19l2.5-1.4L22 19l-1.4-2.5L22 14zM22 2l-2.5 1.4L17 2l1.4 2.5L17 7l2.5-1.4L22 7l-1.4-2.5zm-7.63 5.29a.996.996 0 0 0-1.41 0L1.29 18.96c-.39.39-.39 1.02 0 1.41l2.34 2.34c.39.39 1.02.39 1.41 0L16.7 11.05c.39-.39.39-1.02 0-1.41zm-1.03 5.49-2.12-2.12 2.44-2.44 2.12 2.12z"}),"AutoFixHigh"),CR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,icon:s,onChangeAction:a,updateStore:l})=>{const c=St(),d={random:h.jsx(SR,{})},u={icon:d[s],checkedIcon:d[s]},p=(f,m)=>{const g=Array.isArray(m.true)?m.true:[m.true],S=Array.isArray(m.false)?m.false:[m.false];g.forEach(w=>{l?.(w,f,"disabled")}),S.forEach(w=>{l?.(w,!f,"disabled")})};return b.useEffect(()=>{a&&a.action==="disable"&&p(t,a.target)},[t]),h.jsx(ke,{"data-key":e,className:`flex-auto nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsx(kg,{size:"small",...u,checked:t,title:i,onChange:f=>l?.(e,f.target.checked),disableRipple:!0,sx:{p:1.1,m:0,border:1,borderRadius:1,borderColor:"rgba(255,255,255,0.25)","&.Mui-checked":{backgroundColor:c.palette.secondary.main,color:c.palette.background.paper,borderColor:c.palette.secondary.main}}})})},kR=st(h.jsx("path",{d:"M15.41 7.41 14 6l-6 6 6 6 1.41-1.41L10.83 12z"}),"ChevronLeft"),ER=st(h.jsx("path",{d:"M10 6 8.59 7.41 13.17 12l-4.58 4.59L10 18l6-6z"}),"ChevronRight"),$R=e=>{if(!e)return 1;const t=e.toString();if(t.includes("e-")){const[o,r]=t.split("e-");return(o.includes(".")?o.split(".")[1].length:0)+Number(r)}const n=t.split(".")[1];return n?n.length:0},PR=({fieldKey:e,fieldType:t,dataType:n,value:o,style:r,disabled:i,hidden:s,label:a,min:l,max:c,step:d,updateStore:u})=>{const p=St(),f=b.useRef(),m=b.useRef({x:0,value:0}),g=b.useRef(!1),[S,w]=b.useState(!1),P=t==="slider"&&l!==void 0&&c!==void 0,x=l!==void 0?l:-Number.MAX_SAFE_INTEGER,y=c!==void 0?c:Number.MAX_SAFE_INTEGER,E=n==="float"?$R(d):0,$=d!==void 0?d:n==="float"?.1:1,I=k=>{if(S)return k;const N=isNaN(Number(k))?0:Number(k);return Math.min(y,Math.max(x,N)).toFixed(E)},M=I(o||0),T=()=>{if(!P)return{};const k=isNaN(Number(M))?0:(Number(M)-x)/(y-x)*100;return{background:`linear-gradient(to right, rgba(255,255,255,0.15) ${k}%, rgba(255,255,255,0.0) ${k}%)`}},v=k=>{k.preventDefault(),k.stopPropagation();const N=k.clientX-m.current.x;if(Math.abs(N)<2)return;g.current||(g.current=!0);const j=f.current;document.activeElement===j&&(j?.blur(),w(!1));const B=(y-x)/$||100,z=P?B/250*N:N,G=m.current.value+z*$;u?.(e,I(G))},A=k=>{document.removeEventListener("mousemove",v),document.removeEventListener("mouseup",A);const N=k.target.closest(".numberField"),j=k.target.closest("button");if(N&&P&&!g.current&&!j){const O=N.getBoundingClientRect(),B=k.clientX-O.left,z=Math.max(0,Math.min(1,B/O.width)),G=I(x+(y-x)*z);u?.(e,G)}g.current=!1},L=k=>{k.preventDefault(),k.stopPropagation(),k.button===0&&(S||(document.activeElement?.blur(),m.current={x:k.clientX,value:Number(M)},document.addEventListener("mousemove",v),document.addEventListener("mouseup",A)))},_=()=>{const k=f.current;if(w(!1),!k)return;Number(k.value)!==Number(M)&&u?.(e,I(k.value));const N=k.value;u?.(e,I(" "+N)),u?.(e,I(N)),k.removeEventListener("keydown",C)},C=k=>{const N=f.current;if(N){if(k.key==="Enter"||k.key==="Escape")N.removeEventListener("keydown",C),w(!1),u?.(e,I(N.value||"")),N.blur();else if(k.key==="ArrowUp"){k.preventDefault();const j=Math.min(y,Math.max(x,Number(N.value)+$)).toFixed(E);N.value=String(j),u?.(e,j)}else if(k.key==="ArrowDown"){k.preventDefault();const j=Math.min(y,Math.max(x,Number(N.value)-$)).toFixed(E);N.value=String(j),u?.(e,j)}}},R=k=>{if(k.target.closest("button"))return;const N=f.current;N&&(N.focus(),N.select(),w(!0),N.addEventListener("keydown",C))};return b.useEffect(()=>{const k=f.current;return k===document.activeElement?(k.focus(),w(!0)):(k?.blur(),w(!1)),()=>{document.removeEventListener("mousemove",v),document.removeEventListener("mouseup",A);const N=f.current;N&&N.removeEventListener("keydown",C)}},[S,f]),h.jsx(ke,{className:`${s?"mellon-hidden":""} ${i?"mellon-disabled":""}`,children:h.jsxs(So,{"data-key":e,direction:"row",spacing:.5,className:"numberField nodrag",onMouseDown:L,onDoubleClick:R,sx:{mb:0,p:.6,width:"100%",justifyContent:"space-between",alignItems:"center",borderRadius:1,overflow:"hidden",userSelect:"none",cursor:"default",outline:S?`2px solid ${p.palette.primary.main}`:"1px solid #4f4f4f","&:hover":{outline:S?`2px solid ${p.palette.primary.main}`:`1px solid ${p.palette.common.white}`},...T(),...r},children:[h.jsx(Mn,{size:"small",disableRipple:!0,onClick:()=>{f.current?.blur(),u?.(e,I(Number(f.current?.value)-$))},sx:{p:.5,borderRadius:1,opacity:Number(M)<=x?.4:1,"&:hover":{background:Number(M)<=x?"":"rgba(255,255,255,0.15)"}},children:h.jsx(kR,{fontSize:"small"})}),h.jsx(ke,{sx:{maxWidth:"50%",pointerEvents:"none"},children:h.jsx(Rt,{sx:{fontSize:13,color:p.palette.text.secondary,textOverflow:"ellipsis",overflow:"hidden",whiteSpace:"nowrap"},title:a,children:a})}),h.jsx(ya,{inputRef:f,value:M,size:"small",onChange:k=>u?.(e,I(k.target.value)),onBlur:_,sx:{flexGrow:1,pointerEvents:"none"},slotProps:{input:{sx:{textAlign:"right",p:0,cursor:"default"}}}}),h.jsx(Mn,{size:"small",disableRipple:!0,onClick:()=>{f.current?.blur(),u?.(e,I(Number(f.current?.value)+$))},sx:{p:.5,borderRadius:1,opacity:Number(M)>=y?.4:1,"&:hover":{background:Number(M)>=y?"":"rgba(255,255,255,0.15)"}},children:h.jsx(ER,{fontSize:"small"})})]})})};function IR(e,t,n=(o,r)=>o===r){return e.length===t.length&&e.every((o,r)=>n(o,t[r]))}const RR=2;function Ao(e,t,n,o,r){return n===1?Math.min(e+t,r):Math.max(e-t,o)}function _g(e,t){return e-t}function op(e,t){const{index:n}=e.reduce((o,r,i)=>{const s=Math.abs(t-r);return o===null||s<o.distance||s===o.distance?{distance:s,index:i}:o},null)??{};return n}function Ni(e,t){if(t.current!==void 0&&e.changedTouches){const n=e;for(let o=0;o<n.changedTouches.length;o+=1){const r=n.changedTouches[o];if(r.identifier===t.current)return{x:r.clientX,y:r.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function hs(e,t,n){return(e-t)*100/(n-t)}function MR(e,t,n){return(n-t)*e+t}function TR(e){if(Math.abs(e)<1){const n=e.toExponential().split("e-"),o=n[0].split(".")[1];return(o?o.length:0)+parseInt(n[1],10)}const t=e.toString().split(".")[1];return t?t.length:0}function AR(e,t,n){const o=Math.round((e-n)/t)*t+n;return Number(o.toFixed(TR(t)))}function rp({values:e,newValue:t,index:n}){const o=e.slice();return o[n]=t,o.sort(_g)}function Oi({sliderRef:e,activeIndex:t,setActive:n}){const o=bt(e.current);(!e.current?.contains(o.activeElement)||Number(o?.activeElement?.getAttribute("data-index"))!==t)&&e.current?.querySelector(`[type="range"][data-index="${t}"]`).focus(),n&&n(t)}function Li(e,t){return typeof e=="number"&&typeof t=="number"?e===t:typeof e=="object"&&typeof t=="object"?IR(e,t):!1}const NR={horizontal:{offset:e=>({left:`${e}%`}),leap:e=>({width:`${e}%`})},"horizontal-reverse":{offset:e=>({right:`${e}%`}),leap:e=>({width:`${e}%`})},vertical:{offset:e=>({bottom:`${e}%`}),leap:e=>({height:`${e}%`})}},OR=e=>e;let _i;function ip(){return _i===void 0&&(typeof CSS<"u"&&typeof CSS.supports=="function"?_i=CSS.supports("touch-action","none"):_i=!0),_i}function LR(e){const{"aria-labelledby":t,defaultValue:n,disabled:o=!1,disableSwap:r=!1,isRtl:i=!1,marks:s=!1,max:a=100,min:l=0,name:c,onChange:d,onChangeCommitted:u,orientation:p="horizontal",rootRef:f,scale:m=OR,step:g=1,shiftStep:S=10,tabIndex:w,value:P}=e,x=b.useRef(void 0),[y,E]=b.useState(-1),[$,I]=b.useState(-1),[M,T]=b.useState(!1),v=b.useRef(0),A=b.useRef(null),[L,_]=Yn({controlled:P,default:n??l,name:"Slider"}),C=d&&((J,ee,fe)=>{const be=J.nativeEvent||J,de=new be.constructor(be.type,be);Object.defineProperty(de,"target",{writable:!0,value:{value:ee,name:c}}),A.current=ee,d(de,ee,fe)}),R=Array.isArray(L);let k=R?L.slice().sort(_g):[L];k=k.map(J=>J==null?l:No(J,l,a));const N=s===!0&&g!==null?[...Array(Math.floor((a-l)/g)+1)].map((J,ee)=>({value:l+g*ee})):s||[],j=N.map(J=>J.value),[O,B]=b.useState(-1),z=b.useRef(null),G=at(f,z),Z=J=>ee=>{const fe=Number(ee.currentTarget.getAttribute("data-index"));ls(ee.target)&&B(fe),I(fe),J?.onFocus?.(ee)},K=J=>ee=>{ls(ee.target)||B(-1),I(-1),J?.onBlur?.(ee)},V=(J,ee)=>{const fe=Number(J.currentTarget.getAttribute("data-index")),be=k[fe],de=j.indexOf(be);let xe=ee;if(N&&g==null){const Se=j[j.length-1];xe>Se?xe=Se:xe<j[0]?xe=j[0]:xe=xe<be?j[de-1]:j[de+1]}if(xe=No(xe,l,a),R){r&&(xe=No(xe,k[fe-1]||-1/0,k[fe+1]||1/0));const Se=xe;xe=rp({values:k,newValue:xe,index:fe});let Ye=fe;r||(Ye=xe.indexOf(Se)),Oi({sliderRef:z,activeIndex:Ye})}_(xe),B(fe),C&&!Li(xe,L)&&C(J,xe,fe),u&&u(J,A.current??xe)},F=J=>ee=>{if(["ArrowUp","ArrowDown","ArrowLeft","ArrowRight","PageUp","PageDown","Home","End"].includes(ee.key)){ee.preventDefault();const fe=Number(ee.currentTarget.getAttribute("data-index")),be=k[fe];let de=null;if(g!=null){const xe=ee.shiftKey?S:g;switch(ee.key){case"ArrowUp":de=Ao(be,xe,1,l,a);break;case"ArrowRight":de=Ao(be,xe,i?-1:1,l,a);break;case"ArrowDown":de=Ao(be,xe,-1,l,a);break;case"ArrowLeft":de=Ao(be,xe,i?1:-1,l,a);break;case"PageUp":de=Ao(be,S,1,l,a);break;case"PageDown":de=Ao(be,S,-1,l,a);break;case"Home":de=l;break;case"End":de=a;break}}else if(N){const xe=j[j.length-1],Se=j.indexOf(be),Ye=[i?"ArrowRight":"ArrowLeft","ArrowDown","PageDown","Home"],Fe=[i?"ArrowLeft":"ArrowRight","ArrowUp","PageUp","End"];Ye.includes(ee.key)?Se===0?de=j[0]:de=j[Se-1]:Fe.includes(ee.key)&&(Se===j.length-1?de=xe:de=j[Se+1])}de!=null&&V(ee,de)}J?.onKeyDown?.(ee)};Ft(()=>{o&&z.current.contains(document.activeElement)&&document.activeElement?.blur()},[o]),o&&y!==-1&&E(-1),o&&O!==-1&&B(-1);const te=J=>ee=>{J.onChange?.(ee),V(ee,ee.target.valueAsNumber)},D=b.useRef(void 0);let ne=p;i&&p==="horizontal"&&(ne+="-reverse");const oe=({finger:J,move:ee=!1})=>{const{current:fe}=z,{width:be,height:de,bottom:xe,left:Se}=fe.getBoundingClientRect();let Ye;ne.startsWith("vertical")?Ye=(xe-J.y)/de:Ye=(J.x-Se)/be,ne.includes("-reverse")&&(Ye=1-Ye);let Fe;if(Fe=MR(Ye,l,a),g)Fe=AR(Fe,g,l);else{const Q=op(j,Fe);Fe=j[Q]}Fe=No(Fe,l,a);let ue=0;if(R){ee?ue=D.current:ue=op(k,Fe),r&&(Fe=No(Fe,k[ue-1]||-1/0,k[ue+1]||1/0));const Q=Fe;Fe=rp({values:k,newValue:Fe,index:ue}),r&&ee||(ue=Fe.indexOf(Q),D.current=ue)}return{newValue:Fe,activeIndex:ue}},ie=Et(J=>{const ee=Ni(J,x);if(!ee)return;if(v.current+=1,J.type==="mousemove"&&J.buttons===0){X(J);return}const{newValue:fe,activeIndex:be}=oe({finger:ee,move:!0});Oi({sliderRef:z,activeIndex:be,setActive:E}),_(fe),!M&&v.current>RR&&T(!0),C&&!Li(fe,L)&&C(J,fe,be)}),X=Et(J=>{const ee=Ni(J,x);if(T(!1),!ee)return;const{newValue:fe}=oe({finger:ee,move:!0});E(-1),J.type==="touchend"&&I(-1),u&&u(J,A.current??fe),x.current=void 0,ae()}),se=Et(J=>{if(o)return;ip()||J.preventDefault();const ee=J.changedTouches[0];ee!=null&&(x.current=ee.identifier);const fe=Ni(J,x);if(fe!==!1){const{newValue:de,activeIndex:xe}=oe({finger:fe});Oi({sliderRef:z,activeIndex:xe,setActive:E}),_(de),C&&!Li(de,L)&&C(J,de,xe)}v.current=0;const be=bt(z.current);be.addEventListener("touchmove",ie,{passive:!0}),be.addEventListener("touchend",X,{passive:!0})}),ae=b.useCallback(()=>{const J=bt(z.current);J.removeEventListener("mousemove",ie),J.removeEventListener("mouseup",X),J.removeEventListener("touchmove",ie),J.removeEventListener("touchend",X)},[X,ie]);b.useEffect(()=>{const{current:J}=z;return J.addEventListener("touchstart",se,{passive:ip()}),()=>{J.removeEventListener("touchstart",se),ae()}},[ae,se]),b.useEffect(()=>{o&&ae()},[o,ae]);const ge=J=>ee=>{if(J.onMouseDown?.(ee),o||ee.defaultPrevented||ee.button!==0)return;ee.preventDefault();const fe=Ni(ee,x);if(fe!==!1){const{newValue:de,activeIndex:xe}=oe({finger:fe});Oi({sliderRef:z,activeIndex:xe,setActive:E}),_(de),C&&!Li(de,L)&&C(ee,de,xe)}v.current=0;const be=bt(z.current);be.addEventListener("mousemove",ie,{passive:!0}),be.addEventListener("mouseup",X)},le=hs(R?k[0]:l,l,a),ye=hs(k[k.length-1],l,a)-le,he=(J={})=>{const ee=Pr(J),fe={onMouseDown:ge(ee||{})},be={...ee,...fe};return{...J,ref:G,...be}},je=J=>ee=>{J.onMouseOver?.(ee);const fe=Number(ee.currentTarget.getAttribute("data-index"));I(fe)},Ee=J=>ee=>{J.onMouseLeave?.(ee),I(-1)},Ae=(J={})=>{const ee=Pr(J),fe={onMouseOver:je(ee||{}),onMouseLeave:Ee(ee||{})};return{...J,...ee,...fe}},ce=J=>({pointerEvents:y!==-1&&y!==J?"none":void 0});let Re;return p==="vertical"&&(Re=i?"vertical-rl":"vertical-lr"),{active:y,axis:ne,axisProps:NR,dragging:M,focusedThumbIndex:O,getHiddenInputProps:(J={})=>{const ee=Pr(J),fe={onChange:te(ee||{}),onFocus:Z(ee||{}),onBlur:K(ee||{}),onKeyDown:F(ee||{})},be={...ee,...fe};return{tabIndex:w,"aria-labelledby":t,"aria-orientation":p,"aria-valuemax":m(a),"aria-valuemin":m(l),name:c,type:"range",min:e.min,max:e.max,step:e.step===null&&e.marks?"any":e.step??void 0,disabled:o,...J,...be,style:{...gC,direction:i?"rtl":"ltr",width:"100%",height:"100%",writingMode:Re}}},getRootProps:he,getThumbProps:Ae,marks:N,open:$,range:R,rootRef:G,trackLeap:ye,trackOffset:le,values:k,getThumbStyle:ce}}const _R=e=>!e||!Rn(e);function jR(e){return Pe("MuiSlider",e)}const Jt=Ce("MuiSlider",["root","active","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","disabled","dragging","focusVisible","mark","markActive","marked","markLabel","markLabelActive","rail","sizeSmall","thumb","thumbColorPrimary","thumbColorSecondary","thumbColorError","thumbColorSuccess","thumbColorInfo","thumbColorWarning","track","trackInverted","trackFalse","thumbSizeSmall","valueLabel","valueLabelOpen","valueLabelCircle","valueLabelLabel","vertical"]),BR=e=>{const{open:t}=e;return{offset:re(t&&Jt.valueLabelOpen),circle:Jt.valueLabelCircle,label:Jt.valueLabelLabel}};function zR(e){const{children:t,className:n,value:o}=e,r=BR(e);return t?b.cloneElement(t,{className:re(t.props.className)},h.jsxs(b.Fragment,{children:[t.props.children,h.jsx("span",{className:re(r.offset,n),"aria-hidden":!0,children:h.jsx("span",{className:r.circle,children:h.jsx("span",{className:r.label,children:o})})})]})):null}function sp(e){return e}const DR=Y("span",{name:"MuiSlider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`color${q(n.color)}`],n.size!=="medium"&&t[`size${q(n.size)}`],n.marked&&t.marked,n.orientation==="vertical"&&t.vertical,n.track==="inverted"&&t.trackInverted,n.track===!1&&t.trackFalse]}})(ve(({theme:e})=>({borderRadius:12,boxSizing:"content-box",display:"inline-block",position:"relative",cursor:"pointer",touchAction:"none",WebkitTapHighlightColor:"transparent","@media print":{colorAdjust:"exact"},[`&.${Jt.disabled}`]:{pointerEvents:"none",cursor:"default",color:(e.vars||e).palette.grey[400]},[`&.${Jt.dragging}`]:{[`& .${Jt.thumb}, & .${Jt.track}`]:{transition:"none"}},variants:[...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}})),{props:{orientation:"horizontal"},style:{height:4,width:"100%",padding:"13px 0","@media (pointer: coarse)":{padding:"20px 0"}}},{props:{orientation:"horizontal",size:"small"},style:{height:2}},{props:{orientation:"horizontal",marked:!0},style:{marginBottom:20}},{props:{orientation:"vertical"},style:{height:"100%",width:4,padding:"0 13px","@media (pointer: coarse)":{padding:"0 20px"}}},{props:{orientation:"vertical",size:"small"},style:{width:2}},{props:{orientation:"vertical",marked:!0},style:{marginRight:44}}]}))),FR=Y("span",{name:"MuiSlider",slot:"Rail",overridesResolver:(e,t)=>t.rail})({display:"block",position:"absolute",borderRadius:"inherit",backgroundColor:"currentColor",opacity:.38,variants:[{props:{orientation:"horizontal"},style:{width:"100%",height:"inherit",top:"50%",transform:"translateY(-50%)"}},{props:{orientation:"vertical"},style:{height:"100%",width:"inherit",left:"50%",transform:"translateX(-50%)"}},{props:{track:"inverted"},style:{opacity:1}}]}),HR=Y("span",{name:"MuiSlider",slot:"Track",overridesResolver:(e,t)=>t.track})(ve(({theme:e})=>({display:"block",position:"absolute",borderRadius:"inherit",border:"1px solid currentColor",backgroundColor:"currentColor",transition:e.transitions.create(["left","width","bottom","height"],{duration:e.transitions.duration.shortest}),variants:[{props:{size:"small"},style:{border:"none"}},{props:{orientation:"horizontal"},style:{height:"inherit",top:"50%",transform:"translateY(-50%)"}},{props:{orientation:"vertical"},style:{width:"inherit",left:"50%",transform:"translateX(-50%)"}},{props:{track:!1},style:{display:"none"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t,track:"inverted"},style:{...e.vars?{backgroundColor:e.vars.palette.Slider[`${t}Track`],borderColor:e.vars.palette.Slider[`${t}Track`]}:{backgroundColor:wo(e.palette[t].main,.62),borderColor:wo(e.palette[t].main,.62),...e.applyStyles("dark",{backgroundColor:xo(e.palette[t].main,.5)}),...e.applyStyles("dark",{borderColor:xo(e.palette[t].main,.5)})}}}))]}))),WR=Y("span",{name:"MuiSlider",slot:"Thumb",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.thumb,t[`thumbColor${q(n.color)}`],n.size!=="medium"&&t[`thumbSize${q(n.size)}`]]}})(ve(({theme:e})=>({position:"absolute",width:20,height:20,boxSizing:"border-box",borderRadius:"50%",outline:0,backgroundColor:"currentColor",display:"flex",alignItems:"center",justifyContent:"center",transition:e.transitions.create(["box-shadow","left","bottom"],{duration:e.transitions.duration.shortest}),"&::before":{position:"absolute",content:'""',borderRadius:"inherit",width:"100%",height:"100%",boxShadow:(e.vars||e).shadows[2]},"&::after":{position:"absolute",content:'""',borderRadius:"50%",width:42,height:42,top:"50%",left:"50%",transform:"translate(-50%, -50%)"},[`&.${Jt.disabled}`]:{"&:hover":{boxShadow:"none"}},variants:[{props:{size:"small"},style:{width:12,height:12,"&::before":{boxShadow:"none"}}},{props:{orientation:"horizontal"},style:{top:"50%",transform:"translate(-50%, -50%)"}},{props:{orientation:"vertical"},style:{left:"50%",transform:"translate(-50%, 50%)"}},...Object.entries(e.palette).filter(rt()).map(([t])=>({props:{color:t},style:{[`&:hover, &.${Jt.focusVisible}`]:{...e.vars?{boxShadow:`0px 0px 0px 8px rgba(${e.vars.palette[t].mainChannel} / 0.16)`}:{boxShadow:`0px 0px 0px 8px ${He(e.palette[t].main,.16)}`},"@media (hover: none)":{boxShadow:"none"}},[`&.${Jt.active}`]:{...e.vars?{boxShadow:`0px 0px 0px 14px rgba(${e.vars.palette[t].mainChannel} / 0.16)`}:{boxShadow:`0px 0px 0px 14px ${He(e.palette[t].main,.16)}`}}}}))]}))),VR=Y(zR,{name:"MuiSlider",slot:"ValueLabel",overridesResolver:(e,t)=>t.valueLabel})(ve(({theme:e})=>({zIndex:1,whiteSpace:"nowrap",...e.typography.body2,fontWeight:500,transition:e.transitions.create(["transform"],{duration:e.transitions.duration.shortest}),position:"absolute",backgroundColor:(e.vars||e).palette.grey[600],borderRadius:2,color:(e.vars||e).palette.common.white,display:"flex",alignItems:"center",justifyContent:"center",padding:"0.25rem 0.75rem",variants:[{props:{orientation:"horizontal"},style:{transform:"translateY(-100%) scale(0)",top:"-10px",transformOrigin:"bottom center","&::before":{position:"absolute",content:'""',width:8,height:8,transform:"translate(-50%, 50%) rotate(45deg)",backgroundColor:"inherit",bottom:0,left:"50%"},[`&.${Jt.valueLabelOpen}`]:{transform:"translateY(-100%) scale(1)"}}},{props:{orientation:"vertical"},style:{transform:"translateY(-50%) scale(0)",right:"30px",top:"50%",transformOrigin:"right center","&::before":{position:"absolute",content:'""',width:8,height:8,transform:"translate(-50%, -50%) rotate(45deg)",backgroundColor:"inherit",right:-8,top:"50%"},[`&.${Jt.valueLabelOpen}`]:{transform:"translateY(-50%) scale(1)"}}},{props:{size:"small"},style:{fontSize:e.typography.pxToRem(12),padding:"0.25rem 0.5rem"}},{props:{orientation:"vertical",size:"small"},style:{right:"20px"}}]}))),UR=Y("span",{name:"MuiSlider",slot:"Mark",shouldForwardProp:e=>da(e)&&e!=="markActive",overridesResolver:(e,t)=>{const{markActive:n}=e;return[t.mark,n&&t.markActive]}})(ve(({theme:e})=>({position:"absolute",width:2,height:2,borderRadius:1,backgroundColor:"currentColor",variants:[{props:{orientation:"horizontal"},style:{top:"50%",transform:"translate(-1px, -50%)"}},{props:{orientation:"vertical"},style:{left:"50%",transform:"translate(-50%, 1px)"}},{props:{markActive:!0},style:{backgroundColor:(e.vars||e).palette.background.paper,opacity:.8}}]}))),GR=Y("span",{name:"MuiSlider",slot:"MarkLabel",shouldForwardProp:e=>da(e)&&e!=="markLabelActive",overridesResolver:(e,t)=>t.markLabel})(ve(({theme:e})=>({...e.typography.body2,color:(e.vars||e).palette.text.secondary,position:"absolute",whiteSpace:"nowrap",variants:[{props:{orientation:"horizontal"},style:{top:30,transform:"translateX(-50%)","@media (pointer: coarse)":{top:40}}},{props:{orientation:"vertical"},style:{left:36,transform:"translateY(50%)","@media (pointer: coarse)":{left:44}}},{props:{markLabelActive:!0},style:{color:(e.vars||e).palette.text.primary}}]}))),XR=e=>{const{disabled:t,dragging:n,marked:o,orientation:r,track:i,classes:s,color:a,size:l}=e,c={root:["root",t&&"disabled",n&&"dragging",o&&"marked",r==="vertical"&&"vertical",i==="inverted"&&"trackInverted",i===!1&&"trackFalse",a&&`color${q(a)}`,l&&`size${q(l)}`],rail:["rail"],track:["track"],mark:["mark"],markActive:["markActive"],markLabel:["markLabel"],markLabelActive:["markLabelActive"],valueLabel:["valueLabel"],thumb:["thumb",t&&"disabled",l&&`thumbSize${q(l)}`,a&&`thumbColor${q(a)}`],active:["active"],disabled:["disabled"],focusVisible:["focusVisible"]};return Ie(c,jR,s)},YR=({children:e})=>e,jg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiSlider"}),r=ir(),{"aria-label":i,"aria-valuetext":s,"aria-labelledby":a,component:l="span",components:c={},componentsProps:d={},color:u="primary",classes:p,className:f,disableSwap:m=!1,disabled:g=!1,getAriaLabel:S,getAriaValueText:w,marks:P=!1,max:x=100,min:y=0,name:E,onChange:$,onChangeCommitted:I,orientation:M="horizontal",shiftStep:T=10,size:v="medium",step:A=1,scale:L=sp,slotProps:_,slots:C,tabIndex:R,track:k="normal",value:N,valueLabelDisplay:j="off",valueLabelFormat:O=sp,...B}=o,z={...o,isRtl:r,max:x,min:y,classes:p,disabled:g,disableSwap:m,orientation:M,marks:P,color:u,size:v,step:A,shiftStep:T,scale:L,track:k,valueLabelDisplay:j,valueLabelFormat:O},{axisProps:G,getRootProps:Z,getHiddenInputProps:K,getThumbProps:V,open:F,active:te,axis:D,focusedThumbIndex:ne,range:oe,dragging:ie,marks:X,values:se,trackOffset:ae,trackLeap:ge,getThumbStyle:le}=LR({...z,rootRef:n});z.marked=X.length>0&&X.some(De=>De.label),z.dragging=ie,z.focusedThumbIndex=ne;const ye=XR(z),he=C?.root??c.Root??DR,je=C?.rail??c.Rail??FR,Ee=C?.track??c.Track??HR,Ae=C?.thumb??c.Thumb??WR,ce=C?.valueLabel??c.ValueLabel??VR,Re=C?.mark??c.Mark??UR,$e=C?.markLabel??c.MarkLabel??GR,J=C?.input??c.Input??"input",ee=_?.root??d.root,fe=_?.rail??d.rail,be=_?.track??d.track,de=_?.thumb??d.thumb,xe=_?.valueLabel??d.valueLabel,Se=_?.mark??d.mark,Ye=_?.markLabel??d.markLabel,Fe=_?.input??d.input,ue=Pt({elementType:he,getSlotProps:Z,externalSlotProps:ee,externalForwardedProps:B,additionalProps:{..._R(he)&&{as:l}},ownerState:{...z,...ee?.ownerState},className:[ye.root,f]}),Q=Pt({elementType:je,externalSlotProps:fe,ownerState:z,className:ye.rail}),pe=Pt({elementType:Ee,externalSlotProps:be,additionalProps:{style:{...G[D].offset(ae),...G[D].leap(ge)}},ownerState:{...z,...be?.ownerState},className:ye.track}),Me=Pt({elementType:Ae,getSlotProps:V,externalSlotProps:de,ownerState:{...z,...de?.ownerState},className:ye.thumb}),Oe=Pt({elementType:ce,externalSlotProps:xe,ownerState:{...z,...xe?.ownerState},className:ye.valueLabel}),ze=Pt({elementType:Re,externalSlotProps:Se,ownerState:z,className:ye.mark}),et=Pt({elementType:$e,externalSlotProps:Ye,ownerState:z,className:ye.markLabel}),ft=Pt({elementType:J,getSlotProps:K,externalSlotProps:Fe,ownerState:z});return h.jsxs(he,{...ue,children:[h.jsx(je,{...Q}),h.jsx(Ee,{...pe}),X.filter(De=>De.value>=y&&De.value<=x).map((De,qe)=>{const xt=hs(De.value,y,x),Vt=G[D].offset(xt);let Ct;return k===!1?Ct=se.includes(De.value):Ct=k==="normal"&&(oe?De.value>=se[0]&&De.value<=se[se.length-1]:De.value<=se[0])||k==="inverted"&&(oe?De.value<=se[0]||De.value>=se[se.length-1]:De.value>=se[0]),h.jsxs(b.Fragment,{children:[h.jsx(Re,{"data-index":qe,...ze,...!Rn(Re)&&{markActive:Ct},style:{...Vt,...ze.style},className:re(ze.className,Ct&&ye.markActive)}),De.label!=null?h.jsx($e,{"aria-hidden":!0,"data-index":qe,...et,...!Rn($e)&&{markLabelActive:Ct},style:{...Vt,...et.style},className:re(ye.markLabel,et.className,Ct&&ye.markLabelActive),children:De.label}):null]},qe)}),se.map((De,qe)=>{const xt=hs(De,y,x),Vt=G[D].offset(xt),Ct=j==="off"?YR:ce;return h.jsx(Ct,{...!Rn(Ct)&&{valueLabelFormat:O,valueLabelDisplay:j,value:typeof O=="function"?O(L(De),qe):O,index:qe,open:F===qe||te===qe||j==="on",disabled:g},...Oe,children:h.jsx(Ae,{"data-index":qe,...Me,className:re(ye.thumb,Me.className,te===qe&&ye.active,ne===qe&&ye.focusVisible),style:{...Vt,...le(qe),...Me.style},children:h.jsx(J,{"data-index":qe,"aria-label":S?S(qe):i,"aria-valuenow":L(De),"aria-labelledby":a,"aria-valuetext":w?w(L(De),qe):s,value:se[qe],...ft})})},qe)})]})}),qR=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,min:s,max:a,step:l,updateStore:c})=>{const d=St();return h.jsxs(ke,{"data-key":e,sx:{pt:0,pb:1,pl:1,pr:1,...n},className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:[h.jsx(Rt,{gutterBottom:!0,children:i}),h.jsx(jg,{value:t||[0,1],onChange:(u,p)=>c?.(e,p),min:s||0,max:a||1,step:l||.01,valueLabelDisplay:"auto",color:"secondary",disableSwap:!0,sx:{"& .MuiSlider-thumb":{color:d.palette.secondary.main}}})]},e)};function KR(e){return Pe("MuiButton",e)}const ao=Ce("MuiButton",["root","text","textInherit","textPrimary","textSecondary","textSuccess","textError","textInfo","textWarning","outlined","outlinedInherit","outlinedPrimary","outlinedSecondary","outlinedSuccess","outlinedError","outlinedInfo","outlinedWarning","contained","containedInherit","containedPrimary","containedSecondary","containedSuccess","containedError","containedInfo","containedWarning","disableElevation","focusVisible","disabled","colorInherit","colorPrimary","colorSecondary","colorSuccess","colorError","colorInfo","colorWarning","textSizeSmall","textSizeMedium","textSizeLarge","outlinedSizeSmall","outlinedSizeMedium","outlinedSizeLarge","containedSizeSmall","containedSizeMedium","containedSizeLarge","sizeMedium","sizeSmall","sizeLarge","fullWidth","startIcon","endIcon","icon","iconSizeSmall","iconSizeMedium","iconSizeLarge","loading","loadingWrapper","loadingIconPlaceholder","loadingIndicator","loadingPositionCenter","loadingPositionStart","loadingPositionEnd"]),ZR=b.createContext({}),JR=b.createContext(void 0),QR=e=>{const{color:t,disableElevation:n,fullWidth:o,size:r,variant:i,loading:s,loadingPosition:a,classes:l}=e,c={root:["root",s&&"loading",i,`${i}${q(t)}`,`size${q(r)}`,`${i}Size${q(r)}`,`color${q(t)}`,n&&"disableElevation",o&&"fullWidth",s&&`loadingPosition${q(a)}`],startIcon:["icon","startIcon",`iconSize${q(r)}`],endIcon:["icon","endIcon",`iconSize${q(r)}`],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]},d=Ie(c,KR,l);return{...l,...d}},Bg=[{props:{size:"small"},style:{"& > *:nth-of-type(1)":{fontSize:18}}},{props:{size:"medium"},style:{"& > *:nth-of-type(1)":{fontSize:20}}},{props:{size:"large"},style:{"& > *:nth-of-type(1)":{fontSize:22}}}],eM=Y(Nn,{shouldForwardProp:e=>Nt(e)||e==="classes",name:"MuiButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${q(n.color)}`],t[`size${q(n.size)}`],t[`${n.variant}Size${q(n.size)}`],n.color==="inherit"&&t.colorInherit,n.disableElevation&&t.disableElevation,n.fullWidth&&t.fullWidth,n.loading&&t.loading]}})(ve(({theme:e})=>{const t=e.palette.mode==="light"?e.palette.grey[300]:e.palette.grey[800],n=e.palette.mode==="light"?e.palette.grey.A100:e.palette.grey[700];return{...e.typography.button,minWidth:64,padding:"6px 16px",border:0,borderRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create(["background-color","box-shadow","border-color","color"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none"},[`&.${ao.disabled}`]:{color:(e.vars||e).palette.action.disabled},variants:[{props:{variant:"contained"},style:{color:"var(--variant-containedColor)",backgroundColor:"var(--variant-containedBg)",boxShadow:(e.vars||e).shadows[2],"&:hover":{boxShadow:(e.vars||e).shadows[4],"@media (hover: none)":{boxShadow:(e.vars||e).shadows[2]}},"&:active":{boxShadow:(e.vars||e).shadows[8]},[`&.${ao.focusVisible}`]:{boxShadow:(e.vars||e).shadows[6]},[`&.${ao.disabled}`]:{color:(e.vars||e).palette.action.disabled,boxShadow:(e.vars||e).shadows[0],backgroundColor:(e.vars||e).palette.action.disabledBackground}}},{props:{variant:"outlined"},style:{padding:"5px 15px",border:"1px solid currentColor",borderColor:"var(--variant-outlinedBorder, currentColor)",backgroundColor:"var(--variant-outlinedBg)",color:"var(--variant-outlinedColor)",[`&.${ao.disabled}`]:{border:`1px solid ${(e.vars||e).palette.action.disabledBackground}`}}},{props:{variant:"text"},style:{padding:"6px 8px",color:"var(--variant-textColor)",backgroundColor:"var(--variant-textBg)"}},...Object.entries(e.palette).filter(rt()).map(([o])=>({props:{color:o},style:{"--variant-textColor":(e.vars||e).palette[o].main,"--variant-outlinedColor":(e.vars||e).palette[o].main,"--variant-outlinedBorder":e.vars?`rgba(${e.vars.palette[o].mainChannel} / 0.5)`:He(e.palette[o].main,.5),"--variant-containedColor":(e.vars||e).palette[o].contrastText,"--variant-containedBg":(e.vars||e).palette[o].main,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":(e.vars||e).palette[o].dark,"--variant-textBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette[o].main,e.palette.action.hoverOpacity),"--variant-outlinedBorder":(e.vars||e).palette[o].main,"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette[o].main,e.palette.action.hoverOpacity)}}}})),{props:{color:"inherit"},style:{color:"inherit",borderColor:"currentColor","--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedBg:t,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedHoverBg:n,"--variant-textBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.text.primary,e.palette.action.hoverOpacity),"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:He(e.palette.text.primary,e.palette.action.hoverOpacity)}}}},{props:{size:"small",variant:"text"},style:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"text"},style:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"outlined"},style:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"outlined"},style:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"contained"},style:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"contained"},style:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)}},{props:{disableElevation:!0},style:{boxShadow:"none","&:hover":{boxShadow:"none"},[`&.${ao.focusVisible}`]:{boxShadow:"none"},"&:active":{boxShadow:"none"},[`&.${ao.disabled}`]:{boxShadow:"none"}}},{props:{fullWidth:!0},style:{width:"100%"}},{props:{loadingPosition:"center"},style:{transition:e.transitions.create(["background-color","box-shadow","border-color"],{duration:e.transitions.duration.short}),[`&.${ao.loading}`]:{color:"transparent"}}}]}})),tM=Y("span",{name:"MuiButton",slot:"StartIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.startIcon,n.loading&&t.startIconLoadingStart,t[`iconSize${q(n.size)}`]]}})(({theme:e})=>({display:"inherit",marginRight:8,marginLeft:-4,variants:[{props:{size:"small"},style:{marginLeft:-2}},{props:{loadingPosition:"start",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"start",loading:!0,fullWidth:!0},style:{marginRight:-8}},...Bg]})),nM=Y("span",{name:"MuiButton",slot:"EndIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.endIcon,n.loading&&t.endIconLoadingEnd,t[`iconSize${q(n.size)}`]]}})(({theme:e})=>({display:"inherit",marginRight:-4,marginLeft:8,variants:[{props:{size:"small"},style:{marginRight:-2}},{props:{loadingPosition:"end",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"end",loading:!0,fullWidth:!0},style:{marginLeft:-8}},...Bg]})),oM=Y("span",{name:"MuiButton",slot:"LoadingIndicator",overridesResolver:(e,t)=>t.loadingIndicator})(({theme:e})=>({display:"none",position:"absolute",visibility:"visible",variants:[{props:{loading:!0},style:{display:"flex"}},{props:{loadingPosition:"start"},style:{left:14}},{props:{loadingPosition:"start",size:"small"},style:{left:10}},{props:{variant:"text",loadingPosition:"start"},style:{left:6}},{props:{loadingPosition:"center"},style:{left:"50%",transform:"translate(-50%)",color:(e.vars||e).palette.action.disabled}},{props:{loadingPosition:"end"},style:{right:14}},{props:{loadingPosition:"end",size:"small"},style:{right:10}},{props:{variant:"text",loadingPosition:"end"},style:{right:6}},{props:{loadingPosition:"start",fullWidth:!0},style:{position:"relative",left:-10}},{props:{loadingPosition:"end",fullWidth:!0},style:{position:"relative",right:-10}}]})),ap=Y("span",{name:"MuiButton",slot:"LoadingIconPlaceholder",overridesResolver:(e,t)=>t.loadingIconPlaceholder})({display:"inline-block",width:"1em",height:"1em"}),Wa=b.forwardRef(function(t,n){const o=b.useContext(ZR),r=b.useContext(JR),i=Ur(o,t),s=Te({props:i,name:"MuiButton"}),{children:a,color:l="primary",component:c="button",className:d,disabled:u=!1,disableElevation:p=!1,disableFocusRipple:f=!1,endIcon:m,focusVisibleClassName:g,fullWidth:S=!1,id:w,loading:P=null,loadingIndicator:x,loadingPosition:y="center",size:E="medium",startIcon:$,type:I,variant:M="text",...T}=s,v=rr(w),A=x??h.jsx(Fc,{"aria-labelledby":v,color:"inherit",size:16}),L={...s,color:l,component:c,disabled:u,disableElevation:p,disableFocusRipple:f,fullWidth:S,loading:P,loadingIndicator:A,loadingPosition:y,size:E,type:I,variant:M},_=QR(L),C=($||P&&y==="start")&&h.jsx(tM,{className:_.startIcon,ownerState:L,children:$||h.jsx(ap,{className:_.loadingIconPlaceholder,ownerState:L})}),R=(m||P&&y==="end")&&h.jsx(nM,{className:_.endIcon,ownerState:L,children:m||h.jsx(ap,{className:_.loadingIconPlaceholder,ownerState:L})}),k=r||"",N=typeof P=="boolean"?h.jsx("span",{className:_.loadingWrapper,style:{display:"contents"},children:P&&h.jsx(oM,{className:_.loadingIndicator,ownerState:L,children:A})}):null;return h.jsxs(eM,{ownerState:L,className:re(o.className,_.root,d,k),component:c,disabled:u||P,focusRipple:!f,focusVisibleClassName:re(_.focusVisible,g),ref:n,type:I,id:v,...T,classes:_,children:[C,y!=="end"&&N,a,y==="end"&&N,R]})});function rM(e){return Pe("MuiDialog",e)}const Va=Ce("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]),iM=b.createContext({}),sM=Y(mg,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),aM=e=>{const{classes:t,scroll:n,maxWidth:o,fullWidth:r,fullScreen:i}=e,s={root:["root"],container:["container",`scroll${q(n)}`],paper:["paper",`paperScroll${q(n)}`,`paperWidth${q(String(o))}`,r&&"paperFullWidth",i&&"paperFullScreen"]};return Ie(s,rM,t)},lM=Y(Mc,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),cM=Y("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.container,t[`scroll${q(n.scroll)}`]]}})({height:"100%","@media print":{height:"auto"},outline:0,variants:[{props:{scroll:"paper"},style:{display:"flex",justifyContent:"center",alignItems:"center"}},{props:{scroll:"body"},style:{overflowY:"auto",overflowX:"hidden",textAlign:"center","&::after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}}}]}),uM=Y(sr,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t[`scrollPaper${q(n.scroll)}`],t[`paperWidth${q(String(n.maxWidth))}`],n.fullWidth&&t.paperFullWidth,n.fullScreen&&t.paperFullScreen]}})(ve(({theme:e})=>({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"},variants:[{props:{scroll:"paper"},style:{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"}},{props:{scroll:"body"},style:{display:"inline-block",verticalAlign:"middle",textAlign:"initial"}},{props:({ownerState:t})=>!t.maxWidth,style:{maxWidth:"calc(100% - 64px)"}},{props:{maxWidth:"xs"},style:{maxWidth:e.breakpoints.unit==="px"?Math.max(e.breakpoints.values.xs,444):`max(${e.breakpoints.values.xs}${e.breakpoints.unit}, 444px)`,[`&.${Va.paperScrollBody}`]:{[e.breakpoints.down(Math.max(e.breakpoints.values.xs,444)+32*2)]:{maxWidth:"calc(100% - 64px)"}}}},...Object.keys(e.breakpoints.values).filter(t=>t!=="xs").map(t=>({props:{maxWidth:t},style:{maxWidth:`${e.breakpoints.values[t]}${e.breakpoints.unit}`,[`&.${Va.paperScrollBody}`]:{[e.breakpoints.down(e.breakpoints.values[t]+32*2)]:{maxWidth:"calc(100% - 64px)"}}}})),{props:({ownerState:t})=>t.fullWidth,style:{width:"calc(100% - 64px)"}},{props:({ownerState:t})=>t.fullScreen,style:{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${Va.paperScrollBody}`]:{margin:0,maxWidth:"100%"}}}]}))),dM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiDialog"}),r=St(),i={enter:r.transitions.duration.enteringScreen,exit:r.transitions.duration.leavingScreen},{"aria-describedby":s,"aria-labelledby":a,"aria-modal":l=!0,BackdropComponent:c,BackdropProps:d,children:u,className:p,disableEscapeKeyDown:f=!1,fullScreen:m=!1,fullWidth:g=!1,maxWidth:S="sm",onBackdropClick:w,onClick:P,onClose:x,open:y,PaperComponent:E=sr,PaperProps:$={},scroll:I="paper",slots:M={},slotProps:T={},TransitionComponent:v=Rl,transitionDuration:A=i,TransitionProps:L,..._}=o,C={...o,disableEscapeKeyDown:f,fullScreen:m,fullWidth:g,maxWidth:S,scroll:I},R=aM(C),k=b.useRef(),N=ae=>{k.current=ae.target===ae.currentTarget},j=ae=>{P&&P(ae),k.current&&(k.current=null,w&&w(ae),x&&x(ae,"backdropClick"))},O=rr(a),B=b.useMemo(()=>({titleId:O}),[O]),z={transition:v,...M},G={transition:L,paper:$,backdrop:d,...T},Z={slots:z,slotProps:G},[K,V]=ot("root",{elementType:lM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C,className:re(R.root,p),ref:n}),[F,te]=ot("backdrop",{elementType:sM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C}),[D,ne]=ot("paper",{elementType:uM,shouldForwardComponentProp:!0,externalForwardedProps:Z,ownerState:C,className:re(R.paper,$.className)}),[oe,ie]=ot("container",{elementType:cM,externalForwardedProps:Z,ownerState:C,className:re(R.container)}),[X,se]=ot("transition",{elementType:Rl,externalForwardedProps:Z,ownerState:C,additionalProps:{appear:!0,in:y,timeout:A,role:"presentation"}});return h.jsx(K,{closeAfterTransition:!0,slots:{backdrop:F},slotProps:{backdrop:{transitionDuration:A,as:c,...te}},disableEscapeKeyDown:f,onClose:x,open:y,onClick:j,...V,..._,children:h.jsx(X,{...se,children:h.jsx(oe,{onMouseDown:N,...ie,children:h.jsx(D,{as:E,elevation:24,role:"dialog","aria-describedby":s,"aria-labelledby":O,"aria-modal":l,...ne,children:h.jsx(iM.Provider,{value:B,children:u})})})})})});function pM(e){return Pe("MuiDivider",e)}const lp=Ce("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]),fM=e=>{const{absolute:t,children:n,classes:o,flexItem:r,light:i,orientation:s,textAlign:a,variant:l}=e;return Ie({root:["root",t&&"absolute",l,i&&"light",s==="vertical"&&"vertical",r&&"flexItem",n&&"withChildren",n&&s==="vertical"&&"withChildrenVertical",a==="right"&&s!=="vertical"&&"textAlignRight",a==="left"&&s!=="vertical"&&"textAlignLeft"],wrapper:["wrapper",s==="vertical"&&"wrapperVertical"]},pM,o)},hM=Y("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,n.orientation==="vertical"&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&n.orientation==="vertical"&&t.withChildrenVertical,n.textAlign==="right"&&n.orientation!=="vertical"&&t.textAlignRight,n.textAlign==="left"&&n.orientation!=="vertical"&&t.textAlignLeft]}})(ve(({theme:e})=>({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(e.vars||e).palette.divider,borderBottomWidth:"thin",variants:[{props:{absolute:!0},style:{position:"absolute",bottom:0,left:0,width:"100%"}},{props:{light:!0},style:{borderColor:e.vars?`rgba(${e.vars.palette.dividerChannel} / 0.08)`:He(e.palette.divider,.08)}},{props:{variant:"inset"},style:{marginLeft:72}},{props:{variant:"middle",orientation:"horizontal"},style:{marginLeft:e.spacing(2),marginRight:e.spacing(2)}},{props:{variant:"middle",orientation:"vertical"},style:{marginTop:e.spacing(1),marginBottom:e.spacing(1)}},{props:{orientation:"vertical"},style:{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"}},{props:{flexItem:!0},style:{alignSelf:"stretch",height:"auto"}},{props:({ownerState:t})=>!!t.children,style:{display:"flex",textAlign:"center",border:0,borderTopStyle:"solid",borderLeftStyle:"solid","&::before, &::after":{content:'""',alignSelf:"center"}}},{props:({ownerState:t})=>t.children&&t.orientation!=="vertical",style:{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(e.vars||e).palette.divider}`,borderTopStyle:"inherit"}}},{props:({ownerState:t})=>t.orientation==="vertical"&&t.children,style:{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(e.vars||e).palette.divider}`,borderLeftStyle:"inherit"}}},{props:({ownerState:t})=>t.textAlign==="right"&&t.orientation!=="vertical",style:{"&::before":{width:"90%"},"&::after":{width:"10%"}}},{props:({ownerState:t})=>t.textAlign==="left"&&t.orientation!=="vertical",style:{"&::before":{width:"10%"},"&::after":{width:"90%"}}}]}))),gM=Y("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,n.orientation==="vertical"&&t.wrapperVertical]}})(ve(({theme:e})=>({display:"inline-block",paddingLeft:`calc(${e.spacing(1)} * 1.2)`,paddingRight:`calc(${e.spacing(1)} * 1.2)`,whiteSpace:"nowrap",variants:[{props:{orientation:"vertical"},style:{paddingTop:`calc(${e.spacing(1)} * 1.2)`,paddingBottom:`calc(${e.spacing(1)} * 1.2)`}}]}))),_l=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiDivider"}),{absolute:r=!1,children:i,className:s,orientation:a="horizontal",component:l=i||a==="vertical"?"div":"hr",flexItem:c=!1,light:d=!1,role:u=l!=="hr"?"separator":void 0,textAlign:p="center",variant:f="fullWidth",...m}=o,g={...o,absolute:r,component:l,flexItem:c,light:d,orientation:a,role:u,textAlign:p,variant:f},S=fM(g);return h.jsx(hM,{as:l,className:re(S.root,s),role:u,ref:n,ownerState:g,"aria-orientation":u==="separator"&&(l!=="hr"||a==="vertical")?a:void 0,...m,children:i?h.jsx(gM,{className:S.wrapper,ownerState:g,children:i}):null})});_l&&(_l.muiSkipListHighlight=!0);function mM(e){return Pe("MuiListItem",e)}Ce("MuiListItem",["root","container","dense","alignItemsFlexStart","divider","gutters","padding","secondaryAction"]);const yM=Ce("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function bM(e){return Pe("MuiListItemSecondaryAction",e)}Ce("MuiListItemSecondaryAction",["root","disableGutters"]);const vM=e=>{const{disableGutters:t,classes:n}=e;return Ie({root:["root",t&&"disableGutters"]},bM,n)},xM=Y("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)",variants:[{props:({ownerState:e})=>e.disableGutters,style:{right:0}}]}),zg=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItemSecondaryAction"}),{className:r,...i}=o,s=b.useContext(qn),a={...o,disableGutters:s.disableGutters},l=vM(a);return h.jsx(xM,{className:re(l.root,r),ownerState:a,ref:n,...i})});zg.muiName="ListItemSecondaryAction";const wM=(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,n.alignItems==="flex-start"&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.hasSecondaryAction&&t.secondaryAction]},SM=e=>{const{alignItems:t,classes:n,dense:o,disableGutters:r,disablePadding:i,divider:s,hasSecondaryAction:a}=e;return Ie({root:["root",o&&"dense",!r&&"gutters",!i&&"padding",s&&"divider",t==="flex-start"&&"alignItemsFlexStart",a&&"secondaryAction"],container:["container"]},mM,n)},CM=Y("div",{name:"MuiListItem",slot:"Root",overridesResolver:wM})(ve(({theme:e})=>({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left",variants:[{props:({ownerState:t})=>!t.disablePadding,style:{paddingTop:8,paddingBottom:8}},{props:({ownerState:t})=>!t.disablePadding&&t.dense,style:{paddingTop:4,paddingBottom:4}},{props:({ownerState:t})=>!t.disablePadding&&!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>!t.disablePadding&&!!t.secondaryAction,style:{paddingRight:48}},{props:({ownerState:t})=>!!t.secondaryAction,style:{[`& > .${yM.root}`]:{paddingRight:48}}},{props:{alignItems:"flex-start"},style:{alignItems:"flex-start"}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>t.button,style:{transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}}}},{props:({ownerState:t})=>t.hasSecondaryAction,style:{paddingRight:48}}]}))),kM=Y("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),EM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItem"}),{alignItems:r="center",children:i,className:s,component:a,components:l={},componentsProps:c={},ContainerComponent:d="li",ContainerProps:{className:u,...p}={},dense:f=!1,disableGutters:m=!1,disablePadding:g=!1,divider:S=!1,secondaryAction:w,slotProps:P={},slots:x={},...y}=o,E=b.useContext(qn),$=b.useMemo(()=>({dense:f||E.dense||!1,alignItems:r,disableGutters:m}),[r,E.dense,f,m]),I=b.useRef(null),M=b.Children.toArray(i),T=M.length&&Gi(M[M.length-1],["ListItemSecondaryAction"]),v={...o,alignItems:r,dense:$.dense,disableGutters:m,disablePadding:g,divider:S,hasSecondaryAction:T},A=SM(v),L=at(I,n),_=x.root||l.Root||CM,C=P.root||c.root||{},R={className:re(A.root,C.className,s),...y};let k=a||"li";return T?(k=!R.component&&!a?"div":k,d==="li"&&(k==="li"?k="div":R.component==="li"&&(R.component="div")),h.jsx(qn.Provider,{value:$,children:h.jsxs(kM,{as:d,className:re(A.container,u),ref:L,ownerState:v,...p,children:[h.jsx(_,{...C,...!Rn(_)&&{as:k,ownerState:{...v,...C.ownerState}},...R,children:M}),M.pop()]})})):h.jsx(qn.Provider,{value:$,children:h.jsxs(_,{...C,as:k,ref:L,...!Rn(_)&&{ownerState:{...v,...C.ownerState}},...R,children:[M,w&&h.jsx(zg,{children:w})]})})}),cp=Ce("MuiListItemIcon",["root","alignItemsFlexStart"]);function $M(e){return Pe("MuiListItemText",e)}const Bo=Ce("MuiListItemText",["root","multiline","dense","inset","primary","secondary"]),PM=e=>{const{classes:t,inset:n,primary:o,secondary:r,dense:i}=e;return Ie({root:["root",n&&"inset",i&&"dense",o&&r&&"multiline"],primary:["primary"],secondary:["secondary"]},$M,t)},IM=Y("div",{name:"MuiListItemText",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${Bo.primary}`]:t.primary},{[`& .${Bo.secondary}`]:t.secondary},t.root,n.inset&&t.inset,n.primary&&n.secondary&&t.multiline,n.dense&&t.dense]}})({flex:"1 1 auto",minWidth:0,marginTop:4,marginBottom:4,[`.${$d.root}:where(& .${Bo.primary})`]:{display:"block"},[`.${$d.root}:where(& .${Bo.secondary})`]:{display:"block"},variants:[{props:({ownerState:e})=>e.primary&&e.secondary,style:{marginTop:6,marginBottom:6}},{props:({ownerState:e})=>e.inset,style:{paddingLeft:56}}]}),RM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiListItemText"}),{children:r,className:i,disableTypography:s=!1,inset:a=!1,primary:l,primaryTypographyProps:c,secondary:d,secondaryTypographyProps:u,slots:p={},slotProps:f={},...m}=o,{dense:g}=b.useContext(qn);let S=l??r,w=d;const P={...o,disableTypography:s,inset:a,primary:!!S,secondary:!!w,dense:g},x=PM(P),y={slots:p,slotProps:{primary:c,secondary:u,...f}},[E,$]=ot("primary",{className:x.primary,elementType:Rt,externalForwardedProps:y,ownerState:P}),[I,M]=ot("secondary",{className:x.secondary,elementType:Rt,externalForwardedProps:y,ownerState:P});return S!=null&&S.type!==Rt&&!s&&(S=h.jsx(E,{variant:g?"body2":"body1",component:$?.variant?void 0:"span",...$,children:S})),w!=null&&w.type!==Rt&&!s&&(w=h.jsx(I,{variant:"body2",color:"textSecondary",...M,children:w})),h.jsxs(IM,{className:re(x.root,i),ownerState:P,ref:n,...m,children:[S,w]})});function MM(e){return Pe("MuiMenuItem",e)}const yr=Ce("MuiMenuItem",["root","focusVisible","dense","disabled","divider","gutters","selected"]),TM=(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,n.divider&&t.divider,!n.disableGutters&&t.gutters]},AM=e=>{const{disabled:t,dense:n,divider:o,disableGutters:r,selected:i,classes:s}=e,l=Ie({root:["root",n&&"dense",t&&"disabled",!r&&"gutters",o&&"divider",i&&"selected"]},MM,s);return{...s,...l}},NM=Y(Nn,{shouldForwardProp:e=>Nt(e)||e==="classes",name:"MuiMenuItem",slot:"Root",overridesResolver:TM})(ve(({theme:e})=>({...e.typography.body1,display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",minHeight:48,paddingTop:6,paddingBottom:6,boxSizing:"border-box",whiteSpace:"nowrap","&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${yr.selected}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity),[`&.${yr.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}},[`&.${yr.selected}:hover`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:He(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:He(e.palette.primary.main,e.palette.action.selectedOpacity)}},[`&.${yr.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},[`&.${yr.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity},[`& + .${lp.root}`]:{marginTop:e.spacing(1),marginBottom:e.spacing(1)},[`& + .${lp.inset}`]:{marginLeft:52},[`& .${Bo.root}`]:{marginTop:0,marginBottom:0},[`& .${Bo.inset}`]:{paddingLeft:36},[`& .${cp.root}`]:{minWidth:36},variants:[{props:({ownerState:t})=>!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>!t.dense,style:{[e.breakpoints.up("sm")]:{minHeight:"auto"}}},{props:({ownerState:t})=>t.dense,style:{minHeight:32,paddingTop:4,paddingBottom:4,...e.typography.body2,[`& .${cp.root} svg`]:{fontSize:"1.25rem"}}}]}))),OM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiMenuItem"}),{autoFocus:r=!1,component:i="li",dense:s=!1,divider:a=!1,disableGutters:l=!1,focusVisibleClassName:c,role:d="menuitem",tabIndex:u,className:p,...f}=o,m=b.useContext(qn),g=b.useMemo(()=>({dense:s||m.dense||!1,disableGutters:l}),[m.dense,s,l]),S=b.useRef(null);Ft(()=>{r&&S.current&&S.current.focus()},[r]);const w={...o,dense:g.dense,divider:a,disableGutters:l},P=AM(o),x=at(S,n);let y;return o.disabled||(y=u!==void 0?u:-1),h.jsx(qn.Provider,{value:g,children:h.jsx(NM,{ref:x,role:d,tabIndex:y,component:i,focusVisibleClassName:re(P.focusVisible,c),className:re(P.root,p),...f,ownerState:w,classes:P})})});function LM(e){return Pe("MuiTab",e)}const Xt=Ce("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper","icon"]),_M=e=>{const{classes:t,textColor:n,fullWidth:o,wrapped:r,icon:i,label:s,selected:a,disabled:l}=e,c={root:["root",i&&s&&"labelIcon",`textColor${q(n)}`,o&&"fullWidth",r&&"wrapped",a&&"selected",l&&"disabled"],icon:["iconWrapper","icon"]};return Ie(c,LM,t)},jM=Y(Nn,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.label&&n.icon&&t.labelIcon,t[`textColor${q(n.textColor)}`],n.fullWidth&&t.fullWidth,n.wrapped&&t.wrapped,{[`& .${Xt.iconWrapper}`]:t.iconWrapper},{[`& .${Xt.icon}`]:t.icon}]}})(ve(({theme:e})=>({...e.typography.button,maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center",lineHeight:1.25,variants:[{props:({ownerState:t})=>t.label&&(t.iconPosition==="top"||t.iconPosition==="bottom"),style:{flexDirection:"column"}},{props:({ownerState:t})=>t.label&&t.iconPosition!=="top"&&t.iconPosition!=="bottom",style:{flexDirection:"row"}},{props:({ownerState:t})=>t.icon&&t.label,style:{minHeight:72,paddingTop:9,paddingBottom:9}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="top",style:{[`& > .${Xt.icon}`]:{marginBottom:6}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="bottom",style:{[`& > .${Xt.icon}`]:{marginTop:6}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="start",style:{[`& > .${Xt.icon}`]:{marginRight:e.spacing(1)}}},{props:({ownerState:t,iconPosition:n})=>t.icon&&t.label&&n==="end",style:{[`& > .${Xt.icon}`]:{marginLeft:e.spacing(1)}}},{props:{textColor:"inherit"},style:{color:"inherit",opacity:.6,[`&.${Xt.selected}`]:{opacity:1},[`&.${Xt.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity}}},{props:{textColor:"primary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Xt.selected}`]:{color:(e.vars||e).palette.primary.main},[`&.${Xt.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:{textColor:"secondary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Xt.selected}`]:{color:(e.vars||e).palette.secondary.main},[`&.${Xt.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:({ownerState:t})=>t.fullWidth,style:{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"}},{props:({ownerState:t})=>t.wrapped,style:{fontSize:e.typography.pxToRem(12)}}]}))),up=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTab"}),{className:r,disabled:i=!1,disableFocusRipple:s=!1,fullWidth:a,icon:l,iconPosition:c="top",indicator:d,label:u,onChange:p,onClick:f,onFocus:m,selected:g,selectionFollowsFocus:S,textColor:w="inherit",value:P,wrapped:x=!1,...y}=o,E={...o,disabled:i,disableFocusRipple:s,selected:g,icon:!!l,iconPosition:c,label:!!u,fullWidth:a,textColor:w,wrapped:x},$=_M(E),I=l&&u&&b.isValidElement(l)?b.cloneElement(l,{className:re($.icon,l.props.className)}):l,M=v=>{!g&&p&&p(v,P),f&&f(v)},T=v=>{S&&!g&&p&&p(v,P),m&&m(v)};return h.jsxs(jM,{focusRipple:!s,className:re($.root,r),ref:n,role:"tab","aria-selected":g,disabled:i,onClick:M,onFocus:T,ownerState:E,tabIndex:g?0:-1,...y,children:[c==="top"||c==="start"?h.jsxs(b.Fragment,{children:[I,u]}):h.jsxs(b.Fragment,{children:[u,I]}),d]})}),BM=st(h.jsx("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),zM=st(h.jsx("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function DM(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}function FM(e,t,n,o={},r=()=>{}){const{ease:i=DM,duration:s=300}=o;let a=null;const l=t[e];let c=!1;const d=()=>{c=!0},u=p=>{if(c){r(new Error("Animation cancelled"));return}a===null&&(a=p);const f=Math.min(1,(p-a)/s);if(t[e]=i(f)*(n-l)+l,f>=1){requestAnimationFrame(()=>{r(null)});return}requestAnimationFrame(u)};return l===n?(r(new Error("Element already at target position")),d):(requestAnimationFrame(u),d)}const HM={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};function WM(e){const{onChange:t,...n}=e,o=b.useRef(),r=b.useRef(null),i=()=>{o.current=r.current.offsetHeight-r.current.clientHeight};return Ft(()=>{const s=ca(()=>{const l=o.current;i(),l!==o.current&&t(o.current)}),a=un(r.current);return a.addEventListener("resize",s),()=>{s.clear(),a.removeEventListener("resize",s)}},[t]),b.useEffect(()=>{i(),t(o.current)},[t]),h.jsx("div",{style:HM,...n,ref:r})}function VM(e){return Pe("MuiTabScrollButton",e)}const UM=Ce("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),GM=e=>{const{classes:t,orientation:n,disabled:o}=e;return Ie({root:["root",n,o&&"disabled"]},VM,t)},XM=Y(Nn,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.orientation&&t[n.orientation]]}})({width:40,flexShrink:0,opacity:.8,[`&.${UM.disabled}`]:{opacity:0},variants:[{props:{orientation:"vertical"},style:{width:"100%",height:40,"& svg":{transform:"var(--TabScrollButton-svgRotate)"}}}]}),YM=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTabScrollButton"}),{className:r,slots:i={},slotProps:s={},direction:a,orientation:l,disabled:c,...d}=o,u=ir(),p={isRtl:u,...o},f=GM(p),m=i.StartScrollButtonIcon??BM,g=i.EndScrollButtonIcon??zM,S=Pt({elementType:m,externalSlotProps:s.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:p}),w=Pt({elementType:g,externalSlotProps:s.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:p});return h.jsx(XM,{component:"div",className:re(f.root,r),ref:n,role:null,ownerState:p,tabIndex:null,...d,style:{...d.style,...l==="vertical"&&{"--TabScrollButton-svgRotate":`rotate(${u?-90:90}deg)`}},children:a==="left"?h.jsx(m,{...S}):h.jsx(g,{...w})})});function qM(e){return Pe("MuiTabs",e)}const Ua=Ce("MuiTabs",["root","vertical","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),dp=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,pp=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,ji=(e,t,n)=>{let o=!1,r=n(e,t);for(;r;){if(r===e.firstChild){if(o)return;o=!0}const i=r.disabled||r.getAttribute("aria-disabled")==="true";if(!r.hasAttribute("tabindex")||i)r=n(e,r);else{r.focus();return}}},KM=e=>{const{vertical:t,fixed:n,hideScrollbar:o,scrollableX:r,scrollableY:i,centered:s,scrollButtonsHideMobile:a,classes:l}=e;return Ie({root:["root",t&&"vertical"],scroller:["scroller",n&&"fixed",o&&"hideScrollbar",r&&"scrollableX",i&&"scrollableY"],flexContainer:["flexContainer",t&&"flexContainerVertical",s&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",a&&"scrollButtonsHideMobile"],scrollableX:[r&&"scrollableX"],hideScrollbar:[o&&"hideScrollbar"]},qM,l)},ZM=Y("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${Ua.scrollButtons}`]:t.scrollButtons},{[`& .${Ua.scrollButtons}`]:n.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,n.vertical&&t.vertical]}})(ve(({theme:e})=>({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex",variants:[{props:({ownerState:t})=>t.vertical,style:{flexDirection:"column"}},{props:({ownerState:t})=>t.scrollButtonsHideMobile,style:{[`& .${Ua.scrollButtons}`]:{[e.breakpoints.down("sm")]:{display:"none"}}}}]}))),JM=Y("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.scroller,n.fixed&&t.fixed,n.hideScrollbar&&t.hideScrollbar,n.scrollableX&&t.scrollableX,n.scrollableY&&t.scrollableY]}})({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap",variants:[{props:({ownerState:e})=>e.fixed,style:{overflowX:"hidden",width:"100%"}},{props:({ownerState:e})=>e.hideScrollbar,style:{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}},{props:({ownerState:e})=>e.scrollableX,style:{overflowX:"auto",overflowY:"hidden"}},{props:({ownerState:e})=>e.scrollableY,style:{overflowY:"auto",overflowX:"hidden"}}]}),QM=Y("div",{name:"MuiTabs",slot:"FlexContainer",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.flexContainer,n.vertical&&t.flexContainerVertical,n.centered&&t.centered]}})({display:"flex",variants:[{props:({ownerState:e})=>e.vertical,style:{flexDirection:"column"}},{props:({ownerState:e})=>e.centered,style:{justifyContent:"center"}}]}),eT=Y("span",{name:"MuiTabs",slot:"Indicator",overridesResolver:(e,t)=>t.indicator})(ve(({theme:e})=>({position:"absolute",height:2,bottom:0,width:"100%",transition:e.transitions.create(),variants:[{props:{indicatorColor:"primary"},style:{backgroundColor:(e.vars||e).palette.primary.main}},{props:{indicatorColor:"secondary"},style:{backgroundColor:(e.vars||e).palette.secondary.main}},{props:({ownerState:t})=>t.vertical,style:{height:"100%",width:2,right:0}}]}))),tT=Y(WM)({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),fp={},nT=b.forwardRef(function(t,n){const o=Te({props:t,name:"MuiTabs"}),r=St(),i=ir(),{"aria-label":s,"aria-labelledby":a,action:l,centered:c=!1,children:d,className:u,component:p="div",allowScrollButtonsMobile:f=!1,indicatorColor:m="primary",onChange:g,orientation:S="horizontal",ScrollButtonComponent:w=YM,scrollButtons:P="auto",selectionFollowsFocus:x,slots:y={},slotProps:E={},TabIndicatorProps:$={},TabScrollButtonProps:I={},textColor:M="primary",value:T,variant:v="standard",visibleScrollbar:A=!1,...L}=o,_=v==="scrollable",C=S==="vertical",R=C?"scrollTop":"scrollLeft",k=C?"top":"left",N=C?"bottom":"right",j=C?"clientHeight":"clientWidth",O=C?"height":"width",B={...o,component:p,allowScrollButtonsMobile:f,indicatorColor:m,orientation:S,vertical:C,scrollButtons:P,textColor:M,variant:v,visibleScrollbar:A,fixed:!_,hideScrollbar:_&&!A,scrollableX:_&&!C,scrollableY:_&&C,centered:c&&!_,scrollButtonsHideMobile:!f},z=KM(B),G=Pt({elementType:y.StartScrollButtonIcon,externalSlotProps:E.startScrollButtonIcon,ownerState:B}),Z=Pt({elementType:y.EndScrollButtonIcon,externalSlotProps:E.endScrollButtonIcon,ownerState:B}),[K,V]=b.useState(!1),[F,te]=b.useState(fp),[D,ne]=b.useState(!1),[oe,ie]=b.useState(!1),[X,se]=b.useState(!1),[ae,ge]=b.useState({overflow:"hidden",scrollbarWidth:0}),le=new Map,ye=b.useRef(null),he=b.useRef(null),je=()=>{const Q=ye.current;let pe;if(Q){const Oe=Q.getBoundingClientRect();pe={clientWidth:Q.clientWidth,scrollLeft:Q.scrollLeft,scrollTop:Q.scrollTop,scrollWidth:Q.scrollWidth,top:Oe.top,bottom:Oe.bottom,left:Oe.left,right:Oe.right}}let Me;if(Q&&T!==!1){const Oe=he.current.children;if(Oe.length>0){const ze=Oe[le.get(T)];Me=ze?ze.getBoundingClientRect():null}}return{tabsMeta:pe,tabMeta:Me}},Ee=Et(()=>{const{tabsMeta:Q,tabMeta:pe}=je();let Me=0,Oe;C?(Oe="top",pe&&Q&&(Me=pe.top-Q.top+Q.scrollTop)):(Oe=i?"right":"left",pe&&Q&&(Me=(i?-1:1)*(pe[Oe]-Q[Oe]+Q.scrollLeft)));const ze={[Oe]:Me,[O]:pe?pe[O]:0};if(typeof F[Oe]!="number"||typeof F[O]!="number")te(ze);else{const et=Math.abs(F[Oe]-ze[Oe]),ft=Math.abs(F[O]-ze[O]);(et>=1||ft>=1)&&te(ze)}}),Ae=(Q,{animation:pe=!0}={})=>{pe?FM(R,ye.current,Q,{duration:r.transitions.duration.standard}):ye.current[R]=Q},ce=Q=>{let pe=ye.current[R];C?pe+=Q:pe+=Q*(i?-1:1),Ae(pe)},Re=()=>{const Q=ye.current[j];let pe=0;const Me=Array.from(he.current.children);for(let Oe=0;Oe<Me.length;Oe+=1){const ze=Me[Oe];if(pe+ze[j]>Q){Oe===0&&(pe=Q);break}pe+=ze[j]}return pe},$e=()=>{ce(-1*Re())},J=()=>{ce(Re())},ee=b.useCallback(Q=>{ge({overflow:null,scrollbarWidth:Q})},[]),fe=()=>{const Q={};Q.scrollbarSizeListener=_?h.jsx(tT,{onChange:ee,className:re(z.scrollableX,z.hideScrollbar)}):null;const Me=_&&(P==="auto"&&(D||oe)||P===!0);return Q.scrollButtonStart=Me?h.jsx(w,{slots:{StartScrollButtonIcon:y.StartScrollButtonIcon},slotProps:{startScrollButtonIcon:G},orientation:S,direction:i?"right":"left",onClick:$e,disabled:!D,...I,className:re(z.scrollButtons,I.className)}):null,Q.scrollButtonEnd=Me?h.jsx(w,{slots:{EndScrollButtonIcon:y.EndScrollButtonIcon},slotProps:{endScrollButtonIcon:Z},orientation:S,direction:i?"left":"right",onClick:J,disabled:!oe,...I,className:re(z.scrollButtons,I.className)}):null,Q},be=Et(Q=>{const{tabsMeta:pe,tabMeta:Me}=je();if(!(!Me||!pe)){if(Me[k]<pe[k]){const Oe=pe[R]+(Me[k]-pe[k]);Ae(Oe,{animation:Q})}else if(Me[N]>pe[N]){const Oe=pe[R]+(Me[N]-pe[N]);Ae(Oe,{animation:Q})}}}),de=Et(()=>{_&&P!==!1&&se(!X)});b.useEffect(()=>{const Q=ca(()=>{ye.current&&Ee()});let pe;const Me=et=>{et.forEach(ft=>{ft.removedNodes.forEach(De=>{pe?.unobserve(De)}),ft.addedNodes.forEach(De=>{pe?.observe(De)})}),Q(),de()},Oe=un(ye.current);Oe.addEventListener("resize",Q);let ze;return typeof ResizeObserver<"u"&&(pe=new ResizeObserver(Q),Array.from(he.current.children).forEach(et=>{pe.observe(et)})),typeof MutationObserver<"u"&&(ze=new MutationObserver(Me),ze.observe(he.current,{childList:!0})),()=>{Q.clear(),Oe.removeEventListener("resize",Q),ze?.disconnect(),pe?.disconnect()}},[Ee,de]),b.useEffect(()=>{const Q=Array.from(he.current.children),pe=Q.length;if(typeof IntersectionObserver<"u"&&pe>0&&_&&P!==!1){const Me=Q[0],Oe=Q[pe-1],ze={root:ye.current,threshold:.99},et=xt=>{ne(!xt[0].isIntersecting)},ft=new IntersectionObserver(et,ze);ft.observe(Me);const De=xt=>{ie(!xt[0].isIntersecting)},qe=new IntersectionObserver(De,ze);return qe.observe(Oe),()=>{ft.disconnect(),qe.disconnect()}}},[_,P,X,d?.length]),b.useEffect(()=>{V(!0)},[]),b.useEffect(()=>{Ee()}),b.useEffect(()=>{be(fp!==F)},[be,F]),b.useImperativeHandle(l,()=>({updateIndicator:Ee,updateScrollButtons:de}),[Ee,de]);const xe=h.jsx(eT,{...$,className:re(z.indicator,$.className),ownerState:B,style:{...F,...$.style}});let Se=0;const Ye=b.Children.map(d,Q=>{if(!b.isValidElement(Q))return null;const pe=Q.props.value===void 0?Se:Q.props.value;le.set(pe,Se);const Me=pe===T;return Se+=1,b.cloneElement(Q,{fullWidth:v==="fullWidth",indicator:Me&&!K&&xe,selected:Me,selectionFollowsFocus:x,onChange:g,textColor:M,value:pe,...Se===1&&T===!1&&!Q.props.tabIndex?{tabIndex:0}:{}})}),Fe=Q=>{const pe=he.current,Me=bt(pe).activeElement;if(Me.getAttribute("role")!=="tab")return;let ze=S==="horizontal"?"ArrowLeft":"ArrowUp",et=S==="horizontal"?"ArrowRight":"ArrowDown";switch(S==="horizontal"&&i&&(ze="ArrowRight",et="ArrowLeft"),Q.key){case ze:Q.preventDefault(),ji(pe,Me,pp);break;case et:Q.preventDefault(),ji(pe,Me,dp);break;case"Home":Q.preventDefault(),ji(pe,null,dp);break;case"End":Q.preventDefault(),ji(pe,null,pp);break}},ue=fe();return h.jsxs(ZM,{className:re(z.root,u),ownerState:B,ref:n,as:p,...L,children:[ue.scrollButtonStart,ue.scrollbarSizeListener,h.jsxs(JM,{className:z.scroller,ownerState:B,style:{overflow:ae.overflow,[C?`margin${i?"Left":"Right"}`:"marginBottom"]:A?void 0:-ae.scrollbarWidth},ref:ye,children:[h.jsx(QM,{"aria-label":s,"aria-labelledby":a,"aria-orientation":S==="vertical"?"vertical":null,className:z.flexContainer,ownerState:B,onKeyDown:Fe,ref:he,role:"tablist",children:Ye}),K&&xe]}),ue.scrollButtonEnd]})}),oT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s})=>h.jsx(ke,{"data-key":e,className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{minWidth:"320px",...n},children:h.jsx(li,{variant:"outlined",type:"text",size:"small",fullWidth:!0,multiline:!0,minRows:3,maxRows:12,label:i,value:t,onChange:a=>s?.(e,a.target.value)})},e),rT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,no_validation:s,options:a,updateStore:l})=>{const c=typeof t=="string"?[t]:t||[];return h.jsx(ke,{"data-key":e,sx:{minWidth:"320px",...n},className:`nodrag ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Lg,{multiple:!0,disablePortal:!0,filterSelectedOptions:!0,handleHomeEndKeys:!0,freeSolo:s,options:a,renderInput:d=>h.jsx(li,{...d,label:i}),onChange:(d,u)=>l?.(e,u),value:c,size:"small"})})},iT=({component:e,props:t})=>{const[n,o]=b.useState(null),r=window,i=e?.split("/").pop();return!e||!i?(console.error("The component must be in the format of `module/component`"),h.jsx(ke,{children:"Error loading component"})):(b.useEffect(()=>{r.React===void 0&&(r.React=Zt),r.mellonCustomScripts===void 0&&(r.mellonCustomScripts=new Map);const s=async()=>{try{const l=r.mellonCustomScripts.get(e);if(l)await l;else{const d=new Promise((u,p)=>{const f=document.createElement("script");f.src=`http://${Qn.serverAddress}/custom_component/${e}`,f.async=!0,f.onload=u,f.onerror=p,f.id=i,document.body.appendChild(f)});r.mellonCustomScripts.set(e,d),await d}const c=r[i];if(!c)throw new Error(`Component ${i} failed to load properly`);o(()=>c)}catch(l){console.error("Error loading component:",l),r.mellonCustomScripts.delete(e)}},a=r[i];return a?o(()=>a):s(),()=>{const l=document.getElementById(i);l&&!document.querySelector(`[data-component="${i}"]`)&&(document.body.removeChild(l),r.mellonCustomScripts.delete(e)),r.mellonCustomScripts.size===0&&(delete r.mellonCustomScripts,delete r.React)}},[e,i]),n?h.jsx(ke,{"data-component":i,children:h.jsx(n,{...t})}):h.jsx(ke,{children:"Loading..."}))},sT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s,source:a})=>{const l=d=>s?.(e,d),c=St();return h.jsx(ke,{"data-key":e,className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,sx:{...n},children:h.jsx(iT,{component:a,props:{fieldKey:e,value:t,label:i,setValue:l,theme:c}})})},aT=st(h.jsx("path",{d:"M12 8c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2m0 2c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2m0 6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2"}),"MoreVert"),lT=({fieldKey:e,style:t,disabled:n,hidden:o,label:r,options:i,updateStore:s,onChangeAction:a})=>{const[l,c]=b.useState(null),d=!!l,u=Array.isArray(a?.target)?a?.target:[a?.target],p=St(),f=g=>{c(g.currentTarget)},m=g=>{if(c(null),g<0)return;const S=Array.isArray(i[g].value)?i[g].value:[i[g].value];u.forEach((w,P)=>{s?.(w,S[P])})};return h.jsxs(ke,{"data-key":e,className:`flex-auto nodrag ${n?"mellon-disabled":""} ${o?"mellon-hidden":""}`,sx:{...t},children:[h.jsx(Mn,{onClick:f,title:r,children:h.jsx(aT,{})}),h.jsx(bg,{anchorEl:l,open:d,onClose:()=>m(-1),slotProps:{paper:{sx:{maxHeight:"640px",lineHeight:"0","& li:hover":{backgroundColor:p.palette.secondary.main}},elevation:8}},children:i.map((g,S)=>g.label?.startsWith("---")?h.jsx(_l,{sx:{borderColor:"rgba(255, 255, 255, 0.5)"}},S):h.jsx(OM,{sx:{lineHeight:"1.2",pl:1,pr:1},onClick:()=>m(S),children:g.label},S))})]})},cT=st(h.jsx("path",{d:"M20 11H7.83l5.59-5.59L12 4l-8 8 8 8 1.41-1.41L7.83 13H20z"}),"ArrowBack"),uT=st(h.jsx("path",{d:"m12 4-1.41 1.41L16.17 11H4v2h12.17l-5.58 5.59L12 20l8-8z"}),"ArrowForward"),dT=st(h.jsx("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),pT=b.memo(({urls:e,index:t,label:n,onClose:o})=>{const r=St(),[i,s]=b.useState(-1),[a,l]=b.useState(1),[c,d]=b.useState({x:0,y:0}),u=b.useRef(!1),p=b.useRef({x:0,y:0}),m=$=>{a!==1&&(u.current=!0,p.current={x:$.clientX-c.x,y:$.clientY-c.y})},g=$=>{if(!u.current)return;const I=$.clientX-p.current.x,M=$.clientY-p.current.y,T={x:Math.min(Math.max(I,-(a-1)*500),(a-1)*500),y:Math.min(Math.max(M,-(a-1)*500),(a-1)*500)};d(T)},S=$=>{u.current=!1};b.useEffect(()=>{d({x:0,y:0})},[a,i]),b.useEffect(()=>{l(1),d({x:0,y:0}),s(t)},[t]);const w=b.useCallback($=>{i!==-1&&($.key==="ArrowLeft"||$.key==="ArrowRight")&&($.preventDefault(),$.stopPropagation(),$.key==="ArrowLeft"&&i>0&&s(i-1),$.key==="ArrowRight"&&i<e.length-1&&s(i+1))},[i,e.length]),P=b.useCallback($=>{i!==-1&&l(I=>Math.min(Math.max(1,I-$.deltaY*.005),4))},[i]),x=()=>i===-1?"":`http://${Qn.serverAddress}${e[i].url}`,y=b.useCallback(()=>i>0&&s(i-1),[i]),E=b.useCallback(()=>i<e.length-1&&s(i+1),[i,e.length]);return h.jsx(Mc,{open:i>-1,onClose:o,onKeyDown:w,onWheel:P,"aria-labelledby":"lightbox",children:h.jsxs(ke,{sx:{position:"absolute",top:"50%",left:"50%",transform:"translate(-50%, -50%)",width:"100vw",height:"100vh",display:"flex",flexDirection:"column",justifyContent:"center",alignItems:"center"},onClick:o,children:[h.jsxs(ke,{sx:{display:"flex",alignItems:"center",p:2,backgroundColor:r.palette.background.paper,borderRadius:1,mb:1,mt:2},onClick:$=>{$.stopPropagation(),$.preventDefault()},children:[h.jsx(Mn,{onClick:y,disabled:i===0,size:"small",children:h.jsx(cT,{})}),h.jsx(Mn,{onClick:E,disabled:i===e.length-1,size:"small",children:h.jsx(uT,{})}),h.jsx(jg,{value:a,onChange:($,I)=>l(I),min:1,max:4,step:.1,sx:{mx:2,width:200}}),h.jsx(ke,{sx:{flexGrow:1}}),h.jsx(Mn,{onClick:o,size:"small",children:h.jsx(dT,{})})]}),h.jsx(ke,{sx:{flexGrow:1,overflow:"hidden",display:"flex",justifyContent:"center",alignItems:"center",cursor:a>1?"grab":"default","&:active":{cursor:a>1?"grabbing":"default"},"& img":{maxWidth:"100%",maxHeight:"100%",objectFit:"contain",p:0,m:0,transform:`scale(${a}) translate(${c.x/a}px, ${c.y/a}px)`,transition:u.current?"none":"transform 0.2s",pointerEvents:"none",imageRendering:"pixelated"}},onMouseDown:m,onMouseMove:g,onMouseUp:S,onMouseLeave:S,onClick:$=>{$.stopPropagation(),$.preventDefault()},children:i>-1&&h.jsx("img",{src:x(),alt:`${n} ${i}`,width:`${e[i].width}`,height:`${e[i].height}`})})]})})},(e,t)=>!(e.index!==t.index||!Xr(e.urls,t.urls))),fT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i})=>{typeof t=="string"&&(t=[{url:t,width:0,height:0}]);const s=t.length>1?"1288px":"auto",a=t.length>4?"1360px":"auto",l=(p,f)=>t.length===1||p/f>1.6?"100%":"50%",[c,d]=b.useState(-1),u=p=>{d(p)};return h.jsxs(h.Fragment,{children:[h.jsx(ke,{"data-key":e,sx:{width:s,height:"auto",maxWidth:"2048px",maxHeight:a,overflow:t.length>4?"auto":"hidden",mb:2,...n},className:`${t.length>4?"nowheel":""} ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:t.map(({url:p,width:f,height:m},g)=>h.jsx(ke,{sx:{width:l(Number(f),Number(m)),height:"auto",display:"block",float:"left","& img":{width:"100%",height:"auto",display:"block",p:.25,cursor:"pointer"}},children:h.jsx("img",{src:`http://${Qn.serverAddress}${p}`,alt:`${i} ${g}`,onClick:()=>u(g)})},`${e}-${g}`))}),h.jsx(pT,{urls:t,index:c,label:i||"",onClose:()=>d(-1)})]})},hT=b.lazy(()=>Kg(()=>import("./UIThreePreview-BuvM6dme.js"),__vite__mapDeps([0,1]))),gT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r})=>h.jsx(ke,{"data-key":e,sx:{p:0,m:0,mt:1,mb:1,...n},className:`nodrag nowheel ${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(b.Suspense,{fallback:h.jsx(ke,{sx:{display:"flex",justifyContent:"center",alignItems:"center",width:"768px",height:"768px"},children:h.jsx(Fc,{})}),children:h.jsx(hT,{value:t})})}),mT=st(h.jsx("path",{d:"M20 6h-8l-2-2H4c-1.1 0-1.99.9-1.99 2L2 18c0 1.1.9 2 2 2h16c1.1 0 2-.9 2-2V8c0-1.1-.9-2-2-2m0 12H4V8h16z"}),"FolderOpenOutlined"),yT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i,updateStore:s})=>{const[a,l]=b.useState(!1),c=()=>{l(!0)},d=()=>{l(!1)};return h.jsxs(ke,{"data-key":e,sx:{...n},className:`${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:[h.jsxs(So,{direction:"row",spacing:1,sx:{"& > .MuiBox-root":{flex:"1"},"& > .flex-auto":{flex:"0 0 auto"},justifyContent:"center",alignItems:"stretch"},children:[h.jsx(li,{onChange:u=>s?.(e,u.target.value),variant:"outlined",type:"text",size:"small",fullWidth:!0,label:i,value:t,className:"nodrag",autoComplete:"off"}),h.jsx(Mn,{onClick:c,children:h.jsx(mT,{})})]}),h.jsx(dM,{open:a,onClose:d,"aria-labelledby":"file-browser-dialog",children:h.jsx(ke,{children:"Not yet implemented"})})]})},bT=({fieldKey:e,value:t,style:n,disabled:o,hidden:r,label:i})=>{const s=St(),a=t.value;return h.jsxs(ke,{children:[h.jsx(Rt,{sx:{fontSize:13,color:s.palette.text.secondary,fontWeight:"bold"},children:i}),h.jsx(ke,{component:"pre","data-key":e,sx:{color:s.palette.text.secondary,backgroundColor:"#111",border:`1px solid ${s.palette.divider}`,borderRadius:1,padding:1,m:0,mb:1,...n},className:`${o?"mellon-disabled":""} ${r?"mellon-hidden":""}`,children:h.jsx(Rt,{children:a})})]})},gs=e=>Object.entries(e.fields).map(([t,n])=>{const o=(n.display||"").toLowerCase(),r=e.parentDisabled?!1:n.disabled||!1,i=n.hidden||!1,s=n.style||{},a=n.label||t;if(o==="group"){const g=e.groups?.[t],S=g?g.disabled!==void 0?g.disabled:r:!1,w=g?g.hidden!==void 0?g.hidden:i:!1;return h.jsx(rE,{fieldKey:t,label:n.label,direction:n.direction,disabled:S,hidden:w,style:s,updateStore:e.updateStore,fields:n.params},t)}if(o==="collapse"){const g=e.groups?.[t],S=g?g.open!==void 0?g.open:n.open:!1,w=g?g.disabled!==void 0?g.disabled:r:!1,P=g?g.hidden!==void 0?g.hidden:i:!1;return h.jsx(J2,{fieldKey:t,open:S,label:n.label,disabled:w,hidden:P,style:s,updateStore:e.updateStore,fields:n.params},t)}const l=(Array.isArray(n.type)&&n.type.length>0?n.type[0]:n.type||"string").toLowerCase(),c=xT(o,l,n),d=n.value===void 0?n.default||"":n.value,u=n.options||[],p=n.no_validation||!1,f=typeof n.onChange=="string"?{action:n.onChange}:n.onChange||null,m={fieldKey:t,fieldType:c,dataType:l,label:a,value:d,style:s,hidden:i,disabled:r,options:u,no_validation:p,updateStore:e.updateStore,onChangeAction:f,icon:n.icon,min:n.min,max:n.max,step:n.step,source:n.source};return h.jsx(vT,{...m},t)}),vT=b.memo(e=>{switch(e.fieldType){case"input":case"output":return h.jsx(aE,{...e});case"number":case"slider":return h.jsx(PR,{...e});case"checkbox":case"switch":return h.jsx($P,{...e});case"autocomplete":return h.jsx(xR,{...e});case"select":return h.jsx(wR,{...e});case"textarea":return h.jsx(oT,{...e});case"icontoggle":return h.jsx(CR,{...e});case"range":return h.jsx(qR,{...e});case"tags":return h.jsx(rT,{...e});case"custom":return h.jsx(sT,{...e});case"filebrowser":return h.jsx(yT,{...e});case"ui_image":return h.jsx(fT,{...e});case"ui_dropdownicon":return h.jsx(lT,{...e});case"ui_3d":return h.jsx(gT,{...e});case"ui_text":return h.jsx(bT,{...e});default:return h.jsx(K$,{...e})}},(e,t)=>Xr(e.value,t.value)&&e.disabled===t.disabled&&e.hidden===t.hidden),xT=(e,t,n)=>{if(e==="input"||e==="output")return e;if(t==="boolean"||t==="bool")return e==="checkbox"||e==="icontoggle"?e:"switch";if(e==="ui"){if(t==="image")return"ui_image";if(t.toLowerCase()==="dropdownicon")return"ui_dropdownicon";if(t.toLowerCase()==="3d")return"ui_3d";if(t.toLowerCase()==="text")return"ui_text"}return e||(n.options&&typeof n.options=="object"?"select":t==="int"||t==="integer"||t==="float"||t==="number"?e==="slider"?"slider":"number":"text")},wT=b.memo(e=>{const t=St(),{setParam:n,setNodeExecuted:o}=Un(p=>({setParam:p.setParam,setNodeExecuted:p.setNodeExecuted}),Xn),r=pa(p=>p.nodeProgress[e.id]||{value:0,type:"determinate"},Xn),g=pa(p=>p.nodePreview[e.id]),i=async()=>{const p=e.id;try{(await fetch("http://"+Qn.serverAddress+"/clearNodeCache",{method:"DELETE",body:JSON.stringify({nodeId:p})})).ok&&o(p,!1,0,0)}catch(f){console.error("Error clearing cache:",f)}},s=e.id,a=e.data.label,l=M2(e.data.params),c=e.data.style||{},d=(p,f,m)=>{n(s,p,f,m)},u=h.jsx(L1,{style:{backgroundColor:"transparent",border:"none"},minWidth:200,minHeight:8,children:h.jsx(P2,{sx:{position:"absolute",right:"-6px",bottom:"-6px",transform:"rotate(90deg)",width:"26px",height:"26px",backgroundColor:t.palette.background.default,borderRadius:"0",padding:"2px",color:t.palette.text.secondary}})});return h.jsxs(ke,{id:s,className:`${e.data.module}-${e.data.action} category-${e.data.category} module-${e.data.module}`,sx:{position:"relative",boxShadow:4,outlineOffset:"5px",borderRadius:"0",minWidth:"200px",...c},children:[e.data.resizable&&u,h.jsx(ke,{component:"header",sx:{color:t.palette.common.white,padding:1,borderTopWidth:"6px",borderTopStyle:"solid",borderTopColor:"rgba(0, 0, 0)",backgroundColor:t.palette.background.default,fontSize:"16px",textShadow:"0px 2px 0px rgba(0, 0, 0, 0.75)"},children:a}),h.jsxs(ke,{sx:{backgroundColor:t.palette.background.paper,pl:1,pr:1,pt:1,pb:0,"& > .MuiBox-root":{pb:1.5},"& .MuiAccordionDetails-root > .MuiBox-root":{pb:1.5},"& .MuiStack-root > .MuiBox-root":{pb:1.5},"& .numberField > .MuiBox-root":{pb:0},"& .labelled-group":{pb:0}},children:[h.jsx(gs,{fields:l,updateStore:d,groups:e.data.groups}),g&&h.jsx(ke,{component:"img",src:g,alt:"Live preview",sx:{width:"100%",height:"auto",display:"block",mt:1}})]}),h.jsxs(ke,{component:"footer",sx:{p:0,backgroundColor:t.palette.background.default},children:[h.jsx(ke,{sx:{width:"100%"},children:h.jsx($2,{variant:r.type==="indeterminate"?"indeterminate":"determinate",color:"inherit",value:r.value,className:r.type==="disabled"?"progress-disabled":"",sx:{height:"4px","&.progress-disabled":{"& .MuiLinearProgress-bar":{display:"none"}},"& .MuiLinearProgress-bar1Indeterminate":{background:`repeating-linear-gradient(45deg, ${t.palette.primary.main} 0, ${t.palette.primary.main} 20px, ${t.palette.primary.dark} 20px, ${t.palette.primary.dark} 40px)`,backgroundSize:"60px 100%",backgroundPosition:"0 0",left:"0",right:"0",animation:"mellon-progress-ind 1s linear infinite"},"& .MuiLinearProgress-bar1Determinate":{transitionDuration:"80ms",background:`linear-gradient(100deg, ${t.palette.primary.main} 50%, #ff4259 90%)`},"& .MuiLinearProgress-bar2Indeterminate":{display:"none",animation:"none"}}})}),h.jsx(ke,{sx:{p:1},children:h.jsxs(So,{direction:"row",spacing:2,sx:{justifyContent:"space-between",alignItems:"center",pr:e.data.resizable?2.5:0},children:[h.jsx(wl,{icon:h.jsx(g2,{}),label:"Cache",title:"Clear Cache",onClick:i,disabled:!e.data.cache,color:"secondary",variant:"filled",sx:{height:"24px",borderRadius:.5,fontSize:"12px",span:{padding:"0px 8px 0px 10px"},"& .MuiChip-icon":{fontSize:"18px"}}}),h.jsx(wl,{icon:h.jsx(m2,{}),label:e.data.time?`${e.data.time}s`:"-",title:"Execution Time",sx:{color:t.palette.text.secondary,height:"24px",borderRadius:.5,fontSize:"12px",span:{padding:"0px 8px 0px 10px"},backgroundColor:"rgba(255, 255, 255, 0.1)","& .MuiChip-icon":{fontSize:"18px",color:t.palette.text.secondary}}})]})})]})]})},(e,t)=>{if(e.data.time!==t.data.time||e.data.cache!==t.data.cache||!Xr(e.data.groups,t.data.groups))return!1;const n=e.data.params,o=t.data.params,r=Object.keys(n),i=Object.keys(o);if(r.length!==i.length||!r.every(s=>s in o))return!1;for(const s of r){const a=n[s],l=o[s];if(!Xr(a.value,l.value)||a.disabled!==l.disabled||a.hidden!==l.hidden)return!1}return!0}),ST={custom:wT},CT=e=>({nodes:e.nodes,edges:e.edges,onNodesChange:e.onNodesChange,onEdgesChange:e.onEdgesChange,onEdgeDoubleClick:e.onEdgeDoubleClick,onConnect:e.onConnect,addNode:e.addNode,getParam:e.getParam}),kT=e=>({nodeRegistry:e.nodeRegistry,updateNodeRegistry:e.updateNodeRegistry}),ET=e=>({connect:e.connect}),$T=[0,0];function PT(){const{nodes:e,edges:t,onNodesChange:n,onEdgesChange:o,onEdgeDoubleClick:r,onConnect:i,addNode:s,getParam:a}=Un(CT,Xn),{nodeRegistry:l,updateNodeRegistry:c}=ng(kT,Xn),{connect:d}=pa(ET,Xn),{screenToFlowPosition:u,setNodes:p,setEdges:f,setViewport:m}=ti();b.useEffect(()=>{const E=localStorage.getItem("workflow");if(E){const{nodes:$,edges:I}=JSON.parse(E);p($||[]),f(I||[])}c(),d("ws://"+Qn.serverAddress+"/ws")},[]);const g=(E,$)=>{const I=JSON.parse(localStorage.getItem("workflow")||"{}");I.viewport=$,localStorage.setItem("workflow",JSON.stringify(I))},S=E=>{E.preventDefault();const $=E.dataTransfer.files[0];if($?.type!=="application/json")return;const I=new FileReader;I.onload=M=>{const T=JSON.parse(M.target?.result),{x:v=0,y:A=0,zoom:L=1}=T.viewport;m({x:v,y:A,zoom:L}),p(T.nodes),f(T.edges)},I.readAsText($)},w=E=>{if(E.preventDefault(),E.dataTransfer.types.includes("Files")){E.dataTransfer.dropEffect="copy";return}E.dataTransfer.dropEffect="move"},P=E=>{if(E.preventDefault(),E.dataTransfer.files.length>0){S(E);return}if(!l)return;const $=E.dataTransfer.getData("text/plain");if(!$||!l[$])return;const I=l[$],M=u({x:E.clientX,y:E.clientY}),T={id:Cc(),type:"custom",position:M,data:I};s(T)},x=E=>{if(!E.sourceHandle||!E.targetHandle||E.source===E.target)return!1;let $=a(E.source,E.sourceHandle,"type"),I=a(E.target,E.targetHandle,"type");return $=Array.isArray($)?$:[$],$.push("any"),I=Array.isArray(I)?I:[I],!!$.some(M=>I.includes(M))},y=(()=>{const E=localStorage.getItem("workflow");if(E){const{viewport:$}=JSON.parse(E);if($)return $}return{x:0,y:0,zoom:1}})();return h.jsx(d1,{nodes:e,edges:t,nodeTypes:ST,onNodesChange:n,onEdgesChange:o,onEdgeDoubleClick:(E,$)=>r($.id),isValidConnection:x,onConnect:i,nodeOrigin:$T,onDragOver:w,onDrop:P,onMoveEnd:g,edgesReconnectable:!0,defaultViewport:y,minZoom:.1,maxZoom:1.2,proOptions:{hideAttribution:!0},deleteKeyCode:["Backspace","Delete"],children:h.jsx(m1,{variant:In.Dots,gap:16,size:1,color:"rgba(255, 255, 255, 0.3)"})})}const IT=st(h.jsx("path",{d:"M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14"}),"Search"),RT=260,MT=e=>({nodeRegistry:e.nodeRegistry}),hp=(e,t)=>{const n=Object.entries(t).reduce((o,[r,i])=>{const s=i[e]||"default";return o[s]||(o[s]=[]),o[s].push({key:r,...i}),o},{});return e!=="module"&&Object.keys(n).forEach(o=>{n[o].sort((r,i)=>(r.label||r.key).localeCompare(i.label||i.key))}),Object.fromEntries(Object.entries(n).sort(([o],[r])=>o.localeCompare(r)))};function TT(){const e=St(),{nodeRegistry:t}=ng(MT,Xn),[n,o]=b.useState(""),r=b.useMemo(()=>{const d=n.toLowerCase().split(/\s+/).filter(u=>u.length>0);return d.length===0?null:Object.keys(t).filter(u=>{const p=t[u].label.toLowerCase();return d.every(f=>p.includes(f))})},[t,n]),i=(d,u)=>{d.dataTransfer.setData("text/plain",u),d.dataTransfer.effectAllowed="move"},[s,a]=b.useState(0),l=(d,u)=>{a(u)},c=b.useMemo(()=>{const d=hp(s===0?"module":"category",t);return r?Object.fromEntries(Object.entries(d).map(([u,p])=>[u,p.filter(f=>r.includes(f.key))]).filter(([u,p])=>p.length>0)):d},[t,r,s]);return h.jsxs(ke,{className:"left-sidebar",textAlign:"center",sx:{width:RT,height:"100%",display:"flex",flexDirection:"column",backgroundColor:e.palette.background.paper,borderRight:`1px solid ${e.palette.divider}`},children:[h.jsx(ke,{sx:{p:1.5,borderBottom:`1px solid ${e.palette.divider}`},children:h.jsx(ba,{startAdornment:h.jsx(IT,{fontSize:"small",sx:{marginRight:1}}),id:"main-module-search",placeholder:"Search",size:"small",value:n,onChange:d=>o(d.target.value),sx:{width:"100%",fontSize:"14px"}})}),h.jsx(ke,{sx:{width:"100%"},children:h.jsxs(nT,{value:s,onChange:l,variant:"fullWidth",sx:{lineHeight:"16px",minHeight:0,borderBottom:`1px solid ${e.palette.divider}`,".MuiButtonBase-root":{textTransform:"none",lineHeight:"16px",minHeight:0}},children:[h.jsx(up,{label:"Modules"}),h.jsx(up,{label:"Categories"})]})}),h.jsx(ke,{sx:{flex:1,overflowY:"auto",p:0,m:0},children:h.jsx(ke,{sx:{p:0,pb:0,m:0},children:Object.entries(c).map(([d,u])=>h.jsxs(ag,{disableGutters:!0,sx:{borderBottom:`1px solid ${e.palette.divider}`,boxShadow:"none",backgroundColor:"#1a1a1a",fontSize:12,p:0,m:0,"&:before":{backgroundColor:"transparent"},".MuiAccordionSummary-root":{backgroundColor:"#1a1a1a","&:hover":{backgroundColor:"rgba(255, 255, 255, 0.1)"}},".MuiAccordionDetails-root":{backgroundColor:"#1a1a1a",padding:"8px 4px"}},children:[h.jsx(lg,{expandIcon:h.jsx(ug,{}),children:d.replace(/[_-]/g," ").replace(/\b\w/g,p=>p.toUpperCase())}),h.jsx(cg,{children:h.jsx(fg,{dense:!0,sx:{p:1.5,pt:0,pb:0,m:0},children:u.map(p=>h.jsx(EM,{draggable:!0,className:`${p.key} category-${p.category} module-${p.module}`,onDragStart:f=>i(f,p.key),sx:{outline:`1px solid ${e.palette.divider}`,borderRadius:1,boxShadow:3,m:0,mb:1,p:.5,pl:1,borderLeftWidth:"8px",borderLeftStyle:"solid",cursor:"grab",display:!r||r.includes(p.key)?"flex":"none"},children:h.jsx(RM,{primary:p.label||p.key,sx:{"& .MuiTypography-root":{fontSize:12}}})},p.key))})})]},d))})})]})}const AT=st(h.jsx("path",{d:"M8 5v14l11-7z"}),"PlayArrow"),NT=st(h.jsx("path",{d:"M19 9h-4V3H9v6H5l7 7zM5 18v2h14v-2z"}),"GetApp"),OT=st(h.jsx("path",{d:"M14 2H6c-1.1 0-1.99.9-1.99 2L4 20c0 1.1.89 2 1.99 2H18c1.1 0 2-.9 2-2V8zM6 20V4h7v5h5v11z"}),"InsertDriveFileOutlined");function LT(){const{setNodes:e,setEdges:t,toObject:n,setViewport:o}=ti(),r=St(),{exportGraph:i}=Un(u=>({exportGraph:u.exportGraph}),Xn),{sid:s,isConnected:a}=pa(u=>({sid:u.sid,isConnected:u.isConnected}),Xn),l=async()=>{if(!a){console.error("Not connected to WebSocket server");return}const u=i(s??"");console.info(u);try{await fetch("http://"+Qn.serverAddress+"/graph",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(u)})}catch(p){console.error("Error connecting to API server:",p)}},c=b.useCallback(()=>{const u=n(),p=JSON.stringify(u,null,2),f=new Blob([p],{type:"application/json"}),m=URL.createObjectURL(f),g=document.createElement("a");g.href=m,g.download="workflow.json",document.body.appendChild(g),g.click(),document.body.removeChild(g),URL.revokeObjectURL(m)},[n]),d=b.useCallback(()=>{e([]),t([]),localStorage.removeItem("workflow");const u={x:0,y:0,zoom:1};localStorage.setItem("workflow",JSON.stringify({nodes:[],edges:[],viewport:u})),o(u)},[e,t]);return h.jsx(ke,{sx:{backgroundColor:r.palette.background.paper,padding:1,borderBottom:`1px solid ${r.palette.divider}`},children:h.jsxs(So,{direction:"row",spacing:0,sx:{justifyContent:"space-between",alignItems:"center"},children:[h.jsxs(So,{direction:"row",spacing:0,sx:{justifyContent:"space-between",alignItems:"center"},children:[h.jsx(ke,{sx:{display:"flex",alignItems:"center",ml:3},children:h.jsx(cs,{children:h.jsx("svg",{viewBox:"0 0 28 12",style:{width:"40px",height:"100%",marginRight:"4px"},xmlSpace:"preserve",xmlns:"http://www.w3.org/2000/svg",children:h.jsx("path",{style:{fill:`${r.palette.primary.main}`},d:"M1.815 11.95c0-.08.421-.784.936-1.565 1.217-1.848 2.4-5.662 2.161-6.965-.29-1.577-1.831-1.974-3.759-.97-1.334.696-1.513.496-.524-.578C1.682.725 3.286.007 4.807 0 6.57-.008 7.485 1.07 7.149 2.866c-.07.373-.077.665-.052.682.026.018.683-.505 1.368-1.122C10.205.861 11.458.232 13.026.266c2.323.054 2.982 1.899 3.153 2.636l.233 1.008 1.067-1.027C19.471.963 21.347.29 22.372.233c1.025-.058 1.686.18 2.376.915 1.69 1.801 1.441 4.275-.753 7.237-.963 1.3-1.166 1.726-.822 1.724.56.082 2.803-.211 3.602-.475.801-.262 1.16-.602 1.22-.507.047.072-.253.528-.4.695-.388.431-1.228 1.447-3.416 1.87-1.432.276-3.066.272-7.87.011-5.772-.312-8.614-.405-13.131.207-.75.101-1.364.12-1.364.041zM7.704 9.96c5.39-.463 5.243-.537 5.872-1.863 1.538-3.246-.245-6.387-3.297-5.802-1.09.209-2.7 1.904-4.049 4.262a522.55 522.55 0 0 1-1.532 2.666c-.286.489-.418.888-.296.886.123 0 1.609-.004 3.302-.149zm14.219-.594c.924-.558 1.842-2.346 1.842-3.592 0-1.864-1.516-3.591-3.15-3.591-1.511 0-2.565.904-4.441 3.81-.958 1.483-1.918 2.724-2.028 2.877-.328.462.122.959 4.76 1.064 1.702.038 2.42-.209 3.017-.568z"})})})}),h.jsx(ke,{sx:{mr:3},children:h.jsx(Rt,{variant:"h6",sx:{fontSize:"20px",padding:"0px 4px"},children:"Mellon"})}),h.jsxs(ke,{children:[h.jsx(Wa,{variant:"text",startIcon:h.jsx(OT,{}),onClick:d,sx:{mr:1},children:"New"}),h.jsx(Wa,{variant:"text",startIcon:h.jsx(NT,{}),onClick:c,children:"Export"})]})]}),h.jsx(ke,{children:h.jsx(Wa,{variant:"contained",startIcon:h.jsx(AT,{}),onClick:l,disabled:!a,sx:{background:`linear-gradient(100deg, ${r.palette.primary.main} 25%, #ff4259 90%)`,"&.Mui-disabled":{background:"linear-gradient(100deg, #6a6a6a, #303030)",color:"#1a1a1a"}},children:"Run"})}),h.jsx(ke,{})]})})}const _T=ua({components:{MuiAccordionSummary:{styleOverrides:{root:{fontFamily:"JetBrains Mono"}}}},palette:{mode:"dark",primary:{main:"#ffb300"},secondary:{main:"#00695f"},background:{default:"#121212",paper:"#1a1a1a"}},typography:{fontSize:14,fontFamily:"JetBrains Mono"}});Zg(document.getElementById("root")).render(h.jsx(b.StrictMode,{children:h.jsxs(wk,{theme:_T,children:[h.jsx(Ik,{}),h.jsx(eh,{children:h.jsxs(ke,{sx:{display:"flex",flexDirection:"column",height:"100vh",width:"100vw",overflow:"hidden"},children:[h.jsx(LT,{}),h.jsxs(ke,{sx:{display:"flex",flex:1,minHeight:0,height:"100%"},children:[h.jsx(TT,{}),h.jsx(ke,{sx:{flex:1,height:"100%"},children:h.jsx(Lk,{children:h.jsx(PT,{})})})]})]})})]})}));export{Wa as B,So as S,Nc as a,Qn as c,Ve as u};